@@ -0,0 +1,282 @@
+"""Memoized classification results keyed by (content hash, config hash).
+
+The same post text is classified several times: by the subprocess filter, by
+the worker, by ``/api/posts?include_raw=1`` and by the maintenance scripts.
+A :class:`ClassificationCache` remembers each result under the hash of the
+classifier inputs *and* the hash of the classifier configuration, so an
+unchanged post under an unchanged configuration is never scored twice:
+
+    cache = get_classification_cache("unified")
+    result = cache.get_or_compute(
+        (text, author, company), config.get_config_hash(),
+        lambda: config.classify_post(text, author, company),
+        encode=result_to_dict, decode=result_from_dict,
+    )
+
+Layers:
+- memory: bounded LRU of encoded results (always on)
+- SQLite: optional persistent layer shared across processes and restarts,
+  enabled with ``CLASSIFICATION_CACHE_PATH`` (or ``persist_path``)
+
+Invalidation is automatic: the first lookup with a new config hash drops every
+entry of the namespace computed under another hash, in memory and on disk.
+
+Author: Titan Scraper Team
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional, Sequence, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+DEFAULT_MEMORY_SIZE = 20000     # Results kept in memory per namespace
+DEFAULT_SQLITE_SIZE = 500000    # Rows kept on disk per namespace
+_PRUNE_EVERY = 1000             # SQLite writes between two size checks
+
+
+def content_hash(parts: Sequence[Optional[str]]) -> str:
+    """Stable hash of the classifier inputs (text, author, company, ...)."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update((part or "").encode("utf-8", "surrogatepass"))
+        h.update(b"\x1f")
+    return h.hexdigest()
+
+
+# =============================================================================
+# CACHE
+# =============================================================================
+
+class ClassificationCache:
+    """Two-layer (memory LRU + optional SQLite) cache for one classifier."""
+
+    def __init__(self, namespace: str, memory_size: int = DEFAULT_MEMORY_SIZE,
+                 persist_path: Optional[str] = None, sqlite_size: int = DEFAULT_SQLITE_SIZE):
+        self.namespace = namespace
+        self.memory_size = memory_size
+        self.sqlite_size = sqlite_size
+        self.persist_path = persist_path
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._config_hash: Optional[str] = None
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._writes = 0
+        self.stats = {"memory_hits": 0, "sqlite_hits": 0, "misses": 0, "invalidations": 0}
+        if persist_path:
+            self._init_sqlite(persist_path)
+
+    def _init_sqlite(self, path: str) -> None:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            conn = sqlite3.connect(path, check_same_thread=False, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS classification_cache ("
+                " namespace TEXT NOT NULL,"
+                " content_hash TEXT NOT NULL,"
+                " config_hash TEXT NOT NULL,"
+                " result TEXT NOT NULL,"
+                " created_at TEXT NOT NULL,"
+                " PRIMARY KEY (namespace, content_hash))"
+            )
+            conn.commit()
+            self._conn = conn
+        except sqlite3.Error as exc:
+            logger.warning("classification_cache_sqlite_disabled", path=path, error=str(exc))
+            self._conn = None
+
+    def _sync_config(self, config_hash: str) -> None:
+        """Drop entries computed under another configuration (lock held)."""
+        if config_hash == self._config_hash:
+            return
+        if self._config_hash is not None:
+            self.stats["invalidations"] += 1
+        self._memory.clear()
+        self._config_hash = config_hash
+        if self._conn is not None:
+            try:
+                cur = self._conn.execute(
+                    "DELETE FROM classification_cache WHERE namespace=? AND config_hash<>?",
+                    (self.namespace, config_hash),
+                )
+                self._conn.commit()
+                if cur.rowcount:
+                    logger.info("classification_cache_invalidated", namespace=self.namespace,
+                                removed=cur.rowcount, config_hash=config_hash)
+            except sqlite3.Error as exc:
+                logger.warning("classification_cache_sqlite_error", error=str(exc))
+
+    def get(self, key: str, config_hash: str) -> Optional[Any]:
+        """Encoded result for ``key`` under ``config_hash``, or None."""
+        with self._lock:
+            self._sync_config(config_hash)
+            value = self._memory.get(key)
+            if value is not None:
+                self._memory.move_to_end(key)
+                self.stats["memory_hits"] += 1
+                return value
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT result FROM classification_cache"
+                        " WHERE namespace=? AND content_hash=? AND config_hash=?",
+                        (self.namespace, key, config_hash),
+                    ).fetchone()
+                except sqlite3.Error:
+                    row = None
+                if row is not None:
+                    value = json.loads(row[0])
+                    self._remember(key, value)
+                    self.stats["sqlite_hits"] += 1
+                    return value
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, key: str, config_hash: str, value: Any) -> None:
+        """Store an encoded (JSON-serializable) result."""
+        with self._lock:
+            self._sync_config(config_hash)
+            self._remember(key, value)
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO classification_cache"
+                    " (namespace, content_hash, config_hash, result, created_at) VALUES (?,?,?,?,?)",
+                    (self.namespace, key, config_hash, json.dumps(value, ensure_ascii=False),
+                     datetime.now(timezone.utc).isoformat()),
+                )
+                self._conn.commit()
+                self._writes += 1
+                if self._writes % _PRUNE_EVERY == 0:
+                    self._prune_sqlite()
+            except sqlite3.Error as exc:
+                logger.warning("classification_cache_sqlite_error", error=str(exc))
+
+    def _remember(self, key: str, value: Any) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _prune_sqlite(self) -> None:
+        assert self._conn is not None
+        self._conn.execute(
+            "DELETE FROM classification_cache WHERE namespace=? AND rowid IN ("
+            " SELECT rowid FROM classification_cache WHERE namespace=?"
+            " ORDER BY created_at DESC LIMIT -1 OFFSET ?)",
+            (self.namespace, self.namespace, self.sqlite_size),
+        )
+        self._conn.commit()
+
+    def get_or_compute(self, parts: Sequence[Optional[str]], config_hash: str,
+                       compute: Callable[[], T], encode: Callable[[T], Any],
+                       decode: Callable[[Any], T]) -> T:
+        """Cached result for the inputs ``parts``, computing it on a miss.
+
+        Results are cached in their ``encode``d form and ``decode``d on every
+        hit, so callers always get a fresh object they may mutate.
+        """
+        key = content_hash(parts)
+        cached = self.get(key, config_hash)
+        if cached is not None:
+            return decode(cached)
+        result = compute()
+        self.put(key, config_hash, encode(result))
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            self._config_hash = None
+            if self._conn is not None:
+                try:
+                    self._conn.execute("DELETE FROM classification_cache WHERE namespace=?",
+                                       (self.namespace,))
+                    self._conn.commit()
+                except sqlite3.Error:
+                    pass
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "namespace": self.namespace,
+                "memory_entries": len(self._memory),
+                "memory_size": self.memory_size,
+                "persistent": self._conn is not None,
+                "config_hash": self._config_hash,
+                **self.stats,
+            }
+
+
+# =============================================================================
+# SINGLETONS
+# =============================================================================
+
+_caches: Dict[str, ClassificationCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_classification_cache(namespace: str) -> ClassificationCache:
+    """Process-wide cache for ``namespace`` (one per classifier).
+
+    ``CLASSIFICATION_CACHE_SIZE`` sets the memory bound and
+    ``CLASSIFICATION_CACHE_PATH`` enables the SQLite layer.
+    """
+    cache = _caches.get(namespace)
+    if cache is not None:
+        return cache
+    with _caches_lock:
+        cache = _caches.get(namespace)
+        if cache is None:
+            try:
+                size = int(os.environ.get("CLASSIFICATION_CACHE_SIZE", DEFAULT_MEMORY_SIZE))
+            except ValueError:
+                size = DEFAULT_MEMORY_SIZE
+            cache = ClassificationCache(
+                namespace,
+                memory_size=size,
+                persist_path=os.environ.get("CLASSIFICATION_CACHE_PATH") or None,
+            )
+            _caches[namespace] = cache
+    return cache
+
+
+def reset_classification_caches() -> None:
+    """Drop every cache singleton (for testing or after changing the env)."""
+    with _caches_lock:
+        for cache in _caches.values():
+            cache.close()
+        _caches.clear()
+
+
+__all__ = [
+    "ClassificationCache",
+    "content_hash",
+    "get_classification_cache",
+    "reset_classification_caches",
+    "DEFAULT_MEMORY_SIZE",
+]
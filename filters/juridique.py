@@ -23,7 +23,8 @@ EXTENSION:
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Set
+from functools import lru_cache
+from typing import List, Optional, Set, Tuple
 import re
 
 
@@ -691,13 +692,11 @@ class JuridiqueConfig:
     def compile_patterns(self) -> dict:
         """
         Compile les patterns en expressions régulières pour performance.
-        Retourne un dict avec les regex compilées.
+        Retourne un dict avec les regex compilées (partagées entre les configs
+        ayant les mêmes listes, compilées une seule fois par process).
         """
         def safe_compile(patterns: List[str]) -> re.Pattern:
-            escaped = [re.escape(p) for p in patterns if p]
-            if not escaped:
-                return re.compile(r"(?!)")  # Never matches
-            return re.compile(r"\b(" + "|".join(escaped) + r")\b", re.IGNORECASE)
+            return _compile_alternation(tuple(patterns))
         
         return {
             "legal_roles": safe_compile(self.legal_roles),
@@ -710,6 +709,15 @@ class JuridiqueConfig:
         }
 
 
+@lru_cache(maxsize=64)
+def _compile_alternation(patterns: Tuple[str, ...]) -> re.Pattern:
+    """Word-bounded, case-insensitive alternation of ``patterns`` (cached)."""
+    escaped = [re.escape(p) for p in patterns if p]
+    if not escaped:
+        return re.compile(r"(?!)")  # Never matches
+    return re.compile(r"\b(" + "|".join(escaped) + r")\b", re.IGNORECASE)
+
+
 def get_default_config() -> JuridiqueConfig:
     """
     Retourne la configuration par défaut optimisée pour Titan Partners.
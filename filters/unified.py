@@ -9,6 +9,10 @@ Usage:
     
     config = get_filter_config()
     result = config.classify_post(text, author, company)
+    
+    # Many posts at once (columnar result, optional process pool)
+    batch = config.classify_batch(posts, workers=4)
+    batch.legal_scores[i], batch.category(i), batch.result(i)
 
 Integration:
     1. All other modules should import from here
@@ -23,15 +27,25 @@ from __future__ import annotations
 import hashlib
 import json
 import re
-from dataclasses import dataclass, field
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
 
 import structlog
 
+from .cache import get_classification_cache
+
+try:  # optional C automaton, used to skip categories absent from a post
+    import ahocorasick as _ahocorasick  # type: ignore
+except ImportError:  # pragma: no cover - depends on the environment
+    _ahocorasick = None
+
 logger = structlog.get_logger(__name__)
 
 
@@ -87,6 +101,79 @@ class ClassificationResult:
         }
 
 
+# Category codes used by BatchClassification (index into this tuple)
+CATEGORY_CODES: Tuple[PostCategory, ...] = tuple(PostCategory)
+_CATEGORY_INDEX: Dict[PostCategory, int] = {c: i for i, c in enumerate(CATEGORY_CODES)}
+
+
+@dataclass
+class BatchClassification:
+    """Columnar result of :meth:`UnifiedFilterConfig.classify_batch`.
+    
+    Row ``i`` describes ``posts[i]``. ``categories`` holds indexes into
+    :data:`CATEGORY_CODES`; ``matched_patterns`` is only filled when the batch
+    was classified with ``with_matches=True``.
+    """
+    categories: array = field(default_factory=lambda: array("B"))
+    relevant: array = field(default_factory=lambda: array("B"))
+    legal_scores: array = field(default_factory=lambda: array("d"))
+    recruitment_scores: array = field(default_factory=lambda: array("d"))
+    combined_scores: array = field(default_factory=lambda: array("d"))
+    confidences: array = field(default_factory=lambda: array("d"))
+    exclusion_reasons: List[Optional[str]] = field(default_factory=list)
+    matched_patterns: Optional[List[List[str]]] = None
+    
+    def __len__(self) -> int:
+        return len(self.categories)
+    
+    def append(self, result: ClassificationResult) -> None:
+        self.categories.append(_CATEGORY_INDEX[result.category])
+        self.relevant.append(1 if result.is_relevant else 0)
+        self.legal_scores.append(result.legal_score)
+        self.recruitment_scores.append(result.recruitment_score)
+        self.combined_scores.append(result.combined_score)
+        self.confidences.append(result.confidence)
+        self.exclusion_reasons.append(result.exclusion_reason)
+        if self.matched_patterns is not None:
+            self.matched_patterns.append(result.matched_patterns)
+    
+    def extend(self, other: "BatchClassification") -> None:
+        self.categories.extend(other.categories)
+        self.relevant.extend(other.relevant)
+        self.legal_scores.extend(other.legal_scores)
+        self.recruitment_scores.extend(other.recruitment_scores)
+        self.combined_scores.extend(other.combined_scores)
+        self.confidences.extend(other.confidences)
+        self.exclusion_reasons.extend(other.exclusion_reasons)
+        if self.matched_patterns is not None:
+            self.matched_patterns.extend(other.matched_patterns or [[] for _ in range(len(other))])
+    
+    def category(self, i: int) -> PostCategory:
+        return CATEGORY_CODES[self.categories[i]]
+    
+    def result(self, i: int) -> ClassificationResult:
+        """Row ``i`` as a :class:`ClassificationResult`."""
+        return ClassificationResult(
+            category=self.category(i),
+            is_relevant=bool(self.relevant[i]),
+            legal_score=self.legal_scores[i],
+            recruitment_score=self.recruitment_scores[i],
+            combined_score=self.combined_scores[i],
+            exclusion_reason=self.exclusion_reasons[i],
+            matched_patterns=list(self.matched_patterns[i]) if self.matched_patterns is not None else [],
+            confidence=self.confidences[i],
+        )
+    
+    def relevant_indices(self) -> List[int]:
+        return [i for i, flag in enumerate(self.relevant) if flag]
+    
+    def category_counts(self) -> Dict[str, int]:
+        counts = [0] * len(CATEGORY_CODES)
+        for code in self.categories:
+            counts[code] += 1
+        return {str(c): n for c, n in zip(CATEGORY_CODES, counts) if n}
+
+
 # =============================================================================
 # UNIFIED KEYWORD LISTS
 # =============================================================================
@@ -352,17 +439,123 @@ def _compile_patterns() -> Dict[str, re.Pattern]:
         escaped = [re.escape(p) for p in patterns]
         return re.compile(r"\b(" + "|".join(escaped) + r")\b", re.IGNORECASE)
     
-    return {
-        "legal_roles": compile_set(LEGAL_ROLES),
-        "legal_stems": compile_set(LEGAL_STEMS),
-        "recruitment_signals": compile_set(RECRUITMENT_SIGNALS),
-        "internal_recruitment": compile_set(INTERNAL_RECRUITMENT_PATTERNS),
-        "agency": compile_set(AGENCY_PATTERNS),
-        "external": compile_set(EXTERNAL_RECRUITMENT_PATTERNS),
-        "non_recruitment": compile_set(NON_RECRUITMENT_PATTERNS),
-        "stage_alternance": compile_set(STAGE_ALTERNANCE_PATTERNS),
-        "freelance": compile_set(FREELANCE_PATTERNS),
-    }
+    return {name: compile_set(patterns) for name, patterns in _PATTERN_SETS.items()}
+
+
+_PATTERN_SETS: Dict[str, FrozenSet[str]] = {
+    "legal_roles": LEGAL_ROLES,
+    "legal_stems": LEGAL_STEMS,
+    "recruitment_signals": RECRUITMENT_SIGNALS,
+    "internal_recruitment": INTERNAL_RECRUITMENT_PATTERNS,
+    "agency": AGENCY_PATTERNS,
+    "external": EXTERNAL_RECRUITMENT_PATTERNS,
+    "non_recruitment": NON_RECRUITMENT_PATTERNS,
+    "stage_alternance": STAGE_ALTERNANCE_PATTERNS,
+    "freelance": FREELANCE_PATTERNS,
+}
+# re.IGNORECASE also matches these against an ASCII letter of the patterns
+# (and lower() turns "İ" into "i" + U+0307): fold them so every regex match
+# is also a literal occurrence in the folded text.
+_PREFILTER_FOLD = str.maketrans({"\u0131": "i", "\u017f": "s", "\u0307": None})
+
+
+def _fold(text: str) -> str:
+    text = text.lower()
+    if "\u0131" in text or "\u017f" in text or "\u0307" in text:
+        text = text.translate(_PREFILTER_FOLD)
+    return text
+
+
+_CATEGORY_BITS: Dict[str, int] = {name: 1 << i for i, name in enumerate(_PATTERN_SETS)}
+
+
+@lru_cache(maxsize=1)
+def _compile_prefilter():
+    """Automaton over every pattern literal -> bitmask of its categories.
+    
+    ``None`` without pyahocorasick: the category regexes then scan the whole
+    text, as before.
+    """
+    if _ahocorasick is None:
+        return None
+    bits: Dict[str, int] = {}
+    for name, patterns in _PATTERN_SETS.items():
+        for pattern in patterns:
+            key = _fold(pattern)
+            bits[key] = bits.get(key, 0) | _CATEGORY_BITS[name]
+    automaton = _ahocorasick.Automaton()
+    for key, mask in bits.items():
+        automaton.add_word(key, mask)
+    automaton.make_automaton()
+    return automaton
+
+
+def _prescan(text: str, author: str, company: str) -> Tuple[Optional[int], Optional[int]]:
+    """Categories whose literals occur in ``text`` and in text+author+company.
+    
+    A category regex can only match where one of its literals occurs, so a
+    category missing from the mask is skipped without running its regex.
+    ``(None, None)`` when the automaton is unavailable (every regex runs).
+    """
+    automaton = _compile_prefilter()
+    if automaton is None:
+        return None, None
+    folded = _fold(text)
+    full = f"{folded} {_fold(author)} {_fold(company)}"
+    in_text = in_full = 0
+    text_end = len(folded)
+    for end, mask in automaton.iter(full):
+        in_full |= mask
+        if end < text_end:
+            in_text |= mask
+    return in_text, in_full
+
+
+def _post_fields(post: Any) -> Tuple[str, str, str]:
+    """(text, author, company) of a text, tuple, mapping or post object."""
+    if isinstance(post, str):
+        return post, "", ""
+    if isinstance(post, tuple):
+        text, author, company = (post + ("", ""))[:3]
+    elif isinstance(post, Mapping):
+        text, author, company = post.get("text"), post.get("author"), post.get("company")
+    else:
+        text = getattr(post, "text", "")
+        author = getattr(post, "author", "")
+        company = getattr(post, "company", "")
+    return text or "", author or "", company or ""
+
+
+def _classify_rows(config: "UnifiedFilterConfig", rows: List[Tuple[str, str, str]],
+                   with_matches: bool) -> BatchClassification:
+    """Classify ``rows`` in order; identical posts are classified once."""
+    batch = BatchClassification(matched_patterns=[] if with_matches else None)
+    seen: Dict[Tuple[str, str, str], ClassificationResult] = {}
+    for row in rows:
+        result = seen.get(row)
+        if result is None:
+            result = seen[row] = config.classify_post(*row)
+        batch.append(result)
+    return batch
+
+
+@lru_cache(maxsize=1)
+def _lists_hash() -> str:
+    """Hash of every pattern set (part of the config hash, so of cache keys)."""
+    return hashlib.md5(
+        json.dumps({name: sorted(patterns) for name, patterns in _PATTERN_SETS.items()},
+                   ensure_ascii=False, sort_keys=True).encode()
+    ).hexdigest()[:8]
+
+
+def _result_to_cache(result: ClassificationResult) -> Dict[str, Any]:
+    data = asdict(result)
+    data["category"] = result.category.value
+    return data
+
+
+def _result_from_cache(data: Dict[str, Any]) -> ClassificationResult:
+    return ClassificationResult(**{**data, "category": PostCategory(data["category"])})
 
 
 # =============================================================================
@@ -408,13 +601,17 @@ class UnifiedFilterConfig:
         matches = pattern.findall(text)
         return len(matches), list(set(matches))
     
-    def _calculate_legal_score(self, text: str) -> Tuple[float, List[str]]:
+    def _match(self, text: str, name: str, present: Optional[int]) -> Tuple[int, List[str]]:
+        """:meth:`_count_matches` for category ``name``, unless the prescan ruled it out."""
+        if present is not None and not present & _CATEGORY_BITS[name]:
+            return 0, []
+        return self._count_matches(text, self._get_patterns()[name])
+    
+    def _calculate_legal_score(self, text: str, present: Optional[int] = None) -> Tuple[float, List[str]]:
         """Calculate legal relevance score (0-1)."""
-        patterns = self._get_patterns()
-        
         # Count role matches
-        role_count, role_matches = self._count_matches(text, patterns["legal_roles"])
-        stem_count, stem_matches = self._count_matches(text, patterns["legal_stems"])
+        role_count, role_matches = self._match(text, "legal_roles", present)
+        stem_count, stem_matches = self._match(text, "legal_stems", present)
         
         # Role matches are worth more than stems
         score = min(1.0, (role_count * 0.3) + (stem_count * 0.1))
@@ -425,57 +622,55 @@ class UnifiedFilterConfig:
         
         return score, role_matches + stem_matches
     
-    def _calculate_recruitment_score(self, text: str) -> Tuple[float, List[str]]:
+    def _calculate_recruitment_score(self, text: str, present: Optional[int] = None) -> Tuple[float, List[str]]:
         """Calculate recruitment signal score (0-1)."""
-        patterns = self._get_patterns()
-        
         # General recruitment signals
-        signal_count, signal_matches = self._count_matches(text, patterns["recruitment_signals"])
+        signal_count, signal_matches = self._match(text, "recruitment_signals", present)
         
         # Internal recruitment (stronger signal)
-        internal_count, internal_matches = self._count_matches(text, patterns["internal_recruitment"])
+        internal_count, internal_matches = self._match(text, "internal_recruitment", present)
         
         score = min(1.0, (signal_count * 0.15) + (internal_count * 0.35))
         
         return score, signal_matches + internal_matches
     
-    def _check_exclusions(self, text: str, author: str = "", company: str = "") -> Tuple[bool, PostCategory, str, List[str]]:
+    def _check_exclusions(self, text: str, author: str = "", company: str = "",
+                          present: Optional[int] = None) -> Tuple[bool, PostCategory, str, List[str]]:
         """Check if post should be excluded.
         
         Returns:
             (is_excluded, category, reason, matched_patterns)
         """
-        patterns = self._get_patterns()
         full_text = f"{text} {author} {company}".lower()
         
         # Check stage/alternance
         if self.exclude_stage_alternance:
-            count, matches = self._count_matches(full_text, patterns["stage_alternance"])
+            count, matches = self._match(full_text, "stage_alternance", present)
             # Except if it says "hors stage" or "pas de stage"
             if count > 0 and "hors stage" not in full_text and "pas de stage" not in full_text:
                 return True, PostCategory.STAGE_ALTERNANCE, "Stage/Alternance/VIE", matches
         
         # Check agency
         if self.exclude_agencies:
-            count, matches = self._count_matches(full_text, patterns["agency"])
+            count, matches = self._match(full_text, "agency", present)
             if count >= 2:  # Need at least 2 matches to be sure
                 return True, PostCategory.AGENCY, "Cabinet de recrutement", matches
         
         # Check external recruitment
         if self.exclude_external:
-            count, matches = self._count_matches(full_text, patterns["external"])
+            count, matches = self._match(full_text, "external", present)
             if count > 0:
                 return True, PostCategory.EXTERNAL, "Recrutement externe", matches
         
         # Check freelance
         if self.exclude_freelance:
-            count, matches = self._count_matches(full_text, patterns["freelance"])
+            count, matches = self._match(full_text, "freelance", present)
             if count >= 2:  # Author might mention "ex-freelance"
                 return True, PostCategory.FREELANCE, "Freelance/Indépendant", matches
         
         # Check non-recruitment content
         if self.exclude_non_recruitment:
-            count, matches = self._count_matches(full_text, patterns["non_recruitment"])
+            count, matches = self._match(full_text, "non_recruitment", present)
             if count >= 3:  # Multiple signals needed
                 return True, PostCategory.NON_RECRUITMENT, "Contenu non-recrutement", matches
         
@@ -499,10 +694,12 @@ class UnifiedFilterConfig:
             ClassificationResult with full details
         """
         all_matched: List[str] = []
+        # One scan tells which category regexes can match at all
+        in_text, in_full = _prescan(text, author, company)
         
         # Check exclusions first
         is_excluded, excl_category, excl_reason, excl_matches = self._check_exclusions(
-            text, author, company)
+            text, author, company, in_full)
         
         if is_excluded:
             return ClassificationResult(
@@ -517,8 +714,8 @@ class UnifiedFilterConfig:
             )
         
         # Calculate scores
-        legal_score, legal_matches = self._calculate_legal_score(text)
-        recruit_score, recruit_matches = self._calculate_recruitment_score(text)
+        legal_score, legal_matches = self._calculate_legal_score(text, in_text)
+        recruit_score, recruit_matches = self._calculate_recruitment_score(text, in_text)
         all_matched.extend(legal_matches)
         all_matched.extend(recruit_matches)
         
@@ -564,6 +761,34 @@ class UnifiedFilterConfig:
             confidence=confidence,
         )
     
+    def classify_batch(self, posts: Iterable[Any], *, workers: int = 1,
+                       chunk_size: int = 2000, with_matches: bool = False) -> BatchClassification:
+        """Classify many posts, e.g. to re-score stored posts after a list change.
+        
+        Args:
+            posts: Texts, ``(text, author, company)`` tuples, mappings or
+                objects with ``text`` / ``author`` / ``company``
+            workers: Process pool size; batches larger than ``chunk_size``
+                are split across it (1 = classify in this process)
+            chunk_size: Posts per pool task
+            with_matches: Also keep each post's matched patterns
+            
+        Returns:
+            BatchClassification, row ``i`` for ``posts[i]``. Identical posts
+            are classified once.
+        """
+        rows = [_post_fields(post) for post in posts]
+        if workers <= 1 or len(rows) <= chunk_size:
+            return _classify_rows(self, rows, with_matches)
+        
+        chunks = [rows[i:i + chunk_size] for i in range(0, len(rows), chunk_size)]
+        batch = BatchClassification(matched_patterns=[] if with_matches else None)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(_classify_rows, repeat(self), chunks, repeat(with_matches)):
+                batch.extend(part)
+        logger.debug("classify_batch_done", posts=len(rows), workers=workers, chunks=len(chunks))
+        return batch
+    
     def get_config_hash(self) -> str:
         """Get hash of current configuration for versioning."""
         config_dict = {
@@ -573,14 +798,10 @@ class UnifiedFilterConfig:
             "flags": (self.exclude_stage_alternance, self.exclude_agencies, 
                      self.exclude_external, self.exclude_non_recruitment,
                      self.exclude_freelance),
-            "lists_hash": hashlib.md5(
-                json.dumps([
-                    sorted(LEGAL_ROLES),
-                    sorted(AGENCY_PATTERNS),
-                    sorted(STAGE_ALTERNANCE_PATTERNS),
-                ], ensure_ascii=False).encode()
-            ).hexdigest()[:8],
+            "lists_hash": _lists_hash(),
         }
+        if self.custom_exclusions or self.custom_inclusions:
+            config_dict["custom"] = (sorted(self.custom_exclusions), sorted(self.custom_inclusions))
         return hashlib.md5(
             json.dumps(config_dict, sort_keys=True).encode()
         ).hexdigest()[:16]
@@ -639,16 +860,33 @@ def reset_filter_config() -> None:
     global _config_instance
     _config_instance = None
     _compile_patterns.cache_clear()
+    _compile_prefilter.cache_clear()
+    _lists_hash.cache_clear()
 
 
 def classify_post(text: str, author: str = "", company: str = "") -> ClassificationResult:
-    """Convenience function to classify a post."""
-    return get_filter_config().classify_post(text, author, company)
+    """Convenience function to classify a post.
+    
+    Results are memoized by (content hash, config hash), see filters.cache.
+    """
+    config = get_filter_config()
+    return get_classification_cache("unified").get_or_compute(
+        (text, author, company),
+        config.get_config_hash(),
+        lambda: config.classify_post(text, author, company),
+        encode=_result_to_cache,
+        decode=_result_from_cache,
+    )
 
 
 def is_relevant_post(text: str, author: str = "", company: str = "") -> bool:
     """Convenience function to check if post is relevant."""
-    return get_filter_config().classify_post(text, author, company).is_relevant
+    return classify_post(text, author, company).is_relevant
+
+
+def classify_batch(posts: Iterable[Any], **kwargs: Any) -> BatchClassification:
+    """Convenience function to classify many posts (see UnifiedFilterConfig.classify_batch)."""
+    return get_filter_config().classify_batch(posts, **kwargs)
 
 
 # =============================================================================
@@ -670,10 +908,13 @@ __all__ = [
     # Core
     "UnifiedFilterConfig",
     "ClassificationResult", 
+    "BatchClassification",
     "PostCategory",
+    "CATEGORY_CODES",
     "get_filter_config",
     "reset_filter_config",
     "classify_post",
+    "classify_batch",
     "is_relevant_post",
     
     # Pattern sets
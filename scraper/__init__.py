@@ -23,55 +23,70 @@ USAGE:
     from scraper.diagnostics import run_full_diagnostic
 """
 
-from . import utils  # noqa: F401 (expose utilitaires de haut niveau si nécessaire)
-from . import legal_filter  # noqa: F401 (expose le filtre juridique)
-from . import legal_classifier  # noqa: F401 (expose le classificateur)
+import importlib
+from typing import TYPE_CHECKING
+
+# Les exports sont chargés à la demande (PEP 562): `import scraper.legal_filter`
+# ne doit pas payer l'import de bootstrap (pydantic, redis, user_agents...).
+# Mesurer: python -X importtime -c "import scraper.legal_filter"
+_LAZY_EXPORTS = {
+    # Legal filter
+    "is_legal_job_post": "legal_filter",
+    "FilterResult": "legal_filter",
+    "FilterConfig": "legal_filter",
+    "DEFAULT_FILTER_CONFIG": "legal_filter",
+    # Bootstrap
+    "build_filter_config": "bootstrap",
+    "FilterSessionStats": "bootstrap",
+    # Legal classifier
+    "classify_legal_post": "legal_classifier",
+    "LegalClassification": "legal_classifier",
+    "LEGAL_ROLE_KEYWORDS": "legal_classifier",
+    # LinkedIn analyzer
+    "LinkedInPostAnalyzer": "linkedin",
+    "PostAnalysisResult": "linkedin",
+    "AuthorType": "linkedin",
+    "PostRelevance": "linkedin",
+    "is_relevant_for_titan": "linkedin",
+    "get_post_summary": "linkedin",
+    # Stats
+    "ScraperStats": "stats",
+    "SessionReport": "stats",
+    "log_filtering_decision": "stats",
+    "EXCLUSION_CATEGORIES": "stats",
+}
+# linkedin / stats dépendent de filters: absents si filters n'est pas accessible
+_OPTIONAL_MODULES = {"linkedin", "stats"}
 
-# Expose les éléments clés du filtre légal pour faciliter l'import
-from .legal_filter import (  # noqa: F401
-    is_legal_job_post,
-    FilterResult,
-    FilterConfig,
-    DEFAULT_FILTER_CONFIG,
-)
 
-# Expose le helper de configuration depuis bootstrap
-from .bootstrap import (  # noqa: F401
-    build_filter_config,
-    FilterSessionStats,
-)
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module = importlib.import_module(f".{module_name}", __name__)
+    except ImportError:
+        if module_name in _OPTIONAL_MODULES:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+        raise
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
 
-# Expose le classificateur
-from .legal_classifier import (  # noqa: F401
-    classify_legal_post,
-    LegalClassification,
-    LEGAL_ROLE_KEYWORDS,
-)
 
-# Expose le module LinkedIn
-try:
+if TYPE_CHECKING:  # pragma: no cover
+    from .bootstrap import FilterSessionStats, build_filter_config  # noqa: F401
+    from .legal_classifier import LEGAL_ROLE_KEYWORDS, LegalClassification, classify_legal_post  # noqa: F401
+    from .legal_filter import DEFAULT_FILTER_CONFIG, FilterConfig, FilterResult, is_legal_job_post  # noqa: F401
     from .linkedin import (  # noqa: F401
+        AuthorType,
         LinkedInPostAnalyzer,
         PostAnalysisResult,
-        AuthorType,
         PostRelevance,
-        is_relevant_for_titan,
         get_post_summary,
+        is_relevant_for_titan,
     )
-except ImportError:
-    # Fallback si filters n'est pas accessible
-    pass
-
-# Expose le module de stats
-try:
-    from .stats import (  # noqa: F401
-        ScraperStats,
-        SessionReport,
-        log_filtering_decision,
-        EXCLUSION_CATEGORIES,
-    )
-except ImportError:
-    pass
+    from .stats import EXCLUSION_CATEGORIES, ScraperStats, SessionReport, log_filtering_decision  # noqa: F401
 
 __all__ = [
     # Legal filter
@@ -0,0 +1,176 @@
+"""Parallel batch runner for full-database scoring jobs.
+
+Backfills (recruitment scores, company derivation, classifier reports) all
+follow the same shape: read posts, run a pure-Python function on each, write
+something back. :func:`run_batches` does that for any such job:
+
+- rows are streamed from SQLite in keyset order (``rowid > :after ... LIMIT
+  :limit``), one chunk at a time, so memory stays flat;
+- chunks are scored in a ``ProcessPoolExecutor`` (``workers > 1``) or inline,
+  with at most ``2 * workers`` chunks in flight;
+- results are handed back to the calling process in read order and written by
+  a single writer (``write(conn, results)``), one commit per chunk, so SQLite
+  never sees concurrent writers and an interrupted job keeps what it wrote;
+- progress (rows, rows/sec) is reported every ``progress_every`` seconds.
+
+    stats = run_batches(
+        db_path,
+        "SELECT rowid, id, text FROM posts WHERE rowid > :after ORDER BY rowid LIMIT :limit",
+        score=_score_chunk,            # top-level function: list[row] -> list[result]
+        write=_write_chunk,            # (conn, list[result]) -> rows written
+        workers=4,
+    )
+
+The first selected column must be the rowid; ``score`` must be a module-level
+function so it can be sent to worker processes.
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import sys
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
+
+import structlog
+
+logger = structlog.get_logger(__name__).bind(component="batch_runner")
+
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_PROGRESS_SECONDS = 2.0
+
+ScoreFn = Callable[[List[tuple]], List[Any]]
+WriteFn = Callable[[sqlite3.Connection, List[Any]], int]
+
+
+@dataclass
+class BatchRunStats:
+    """Totals of one :func:`run_batches` call."""
+    label: str
+    rows: int = 0
+    written: int = 0
+    chunks: int = 0
+    workers: int = 1
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "label": self.label,
+            "rows": self.rows,
+            "written": self.written,
+            "chunks": self.chunks,
+            "workers": self.workers,
+            "elapsed": round(self.elapsed, 3),
+            "rows_per_sec": round(self.rows_per_sec, 1),
+        }
+
+
+def default_workers() -> int:
+    """``BATCH_WORKERS`` env var, else the number of CPUs."""
+    try:
+        return max(1, int(os.environ.get("BATCH_WORKERS") or (os.cpu_count() or 1)))
+    except ValueError:
+        return os.cpu_count() or 1
+
+
+def print_progress(stats: BatchRunStats) -> None:
+    print(
+        f"[{stats.label}] rows={stats.rows} written={stats.written} "
+        f"rate={stats.rows_per_sec:.0f}/s elapsed={stats.elapsed:.1f}s",
+        file=sys.stderr,
+        flush=True,
+    )
+
+
+def run_batches(
+    sqlite_path: str,
+    select_sql: str,
+    *,
+    score: ScoreFn,
+    write: Optional[WriteFn] = None,
+    params: Optional[Dict[str, Any]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    label: str = "batch",
+    progress: Optional[Callable[[BatchRunStats], None]] = print_progress,
+    progress_every: float = DEFAULT_PROGRESS_SECONDS,
+    conn: Optional[sqlite3.Connection] = None,
+) -> BatchRunStats:
+    """Stream ``select_sql`` rows through ``score`` and hand results to ``write``.
+
+    Args:
+        sqlite_path: Database path (ignored when ``conn`` is given)
+        select_sql: Keyset query using ``:after`` and ``:limit``; first column is the rowid
+        score: Module-level function scoring a chunk of rows
+        write: Called in the calling process, in read order, once per chunk;
+            returns the number of rows it wrote. A commit follows each call.
+        params: Extra named parameters for ``select_sql``
+        workers: Process count (None = :func:`default_workers`, 1 = inline)
+        chunk_size: Rows per chunk
+        progress: Called with running totals every ``progress_every`` seconds
+            and once at the end (None = silent)
+    """
+    workers = default_workers() if workers is None else max(1, workers)
+    stats = BatchRunStats(label=label, workers=workers)
+    own_conn = conn is None
+    if conn is None:
+        conn = sqlite3.connect(sqlite_path)
+    start = time.perf_counter()
+    last_report = start
+
+    def _chunks():
+        after = 0
+        while True:
+            rows = conn.execute(select_sql, {**(params or {}), "after": after, "limit": chunk_size}).fetchall()
+            if not rows:
+                return
+            after = rows[-1][0]
+            yield rows
+
+    def _consume(rows: Sequence[tuple], results: List[Any]) -> None:
+        nonlocal last_report
+        if write is not None:
+            stats.written += max(write(conn, results) or 0, 0)
+            conn.commit()
+        stats.rows += len(rows)
+        stats.chunks += 1
+        now = time.perf_counter()
+        stats.elapsed = now - start
+        if progress is not None and now - last_report >= progress_every:
+            last_report = now
+            progress(stats)
+
+    try:
+        if workers == 1:
+            for rows in _chunks():
+                _consume(rows, score(rows))
+        else:
+            pending: Deque[tuple[Sequence[tuple], Future]] = deque()
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for rows in _chunks():
+                    pending.append((rows, pool.submit(score, rows)))
+                    # Bounded read-ahead; results are written in read order
+                    while len(pending) >= 2 * workers:
+                        done_rows, fut = pending.popleft()
+                        _consume(done_rows, fut.result())
+                while pending:
+                    done_rows, fut = pending.popleft()
+                    _consume(done_rows, fut.result())
+    finally:
+        stats.elapsed = time.perf_counter() - start
+        if own_conn:
+            conn.close()
+    if progress is not None:
+        progress(stats)
+    logger.info("batch_run_done", **stats.as_dict())
+    return stats
+
+
+__all__ = ["BatchRunStats", "run_batches", "default_workers", "print_progress", "DEFAULT_CHUNK_SIZE"]
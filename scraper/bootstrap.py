@@ -156,6 +156,8 @@ class Settings(BaseSettings):
             return os.path.join(base, "fallback.sqlite3")
     
     sqlite_path: str = Field(default_factory=lambda: Settings._default_sqlite_path(), alias="SQLITE_PATH")
+    # Long-lived WAL connections kept per database file (see scraper.repository)
+    sqlite_pool_size: int = Field(4, alias="SQLITE_POOL_SIZE")
     csv_fallback_file: str = Field("exports/fallback_posts.csv", alias="CSV_FALLBACK_FILE")
 
     # Auth (optional internal)
@@ -316,6 +318,11 @@ class Settings(BaseSettings):
     # Content filters: exclude job-seeker posts, enforce France locale
     filter_exclude_job_seekers: bool = Field(True, alias="FILTER_EXCLUDE_JOB_SEEKERS")
     filter_france_only: bool = Field(True, alias="FILTER_FRANCE_ONLY")
+    # Long-lived scraper subprocess (warm interpreter + browser between batches), recycled
+    # after N jobs or above a memory ceiling (MB, 0 = no ceiling). Disabled = one cold subprocess per batch.
+    scraper_server_enabled: bool = Field(True, alias="SCRAPER_SERVER_ENABLED")
+    scraper_server_max_jobs: int = Field(20, alias="SCRAPER_SERVER_MAX_JOBS")
+    scraper_server_max_rss_mb: int = Field(1500, alias="SCRAPER_SERVER_MAX_RSS_MB")
     # Hard disable flag (dev reload, maintenance). If true we never start scraping even if runtime toggle tries to enable it.
     disable_scraper: bool = Field(False, alias="DISABLE_SCRAPER")
     # When true, automatically disable scraper if a live reload environment is detected (uvicorn --reload)
@@ -522,6 +529,21 @@ SCRAPE_JOB_FAILURES = Counter(
 SCRAPE_STEP_DURATION = Histogram(
     "scrape_step_duration_seconds", "Duration of internal scrape steps", labelnames=("step",)
 )
+# Per-keyword pipeline stage time: subprocess stages (navigation, extraction,
+# prequalify, dedup, filter_*, ...) arrive as "spans" records on the result
+# stream, worker stages (filter_classify, storage, broadcast) are timed per batch
+SCRAPE_STAGE_DURATION = Histogram(
+    "scrape_stage_duration_seconds",
+    "Time spent in each scraping pipeline stage, per keyword",
+    labelnames=("stage", "keyword"),
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+SQLITE_QUERY_DURATION = Histogram(
+    "sqlite_query_duration_seconds", "Execution time of SQLite repository calls (off event loop)", labelnames=("query",)
+)
+SQLITE_QUERY_WAIT = Histogram(
+    "sqlite_query_wait_seconds", "Time SQLite repository calls spent queued for a worker thread", labelnames=("query",)
+)
 
 # Rate limit metrics
 SCRAPE_RATE_LIMIT_WAIT = Counter(
@@ -0,0 +1,185 @@
+"""Materialized per-day aggregates of the posts table.
+
+``/api/daily_summary`` used to load every post of the day and re-run the
+opportunity / contract-status heuristics in Python, and ``fetch_meta`` /
+``/health`` ran a ``COUNT(*)`` with a LEFT JOIN on every poll. The
+``daily_stats`` table holds those counters instead:
+
+    day   'YYYY-MM-DD' (prefix of posts.collected_at) or '*' for all time
+    dim   total | demo | opportunities | favorites_auto | favorites_manual
+          | company | status
+    key   '' for plain counters, the company / contract status otherwise
+    count number of live (not soft-deleted) posts in that bucket
+
+Counters are maintained incrementally by triggers on ``posts`` and
+``post_flags``: every write path (worker ``store_posts`` and its
+auto-favorites, the flag endpoints, purges, display backfills) applies
+"minus the row's old contribution, plus its new one" inside its own
+transaction, so readers answer from a handful of rows whatever the table size.
+:func:`rebuild_daily_stats` recomputes everything from scratch (migration,
+repairs).
+"""
+from __future__ import annotations
+
+import sqlite3
+from typing import Any
+
+from .display_fields import CONTRACT_STATUSES
+
+DAILY_STATS_TABLE = "daily_stats"
+ALL_TIME = "*"
+
+# A favorite set within this many seconds of collection was set by the worker
+# (AUTO_FAVORITE_OPPORTUNITIES), anything else by a user.
+AUTO_FAVORITE_WINDOW_SECONDS = 3
+
+_AUTO_FAVORITE = (
+    f"COALESCE(abs(julianday(f.favorite_at) - julianday(p.collected_at)) * 86400 <= {AUTO_FAVORITE_WINDOW_SECONDS}, 0)"
+)
+
+# (dim, key expression, condition, scopes). Expressions see the post as ``p``
+# and its flags as ``f``; "day" buckets by collected_at date, "all" is '*'.
+_DIMENSIONS: list[tuple[str, str, str, tuple[str, ...]]] = [
+    ("total", "''", "1", ("day", "all")),
+    ("demo", "''", "(LOWER(p.author) = 'demo_recruteur' OR LOWER(p.keyword) = 'demo_recruteur')", ("all",)),
+    ("opportunities", "''", "p.opportunity = 1", ("day",)),
+    ("favorites_auto", "''", f"f.is_favorite = 1 AND {_AUTO_FAVORITE}", ("day",)),
+    ("favorites_manual", "''", f"f.is_favorite = 1 AND NOT {_AUTO_FAVORITE}", ("day",)),
+    ("company", "TRIM(p.company)", "TRIM(p.company) <> ''", ("day",)),
+] + [
+    ("status", f"'{s}'", f"instr(', ' || p.status || ', ', ', {s}, ') > 0", ("day",))
+    for s in CONTRACT_STATUSES
+]
+
+# Post columns the counters depend on (posts UPDATE trigger watches these).
+_POST_COLUMNS = ("id", "collected_at", "author", "keyword", "company", "status", "opportunity")
+_FLAG_COLUMNS = ("is_favorite", "is_deleted", "favorite_at")
+
+
+def _contribution_select(source: str, sign: int, where: str = "1") -> str:
+    """UNION ALL of (day, dim, key, n) rows a post contributes, for each post in ``source``."""
+    live = f"COALESCE(f.is_deleted, 0) = 0 AND ({where})"
+    parts = []
+    for dim, key, cond, scopes in _DIMENSIONS:
+        for scope in scopes:
+            day = "COALESCE(substr(p.collected_at, 1, 10), '')" if scope == "day" else f"'{ALL_TIME}'"
+            parts.append(f"SELECT {day} AS day, '{dim}' AS dim, {key} AS key, {sign} AS n FROM {source} WHERE {live} AND {cond}")
+    return "\nUNION ALL ".join(parts)
+
+
+def _post_row(ref: str) -> str:
+    return "(SELECT " + ", ".join(f"{ref}.{c} AS {c}" for c in _POST_COLUMNS) + ") p"
+
+
+def _flag_row(ref: str | None) -> str:
+    if ref is None:
+        return "(SELECT " + ", ".join(f"NULL AS {c}" for c in _FLAG_COLUMNS) + ") f"
+    return "(SELECT " + ", ".join(f"{ref}.{c} AS {c}" for c in _FLAG_COLUMNS) + ") f"
+
+
+def _apply(select: str) -> str:
+    return (
+        f"INSERT INTO {DAILY_STATS_TABLE}(day, dim, key, count) {select}\n"
+        "ON CONFLICT(day, dim, key) DO UPDATE SET count = count + excluded.count;"
+    )
+
+
+def _trigger(name: str, event: str, table: str, *selects: str) -> str:
+    body = "\n".join(_apply(s) for s in selects)
+    return f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON {table} BEGIN\n{body}\nEND"
+
+
+def _ddl() -> list[str]:
+    with_flags = "LEFT JOIN post_flags f ON f.post_id = p.id"
+    return [
+        f"""CREATE TABLE IF NOT EXISTS {DAILY_STATS_TABLE} (
+        day TEXT NOT NULL,
+        dim TEXT NOT NULL,
+        key TEXT NOT NULL DEFAULT '',
+        count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, dim, key)
+        ) WITHOUT ROWID""",
+        _trigger(
+            "daily_stats_posts_ai", "INSERT", "posts",
+            _contribution_select(f"{_post_row('new')} {with_flags}", 1),
+        ),
+        _trigger(
+            "daily_stats_posts_ad", "DELETE", "posts",
+            _contribution_select(f"{_post_row('old')} {with_flags}", -1),
+        ),
+        _trigger(
+            "daily_stats_posts_au", "UPDATE OF " + ", ".join(_POST_COLUMNS[1:]), "posts",
+            _contribution_select(f"{_post_row('old')} {with_flags}", -1),
+            _contribution_select(f"{_post_row('new')} {with_flags}", 1),
+        ),
+        _trigger(
+            "daily_stats_flags_ai", "INSERT", "post_flags",
+            _contribution_select(f"posts p, {_flag_row(None)}", -1, "p.id = new.post_id"),
+            _contribution_select(f"posts p, {_flag_row('new')}", 1, "p.id = new.post_id"),
+        ),
+        _trigger(
+            "daily_stats_flags_au", "UPDATE", "post_flags",
+            _contribution_select(f"posts p, {_flag_row('old')}", -1, "p.id = old.post_id"),
+            _contribution_select(f"posts p, {_flag_row('new')}", 1, "p.id = new.post_id"),
+        ),
+        _trigger(
+            "daily_stats_flags_ad", "DELETE", "post_flags",
+            _contribution_select(f"posts p, {_flag_row('old')}", -1, "p.id = old.post_id"),
+            _contribution_select(f"posts p, {_flag_row(None)}", 1, "p.id = old.post_id"),
+        ),
+    ]
+
+
+def install_daily_stats(conn: sqlite3.Connection) -> None:
+    """Create the aggregates table and the triggers keeping it current."""
+    for ddl in _ddl():
+        conn.execute(ddl)
+
+
+def rebuild_daily_stats(conn: sqlite3.Connection) -> None:
+    """Recompute every counter from posts / post_flags."""
+    conn.execute(f"DELETE FROM {DAILY_STATS_TABLE}")
+    conn.execute(
+        f"INSERT INTO {DAILY_STATS_TABLE}(day, dim, key, count) SELECT day, dim, key, SUM(n) FROM ("
+        + _contribution_select("posts p LEFT JOIN post_flags f ON f.post_id = p.id", 1)
+        + ") GROUP BY day, dim, key"
+    )
+
+
+def daily_summary(conn: sqlite3.Connection, day: str, top_companies: int = 5) -> dict[str, Any]:
+    """Counters of ``day`` in the /api/daily_summary shape (without the ``date`` key)."""
+    counts = {"total": 0, "opportunities": 0, "favorites_auto": 0, "favorites_manual": 0}
+    statuses: dict[str, int] = {}
+    for dim, key, n in conn.execute(
+        f"SELECT dim, key, count FROM {DAILY_STATS_TABLE} WHERE day = ? AND dim <> 'company' AND count > 0"
+        " ORDER BY count DESC, key",
+        (day,),
+    ):
+        if dim == "status":
+            statuses[key] = n
+        elif dim in counts:
+            counts[dim] = n
+    companies = conn.execute(
+        f"SELECT key, count FROM {DAILY_STATS_TABLE} WHERE day = ? AND dim = 'company' AND count > 0"
+        " ORDER BY count DESC, key LIMIT ?",
+        (day, top_companies),
+    ).fetchall()
+    return {
+        "total": counts["total"],
+        "opportunities": counts["opportunities"],
+        "favorites": counts["favorites_auto"] + counts["favorites_manual"],
+        "favorites_manual": counts["favorites_manual"],
+        "favorites_auto": counts["favorites_auto"],
+        "companies_top": [{"company": c, "count": n} for c, n in companies],
+        "status_distribution": statuses,
+    }
+
+
+def visible_posts_count(conn: sqlite3.Connection) -> int:
+    """Live posts excluding demo ones (the dashboard ``posts_count``)."""
+    row = conn.execute(
+        f"SELECT COALESCE(SUM(CASE dim WHEN 'total' THEN count ELSE -count END), 0) FROM {DAILY_STATS_TABLE}"
+        " WHERE day = ? AND dim IN ('total', 'demo') AND key = ''",
+        (ALL_TIME,),
+    ).fetchone()
+    return int(row[0] or 0)
@@ -0,0 +1,684 @@
+"""Derived display fields for stored posts (company, status, métier, opportunity, permalink).
+
+These values used to be recomputed by ``server.routes.fetch_posts`` for every
+row of every page view and export. They are now computed once, when a post is
+written (``worker._store_sqlite``), and stored in dedicated ``posts`` columns.
+Rows written before that (or by an older derivation) are refreshed by
+:func:`backfill_display_fields`, which is versioned through
+``posts.display_version``: bump :data:`DISPLAY_FIELDS_VERSION` whenever the
+heuristics below change and existing rows will be recomputed.
+"""
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+from typing import Any, Optional
+
+import structlog
+
+from . import utils
+from .patterns import PatternRegistry
+
+logger = structlog.get_logger(__name__).bind(component="display_fields")
+
+# Bump when any derivation below changes; rows with an older version are recomputed.
+DISPLAY_FIELDS_VERSION = 3
+
+# Stored columns, in the order returned by compute_display_fields().
+DISPLAY_COLUMNS = (
+    "company_display",
+    "status",
+    "metier",
+    "opportunity",
+    "permalink_canonical",
+    "author_slug",
+    "company_slug",
+    "dedup_key",
+    "display_version",
+)
+
+_ACTIVITY_RE = re.compile(r"(urn:li:activity:(\d+))|(activity/(\d+))")
+_SLUG_SEPARATORS_RE = re.compile(r"[^0-9a-z]+")
+
+# Name / company heuristics (compiled on first use)
+_PATTERNS = PatternRegistry(
+    followers=(r"\b\d[\d\s\.,]*\s*(k|m)?\s*(abonn[eé]s?|followers)\b", re.IGNORECASE),
+    followers_parenthesized=(r"\(\s*\d[\d\s\.,\u202f\u00a0]*\s*(?:k|m)?\s*(?:abonn[eé]s?|followers)\s*\)", re.IGNORECASE),
+    followers_trailing=(r"[\s\-•|·—,;:]*\d[\d\s\.,\u202f\u00a0]*\s*(?:k|m)?\s*(?:abonn[eé]s?|followers)\s*$", re.IGNORECASE),
+    at_company_loose=r'@\s*([A-Za-zÀ-ÿ][A-Za-zÀ-ÿ0-9\s&\-\.\']{2,50})',
+    at_company=r'@([A-Za-zÀ-ÿ][A-Za-zÀ-ÿ0-9\s&\'\-]{1,40})(?:\s|$|[,\.\!\?])',
+    company_recrute=r'([A-ZÀ-Ÿ][A-Za-zÀ-ÿ0-9\s&\'\-]{2,50}?)\s+(?:Paris\s+)?recrute',
+    chez_company=(r'\b(?:chez|at)\s+([A-Z][A-Za-zÀ-ÿ0-9\s&\'\-]{1,40}?)(?:\s*[,\.\!\?\-–|]|$)', re.IGNORECASE),
+    leading_emojis=r'^[🚀📢📣🔍📌💼✨👉‼️\s]+',
+    trailing_paris=(r'\s+Paris$', re.IGNORECASE),
+    law_domain=r'^[a-z]+law$',
+    trailing_recruit_words=(r'\s+(recrute|recherche|hiring|looking).*$', re.IGNORECASE),
+    # derive_company_norm (server company normalization)
+    capitalized_words=r"(?:(?:[A-Z][A-Za-z&\-]{1,}\s){0,3}[A-Z][A-Za-z&\-]{1,})",
+    company_separators=r"\s[|·•-]\s|,",
+)
+
+
+# =============================================================================
+# NAME / COMPANY HYGIENE
+# =============================================================================
+
+def dedupe_person_name(name: Optional[str]) -> str:
+    s = (name or "").strip()
+    if not s:
+        return s
+    tokens = s.split()
+    # Pattern: exact duplication like "John Doe John Doe"
+    if len(tokens) >= 2 and len(tokens) % 2 == 0:
+        half = len(tokens) // 2
+        if tokens[:half] == tokens[half:]:
+            return " ".join(tokens[:half])
+    return s
+
+
+def looks_like_followers(segment: str) -> bool:
+    seg = segment.strip().lower()
+    seg = seg.replace("\u00a0", " ").replace("\u202f", " ")
+    # Accept forms: 12 345 abonnés, 12k abonnés, 1.2m followers, 123 abonnés (singular/plural tolerant)
+    return _PATTERNS.followers.search(seg) is not None
+
+
+_COMPANY_NORM_EXCLUDE = {"freelance", "consultant", "independant", "indépendant", "recruteur"}
+
+
+def derive_company_norm(author: str, company: Optional[str], profile: Optional[str], text: Optional[str]) -> Optional[str]:
+    """Company candidate for ``posts.company_norm`` (server normalization job and endpoint).
+
+    Keeps ``company`` when it already differs from the author; otherwise the
+    first plausible segment of the profile fields or the text ("chez X",
+    separated parts, capitalized words) that is not the author.
+    """
+    try:
+        if company and company.strip() and company.strip().lower() != author.strip().lower():
+            return company
+        cand_blocks = []
+        if profile and profile.strip().startswith('{'):
+            try:
+                pobj = json.loads(profile)
+                for k in ("company", "organization", "org", "headline", "subtitle", "occupation", "title"):
+                    v = pobj.get(k)
+                    if isinstance(v, str):
+                        cand_blocks.append(v)
+            except Exception:
+                pass
+        if text:
+            cand_blocks.append(text[:240])
+        out_candidates = []
+        for raw in cand_blocks:
+            if not raw:
+                continue
+            low = raw.lower()
+            for marker in ["chez ", " at ", " @"]:
+                if marker in low:
+                    out_candidates.append(raw[low.find(marker)+len(marker):])
+            out_candidates.extend(_PATTERNS.company_separators.split(raw))
+            out_candidates.extend(_PATTERNS.capitalized_words.findall(raw))
+        author_lower = author.lower()
+        for c in out_candidates:
+            c2 = c.strip().strip('-–|·•').strip()
+            if not c2 or len(c2) < 2:
+                continue
+            low2 = c2.lower()
+            if low2 == author_lower or low2 in _COMPANY_NORM_EXCLUDE:
+                continue
+            if not any(ch.isalpha() for ch in c2):
+                continue
+            if author_lower in low2:
+                continue
+            return c2[:120]
+    except Exception:
+        return company
+    return company
+
+
+def derive_company(author: str, author_profile: Optional[str], text: Optional[str]) -> Optional[str]:
+    """Best-effort company derivation from profile/text.
+    Heuristics:
+    - Prefer author_profile; handle 'chez'/'at' patterns and common separators.
+    - Avoid returning segments that look like roles (Recruiter, Manager, etc.).
+    - Never return the author name.
+    - Fall back to scanning text for 'chez/at @Company' markers and parenthesis.
+    """
+    norm_author = (author or "").strip().lower()
+    role_keywords = {
+        "recruteur","recruiter","talent","senior","junior","stagiaire","alternant",
+        "manager","responsable","lead","engineer","ingénieur","consultant","développeur","developer",
+        "cto","ceo","cfo","cmo","rh","hr","human resources","marketing","sales","commercial",
+    }
+    company_suffixes = {"sas","sarl","sa","inc","llc","gmbh","ltd","spa","s.p.a","ag","bv","nv"}
+
+    def looks_like_role(segment: str) -> bool:
+        seg = segment.lower()
+        return any(k in seg for k in role_keywords)
+
+    def company_score(segment: str) -> int:
+        s = segment.strip()
+        score = 0
+        # bonus if contains company suffixes
+        if any(s.lower().endswith(" "+suf) or (" "+suf+" ") in s.lower() for suf in company_suffixes):
+            score += 3
+        # bonus for Title Case words
+        tokens = s.split()
+        score += sum(1 for t in tokens if t[:1].isupper())
+        # penalty if contains role
+        if looks_like_role(s):
+            score -= 2
+        return score
+
+    prof = (author_profile or "").strip()
+    if prof:
+        # Direct patterns in profile: 'chez X' / 'at X'
+        for marker in (" chez ", " at "):
+            if marker in prof.lower():
+                tail = prof.lower().split(marker, 1)[1]
+                # Recover original casing by slicing same length offset
+                start_idx = prof.lower().index(marker) + len(marker)
+                tail = prof[start_idx:].strip()
+                for stop in [" |", " -", ",", " •", " ·", " – ", " — ", "  "]:
+                    if stop in tail:
+                        tail = tail.split(stop, 1)[0].strip()
+                if 2 <= len(tail) <= 80 and tail.strip().lower() != norm_author:
+                    return tail
+        # Split on common separators and pick the most company-like segment
+        seps = [" • ", " — ", " – ", " | ", " •", "•", "—", "-", "|", "·"]
+        if any(sep in prof for sep in seps):
+            parts: list[str] = []
+            tmp = prof
+            for sep in [" • ", " — ", " – ", " | "]:
+                tmp = tmp.replace(sep, "|")
+            for sep in [" •", "•", "—", "-", "|", "·"]:
+                tmp = tmp.replace(sep, "|")
+            parts = [p.strip() for p in tmp.split("|") if p.strip()]
+            candidates = [p for p in parts if p and p.lower() != norm_author]
+            # prefer segments that don't look like roles, then by score/length
+            candidates.sort(key=lambda p: (looks_like_role(p), -company_score(p), -len(p)))
+            if candidates:
+                top = candidates[0]
+                if 2 <= len(top) <= 80 and top.lower() != norm_author:
+                    return top
+
+    # Fallback: look into text for @Company marker ONLY (not generic text extraction)
+    blob = (text or "")
+    # Content markers that indicate this is post text, not a company name
+    content_indicators = ['#', '🚀', '📢', '📍', '🔍', '📌', '💼', '!', '?', '\n', 
+                          'recrute', 'recherche', 'Cher', 'Bonjour', 'CDI', 'CDD']
+    
+    # Only extract from @Company pattern
+    at_match = _PATTERNS.at_company_loose.search(blob)
+    if at_match:
+        company = at_match.group(1).strip()
+        # Validate it's not post content
+        if not any(indicator in company for indicator in content_indicators):
+            if 2 <= len(company) <= 50 and company.lower() != norm_author:
+                return company
+    
+    # Try "chez Company" pattern with strict validation
+    for marker in [" chez ", " at "]:
+        if marker in blob.lower():
+            idx = blob.lower().index(marker)
+            tail = blob[idx + len(marker):].strip()
+            # Stop at first separator or end of line
+            for stop in [" |", " -", ",", " •", " ·", "  ", "\n", "!", "?"]:
+                if stop in tail:
+                    tail = tail.split(stop, 1)[0].strip()
+            # Strict validation
+            if 2 <= len(tail) <= 50 and tail.lower() != norm_author:
+                if not any(indicator in tail for indicator in content_indicators):
+                    return tail
+    
+    # Skip parentheses extraction - too risky for post content
+    # Last resort: inspect author string itself for patterns "Nom Prénom • Entreprise" or "Nom chez Entreprise"
+    author_clean = (author or "").strip()
+    if author_clean:
+        lc = author_clean.lower()
+        for marker in [" chez ", " at "]:
+            if marker in lc:
+                tail = author_clean[lc.index(marker)+len(marker):].strip()
+                for stop in [" |", " -", ",", " •", " ·", " —", " –", " (", "  "]:
+                    if stop in tail:
+                        tail = tail.split(stop, 1)[0].strip()
+                if 2 <= len(tail) <= 80 and tail.lower() != norm_author and not looks_like_role(tail):
+                    return tail
+        for sep in [" • ", " – ", " — ", " | ", " - "]:
+            if sep in author_clean:
+                parts = [p.strip() for p in author_clean.split(sep) if p.strip()]
+                if len(parts) >= 2:
+                    cand2 = parts[-1]
+                    if 2 <= len(cand2) <= 80 and cand2.lower() != norm_author and not looks_like_role(cand2):
+                        return cand2
+    return None
+
+
+def sanitize_company(company: Optional[str]) -> Optional[str]:
+    s = (company or "").strip()
+    if not s:
+        return None
+    # Remove common prefixes/symbols
+    if s.startswith("@"):
+        s = s[1:].strip()
+    for pref in ["chez ", "Chez ", "at ", "At "]:
+        if s.startswith(pref):
+            s = s[len(pref):].strip()
+            break
+    # Collapse excessive whitespace
+    s = " ".join(s.split())
+    # Strip trailing punctuation
+    s = s.strip("-•|·—,;: ")
+    return s or None
+
+
+def strip_followers_suffix(value: Optional[str]) -> Optional[str]:
+    s = (value or "").strip()
+    if not s:
+        return None
+    # Remove parenthesized follower counts
+    s = _PATTERNS.followers_parenthesized.sub("", s)
+    # Remove trailing segments separated by common separators
+    for sep in [" | ", " · ", " - ", " — ", " – "]:
+        parts = [p.strip() for p in s.split(sep) if p is not None]
+        if len(parts) >= 2 and looks_like_followers(parts[-1]):
+            s = sep.join(parts[:-1])
+    # Terminal follower phrase
+    s = _PATTERNS.followers_trailing.sub("", s)
+    # Leading follower phrase like "12 345 abonnés • Company"
+    if " • " in s:
+        head, tail = s.split(" • ", 1)
+        if looks_like_followers(head):
+            s = tail.strip()
+    s = " ".join(s.split())
+    s = s.strip("-•|·—,;: ")
+    return s or None
+
+
+def dedupe_repeated_phrase(value: Optional[str]) -> Optional[str]:
+    s = (value or "").strip()
+    if not s:
+        return None
+    tokens = s.split()
+    if len(tokens) % 2 == 0 and len(tokens) >= 2:
+        half = len(tokens) // 2
+        if tokens[:half] == tokens[half:]:
+            return " ".join(tokens[:half])
+    return s
+
+
+# =============================================================================
+# TEXT-DERIVED LABELS
+# =============================================================================
+
+# Labels returned by extract_contract_status, in display order.
+CONTRACT_STATUSES = ("CDI", "CDD", "Alternance", "Stage", "Freelance", "Temps plein", "Temps partiel")
+
+
+def extract_contract_status(text: Optional[str]) -> Optional[str]:
+    """Extract a contract/status label like CDI/CDD/Alternance/Freelance from the post text only.
+
+    Returns a comma-separated string in a consistent order, or None if nothing found.
+    """
+    blob = (text or "").strip()
+    if not blob:
+        return None
+    low = blob.lower()
+    found = set()
+    # Simple keyword spotting (FR + EN equivalents where useful)
+    if " cdi" in low or low.startswith("cdi") or "(cdi" in low:
+        found.add("CDI")
+    if " cdd" in low or low.startswith("cdd") or "(cdd" in low:
+        found.add("CDD")
+    if " alternance" in low or low.startswith("alternance") or "apprentissage" in low:
+        found.add("Alternance")
+    if " stage" in low or low.startswith("stage") or "internship" in low:
+        found.add("Stage")
+    if " freelance" in low or low.startswith("freelance") or "indépendant" in low or "independant" in low:
+        found.add("Freelance")
+    if "temps plein" in low or "full time" in low or "full-time" in low:
+        found.add("Temps plein")
+    if "temps partiel" in low or "part time" in low or "part-time" in low:
+        found.add("Temps partiel")
+    if not found:
+        return None
+    ordered = [x for x in CONTRACT_STATUSES if x in found]
+    return ", ".join(ordered) if ordered else None
+
+
+def extract_metier(text: Optional[str]) -> Optional[str]:
+    """Extract legal/tax job roles from post text based on curated patterns.
+
+    Returns a comma-separated label list or None.
+    """
+    blob = (text or "").lower()
+    if not blob:
+        return None
+    hits: list[str] = []
+    patterns: list[tuple[list[str], str]] = [
+        # Avocats
+        (["avocat collaborateur"], "Avocat collaborateur"),
+        (["avocat associe", "avocat associé"], "Avocat associé"),
+        (["avocat counsel", "counsel"], "Avocat counsel"),
+        (["avocat"], "Avocat"),
+        # Juristes / Legal
+        (["paralegal"], "Paralegal"),
+        (["legal counsel"], "Legal counsel"),
+        (["juriste"], "Juriste"),
+        # Management juridique
+        (["responsable juridique"], "Responsable juridique"),
+        (["directeur juridique"], "Directeur juridique"),
+        # Notariat
+        (["notaire stagiaire"], "Notaire stagiaire"),
+        (["notaire associe", "notaire associé"], "Notaire associé"),
+        (["notaire salarie", "notaire salarié"], "Notaire salarié"),
+        (["notaire assistant"], "Notaire assistant"),
+        (["clerc de notaire"], "Clerc de notaire"),
+        (["redacteur d'actes", "rédacteur d’actes", "rédacteur d'actes", "redacteur d’actes"], "Rédacteur d’actes"),
+        (["notaire"], "Notaire"),
+        # Fiscalité
+        (["responsable fiscal"], "Responsable fiscal"),
+        (["directeur fiscal"], "Directeur fiscal"),
+        (["juriste fiscaliste"], "Juriste fiscaliste"),
+        (["comptable taxateur"], "Comptable taxateur"),
+        (["formaliste"], "Formaliste"),
+    ]
+    for keys, label in patterns:
+        if any(k in blob for k in keys):
+            # avoid duplicates
+            if label not in hits:
+                hits.append(label)
+    if not hits:
+        return None
+    # Preserve pattern order; cap to 3 labels to keep UI compact
+    return ", ".join(hits[:3])
+
+
+def derive_company_strict(author: str, current_company: Optional[str], author_profile: Optional[str], text: Optional[str]) -> Optional[str]:
+    """Derive company name following strict rules:
+
+    1. If author is a company (no /in/ in profile URL, or name in all caps), return None (empty)
+    2. If author is a person, try to extract company from text using @company, chez, at patterns
+    3. Never return post content, websites, or uncertain data
+    4. If company cannot be determined with certainty, return None
+    """
+
+    if not author:
+        return None
+
+    author_clean = author.strip()
+
+    # === RULE 1: Check if author IS a company (not a person) ===
+    # If author_profile exists and has /in/, it's a person
+    # If no /in/ or no profile, check name patterns
+
+    is_company_author = False
+
+    # No profile URL or profile is not /in/ = likely a company page
+    if not author_profile or not isinstance(author_profile, str):
+        is_company_author = True
+    elif '/in/' not in author_profile:
+        is_company_author = True
+
+    # Name patterns that suggest company
+    company_name_markers = [
+        'notaires', 'notaire ', 'cabinet', 'étude', 'office', 'groupe', 'group',
+        'sas', 'sarl', 'sasu', 'eurl', 'sa ', 's.a.', 'inc', 'ltd', 'llc',
+        'associés', 'partners', 'avocats', 'conseil', 'consulting',
+    ]
+    author_lower = author_clean.lower()
+    if any(marker in author_lower for marker in company_name_markers):
+        is_company_author = True
+
+    # ALL CAPS name = likely company
+    if len(author_clean) > 3 and author_clean.isupper():
+        is_company_author = True
+
+    # More than 50% uppercase letters in a name > 5 chars = likely company
+    if len(author_clean) > 5:
+        upper_count = sum(1 for c in author_clean if c.isupper())
+        alpha_count = sum(1 for c in author_clean if c.isalpha())
+        if alpha_count > 0 and (upper_count / alpha_count) > 0.6:
+            is_company_author = True
+
+    # If author is a company, leave enterprise column empty
+    if is_company_author:
+        return None
+
+    # === RULE 2: Author is a person - try to find their company ===
+
+    # First check if we already have a valid company stored
+    if current_company and current_company.strip():
+        cc = current_company.strip()
+        # Validate it's not post content
+        if len(cc) <= 50 and cc.lower() != author_lower:
+            content_markers = ['#', '🚀', '📢', '📍', '🔍', '!', '?', '\n', 
+                              'recrute', 'recherche', 'http', 'www', '.com', '.fr']
+            if not any(m in cc for m in content_markers):
+                return cc
+
+    # === Try to extract company from text using patterns ===
+    if not text or not isinstance(text, str):
+        return None
+
+    # Pattern 1: "Company recrute" or "Company Paris recrute" 
+    # This is the most common pattern in French job posts
+    recrute_match = _PATTERNS.company_recrute.search(text)
+    if recrute_match:
+        company = recrute_match.group(1).strip()
+        # Remove leading emojis and common words
+        company = _PATTERNS.leading_emojis.sub('', company)
+        # Remove trailing "Paris" if present
+        company = _PATTERNS.trailing_paris.sub('', company)
+        if company and 2 <= len(company) <= 50 and company.lower() != author_lower:
+            # Skip if it's a pronoun or common word
+            skip_words = ['je', 'nous', 'on', 'notre', 'mon', 'l\'étude', 'l\'entreprise', 'le', 'la', 'les']
+            if company.lower() not in skip_words and not company.lower().startswith('l\''):
+                return company
+
+    # Pattern 2: @CompanyName (but not URLs like @goodwinlaw.com)
+    at_match = _PATTERNS.at_company.search(text)
+    if at_match:
+        company = at_match.group(1).strip()
+        # Skip if it looks like a URL/domain
+        if not _PATTERNS.law_domain.match(company.lower()) and '.' not in company:
+            # Clean trailing words
+            company = _PATTERNS.trailing_recruit_words.sub('', company)
+            if company and 2 <= len(company) <= 50 and company.lower() != author_lower:
+                return company
+
+    # Pattern 3: "chez Company" or "at Company"
+    chez_match = _PATTERNS.chez_company.search(text)
+    if chez_match:
+        company = chez_match.group(1).strip()
+        if company and 2 <= len(company) <= 50 and company.lower() != author_lower:
+            # Make sure it's not a job title
+            job_titles = ['notaire', 'avocat', 'juriste', 'consultant', 'manager', 'directeur']
+            if not any(company.lower().startswith(t) for t in job_titles):
+                return company
+
+    # === RULE 4: Cannot determine with certainty ===
+    return None
+
+
+def canonical_permalink(permalink: Optional[str]) -> Optional[str]:
+    """Drop query/fragment/trailing slash and normalise activity URLs to one form."""
+    perma_raw = (permalink or "").strip()
+    if not perma_raw:
+        return None
+    perma_norm = perma_raw.split('?', 1)[0].split('#', 1)[0].rstrip('/')
+    m = _ACTIVITY_RE.search(perma_norm)
+    if m:
+        act = m.group(2) or m.group(4)
+        if act:
+            perma_norm = f"https://www.linkedin.com/feed/update/urn:li:activity:{act}"
+    return perma_norm
+
+
+def account_slug(value: Optional[str]) -> Optional[str]:
+    """Comparable account key: accent-free, lowercase, words separated by single spaces.
+
+    Used on both sides of the blocked-accounts filter (``posts.author_slug`` /
+    ``posts.company_slug`` and ``blocked_accounts.slug``) so the containment
+    test runs in SQL on precomputed columns.
+    """
+    slug = _SLUG_SEPARATORS_RE.sub(" ", utils.normalize_for_search(value)).strip()
+    return slug or None
+
+
+def blocked_slug_from_url(url: str) -> str:
+    """Comparable name/slug from a LinkedIn URL.
+
+    Examples:
+     - https://www.linkedin.com/company/law-profiler/ -> "law profiler"
+     - https://www.linkedin.com/in/john-doe -> "john doe"
+    If parsing fails, returns a normalized last non-empty path segment.
+    """
+    try:
+        from urllib.parse import urlparse, unquote
+        p = urlparse(url or "")
+        parts = [seg for seg in (p.path or "").split('/') if seg]
+        slug = ""
+        if parts:
+            # Prefer segment after known prefixes like 'company' or 'in'
+            for pref in ("company", "in", "school", "pages"):
+                if pref in parts:
+                    idx = parts.index(pref)
+                    if idx + 1 < len(parts):
+                        slug = parts[idx + 1]
+                        break
+            if not slug:
+                slug = parts[-1]
+        return account_slug(unquote(slug)) or ""
+    except Exception:
+        return ""
+
+
+def dedup_key(
+    permalink_canonical: Optional[str],
+    author_slug: Optional[str],
+    published_at: Optional[str],
+    author: Optional[str],
+    text: Optional[str],
+) -> str:
+    """Canonical duplicate key enforced by ``uniq_posts_dedup_key``.
+
+    Canonical permalink first; else author + publication date; else author +
+    content fingerprint (same precedence the dashboard used to apply per page).
+    """
+    if permalink_canonical:
+        return f"perma|{permalink_canonical}"
+    if author_slug and published_at:
+        return f"authdate|{author_slug}|{published_at}"
+    return f"authtext|{author_slug or ''}|{utils.compute_content_hash(author, text)}"
+
+
+def display_author(author: Optional[str]) -> str:
+    """Author as shown in the dashboard (duplicated names and follower counts removed)."""
+    item_author = strip_followers_suffix(dedupe_person_name(author))
+    if item_author and looks_like_followers(item_author):
+        item_author = "Unknown"
+    return item_author or (author or "")
+
+
+# =============================================================================
+# WRITE-TIME COMPUTATION
+# =============================================================================
+
+def compute_display_fields(
+    author: Optional[str],
+    company: Optional[str],
+    author_profile: Optional[str],
+    text: Optional[str],
+    permalink: Optional[str],
+    *,
+    published_at: Optional[str] = None,
+    opportunity_threshold: float = 0.05,
+) -> dict[str, Any]:
+    """Return the stored display columns for one post (keys = DISPLAY_COLUMNS)."""
+    author_raw = str(author or "")
+    shown_author = display_author(author)
+    comp = derive_company_strict(author_raw, company, author_profile, text) or company
+    comp = sanitize_company(comp)
+    comp = strip_followers_suffix(comp) or comp
+    comp = dedupe_repeated_phrase(comp) or comp
+    if (comp or "").strip().lower() == shown_author.strip().lower():
+        comp = None
+    try:
+        opportunity = 1 if utils.is_opportunity(text, threshold=opportunity_threshold) else 0
+    except Exception:
+        opportunity = 0
+    perma = canonical_permalink(permalink)
+    author_key = account_slug(shown_author)
+    return {
+        "company_display": comp,
+        "status": extract_contract_status(text),
+        "metier": extract_metier(text),
+        "opportunity": opportunity,
+        "permalink_canonical": perma,
+        "author_slug": author_key,
+        "company_slug": account_slug(comp),
+        "dedup_key": dedup_key(perma, author_key, published_at, author, text),
+        "display_version": DISPLAY_FIELDS_VERSION,
+    }
+
+
+def backfill_display_fields(
+    conn: sqlite3.Connection,
+    *,
+    opportunity_threshold: float = 0.05,
+    batch_size: int = 500,
+    force: bool = False,
+) -> int:
+    """Compute display columns for rows missing them or derived by an older version.
+
+    Walks ``posts`` by rowid in batches; each batch is one executemany committed
+    on its own, so it can run on a live database without holding the write lock
+    for the whole table. Rerunning it is cheap once rows are current.
+    Rows whose dedup_key already belongs to another post are written with a
+    NULL dedup_key (and the current version, so they are not re-derived on
+    every pass); ``scraper.maintenance.compact_duplicate_posts`` removes them.
+    Returns the number of rows updated.
+    """
+    stale_sql = "" if force else " AND (display_version IS NULL OR display_version < ?)"
+    updated = collisions = 0
+    last_rowid = 0
+    key_index = DISPLAY_COLUMNS.index("dedup_key")
+    other_columns = [c for c in DISPLAY_COLUMNS if c != "dedup_key"]
+    while True:
+        params: list[Any] = [last_rowid]
+        if not force:
+            params.append(DISPLAY_FIELDS_VERSION)
+        rows = conn.execute(
+            "SELECT rowid, id, author, company, author_profile, text, permalink, published_at FROM posts"
+            f" WHERE rowid > ?{stale_sql} ORDER BY rowid LIMIT ?",
+            [*params, batch_size],
+        ).fetchall()
+        if not rows:
+            break
+        last_rowid = rows[-1][0]
+        values = []
+        for r in rows:
+            fields = compute_display_fields(
+                r[2], r[3], r[4], r[5], r[6], published_at=r[7], opportunity_threshold=opportunity_threshold
+            )
+            values.append(tuple(fields[c] for c in DISPLAY_COLUMNS) + (r[1],))
+        # rowcount (sqlite3_changes) excludes the daily_stats trigger writes, unlike total_changes
+        cur = conn.executemany(
+            f"UPDATE OR IGNORE posts SET {', '.join(c + '=?' for c in DISPLAY_COLUMNS)} WHERE id=?",
+            values,
+        )
+        updated += max(cur.rowcount, 0)
+        # Ignored rows still hold their old key: keep them out of the unique index
+        cur = conn.executemany(
+            f"UPDATE posts SET {', '.join(c + '=?' for c in other_columns)}, dedup_key=NULL"
+            " WHERE id=? AND dedup_key IS NOT ?",
+            [v[:key_index] + v[key_index + 1:-1] + (v[-1], v[key_index]) for v in values],
+        )
+        collisions += max(cur.rowcount, 0)
+        conn.commit()
+    updated += collisions
+    if updated:
+        logger.info("display_fields_backfilled", updated=updated, collisions=collisions, version=DISPLAY_FIELDS_VERSION)
+    return updated
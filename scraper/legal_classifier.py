@@ -18,10 +18,18 @@ Future extension:
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
+import hashlib
+import json
 import math
 import re
 
+from filters.cache import get_classification_cache
+
+from .normalized_text import NormalizedText
+from .text_matcher import VocabularyMatcher
+
 # Core legal role keywords - OPTIMISÉ pour cibler les métiers juridiques précis
 # Priorité aux rôles explicitement recherchés par le client
 LEGAL_ROLE_KEYWORDS = [
@@ -157,6 +165,27 @@ FR_NEGATIVE = [
 # Simple tokenization
 _TOKEN_RE = re.compile(r"[\wÀ-ÖØ-öø-ÿ']+")
 
+# Multi-word roles first so that they are removed before their sub-terms
+_ROLE_KEYWORDS_BY_LENGTH = sorted(LEGAL_ROLE_KEYWORDS, key=len, reverse=True)
+
+_matcher: Optional[VocabularyMatcher] = None
+
+
+def _get_matcher() -> VocabularyMatcher:
+    # One automaton over every vocabulary above, built on first use
+    global _matcher
+    if _matcher is None:
+        _matcher = VocabularyMatcher({
+            "roles": LEGAL_ROLE_KEYWORDS,
+            "recruitment": RECRUITMENT_PHRASES,
+            "stage": STAGE_ALTERNANCE_EXCLUSION,
+            "agency": RECRUITMENT_AGENCY_EXCLUSION,
+            "negative": NEGATIVE_CONTEXT_PHRASES,
+            "fr_positive": FR_POSITIVE,
+            "fr_negative": FR_NEGATIVE,
+        })
+    return _matcher
+
 @dataclass(slots=True)
 class LegalClassification:
     intent: str  # "recherche_profil" | "autre"
@@ -175,7 +204,8 @@ class LegalClassification:
         }
 
 def _lower(text: str) -> str:
-    return text.lower()
+    # Shared view: the worker and legal_filter already lowered this text
+    return NormalizedText.of(text).lowered
 
 
 def classify_legal_post(text: str, *, language: str = "fr", intent_threshold: float = 0.35) -> LegalClassification:
@@ -194,34 +224,68 @@ def classify_legal_post(text: str, *, language: str = "fr", intent_threshold: fl
     Confidence: fraction of distinct signal categories triggered (legal, recruit, language, location).
     
     Note: Posts containing stage/alternance keywords OR from recruitment agencies are automatically rejected.
+
+    Results are memoized by (content hash, config hash), see filters.cache.
     """
     if not text:
         return LegalClassification("autre", 0.0, 0.0, [], False)
+    return get_classification_cache("legal").get_or_compute(
+        # The threshold is an input (callers pass different ones), not config
+        (text, language, repr(intent_threshold)),
+        _config_hash(),
+        lambda: _classify(text, language, intent_threshold),
+        encode=_to_cache,
+        decode=_from_cache,
+    )
+
+
+@lru_cache(maxsize=1)
+def _config_hash() -> str:
+    # Hash of the vocabularies: editing a list invalidates cached results
+    payload = json.dumps([
+        LEGAL_ROLE_KEYWORDS, RECRUITMENT_PHRASES, STAGE_ALTERNANCE_EXCLUSION,
+        RECRUITMENT_AGENCY_EXCLUSION, NEGATIVE_CONTEXT_PHRASES, FR_POSITIVE, FR_NEGATIVE,
+    ], ensure_ascii=False)
+    return hashlib.md5(payload.encode()).hexdigest()[:16]
+
+
+def _to_cache(result: LegalClassification) -> Dict[str, Any]:
+    return result.as_dict()
+
+
+def _from_cache(data: Dict[str, Any]) -> LegalClassification:
+    return LegalClassification(
+        data["intent"], data["relevance_score"], data["confidence"],
+        list(data["keywords_matched"]), data["location_ok"],
+    )
+
+
+def _classify(text: str, language: str, intent_threshold: float) -> LegalClassification:
     low = _lower(text)
+    hits = _get_matcher().scan(low)
 
     # EARLY EXIT 1: Reject stage/alternance posts immediately
-    for excl_kw in STAGE_ALTERNANCE_EXCLUSION:
-        if excl_kw in low:
-            return LegalClassification("autre", 0.0, 0.0, [], False)
+    if hits.has("stage"):
+        return LegalClassification("autre", 0.0, 0.0, [], False)
     
     # EARLY EXIT 2: Reject posts from recruitment agencies (concurrents)
-    for agency_kw in RECRUITMENT_AGENCY_EXCLUSION:
-        if agency_kw in low:
-            return LegalClassification("autre", 0.0, 0.0, [], False)
+    if hits.has("agency"):
+        return LegalClassification("autre", 0.0, 0.0, [], False)
 
     # Language gate
     lang_ok = (language or "fr").lower() == "fr"
 
     # Location heuristic (positive > negative & at least one positive when a negative appears)
-    location_hits_pos = [p for p in FR_POSITIVE if p in low]
-    location_hits_neg = [n for n in FR_NEGATIVE if n in low]
+    location_hits_pos = hits.terms("fr_positive")
+    location_hits_neg = hits.terms("fr_negative")
     location_ok = bool(location_hits_pos) or not location_hits_neg  # pass if no negatives or positives present
 
     # Keyword matches (prefer multi-word sequences first to avoid double counting)
     matched: List[str] = []
     remaining = low
-    for kw in sorted(LEGAL_ROLE_KEYWORDS, key=len, reverse=True):
-        if kw in remaining:
+    for kw in _ROLE_KEYWORDS_BY_LENGTH:
+        # Roles absent from the text are skipped up front
+        if kw in hits and kw in remaining:
             matched.append(kw)
             # remove once to reduce repeated counting for overlapping tokens
             remaining = remaining.replace(kw, " ")
@@ -241,7 +305,7 @@ def classify_legal_post(text: str, *, language: str = "fr", intent_threshold: fl
     # Recruitment phrase detection with negation guard (avoid 'sans offre d\'emploi')
     recruit_hits: list[str] = []
     NEGATION_TOKENS = ["sans","pas","aucune","aucun","ni"]
-    for phrase in RECRUITMENT_PHRASES:
+    for phrase in hits.terms("recruitment"):
         start = 0
         while True:
             idx = low.find(phrase, start)
@@ -259,7 +323,7 @@ def classify_legal_post(text: str, *, language: str = "fr", intent_threshold: fl
                 recruit_hits.append(phrase)
                 break  # count phrase once
             start = idx + len(phrase)
-    negative_hits = [n for n in NEGATIVE_CONTEXT_PHRASES if n in low]
+    negative_hits = hits.terms("negative")
     recruit_score = min(1.0, math.log1p(len(recruit_hits)) / math.log1p(5))
 
     combined = max(0.0, min(1.0, legal_score * 0.6 + recruit_score * 0.4))
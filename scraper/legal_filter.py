@@ -8,18 +8,22 @@ Main function: is_legal_job_post(text, post_date=None) -> FilterResult
 Design principles:
 - Immediate exclusion if ANY negative keyword is detected
 - Scoring system: recruitment signal >= 0.15 + legal job >= 0.2
-- Text normalization: lowercase, no accents, no hashtags, no emojis
+- Text normalization: lowercase, no accents, no hashtags, no emojis, done once
+  per post (every function also accepts a NormalizedText view)
 - Detailed logging explaining why each post is excluded
 """
 from __future__ import annotations
 
-import re
-import unicodedata
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Callable, List, Optional, Tuple
 import logging
 
+from .normalized_text import NormalizedText, remove_accents, remove_emojis, remove_hashtags  # noqa: F401
+from .patterns import PatternRegistry
+from .text_matcher import MatchSet, VocabularyMatcher
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -62,6 +66,9 @@ LEGAL_PROFESSIONS = [
 # Stems for flexible matching (more flexible)
 LEGAL_STEMS = ["avocat", "juriste", "notaire", "paralegal", "counsel", "legal", "juridique", "fiscaliste", "fiscal"]
 
+# Longer matches take precedence in calculate_legal_profession_score
+_LEGAL_PROFESSIONS_BY_LENGTH = sorted(LEGAL_PROFESSIONS, key=len, reverse=True)
+
 # =============================================================================
 # RECRUITMENT SIGNALS (Score >= 0.15 required)
 # =============================================================================
@@ -618,41 +625,205 @@ EXCLUSION_NON_LEGAL_JOBS = [
 ]
 
 # =============================================================================
-# TEXT CLEANING FUNCTIONS
+# CONTEXT VOCABULARIES (used by the scoring / exclusion functions below)
 # =============================================================================
+# Module-level so that the shared matcher compiles them once; see _scan().
+
+_HIGH_VALUE_ROLES = [
+    "directeur juridique", "directrice juridique",
+    "responsable juridique", "general counsel",
+    "head of legal", "avocat associe", "notaire",
+    "head of legal compliance", "legal manager",
+    "senior legal counsel", "juriste confirme",
+]
 
-def remove_accents(text: str) -> str:
-    """Remove accents from text using unicode normalization."""
-    nfkd = unicodedata.normalize('NFKD', text)
-    return ''.join(c for c in nfkd if not unicodedata.combining(c))
-
-
-def remove_emojis(text: str) -> str:
-    """Remove emojis and special unicode characters."""
-    # Comprehensive emoji pattern
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # emoticons
-        "\U0001F300-\U0001F5FF"  # symbols & pictographs
-        "\U0001F680-\U0001F6FF"  # transport & map symbols
-        "\U0001F1E0-\U0001F1FF"  # flags
-        "\U00002702-\U000027B0"  # dingbats
-        "\U000024C2-\U0001F251"  # enclosed characters
-        "\U0001F900-\U0001F9FF"  # supplemental symbols
-        "\U0001FA00-\U0001FA6F"  # chess symbols
-        "\U0001FA70-\U0001FAFF"  # symbols extended-A
-        "\U00002600-\U000026FF"  # misc symbols
-        "\U00002700-\U000027BF"  # dingbats
-        "]+",
-        flags=re.UNICODE
-    )
-    return emoji_pattern.sub('', text)
+_LEGAL_FIRM_CONTEXT = [
+    "law firm", "cabinet avocat", "cabinet d avocat",
+    "etude notariale", "direction juridique",
+]
+
+# Recrutement ACTIF (maintenant)
+_VERY_STRONG_RECRUITMENT_SIGNALS = [
+    # Entreprise qui recrute MAINTENANT
+    "nous recrutons", "on recrute", "notre equipe recrute",
+    "notre cabinet recrute", "notre direction juridique recrute",
+    "notre etude recrute", "etude notariale recrute",
+
+    # Poste à pourvoir (MAINTENANT)
+    "poste a pourvoir", "poste ouvert", "poste disponible",
+    "cdi a pourvoir", "cdd a pourvoir",
+
+    # Appel à candidature explicite
+    "postulez", "candidatez", "envoyez votre cv",
+    "adressez votre candidature", "merci d envoyer",
 
+    # Anglais recrutement actif
+    "we are hiring", "is hiring", "now hiring", "currently hiring",
+    "we are looking for", "is looking for",
 
-def remove_hashtags(text: str) -> str:
-    """Remove hashtags but keep the word (e.g., #avocat -> avocat)."""
-    return re.sub(r'#(\w+)', r'\1', text)
+    # Spécifique aux 16 métiers
+    "recrute un avocat", "recrute une avocate",
+    "recrute un juriste", "recrute une juriste",
+    "recrute un notaire", "recrute une notaire",
+    "recrute un paralegal", "recrute une paralegale",
+    "recrute un legal counsel", "recrute une legal counsel",
+    "recrute un responsable juridique", "recrute une responsable juridique",
+    "recrute un directeur juridique", "recrute une directrice juridique",
+    "recrute un directeur fiscal", "recrute une directrice fiscale",
+    "recrute un responsable fiscal", "recrute une responsable fiscale",
+]
+
+_STRONG_SIGNALS_CHECK = [
+    "nous recherchons", "on recherche", "cdi", "cdd",
+    "recherche un avocat", "recherche une avocate",
+    "recherche un juriste", "recherche une juriste",
+]
+
+# Contexte recrutement clair
+_STRONG_RECRUITMENT_SIGNALS = [
+    # Recherche active
+    "nous recherchons", "on recherche",
+    "recherche un avocat", "recherche une avocate",
+    "recherche un juriste", "recherche une juriste",
+    "recherche un notaire", "recherche une notaire",
+    "recherche un paralegal", "recherche une paralegale",
+
+    # Contrats
+    "cdi", "cdd", "temps plein", "full time",
 
+    # Création/Opportunité
+    "creation de poste", "nouveau poste", "ouverture de poste",
+    "opportunite a saisir",
+
+    # Description de poste
+    "profil recherche", "missions principales",
+    "experience requise", "vous justifiez",
+
+    # Anglais
+    "join our team", "join the team",
+]
+
+_FIRST_PERSON_SIGNALS = ["je recrute", "je recherche", "je cherche"]
+
+_JOB_SEEKER_SIGNALS = [
+    "je recherche un poste", "je cherche un emploi",
+    "disponible immediatement", "opentowork",
+    "mon cv", "mon profil", "je suis juriste",
+]
+
+_RECRUITMENT_DONE_SIGNALS = [
+    "a rejoint", "vient de rejoindre", "a integre",
+    "nous avons recrute", "nous avons embauche",
+    "bienvenue a", "welcome",
+    "nouveau collaborateur", "nouvelle recrue",
+]
+
+_STAGE_FALSE_POSITIVES = [
+    "stade",  # "stade de france" != "stage"
+    "stage de carriere",  # métaphore
+]
+
+# Extended list of French cities/regions
+_FRANCE_INDICATORS = [
+    # Grandes villes
+    "france", "paris", "lyon", "marseille", "bordeaux",
+    "toulouse", "nantes", "lille", "strasbourg", "nice",
+    "rennes", "grenoble", "montpellier", "la defense",
+    # Régions
+    "ile-de-france", "ile de france", "idf", "region parisienne",
+    "hauts-de-france", "hauts de france", "auvergne", "rhone-alpes",
+    "paca", "provence", "normandie", "bretagne", "occitanie",
+    "nouvelle-aquitaine", "nouvelle aquitaine", "grand est",
+    # Villes moyennes
+    "angers", "dijon", "reims", "le havre", "saint-etienne",
+    "toulon", "clermont-ferrand", "villeurbanne", "metz", "besancon",
+    "orleans", "rouen", "mulhouse", "perpignan", "caen",
+    "boulogne-billancourt", "nancy", "argenteuil", "roubaix",
+    "tourcoing", "dunkerque", "avignon", "nimes", "poitiers",
+    "aix-en-provence", "aix en provence", "versailles", "pau",
+    "la rochelle", "limoges", "tours", "amiens", "annecy",
+    "brest", "le mans", "saint-nazaire", "colmar", "troyes",
+    "lorient", "quimper", "valence", "chambery", "niort",
+    "vannes", "chartres", "laval", "cholet", "saint-denis",
+    "saint denis", "voreppe", "compiegne", "neuilly",
+    # Arrondissements Paris
+    "paris 1", "paris 2", "paris 3", "paris 4", "paris 5",
+    "paris 6", "paris 7", "paris 8", "paris 9", "paris 10",
+    "paris 11", "paris 12", "paris 13", "paris 14", "paris 15",
+    "paris 16", "paris 17", "paris 18", "paris 19", "paris 20",
+]
+
+# "je recherche un juriste" = recruteur, "je recherche un poste" = candidat
+_RECRUITER_SEEKING_CANDIDATE = [
+    "je recherche un juriste", "je recherche une juriste",
+    "je recherche un avocat", "je recherche une avocate",
+    "je recherche un paralegal", "je recherche un notaire",
+    "je suis a la recherche d un juriste", "je suis a la recherche d une juriste",
+    "je suis a la recherche d un avocat", "je suis a la recherche d une avocate",
+    "a la recherche d un juriste", "a la recherche d une juriste",
+    "a la recherche d un avocat", "a la recherche d une avocate",
+    "nous recrutons", "on recrute", "recrute un", "recrute une",
+    "poste a pourvoir", "poste de juriste", "poste d avocat",
+    "cdi a pourvoir", "cdd a pourvoir", "postulez", "candidatez",
+]
+
+_JOB_SEEKER_CANDIDATE_SIGNALS = [
+    "je recherche un poste", "je recherche un emploi",
+    "je cherche un poste", "je cherche un emploi",
+    "mon cv", "mon profil est disponible",
+    "je suis juriste", "je suis avocat", "je suis avocate",
+    "disponible immediatement", "disponible des maintenant",
+]
+
+# Recruitment signals that override an informational exclusion
+_RECRUITING_OVERRIDE = ["recrute", "recruiting", "hiring", "poste a pourvoir"]
+_RECRUITING_CONTRACT_OVERRIDE = ["recrute", "recruiting", "hiring", "poste a pourvoir", "cdi", "cdd"]
+_FORMATION_OVERRIDE = ["recrute", "recherche", "poste a pourvoir", "cdi", "cdd"]
+_ACTIVE_RECRUITMENT_OVERRIDE = [
+    "nous recrutons", "on recrute", "poste a pourvoir",
+    "cdi a pourvoir", "cdd a pourvoir", "postulez",
+]
+_INFORMATIF_OVERRIDE = [
+    "recrute", "recherche", "poste a pourvoir", "cdi", "cdd",
+    "postulez", "candidatez",
+]
+_PROMO_OVERRIDE = [
+    "recrute", "recruiting", "hiring", "cdi", "cdd",
+    "poste", "offre", "juriste", "avocat", "notaire",
+]
+_SPONSORED_OVERRIDE = ["recrute", "cdi", "cdd", "poste a pourvoir"]
+_EMOTIONAL_OVERRIDE = [
+    "recrute", "cdi", "cdd", "poste a pourvoir", "hiring",
+    "nous recherchons", "on recherche",
+]
+
+_LEGAL_JOB_TERMS = [
+    "juriste", "avocat", "notaire", "legal", "juridique",
+    "counsel", "paralegal", "clerc",
+]
+# Looked up in the 50 characters before a non-legal job term
+_NON_LEGAL_TARGET_PATTERNS = ["recrute", "recherche", "recherchons", "poste de", "poste d"]
+
+_SHORT_POST_SIGNALS = [
+    "nous recrutons", "on recrute", "poste a pourvoir",
+    "cdi", "cdd", "hiring", "postulez",
+]
+_LINK_MARKERS = ["https", "lnkd.in"]
+
+_RECRUITMENT_WORDS = ["recrute", "recherche", "recherchons", "poste de", "poste d"]
+_LEGAL_JOB_TITLES = [
+    "juriste", "avocat", "notaire", "paralegal", "legal",
+    "juridique", "counsel", "clerc", "fiscaliste", "compliance",
+]
+_NON_LEGAL_JOB_TITLES = [
+    "marketing", "commercial", "finance", "rh", "developpeur",
+    "comptable", "gestionnaire", "assistant administratif",
+    "chef de projet", "product manager", "data",
+]
+
+# =============================================================================
+# TEXT CLEANING FUNCTIONS
+# =============================================================================
 
 def normalize_text(text: str) -> str:
     """
@@ -662,21 +833,87 @@ def normalize_text(text: str) -> str:
     - Remove emojis
     - Remove hashtags (keep words)
     - Normalize whitespace
+
+    Computed once per text: see :class:`scraper.normalized_text.NormalizedText`.
     """
-    if not text:
-        return ""
-    
-    text = text.lower()
-    text = remove_accents(text)
-    text = remove_emojis(text)
-    text = remove_hashtags(text)
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
-    # Remove special characters but keep basic punctuation
-    text = re.sub(r'[^\w\s\'-]', ' ', text)
-    text = re.sub(r'\s+', ' ', text)
-    
-    return text.strip()
+    return NormalizedText.of(text).normalized
+
+
+# =============================================================================
+# SHARED MATCHER (one pass over the normalized text for every vocabulary)
+# =============================================================================
+
+_matcher: Optional[VocabularyMatcher] = None
+
+
+def _vocabularies() -> dict:
+    """Every term list tested against normalized text, by name."""
+    vocab = {
+        "LEGAL_PROFESSIONS": LEGAL_PROFESSIONS,
+        "LEGAL_STEMS": LEGAL_STEMS,
+        "RECRUITMENT_SIGNALS": RECRUITMENT_SIGNALS,
+        "EXCLUSION_STAGE_ALTERNANCE": EXCLUSION_STAGE_ALTERNANCE,
+        "EXCLUSION_FREELANCE": EXCLUSION_FREELANCE,
+        "EXCLUSION_NON_FRANCE": EXCLUSION_NON_FRANCE,
+        "EXCLUSION_JOBSEEKER": EXCLUSION_JOBSEEKER,
+        "EXCLUSION_RECRUITMENT_DONE": EXCLUSION_RECRUITMENT_DONE,
+        "EXCLUSION_PROMOTIONAL": EXCLUSION_PROMOTIONAL,
+        "EXCLUSION_SPONSORED": EXCLUSION_SPONSORED,
+        "EXCLUSION_EMOTIONAL": EXCLUSION_EMOTIONAL,
+        "EXCLUSION_INSTITUTIONAL": EXCLUSION_INSTITUTIONAL,
+        "EXCLUSION_LEGAL_NEWS": EXCLUSION_LEGAL_NEWS,
+        "EXCLUSION_TESTIMONIALS": EXCLUSION_TESTIMONIALS,
+        "EXCLUSION_NETWORKING": EXCLUSION_NETWORKING,
+        "EXCLUSION_RECRUITMENT_FEEDBACK": EXCLUSION_RECRUITMENT_FEEDBACK,
+        "EXCLUSION_FORMATION_EDUCATION": EXCLUSION_FORMATION_EDUCATION,
+        "EXCLUSION_RECRUTEMENT_PASSE": EXCLUSION_RECRUTEMENT_PASSE,
+        "EXCLUSION_CANDIDAT_INDIVIDU": EXCLUSION_CANDIDAT_INDIVIDU,
+        "EXCLUSION_CONTENU_INFORMATIF": EXCLUSION_CONTENU_INFORMATIF,
+        "EXCLUSION_RECRUITMENT_AGENCIES": EXCLUSION_RECRUITMENT_AGENCIES,
+        "EXCLUSION_NON_LEGAL_JOBS": EXCLUSION_NON_LEGAL_JOBS,
+    }
+    # Private context lists (module-level _UPPER_CASE lists of terms)
+    for name, value in globals().items():
+        if name.startswith("_") and name.isupper() and isinstance(value, list) and name not in vocab:
+            vocab[name] = value
+    for job, keywords in TARGET_JOBS_16.items():
+        vocab[f"TARGET_JOBS_16:{job}"] = keywords
+    for name, table in (
+        ("GENERIC_TARGET_JOBS", _GENERIC_TARGET_JOBS),
+        ("SPECIALIZATIONS", _SPECIALIZATION_KEYWORDS),
+        ("EXPERIENCE_LEVELS", _EXPERIENCE_KEYWORDS),
+    ):
+        for key, keywords in table.items():
+            vocab[f"{name}:{key}"] = keywords
+    return vocab
+
+
+def _get_matcher() -> VocabularyMatcher:
+    # Built on first use (the vocabularies span the whole module)
+    global _matcher
+    if _matcher is None:
+        _matcher = VocabularyMatcher(_vocabularies())
+    return _matcher
+
+
+@lru_cache(maxsize=256)
+def _scan(normalized: str) -> MatchSet:
+    """Vocabulary hits of a normalized text.
+
+    Cached so that the helpers called by is_legal_job_post share a single
+    pass over the post.
+    """
+    return _get_matcher().scan(normalized)
+
+
+# Regexes of the scoring / coherence helpers, compiled on first use
+_PATTERNS = PatternRegistry(
+    # "Cabinet ABC recrute", "Entreprise XYZ recrute"
+    company_recrute=r"\b[a-z\s]+\s+recrute\b",
+    coherence_non_legal_target=lambda: (
+        r"(recrute|recherche|recherchons)\s+(?:un|une)?\s*(?:" + "|".join(_COHERENCE_NON_LEGAL_JOBS) + ")"
+    ),
+)
 
 
 # =============================================================================
@@ -690,16 +927,16 @@ def calculate_legal_profession_score(text: str) -> Tuple[float, List[str]]:
     Score >= 0.2 required for valid post.
     """
     matched = []
-    normalized = normalize_text(text)
+    hits = _scan(normalize_text(text))
     
     # Check full profession keywords first (longer matches take precedence)
-    for profession in sorted(LEGAL_PROFESSIONS, key=len, reverse=True):
-        if profession in normalized:
+    for profession in _LEGAL_PROFESSIONS_BY_LENGTH:
+        if profession in hits:
             matched.append(profession)
     
     # Also check stems for flexible matching
-    for stem in LEGAL_STEMS:
-        if stem in normalized and stem not in matched:
+    for stem in hits.terms("LEGAL_STEMS"):
+        if stem not in matched:
             matched.append(stem)
     
     # Calculate score based on matches
@@ -714,18 +951,11 @@ def calculate_legal_profession_score(text: str) -> Tuple[float, List[str]]:
     score += min(0.3, len(unique_matches) * 0.1)
     
     # Bonus for specific high-value roles
-    high_value_roles = ["directeur juridique", "directrice juridique", 
-                        "responsable juridique", "general counsel", 
-                        "head of legal", "avocat associe", "notaire",
-                        "head of legal compliance", "legal manager",
-                        "senior legal counsel", "juriste confirme"]
-    if any(role in normalized for role in high_value_roles):
+    if hits.has("_HIGH_VALUE_ROLES"):
         score += 0.15
     
     # Extra bonus for legal firm context
-    firm_context = ["law firm", "cabinet avocat", "cabinet d avocat", 
-                    "etude notariale", "direction juridique"]
-    if any(ctx in normalized for ctx in firm_context):
+    if hits.has("_LEGAL_FIRM_CONTEXT"):
         score += 0.1
     
     return min(1.0, score), list(unique_matches)
@@ -744,49 +974,15 @@ def calculate_recruitment_score(text: str) -> Tuple[float, List[str]]:
     """
     matched = []
     normalized = normalize_text(text)
+    hits = _scan(normalized)
     
     # ========== SIGNAUX TRÈS FORTS (Recrutement ACTIF) ==========
     # Ces patterns indiquent une recherche ACTIVE maintenant
-    very_strong_signals = [
-        # Entreprise qui recrute MAINTENANT
-        "nous recrutons", "on recrute", "notre equipe recrute",
-        "notre cabinet recrute", "notre direction juridique recrute",
-        "notre etude recrute", "etude notariale recrute",
-        
-        # Poste à pourvoir (MAINTENANT)
-        "poste a pourvoir", "poste ouvert", "poste disponible",
-        "cdi a pourvoir", "cdd a pourvoir",
-        
-        # Appel à candidature explicite
-        "postulez", "candidatez", "envoyez votre cv",
-        "adressez votre candidature", "merci d envoyer",
-        
-        # Anglais recrutement actif
-        "we are hiring", "is hiring", "now hiring", "currently hiring",
-        "we are looking for", "is looking for",
-        
-        # Spécifique aux 16 métiers
-        "recrute un avocat", "recrute une avocate",
-        "recrute un juriste", "recrute une juriste",
-        "recrute un notaire", "recrute une notaire",
-        "recrute un paralegal", "recrute une paralegale",
-        "recrute un legal counsel", "recrute une legal counsel",
-        "recrute un responsable juridique", "recrute une responsable juridique",
-        "recrute un directeur juridique", "recrute une directrice juridique",
-        "recrute un directeur fiscal", "recrute une directrice fiscale",
-        "recrute un responsable fiscal", "recrute une responsable fiscale",
-    ]
-    
-    very_strong_count = sum(1 for s in very_strong_signals if s in normalized)
+    very_strong_count = hits.count("_VERY_STRONG_RECRUITMENT_SIGNALS")
     
     if very_strong_count == 0:
         # Vérifier les signaux forts avant de rejeter
-        strong_signals_check = [
-            "nous recherchons", "on recherche", "cdi", "cdd",
-            "recherche un avocat", "recherche une avocate",
-            "recherche un juriste", "recherche une juriste",
-        ]
-        has_strong = any(s in normalized for s in strong_signals_check)
+        has_strong = hits.has("_STRONG_SIGNALS_CHECK")
         if not has_strong:
             # AUCUN signal fort = REJET
             return 0.0, []
@@ -795,44 +991,20 @@ def calculate_recruitment_score(text: str) -> Tuple[float, List[str]]:
     score = 0.35 + min(0.35, very_strong_count * 0.15) if very_strong_count > 0 else 0.20
     
     # ========== SIGNAUX FORTS (Contexte recrutement clair) ==========
-    strong_signals = [
-        # Recherche active
-        "nous recherchons", "on recherche",
-        "recherche un avocat", "recherche une avocate",
-        "recherche un juriste", "recherche une juriste",
-        "recherche un notaire", "recherche une notaire",
-        "recherche un paralegal", "recherche une paralegale",
-        
-        # Contrats
-        "cdi", "cdd", "temps plein", "full time",
-        
-        # Création/Opportunité
-        "creation de poste", "nouveau poste", "ouverture de poste",
-        "opportunite a saisir",
-        
-        # Description de poste
-        "profil recherche", "missions principales",
-        "experience requise", "vous justifiez",
-        
-        # Anglais
-        "join our team", "join the team",
-    ]
-    
-    strong_count = sum(1 for s in strong_signals if s in normalized)
+    strong_matches = hits.terms("_STRONG_RECRUITMENT_SIGNALS")
+    strong_count = len(strong_matches)
     if strong_count > 0:
         score += 0.15 + min(0.15, strong_count * 0.05)
-        matched.extend([s for s in strong_signals if s in normalized])
+        matched.extend(strong_matches)
     
     # ========== BONUS POUR PATTERN "[ENTREPRISE] RECRUTE" ==========
     # Pattern: "Cabinet ABC recrute" ou "Entreprise XYZ recrute"
-    recrute_pattern = re.search(r'\b[a-z\s]+\s+recrute\b', normalized)
-    if recrute_pattern:
+    if _PATTERNS.company_recrute.search(normalized):
         score += 0.15
         matched.append("[entreprise] recrute")
     
     # ========== MALUS POUR PREMIÈRE PERSONNE (Chasseur de têtes) ==========
-    first_person_signals = ["je recrute", "je recherche", "je cherche"]
-    if any(fp in normalized for fp in first_person_signals):
+    if hits.has("_FIRST_PERSON_SIGNALS"):
         # Première personne = potentiellement chasseur de têtes
         # Exiger des signaux TRÈS FORTS d'entreprise
         if very_strong_count < 2:
@@ -840,27 +1012,16 @@ def calculate_recruitment_score(text: str) -> Tuple[float, List[str]]:
         score = max(0, score - 0.20)
     
     # ========== VÉRIFIER QUE CE N'EST PAS UN CANDIDAT ==========
-    job_seeker_signals = [
-        "je recherche un poste", "je cherche un emploi",
-        "disponible immediatement", "opentowork",
-        "mon cv", "mon profil", "je suis juriste",
-    ]
-    if any(js in normalized for js in job_seeker_signals):
+    if hits.has("_JOB_SEEKER_SIGNALS"):
         return 0.0, []
     
     # ========== VÉRIFIER QUE LE RECRUTEMENT N'EST PAS TERMINÉ ==========
-    recruitment_done_signals = [
-        "a rejoint", "vient de rejoindre", "a integre",
-        "nous avons recrute", "nous avons embauche",
-        "bienvenue a", "welcome",
-        "nouveau collaborateur", "nouvelle recrue",
-    ]
-    if any(rd in normalized for rd in recruitment_done_signals):
+    if hits.has("_RECRUITMENT_DONE_SIGNALS"):
         return 0.0, []
     
     # Vérifier les signaux de recrutement génériques
-    for signal in RECRUITMENT_SIGNALS:
-        if signal in normalized and signal not in matched:
+    for signal in hits.terms("RECRUITMENT_SIGNALS"):
+        if signal not in matched:
             matched.append(signal)
     
     return min(1.0, score), matched
@@ -878,6 +1039,152 @@ class ExclusionResult:
     matched_terms: List[str] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class ExclusionRule:
+    """One row of the exclusion table.
+
+    A rule fires when its ``flag`` is enabled in the FilterConfig, its gate
+    vocabulary ``category`` is present, ``override`` is absent, ``require``
+    is present and ``check`` (if any) returns the matched terms. Rules are
+    evaluated in table order and the first one that fires decides.
+    """
+    reason: str
+    flag: Optional[str] = None          # FilterConfig attribute (None = always on)
+    category: Optional[str] = None      # gate vocabulary (None = no gate)
+    override: Optional[str] = None      # vocabulary cancelling the exclusion
+    require: Optional[str] = None       # vocabulary the exclusion also needs
+    details: str = "terms"              # "terms" | "first" (of category)
+    check: Optional[Callable[[str, MatchSet, Optional[datetime]], Optional[List[str]]]] = None
+    cost: int = 1                       # 0 = no text, 1 = hit-set lookups, 2 = text scan
+
+
+def _check_post_age(normalized: str, hits: MatchSet, post_date: Optional[datetime]) -> Optional[List[str]]:
+    if not post_date:
+        return None
+    if post_date.tzinfo is None:
+        post_date = post_date.replace(tzinfo=timezone.utc)
+    age = datetime.now(timezone.utc) - post_date
+    if age > timedelta(weeks=3):
+        return [f"{age.days} jours"]
+    return None
+
+
+def _check_non_legal_target(normalized: str, hits: MatchSet, post_date: Optional[datetime]) -> Optional[List[str]]:
+    # Only exclude when the non-legal term is the job being recruited
+    for term in hits.terms("EXCLUSION_NON_LEGAL_JOBS"):
+        term_idx = normalized.find(term)
+        # Look at context around the term (50 chars before)
+        context_before = normalized[max(0, term_idx-50):term_idx]
+        is_recruitment_target = any(pat in context_before for pat in _NON_LEGAL_TARGET_PATTERNS)
+        # Also check for title patterns like "Directeur Financier recherché"
+        context_after = normalized[term_idx:term_idx+30]
+        is_job_title = "recherche" in context_after or term_idx < 50  # Term appears early = likely the job title
+        if is_recruitment_target or is_job_title:
+            return [term]
+    return None
+
+
+def _check_short_link(normalized: str, hits: MatchSet, post_date: Optional[datetime]) -> Optional[List[str]]:
+    # Posts < 150 chars need a VERY explicit recruitment signal
+    return ["lien sans contexte"] if len(normalized) < 150 else None
+
+
+# ORDRE DE PRIORITÉ: l'ordre de la table décide de la raison retournée quand
+# plusieurs règles s'appliquent. Chaque règle est d'abord filtrée par sa
+# catégorie (simple lookup dans le hit set du scan), donc une règle absente du
+# texte ne coûte rien; `cost` documente le coût de l'étape de confirmation.
+EXCLUSION_RULES: Tuple[ExclusionRule, ...] = (
+    # 0. Posts trop anciens (> 3 semaines) - rapide, élimine beaucoup
+    ExclusionRule("post_trop_ancien", check=_check_post_age, cost=0),
+    # 1. Stage/Alternance - priorité maximale (faux positifs: "stage de développement de carrière")
+    ExclusionRule("stage_alternance", "exclude_stage", "EXCLUSION_STAGE_ALTERNANCE",
+                  override="_STAGE_FALSE_POSITIVES", details="first"),
+    # 2. Freelance/Missions
+    ExclusionRule("freelance_mission", "exclude_freelance", "EXCLUSION_FREELANCE", details="first"),
+    # 3. Non-France locations, sauf si une ville/indicateur français est aussi cité
+    ExclusionRule("hors_france", "exclude_foreign", "EXCLUSION_NON_FRANCE", override="_FRANCE_INDICATORS"),
+    # 4. Chercheurs d'emploi (pas un recruteur qui cherche un candidat)
+    ExclusionRule("chercheur_emploi", "exclude_opentowork", "EXCLUSION_JOBSEEKER",
+                  override="_RECRUITER_SEEKING_CANDIDATE", require="_JOB_SEEKER_CANDIDATE_SIGNALS",
+                  details="first"),
+    # 4b. Recrutement déjà pourvu (annonces d'arrivée)
+    ExclusionRule("recrutement_termine", "exclude_opentowork", "EXCLUSION_RECRUITMENT_DONE", details="first"),
+    # 5. Posts institutionnels, veille juridique, témoignages, networking
+    ExclusionRule("post_institutionnel", "exclude_promo", "EXCLUSION_INSTITUTIONAL",
+                  override="_RECRUITING_OVERRIDE"),
+    ExclusionRule("veille_juridique", "exclude_promo", "EXCLUSION_LEGAL_NEWS",
+                  override="_RECRUITING_CONTRACT_OVERRIDE"),
+    ExclusionRule("temoignage_client", "exclude_promo", "EXCLUSION_TESTIMONIALS",
+                  override="_RECRUITING_OVERRIDE"),
+    ExclusionRule("post_networking", "exclude_promo", "EXCLUSION_NETWORKING",
+                  override="_RECRUITING_CONTRACT_OVERRIDE"),
+    # 5e. Plaintes/retours sur un recrutement (pas une offre active)
+    ExclusionRule("feedback_recrutement", "exclude_promo", "EXCLUSION_RECRUITMENT_FEEDBACK"),
+    # 5h-5k. Exclusions renforcées (réduction faux positifs)
+    ExclusionRule("formation_education", "exclude_formation_education", "EXCLUSION_FORMATION_EDUCATION",
+                  override="_FORMATION_OVERRIDE"),
+    ExclusionRule("recrutement_passe", "exclude_recrutement_passe", "EXCLUSION_RECRUTEMENT_PASSE",
+                  override="_ACTIVE_RECRUITMENT_OVERRIDE"),
+    ExclusionRule("candidat_individu", "exclude_candidat_individu", "EXCLUSION_CANDIDAT_INDIVIDU"),
+    ExclusionRule("contenu_informatif", "exclude_contenu_informatif", "EXCLUSION_CONTENU_INFORMATIF",
+                  override="_INFORMATIF_OVERRIDE"),
+    # Promo, sponsorisé, émotionnel: sauf signal de recrutement
+    ExclusionRule("contenu_promotionnel", "exclude_promo", "EXCLUSION_PROMOTIONAL", override="_PROMO_OVERRIDE"),
+    ExclusionRule("contenu_sponsorise", "exclude_sponsored", "EXCLUSION_SPONSORED",
+                  override="_SPONSORED_OVERRIDE"),
+    ExclusionRule("post_emotionnel", "exclude_emotional", "EXCLUSION_EMOTIONAL", override="_EMOTIONAL_OVERRIDE"),
+    # 6. Cabinets de recrutement (concurrents)
+    ExclusionRule("cabinet_recrutement", "exclude_agencies", "EXCLUSION_RECRUITMENT_AGENCIES", details="first"),
+    # 7. Métier recruté non juridique (ignoré si un métier juridique est cité)
+    ExclusionRule("metier_non_juridique", "exclude_non_legal", "EXCLUSION_NON_LEGAL_JOBS",
+                  override="_LEGAL_JOB_TERMS", check=_check_non_legal_target, cost=2),
+    # 9. Post court qui ne partage qu'un lien
+    ExclusionRule("post_trop_court", None, "_LINK_MARKERS", override="_SHORT_POST_SIGNALS",
+                  check=_check_short_link),
+    # 10. Cohérence: recrutement sans métier juridique mais avec un métier non juridique
+    ExclusionRule("recrutement_non_juridique", None, "_RECRUITMENT_WORDS", override="_LEGAL_JOB_TITLES",
+                  require="_NON_LEGAL_JOB_TITLES", check=lambda *_: ["poste non juridique"]),
+)
+
+
+class _RuleStats:
+    __slots__ = ("evaluated", "gated", "fired")
+
+    def __init__(self) -> None:
+        self.evaluated = 0  # rule enabled and reached
+        self.gated = 0      # gate vocabulary present
+        self.fired = 0      # rule decided the verdict
+
+
+_RULE_STATS = {rule.reason: _RuleStats() for rule in EXCLUSION_RULES}
+
+
+def get_exclusion_rule_stats() -> List[dict]:
+    """Per-rule counters since start (or the last reset), in table order.
+
+    ``hit_rate`` is the share of evaluations where the rule decided the
+    verdict; ``gate_rate`` the share where its gate vocabulary was present.
+    """
+    out = []
+    for rule in EXCLUSION_RULES:
+        st = _RULE_STATS[rule.reason]
+        out.append({
+            "reason": rule.reason,
+            "cost": rule.cost,
+            "evaluated": st.evaluated,
+            "gated": st.gated,
+            "fired": st.fired,
+            "gate_rate": round(st.gated / st.evaluated, 4) if st.evaluated else 0.0,
+            "hit_rate": round(st.fired / st.evaluated, 4) if st.evaluated else 0.0,
+        })
+    return out
+
+
+def reset_exclusion_rule_stats() -> None:
+    for reason in _RULE_STATS:
+        _RULE_STATS[reason] = _RuleStats()
+
+
 def check_exclusions(
     text: str, 
     post_date: Optional[datetime] = None,
@@ -886,339 +1193,42 @@ def check_exclusions(
     """
     Check if post should be excluded.
     Returns ExclusionResult with reason if excluded.
-    
-    ORDRE DE PRIORITÉ DES FILTRES (optimisé pour performance):
-    1. Posts trop anciens (> 3 semaines) - RAPIDE, élimine beaucoup
-    2. Stage/Alternance/Apprentissage - CRITIQUE, jamais accepter
-    3. Freelance/Missions - Exclure missions courtes
-    4. Non-France locations - Filtrage géographique
-    5. Job seekers (#opentowork) - Chercheurs d'emploi, pas recruteurs
-    6. Promotional content - Contenu non-recrutement
-    7. Recruitment agencies - Concurrents
-    8. Non-legal professions - Hors domaine juridique
+
+    Walks EXCLUSION_RULES in priority order and stops at the first rule that
+    fires; rules whose gate vocabulary is absent from the scan are skipped
+    without further work. Per-rule counters: get_exclusion_rule_stats().
     """
     if config is None:
         config = FilterConfig()  # Use defaults
         
     normalized = normalize_text(text)
-    
-    # 0. FILTRE DATE - EN PREMIER (rapide et élimine beaucoup de posts)
-    if post_date:
-        now = datetime.now(timezone.utc)
-        if post_date.tzinfo is None:
-            post_date = post_date.replace(tzinfo=timezone.utc)
-        age = now - post_date
-        if age > timedelta(weeks=3):
-            return ExclusionResult(True, "post_trop_ancien", 
-                                   [f"{age.days} jours"])
-    
-    # 1. Stage/Alternance - PRIORITÉ MAXIMALE (jamais accepter)
-    if config.exclude_stage:
-        # Vérification exhaustive avec tous les termes
-        for term in EXCLUSION_STAGE_ALTERNANCE:
-            if term in normalized:
-                # Double vérification: s'assurer que ce n'est pas un faux positif
-                # Ex: "stage de développement de carrière" vs "offre de stage"
-                false_positive_contexts = [
-                    "stade",  # "stade de france" != "stage"
-                    "stage de carriere",  # métaphore
-                ]
-                is_false_positive = any(fp in normalized for fp in false_positive_contexts)
-                if not is_false_positive:
-                    return ExclusionResult(True, "stage_alternance", [term])
-    
-    # 2. Freelance/Missions
-    if config.exclude_freelance:
-        for term in EXCLUSION_FREELANCE:
-            if term in normalized:
-                return ExclusionResult(True, "freelance_mission", [term])
-    
-    # 3. Non-France locations - improved logic
-    if config.exclude_foreign:
-        matched_locations = [loc for loc in EXCLUSION_NON_FRANCE if loc in normalized]
-        if matched_locations:
-            # Check if France is also mentioned (could be multi-location role OR comparison post)
-            # Extended list of French cities/regions
-            france_indicators = [
-                # Grandes villes
-                "france", "paris", "lyon", "marseille", "bordeaux", 
-                "toulouse", "nantes", "lille", "strasbourg", "nice",
-                "rennes", "grenoble", "montpellier", "la defense",
-                # Régions
-                "ile-de-france", "ile de france", "idf", "region parisienne",
-                "hauts-de-france", "hauts de france", "auvergne", "rhone-alpes",
-                "paca", "provence", "normandie", "bretagne", "occitanie",
-                "nouvelle-aquitaine", "nouvelle aquitaine", "grand est",
-                # Villes moyennes
-                "angers", "dijon", "reims", "le havre", "saint-etienne",
-                "toulon", "clermont-ferrand", "villeurbanne", "metz", "besancon",
-                "orleans", "rouen", "mulhouse", "perpignan", "caen",
-                "boulogne-billancourt", "nancy", "argenteuil", "roubaix",
-                "tourcoing", "dunkerque", "avignon", "nimes", "poitiers",
-                "aix-en-provence", "aix en provence", "versailles", "pau",
-                "la rochelle", "limoges", "tours", "amiens", "annecy",
-                "brest", "le mans", "saint-nazaire", "colmar", "troyes",
-                "lorient", "quimper", "valence", "chambery", "niort",
-                "vannes", "chartres", "laval", "cholet", "saint-denis",
-                "saint denis", "voreppe", "compiegne", "neuilly",
-                # Arrondissements Paris
-                "paris 1", "paris 2", "paris 3", "paris 4", "paris 5",
-                "paris 6", "paris 7", "paris 8", "paris 9", "paris 10",
-                "paris 11", "paris 12", "paris 13", "paris 14", "paris 15",
-                "paris 16", "paris 17", "paris 18", "paris 19", "paris 20",
-            ]
-            has_france = any(f in normalized for f in france_indicators)
-            
-            # Foreign location explicitly mentioned = exclude (CDI/CDD alone don't prove France)
-            # Only accept if a French city/indicator is ALSO mentioned
-            if not has_france:
-                return ExclusionResult(True, "hors_france", matched_locations)
-    
-    # 4. Job seekers - Exclude if the author is seeking work, not recruiting
-    if config.exclude_opentowork:
-        for term in EXCLUSION_JOBSEEKER:
-            if term in normalized:
-                # AMÉLIORATION: Vérifier si c'est un recruteur qui cherche un candidat
-                # "je recherche un juriste" = recruteur, "je recherche un poste" = candidat
-                recruiter_seeking_candidate = any(rp in normalized for rp in [
-                    "je recherche un juriste", "je recherche une juriste",
-                    "je recherche un avocat", "je recherche une avocate",
-                    "je recherche un paralegal", "je recherche un notaire",
-                    "je suis a la recherche d un juriste", "je suis a la recherche d une juriste",
-                    "je suis a la recherche d un avocat", "je suis a la recherche d une avocate",
-                    "a la recherche d un juriste", "a la recherche d une juriste",
-                    "a la recherche d un avocat", "a la recherche d une avocate",
-                    "nous recrutons", "on recrute", "recrute un", "recrute une",
-                    "poste a pourvoir", "poste de juriste", "poste d avocat",
-                    "cdi a pourvoir", "cdd a pourvoir", "postulez", "candidatez",
-                ])
-                
-                if recruiter_seeking_candidate:
-                    continue  # C'est un recruteur, ne pas exclure
-                
-                # Vérifier les signaux de chercheur d'emploi
-                candidate_signals = any(fp in normalized for fp in [
-                    "je recherche un poste", "je recherche un emploi",
-                    "je cherche un poste", "je cherche un emploi",
-                    "mon cv", "mon profil est disponible",
-                    "je suis juriste", "je suis avocat", "je suis avocate",
-                    "disponible immediatement", "disponible des maintenant",
-                ])
-                
-                if candidate_signals:
-                    return ExclusionResult(True, "chercheur_emploi", [term])
-    
-    # 4b. Recruitment already done - Exclude welcome/arrival announcements
-    if config.exclude_opentowork:  # Reuse same config flag
-        for term in EXCLUSION_RECRUITMENT_DONE:
-            if term in normalized:
-                # This is announcing someone ALREADY hired, not an active job posting
-                return ExclusionResult(True, "recrutement_termine", [term])
-    
-    # 5. Institutional posts (no recruitment)
-    if config.exclude_promo:
-        matched_institutional = [term for term in EXCLUSION_INSTITUTIONAL if term in normalized]
-        if matched_institutional:
-            has_recruitment = any(sig in normalized for sig in [
-                "recrute", "recruiting", "hiring", "poste a pourvoir"
-            ])
-            if not has_recruitment:
-                return ExclusionResult(True, "post_institutionnel", matched_institutional)
-    
-    # 5b. Legal news (not job offers)
-    if config.exclude_promo:
-        matched_legal_news = [term for term in EXCLUSION_LEGAL_NEWS if term in normalized]
-        if matched_legal_news:
-            has_recruitment = any(sig in normalized for sig in [
-                "recrute", "recruiting", "hiring", "poste a pourvoir", "cdi", "cdd"
-            ])
-            if not has_recruitment:
-                return ExclusionResult(True, "veille_juridique", matched_legal_news)
-    
-    # 5c. Client testimonials
-    if config.exclude_promo:
-        matched_testimonials = [term for term in EXCLUSION_TESTIMONIALS if term in normalized]
-        if matched_testimonials:
-            has_recruitment = any(sig in normalized for sig in [
-                "recrute", "recruiting", "hiring", "poste a pourvoir"
-            ])
-            if not has_recruitment:
-                return ExclusionResult(True, "temoignage_client", matched_testimonials)
-    
-    # 5d. Networking posts
-    if config.exclude_promo:
-        matched_networking = [term for term in EXCLUSION_NETWORKING if term in normalized]
-        if matched_networking:
-            has_recruitment = any(sig in normalized for sig in [
-                "recrute", "recruiting", "hiring", "poste a pourvoir", "cdi", "cdd"
-            ])
-            if not has_recruitment:
-                return ExclusionResult(True, "post_networking", matched_networking)
-    
-    # 5e. Posts de plainte/feedback sur le recrutement (pas une offre active)
-    # Ex: "je recrute un Auditeur mais j'ai reçu des cv d'infographe"
-    if config.exclude_promo:
-        matched_feedback = [term for term in EXCLUSION_RECRUITMENT_FEEDBACK if term in normalized]
-        if matched_feedback:
-            # Ces posts mentionnent le recrutement mais ne sont PAS des offres actives
-            # Ils parlent de l'expérience passée, de plaintes, de retours
-            return ExclusionResult(True, "feedback_recrutement", matched_feedback)
-    
-    # ==========================================================================
-    # NOUVELLES EXCLUSIONS RENFORCÉES (réduction 90% faux positifs)
-    # ==========================================================================
-    
-    # 5h. Formation/Education (not recruitment)
-    if config.exclude_formation_education:
-        matched_formation = [term for term in EXCLUSION_FORMATION_EDUCATION if term in normalized]
-        if matched_formation:
-            has_recruitment = any(sig in normalized for sig in [
-                "recrute", "recherche", "poste a pourvoir", "cdi", "cdd"
-            ])
-            if not has_recruitment:
-                return ExclusionResult(True, "formation_education", matched_formation)
-    
-    # 5i. Recrutement Passé (not active recruitment)
-    if config.exclude_recrutement_passe:
-        matched_passe = [term for term in EXCLUSION_RECRUTEMENT_PASSE if term in normalized]
-        if matched_passe:
-            has_active_recruitment = any(sig in normalized for sig in [
-                "nous recrutons", "on recrute", "poste a pourvoir",
-                "cdi a pourvoir", "cdd a pourvoir", "postulez"
-            ])
-            if not has_active_recruitment:
-                return ExclusionResult(True, "recrutement_passe", matched_passe)
-    
-    # 5j. Candidat Individu Cherchant Emploi
-    if config.exclude_candidat_individu:
-        matched_candidat = [term for term in EXCLUSION_CANDIDAT_INDIVIDU if term in normalized]
-        if matched_candidat:
-            return ExclusionResult(True, "candidat_individu", matched_candidat)
-    
-    # 5k. Contenu Informatif (Articles, Blogs, Webinaires)
-    if config.exclude_contenu_informatif:
-        matched_info = [term for term in EXCLUSION_CONTENU_INFORMATIF if term in normalized]
-        if matched_info:
-            has_recruitment = any(sig in normalized for sig in [
-                "recrute", "recherche", "poste a pourvoir", "cdi", "cdd",
-                "postulez", "candidatez"
-            ])
-            if not has_recruitment:
-                return ExclusionResult(True, "contenu_informatif", matched_info)
-    
-    # 5e. Promotional content - more lenient
-    if config.exclude_promo:
-        matched_promo = [term for term in EXCLUSION_PROMOTIONAL if term in normalized]
-        if matched_promo:
-            # Don't exclude if ANY recruitment signal is present
-            has_recruitment = any(sig in normalized for sig in [
-                "recrute", "recruiting", "hiring", "cdi", "cdd", 
-                "poste", "offre", "juriste", "avocat", "notaire"
-            ])
-            if not has_recruitment:
-                return ExclusionResult(True, "contenu_promotionnel", matched_promo)
-    
-    # 5b. Sponsored content
-    if config.exclude_sponsored:
-        matched_sponsored = [term for term in EXCLUSION_SPONSORED if term in normalized]
-        if matched_sponsored:
-            # Don't exclude if clear recruitment signal
-            has_recruitment = any(sig in normalized for sig in [
-                "recrute", "cdi", "cdd", "poste a pourvoir"
-            ])
-            if not has_recruitment:
-                return ExclusionResult(True, "contenu_sponsorise", matched_sponsored)
-    
-    # 5f. Emotional/Personal posts
-    if config.exclude_emotional:
-        matched_emotional = [term for term in EXCLUSION_EMOTIONAL if term in normalized]
-        if matched_emotional:
-            # Don't exclude if clear recruitment signal
-            has_recruitment = any(sig in normalized for sig in [
-                "recrute", "cdi", "cdd", "poste a pourvoir", "hiring",
-                "nous recherchons", "on recherche"
-            ])
-            if not has_recruitment:
-                return ExclusionResult(True, "post_emotionnel", matched_emotional)
-    
-    # 6. Recruitment agencies
-    if config.exclude_agencies:
-        for term in EXCLUSION_RECRUITMENT_AGENCIES:
-            if term in normalized:
-                return ExclusionResult(True, "cabinet_recrutement", [term])
-    
-    # 7. Non-legal professions - Check if the JOB BEING RECRUITED is non-legal
-    if config.exclude_non_legal:
-        # First check if there's a legal job term - if yes, don't exclude
-        has_legal_job = any(term in normalized for term in [
-            "juriste", "avocat", "notaire", "legal", "juridique", 
-            "counsel", "paralegal", "clerc"
-        ])
-        
-        if not has_legal_job:
-            # Only check non-legal exclusions if no legal job is mentioned
-            recruitment_patterns = ["recrute", "recherche", "recherchons", "poste de", "poste d"]
-            for term in EXCLUSION_NON_LEGAL_JOBS:
-                if term in normalized:
-                    # Check if this non-legal term is the TARGET of recruitment
-                    term_idx = normalized.find(term)
-                    # Look at context around the term (50 chars before)
-                    context_before = normalized[max(0, term_idx-50):term_idx]
-                    is_recruitment_target = any(pat in context_before for pat in recruitment_patterns)
-                    
-                    # Also check for title patterns like "Directeur Financier recherché"
-                    context_after = normalized[term_idx:term_idx+30]
-                    is_job_title = "recherche" in context_after or term_idx < 50  # Term appears early = likely the job title
-                    
-                    if is_recruitment_target or is_job_title:
-                        return ExclusionResult(True, "metier_non_juridique", [term])
-    
-    # 8. Posts older than 3 weeks
-    if post_date:
-        now = datetime.now(timezone.utc)
-        if post_date.tzinfo is None:
-            post_date = post_date.replace(tzinfo=timezone.utc)
-        age = now - post_date
-        if age > timedelta(weeks=3):
-            return ExclusionResult(True, "post_trop_ancien", 
-                                   [f"{age.days} jours"])
-    
-    # 9. Short posts without explicit recruitment signal
-    # Posts < 150 chars need a VERY explicit recruitment signal
-    if len(normalized) < 150:
-        explicit_signals = [
-            "nous recrutons", "on recrute", "poste a pourvoir",
-            "cdi", "cdd", "hiring", "postulez"
-        ]
-        has_explicit = any(sig in normalized for sig in explicit_signals)
-        if not has_explicit:
-            # Check if it's just a link share
-            if "https" in normalized or "lnkd.in" in normalized:
-                return ExclusionResult(True, "post_trop_court", ["lien sans contexte"])
-    
-    # 10. Check for coherence: if recruitment mentioned, ensure it's for a legal job
-    recruitment_words = ["recrute", "recherche", "recherchons", "poste de", "poste d"]
-    has_recruitment_context = any(word in normalized for word in recruitment_words)
-    
-    if has_recruitment_context:
-        legal_job_titles = [
-            "juriste", "avocat", "notaire", "paralegal", "legal",
-            "juridique", "counsel", "clerc", "fiscaliste", "compliance"
-        ]
-        has_legal_job = any(job in normalized for job in legal_job_titles)
-        
-        # If recruiting but no legal job mentioned, exclude
-        if not has_legal_job:
-            # Check for non-legal job titles being recruited
-            non_legal_jobs = [
-                "marketing", "commercial", "finance", "rh", "developpeur",
-                "comptable", "gestionnaire", "assistant administratif",
-                "chef de projet", "product manager", "data"
-            ]
-            recruited_non_legal = any(job in normalized for job in non_legal_jobs)
-            if recruited_non_legal:
-                return ExclusionResult(True, "recrutement_non_juridique", ["poste non juridique"])
-    
+    hits = _scan(normalized)
+    stats = _RULE_STATS
+
+    for rule in EXCLUSION_RULES:
+        if rule.flag is not None and not getattr(config, rule.flag):
+            continue
+        st = stats[rule.reason]
+        st.evaluated += 1
+        if rule.category is not None:
+            if not hits.has(rule.category):
+                continue
+            st.gated += 1
+        if rule.override is not None and hits.has(rule.override):
+            continue
+        if rule.require is not None and not hits.has(rule.require):
+            continue
+        if rule.check is not None:
+            matched = rule.check(normalized, hits, post_date)
+            if matched is None:
+                continue
+        elif rule.details == "first":
+            matched = [hits.first(rule.category)]
+        else:
+            matched = hits.terms(rule.category)
+        st.fired += 1
+        return ExclusionResult(True, rule.reason, matched)
+
     return ExclusionResult(False, "", [])
 
 
@@ -1246,6 +1256,79 @@ TARGET_JOBS_16 = {
 }
 
 
+# Ces termes indiquent une entreprise juridique, pas une agence de recrutement
+_LEGITIMATE_LEGAL_FIRMS = [
+    "cabinet d avocat", "cabinet d'avocat", "cabinet avocat",
+    "cabinet juridique", "cabinet legal",
+    "etude notariale", "etude de notaire",
+    "direction juridique", "service juridique",
+]
+
+_KNOWN_AGENCIES = [
+    # Cabinets juridiques spécialisés (RECRUTEMENT)
+    "fed legal", "fed juridique",
+    "michael page", "page group", "page personnel",
+    "walters people", "robert walters",
+    "hays",
+
+    # Autres grands cabinets de recrutement
+    "robert half", "expectra", "adecco", "manpower", "randstad",
+    "spring professional", "lincoln associates", "laurence simons",
+    "taylor root", "morgan philips", "spencer stuart",
+    "russell reynolds", "egon zehnder", "korn ferry",
+    "boyden", "heidrick struggles", "odgers berndtson",
+
+    # Termes explicites d'agence de recrutement
+    "cabinet de recrutement", "cabinet recrutement",
+    "agence de recrutement", "agence recrutement",
+    "chasseur de tetes", "chasseuse de tetes",
+    "headhunter", "executive search",
+]
+
+# Toujours une agence, même dans un post de cabinet juridique
+_EXPLICIT_AGENCY_TERMS = [
+    "cabinet de recrutement", "cabinet recrutement",
+    "agence de recrutement", "agence recrutement",
+]
+
+# Ces patterns indiquent une agence qui recrute POUR quelqu'un d'autre
+_INDIRECT_RECRUITMENT_PATTERNS = [
+    # "Pour notre client"
+    "pour notre client", "pour l un de nos clients",
+    "pour l une de nos clientes", "pour le compte de",
+    "pour le compte d un client", "pour le compte d une cliente",
+
+    # "Client confidentiel"
+    "client confidentiel", "societe confidentielle",
+    "entreprise confidentielle",
+
+    # "Mandat de recrutement"
+    "mandat de recrutement",
+    # NOTE: "nous recrutons pour" retiré car trop de faux positifs
+    # Ex: "Nous recrutons pour le poste de Notaire" = légitime
+
+    # "Au nom de" (attention: pas "pour le compte de notre cabinet")
+    "au nom de notre client",
+]
+
+_DIRECT_COMPANY_SIGNALS = [
+    "notre equipe", "notre cabinet", "notre direction",
+    "notre etude", "notre groupe", "notre societe",
+    "notre entreprise", "notre organisation",
+]
+
+# Langage très générique d'agence uniquement (réduire les faux positifs)
+_AGENCY_SUSPICIOUS_PATTERNS = [
+    "nous recherchons un profil pour",
+    "candidat ideal pour notre client",
+]
+
+_DIRECT_COMPANY_SIGNALS_CORE = [
+    "notre equipe", "notre cabinet", "notre direction",
+    "notre etude", "notre groupe",
+]
+
+
 def is_recruitment_agency_strict(text: str) -> Tuple[bool, str]:
     """
     DÉTECTION STRICTE DES CABINETS DE RECRUTEMENT.
@@ -1258,80 +1341,24 @@ def is_recruitment_agency_strict(text: str) -> Tuple[bool, str]:
     - "cabinet de recrutement" (agence) vs "cabinet d'avocats" (entreprise légitime)
     - "cabinet juridique" est une entreprise légitime
     """
-    normalized = normalize_text(text)
+    hits = _scan(normalize_text(text))
     
     # ========== VÉRIFIER D'ABORD SI C'EST UN CABINET JURIDIQUE LÉGITIME ==========
-    # Ces termes indiquent une entreprise juridique, pas une agence de recrutement
-    legitimate_legal_firms = [
-        "cabinet d avocat", "cabinet d'avocat", "cabinet avocat",
-        "cabinet juridique", "cabinet legal",
-        "etude notariale", "etude de notaire",
-        "direction juridique", "service juridique",
-    ]
-    is_legal_firm = any(lf in normalized for lf in legitimate_legal_firms)
+    is_legal_firm = hits.has("_LEGITIMATE_LEGAL_FIRMS")
     
     # ========== CABINETS DE RECRUTEMENT CONNUS ==========
-    known_agencies = [
-        # Cabinets juridiques spécialisés (RECRUTEMENT)
-        "fed legal", "fed juridique",
-        "michael page", "page group", "page personnel",
-        "walters people", "robert walters",
-        "hays",
-        
-        # Autres grands cabinets de recrutement
-        "robert half", "expectra", "adecco", "manpower", "randstad",
-        "spring professional", "lincoln associates", "laurence simons",
-        "taylor root", "morgan philips", "spencer stuart",
-        "russell reynolds", "egon zehnder", "korn ferry",
-        "boyden", "heidrick struggles", "odgers berndtson",
-        
-        # Termes explicites d'agence de recrutement
-        "cabinet de recrutement", "cabinet recrutement",
-        "agence de recrutement", "agence recrutement",
-        "chasseur de tetes", "chasseuse de tetes",
-        "headhunter", "executive search",
-    ]
-    
-    for agency in known_agencies:
-        if agency in normalized:
-            # Si c'est aussi un cabinet juridique légitime, ne pas exclure
-            if is_legal_firm and agency not in ["cabinet de recrutement", "cabinet recrutement", 
-                                                   "agence de recrutement", "agence recrutement"]:
-                continue
-            return True, f"Cabinet connu: {agency}"
+    for agency in hits.terms("_KNOWN_AGENCIES"):
+        # Si c'est aussi un cabinet juridique légitime, ne pas exclure
+        if is_legal_firm and agency not in _EXPLICIT_AGENCY_TERMS:
+            continue
+        return True, f"Cabinet connu: {agency}"
     
     # ========== PATTERNS DE RECRUTEMENT INDIRECT ==========
-    # Ces patterns indiquent une agence qui recrute POUR quelqu'un d'autre
-    indirect_patterns = [
-        # "Pour notre client"
-        "pour notre client", "pour l un de nos clients",
-        "pour l une de nos clientes", "pour le compte de",
-        "pour le compte d un client", "pour le compte d une cliente",
-        
-        # "Client confidentiel"
-        "client confidentiel", "societe confidentielle",
-        "entreprise confidentielle",
-        
-        # "Mandat de recrutement"
-        "mandat de recrutement",
-        # NOTE: "nous recrutons pour" retiré car trop de faux positifs
-        # Ex: "Nous recrutons pour le poste de Notaire" = légitime
-        
-        # "Au nom de" (attention: pas "pour le compte de notre cabinet")
-        "au nom de notre client",
-    ]
-    
-    indirect_count = sum(1 for p in indirect_patterns if p in normalized)
+    indirect_count = hits.count("_INDIRECT_RECRUITMENT_PATTERNS")
     
     if indirect_count >= 1:
         # Vérifier qu'il y a AUSSI un signal d'entreprise directe
-        direct_company_signals = [
-            "notre equipe", "notre cabinet", "notre direction",
-            "notre etude", "notre groupe", "notre societe",
-            "notre entreprise", "notre organisation",
-        ]
-        
-        has_direct_signal = any(ds in normalized for ds in direct_company_signals)
+        has_direct_signal = hits.has("_DIRECT_COMPANY_SIGNALS")
         
         # Si c'est un cabinet juridique avec "notre cabinet", c'est légitime
         if is_legal_firm and has_direct_signal:
@@ -1342,21 +1369,11 @@ def is_recruitment_agency_strict(text: str) -> Tuple[bool, str]:
     
     # ========== PATTERNS SUSPECTS D'AGENCE ==========
     # Ces patterns suggèrent une agence même sans mention explicite
-    # ATTENTION: Réduire les faux positifs
-    agency_suspicious_patterns = [
-        # Langage très générique d'agence uniquement
-        "nous recherchons un profil pour",
-        "candidat ideal pour notre client",
-    ]
-    
-    suspicious_count = sum(1 for p in agency_suspicious_patterns if p in normalized)
+    suspicious_count = hits.count("_AGENCY_SUSPICIOUS_PATTERNS")
     
     # Si patterns suspects ET pas de cabinet juridique
     if suspicious_count >= 1 and not is_legal_firm:
-        has_direct_signal = any(ds in normalized for ds in [
-            "notre equipe", "notre cabinet", "notre direction",
-            "notre etude", "notre groupe",
-        ])
+        has_direct_signal = hits.has("_DIRECT_COMPANY_SIGNALS_CORE")
         
         if not has_direct_signal:
             return True, "Patterns suspects d'agence"
@@ -1364,6 +1381,36 @@ def is_recruitment_agency_strict(text: str) -> Tuple[bool, str]:
     return False, ""
 
 
+# Termes génériques quand aucun des 16 métiers n'est détecté
+_GENERIC_TARGET_JOBS = {
+    "juriste": ["juriste"],
+    "avocat": ["avocat", "avocate"],
+    "notaire": ["notaire"],
+    "paralegal": ["paralegal", "paralegale"],
+}
+
+_SPECIALIZATION_KEYWORDS = {
+    "droit social": ["droit social", "droit du travail"],
+    "droit des affaires": ["droit des affaires", "business law"],
+    "droit fiscal": ["droit fiscal", "fiscalite"],
+    "droit immobilier": ["droit immobilier", "real estate"],
+    "droit de la propriété intellectuelle": ["propriete intellectuelle", "ip", "brevets"],
+    "droit pénal": ["droit penal", "penal"],
+    "droit public": ["droit public"],
+    "droit des contrats": ["droit des contrats", "contrats"],
+    "contentieux": ["contentieux"],
+    "compliance": ["compliance", "conformite"],
+    "corporate": ["corporate", "m&a", "fusions acquisitions"],
+}
+
+_EXPERIENCE_KEYWORDS = {
+    "junior": ["junior", "debutant", "0-2 ans"],
+    "confirmé": ["confirme", "3-5 ans", "3 a 5 ans"],
+    "senior": ["senior", "experimente", "5+ ans", "10+ ans"],
+    "manager": ["manager", "responsable", "directeur"],
+}
+
+
 def detect_specialized_job_info(text: str) -> dict:
     """
     Détecte les informations spécialisées sur le poste.
@@ -1374,55 +1421,30 @@ def detect_specialized_job_info(text: str) -> dict:
         - specializations: List des spécialisations (droit social, etc.)
         - experience_levels: List des niveaux d'expérience
     """
-    normalized = normalize_text(text)
+    hits = _scan(normalize_text(text))
     
     # Détecter les 16 métiers cibles
     target_jobs = []
     for job_name, keywords in TARGET_JOBS_16.items():
-        if any(keyword in normalized for keyword in keywords):
+        if any(keyword in hits for keyword in keywords):
             target_jobs.append(job_name)
     
     # Si aucun métier spécifique, vérifier les termes génériques
     if not target_jobs:
-        generic_terms = {
-            "juriste": ["juriste"],
-            "avocat": ["avocat", "avocate"],
-            "notaire": ["notaire"],
-            "paralegal": ["paralegal", "paralegale"],
-        }
-        for job_name, keywords in generic_terms.items():
-            if any(keyword in normalized for keyword in keywords):
+        for job_name, keywords in _GENERIC_TARGET_JOBS.items():
+            if any(keyword in hits for keyword in keywords):
                 target_jobs.append(job_name)
     
     # Détecter les spécialisations
     specializations = []
-    spec_keywords = {
-        "droit social": ["droit social", "droit du travail"],
-        "droit des affaires": ["droit des affaires", "business law"],
-        "droit fiscal": ["droit fiscal", "fiscalite"],
-        "droit immobilier": ["droit immobilier", "real estate"],
-        "droit de la propriété intellectuelle": ["propriete intellectuelle", "ip", "brevets"],
-        "droit pénal": ["droit penal", "penal"],
-        "droit public": ["droit public"],
-        "droit des contrats": ["droit des contrats", "contrats"],
-        "contentieux": ["contentieux"],
-        "compliance": ["compliance", "conformite"],
-        "corporate": ["corporate", "m&a", "fusions acquisitions"],
-    }
-    for spec_name, keywords in spec_keywords.items():
-        if any(keyword in normalized for keyword in keywords):
+    for spec_name, keywords in _SPECIALIZATION_KEYWORDS.items():
+        if any(keyword in hits for keyword in keywords):
             specializations.append(spec_name)
     
     # Détecter les niveaux d'expérience
     experience_levels = []
-    exp_keywords = {
-        "junior": ["junior", "debutant", "0-2 ans"],
-        "confirmé": ["confirme", "3-5 ans", "3 a 5 ans"],
-        "senior": ["senior", "experimente", "5+ ans", "10+ ans"],
-        "manager": ["manager", "responsable", "directeur"],
-    }
-    for exp_name, keywords in exp_keywords.items():
-        if any(keyword in normalized for keyword in keywords):
+    for exp_name, keywords in _EXPERIENCE_KEYWORDS.items():
+        if any(keyword in hits for keyword in keywords):
             experience_levels.append(exp_name)
     
     return {
@@ -1432,6 +1454,33 @@ def detect_specialized_job_info(text: str) -> dict:
     }
 
 
+# Un recruteur qui parle à la première personne
+_RECRUITER_PATTERNS = [
+    "nous recrutons", "on recrute", "je suis a la recherche d un juriste",
+    "je suis a la recherche d une juriste", "je suis a la recherche d un avocat",
+    "je suis a la recherche d une avocate", "je recherche un juriste",
+    "je recherche une juriste", "je recherche un avocat", "je recherche une avocate",
+    "je recherche un paralegal", "je recherche un notaire",
+    "poste a pourvoir", "cdi a pourvoir", "cdd a pourvoir",
+    "postulez", "candidatez", "envoyez votre cv",
+    "rejoindre notre equipe", "rejoindre mon equipe",
+    "recrute un", "recrute une", "pour notre cabinet",
+]
+
+# Candidats cherchant du travail
+_CANDIDATE_PATTERNS = [
+    "je recherche un poste", "je recherche un emploi",
+    "je cherche un poste", "je cherche un emploi", 
+    "je suis en recherche active", "je suis en recherche d emploi",
+    "je suis a la recherche d un poste", "je suis a la recherche d un emploi",
+    "opentowork", "open to work",
+    "mon cv", "mon profil est disponible",
+    "je suis juriste disponible", "je suis avocat disponible", 
+    "je suis avocate disponible",
+    "je me permets de vous contacter", "je suis actuellement a l ecoute",
+]
+
+
 def is_first_person_post(text: str) -> bool:
     """
     Détecte si le post est écrit à la première personne par un CANDIDAT cherchant emploi.
@@ -1442,38 +1491,61 @@ def is_first_person_post(text: str) -> bool:
     AMÉLIORATION: On vérifie si c'est un candidat cherchant du travail,
     PAS un recruteur qui parle à la première personne.
     """
-    normalized = normalize_text(text)
+    hits = _scan(normalize_text(text))
     
     # EXCLUSION: Si c'est clairement un recruteur qui parle, NE PAS exclure
-    recruiter_patterns = [
-        "nous recrutons", "on recrute", "je suis a la recherche d un juriste",
-        "je suis a la recherche d une juriste", "je suis a la recherche d un avocat",
-        "je suis a la recherche d une avocate", "je recherche un juriste",
-        "je recherche une juriste", "je recherche un avocat", "je recherche une avocate",
-        "je recherche un paralegal", "je recherche un notaire",
-        "poste a pourvoir", "cdi a pourvoir", "cdd a pourvoir",
-        "postulez", "candidatez", "envoyez votre cv",
-        "rejoindre notre equipe", "rejoindre mon equipe",
-        "recrute un", "recrute une", "pour notre cabinet",
-    ]
-    
-    if any(pattern in normalized for pattern in recruiter_patterns):
+    if hits.has("_RECRUITER_PATTERNS"):
         return False  # C'est un recruteur, pas un candidat
     
     # Patterns de candidats cherchant du travail
-    candidate_patterns = [
-        "je recherche un poste", "je recherche un emploi",
-        "je cherche un poste", "je cherche un emploi", 
-        "je suis en recherche active", "je suis en recherche d emploi",
-        "je suis a la recherche d un poste", "je suis a la recherche d un emploi",
-        "opentowork", "open to work",
-        "mon cv", "mon profil est disponible",
-        "je suis juriste disponible", "je suis avocat disponible", 
-        "je suis avocate disponible",
-        "je me permets de vous contacter", "je suis actuellement a l ecoute",
-    ]
-    
-    return any(pattern in normalized for pattern in candidate_patterns)
+    return hits.has("_CANDIDATE_PATTERNS")
+
+
+# Métiers NON-juridiques recrutés (même si "notaire" apparaît dans le contexte)
+_NON_LEGAL_RECRUITMENT_PATTERNS = [
+    # Courtiers, agents immobiliers, commerciaux
+    "recrutons de nouveaux courtiers", "recrutons des courtiers",
+    "recrute des courtiers", "recrute un courtier", "recrute une courtiere",
+    "devenir courtier", "devenir agent immobilier",
+    "recrutons des commerciaux", "recrute des commerciaux",
+    "recrute un commercial", "recrute une commerciale",
+    "agent commercial", "agente commerciale", "agents commerciaux",
+    "agent e commercial", "commercial e en immobilier",  # variantes inclusives
+    "conseiller commercial", "conseillere commerciale",
+    "negociateur immobilier", "negociatrice immobiliere",
+    # Contexte immobilier où "notaire" est mentionné mais pas recruté
+    "au notaire", "chez le notaire",  # "piloter le cycle de vente... au notaire"
+    "signature chez le notaire", "acte chez le notaire",
+    "rendez-vous chez le notaire", "rdv chez le notaire",
+    "passage chez le notaire", "frais de notaire", "frais de notaires",
+    "honoraires de notaire", "honoraires du notaire",
+    "office du notaire",
+    # Agents et conseillers (non juridiques)
+    "recrute des conseillers", "recrutons des conseillers",
+    "recrute un conseiller", "recrute une conseillere",
+    "recrute des agents", "recrutons des agents",
+    # Contexte où "notaire" est juste mentionné comme référence
+    "ne m appelez plus", "frais de notaire",  # articles d'opinion
+]
+
+_GENERIC_LEGAL_JOBS = [
+    "juriste", "avocat", "avocate", "notaire", "paralegal", "paralegale", 
+    "legal counsel", "counsel", "clerc", "fiscaliste",
+    "directeur juridique", "directrice juridique",
+    "responsable juridique", "directeur fiscal", "directrice fiscale",
+]
+
+_COHERENCE_RECRUITMENT_WORDS = [
+    "recrute", "recrutons", "recherche", "recherchons",
+    "poste", "cdi", "cdd", "hiring",
+]
+
+# Autres métiers de la même entreprise
+_COHERENCE_NON_LEGAL_JOBS = [
+    "developpeur", "developer", "data scientist",
+    "marketing manager", "commercial",
+    "comptable", "assistant administratif",
+]
 
 
 def is_coherent_legal_recruitment(text: str) -> bool:
@@ -1484,89 +1556,44 @@ def is_coherent_legal_recruitment(text: str) -> bool:
     ou qui recrutent pour un autre métier (ex: courtier, commercial).
     """
     normalized = normalize_text(text)
+    hits = _scan(normalized)
     
     # ÉTAPE 0: Vérifier si c'est un recrutement pour un métier NON-juridique
     # Ces métiers ne sont PAS des cibles même s'ils mentionnent "notaire" dans le contexte
-    non_legal_recruitment_patterns = [
-        # Courtiers, agents immobiliers, commerciaux
-        "recrutons de nouveaux courtiers", "recrutons des courtiers",
-        "recrute des courtiers", "recrute un courtier", "recrute une courtiere",
-        "devenir courtier", "devenir agent immobilier",
-        "recrutons des commerciaux", "recrute des commerciaux",
-        "recrute un commercial", "recrute une commerciale",
-        "agent commercial", "agente commerciale", "agents commerciaux",
-        "agent e commercial", "commercial e en immobilier",  # variantes inclusives
-        "conseiller commercial", "conseillere commerciale",
-        "negociateur immobilier", "negociatrice immobiliere",
-        # Contexte immobilier où "notaire" est mentionné mais pas recruté
-        "au notaire", "chez le notaire",  # "piloter le cycle de vente... au notaire"
-        "signature chez le notaire", "acte chez le notaire",
-        "rendez-vous chez le notaire", "rdv chez le notaire",
-        "passage chez le notaire", "frais de notaire", "frais de notaires",
-        "honoraires de notaire", "honoraires du notaire",
-        "office du notaire",
-        # Agents et conseillers (non juridiques)
-        "recrute des conseillers", "recrutons des conseillers",
-        "recrute un conseiller", "recrute une conseillere",
-        "recrute des agents", "recrutons des agents",
-        # Contexte où "notaire" est juste mentionné comme référence
-        "ne m appelez plus", "frais de notaire",  # articles d'opinion
-    ]
-    
-    if any(pattern in normalized for pattern in non_legal_recruitment_patterns):
+    if hits.has("_NON_LEGAL_RECRUITMENT_PATTERNS"):
         return False
     
     # Vérifier si un des 16 métiers est mentionné
     target_job_found = False
     found_job = None
     for job_name, keywords in TARGET_JOBS_16.items():
-        if any(keyword in normalized for keyword in keywords):
+        if any(keyword in hits for keyword in keywords):
             target_job_found = True
             found_job = job_name
             break
     
     # Si aucun des 16 métiers spécifiques, vérifier les termes génériques
     if not target_job_found:
-        generic_legal_jobs = ["juriste", "avocat", "avocate", "notaire", "paralegal", "paralegale", 
-                              "legal counsel", "counsel", "clerc", "fiscaliste",
-                              "directeur juridique", "directrice juridique",
-                              "responsable juridique", "directeur fiscal", "directrice fiscale"]
-        for term in generic_legal_jobs:
-            if term in normalized:
-                target_job_found = True
-                found_job = term
-                break
+        term = hits.first("_GENERIC_LEGAL_JOBS")
+        if term:
+            target_job_found = True
+            found_job = term
     
     if not target_job_found:
         return False
     
     # Vérifier qu'il y a un signal de recrutement
-    recruitment_words = [
-        "recrute", "recrutons", "recherche", "recherchons",
-        "poste", "cdi", "cdd", "hiring"
-    ]
-    has_recruitment = any(word in normalized for word in recruitment_words)
+    has_recruitment = hits.has("_COHERENCE_RECRUITMENT_WORDS")
     
     if not has_recruitment:
         # Métier mentionné SANS recrutement = REJET
         return False
     
     # Vérifier que le poste recruté est bien un des 16 métiers
-    # (pas un autre métier dans la même entreprise)
-    non_legal_jobs = [
-        "developpeur", "developer", "data scientist",
-        "marketing manager", "commercial",
-        "comptable", "assistant administratif",
-    ]
-    
-    # Si un métier non-juridique est mentionné dans le contexte de recrutement
-    for non_legal in non_legal_jobs:
-        if non_legal in normalized:
-            # Vérifier si c'est le FOCUS du recrutement (après "recrute" ou "recherche")
-            # Chercher le pattern "recrute/recherche [quelques mots] métier non-juridique"
-            pattern = rf"(recrute|recherche|recherchons)\s+(?:un|une)?\s*{non_legal}"
-            if re.search(pattern, normalized):
-                return False
+    # (pas un autre métier dans la même entreprise): "recrute/recherche
+    # [un|une] métier non-juridique" = le FOCUS du recrutement
+    if hits.has("_COHERENCE_NON_LEGAL_JOBS") and _PATTERNS.coherence_non_legal_target.search(normalized):
+        return False
     
     return True
 
@@ -1702,6 +1729,17 @@ class FilterConfig:
 # Default configuration
 DEFAULT_FILTER_CONFIG = FilterConfig()
 
+# Localisation (étape 7 de is_legal_job_post)
+_POST_FRANCE_INDICATORS = [
+    "france", "paris", "lyon", "marseille", "bordeaux",
+    "toulouse", "nantes", "lille", "strasbourg", "nice",
+    "rennes", "grenoble", "montpellier", "la defense",
+]
+_POST_FOREIGN_INDICATORS = [
+    "canada", "usa", "belgique", "suisse", "uk",
+    "allemagne", "espagne", "italie", "singapour",
+]
+
 
 def is_legal_job_post(
     text: str,
@@ -1722,7 +1760,8 @@ def is_legal_job_post(
     6. Contenu informatif (articles, blogs, webinaires)
     
     Args:
-        text: Raw post text
+        text: Raw post text, or its NormalizedText view (normalized once and
+            shared by every helper below)
         post_date: Optional datetime of the post (for age filtering)
         log_exclusions: Whether to log exclusion reasons
         config: Optional FilterConfig for custom thresholds and exclusion toggles
@@ -1733,7 +1772,8 @@ def is_legal_job_post(
     if config is None:
         config = DEFAULT_FILTER_CONFIG
         
-    normalized = normalize_text(text)
+    text = NormalizedText.of(text)
+    hits = _scan(text.normalized)
     
     # Vérification texte vide
     if not text or not text.strip():
@@ -1889,18 +1929,8 @@ def is_legal_job_post(
     
     # ========== ÉTAPE 7: VÉRIFIER LA LOCALISATION ==========
     if config.exclude_foreign:
-        france_indicators = [
-            "france", "paris", "lyon", "marseille", "bordeaux",
-            "toulouse", "nantes", "lille", "strasbourg", "nice",
-            "rennes", "grenoble", "montpellier", "la defense",
-        ]
-        has_france = any(f in normalized for f in france_indicators)
-        
-        foreign_indicators = [
-            "canada", "usa", "belgique", "suisse", "uk",
-            "allemagne", "espagne", "italie", "singapour",
-        ]
-        has_foreign = any(f in normalized for f in foreign_indicators)
+        has_france = hits.has("_POST_FRANCE_INDICATORS")
+        has_foreign = hits.has("_POST_FOREIGN_INDICATORS")
         
         if has_foreign and not has_france:
             result = FilterResult(
@@ -29,9 +29,12 @@ import unicodedata
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from enum import Enum, auto
+from functools import lru_cache
 from typing import List, Optional, Tuple, Dict, Any
 import logging
 
+from .patterns import PatternRegistry
+
 # Import de la configuration juridique
 try:
     from filters.juridique import (
@@ -107,6 +110,22 @@ AGENCY_INDICATORS = [
     r"\bpour (le compte de|l'un de) nos? clients?\b",
 ]
 
+_PATTERNS = PatternRegistry(
+    emojis=r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]+',
+    whitespace=r'\s+',
+    follower_count=r'(\d[\d\s,.]*)+(k|m)?\s*(abonné|follower|employé|employee)',
+)
+
+
+@lru_cache(maxsize=1)
+def _indicator_patterns() -> Tuple[List[re.Pattern], List[re.Pattern], List[re.Pattern]]:
+    """(company page, individual profile, agency) indicator regexes, compiled on first use."""
+    def compile_all(patterns: List[str]) -> List[re.Pattern]:
+        return [re.compile(p, re.IGNORECASE) for p in patterns]
+
+    return (compile_all(COMPANY_PAGE_INDICATORS), compile_all(INDIVIDUAL_PROFILE_INDICATORS),
+            compile_all(AGENCY_INDICATORS))
+
 
 # =============================================================================
 # DATACLASSES DE RÉSULTAT
@@ -203,10 +222,8 @@ class LinkedInPostAnalyzer:
         self.config = config or get_default_config()
         self._compiled_patterns = self.config.compile_patterns()
         
-        # Compile les patterns additionnels
-        self._company_patterns = [re.compile(p, re.IGNORECASE) for p in COMPANY_PAGE_INDICATORS]
-        self._individual_patterns = [re.compile(p, re.IGNORECASE) for p in INDIVIDUAL_PROFILE_INDICATORS]
-        self._agency_patterns = [re.compile(p, re.IGNORECASE) for p in AGENCY_INDICATORS]
+        # Patterns additionnels (compilés une fois par process)
+        self._company_patterns, self._individual_patterns, self._agency_patterns = _indicator_patterns()
     
     def _normalize_text(self, text: str) -> str:
         """Normalise le texte pour l'analyse."""
@@ -218,9 +235,9 @@ class LinkedInPostAnalyzer:
         text = unicodedata.normalize('NFKD', text)
         text = ''.join(c for c in text if not unicodedata.combining(c))
         # Remove emojis
-        text = re.sub(r'[\U0001F600-\U0001F64F\U0001F300-\U0001F5FF\U0001F680-\U0001F6FF\U0001F1E0-\U0001F1FF]+', '', text)
+        text = _PATTERNS.emojis.sub('', text)
         # Normalize whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _PATTERNS.whitespace.sub(' ', text).strip()
         return text
     
     def analyze_author(
@@ -308,7 +325,7 @@ class LinkedInPostAnalyzer:
                 indicators.append(f"individual_pattern: {pattern.pattern[:30]}")
         
         # Nombre d'abonnés/followers (indicateur de page entreprise)
-        follower_match = re.search(r'(\d[\d\s,.]*)+(k|m)?\s*(abonné|follower|employé|employee)', combined)
+        follower_match = _PATTERNS.follower_count.search(combined)
         if follower_match:
             company_score += 0.15
             indicators.append("has_follower_count")
@@ -607,7 +624,7 @@ def is_relevant_for_titan(
         if is_relevant_for_titan(text, author):
             # Traiter le post
     """
-    analyzer = LinkedInPostAnalyzer(config)
+    analyzer = _default_analyzer() if config is None else LinkedInPostAnalyzer(config)
     result = analyzer.analyze_post(
         text=text,
         author=author,
@@ -617,6 +634,12 @@ def is_relevant_for_titan(
     return result.relevance in (PostRelevance.HIGH, PostRelevance.MEDIUM)
 
 
+@lru_cache(maxsize=1)
+def _default_analyzer() -> LinkedInPostAnalyzer:
+    """Shared analyzer for the default configuration (patterns compiled once)."""
+    return LinkedInPostAnalyzer()
+
+
 def get_post_summary(result: PostAnalysisResult) -> str:
     """
     Génère un résumé textuel de l'analyse d'un post.
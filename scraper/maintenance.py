@@ -1,64 +1,145 @@
-"""Maintenance utilities: recompute recruitment_score across backends.
+"""Maintenance utilities: recompute recruitment_score across backends, compact duplicates.
 
-Functions here are imported by the CLI script `scripts/recompute_recruitment_scores.py` and
-can be unit tested independently.
+Functions here are imported by the CLI scripts `scripts/recompute_recruitment_scores.py`
+and `scripts/compact_duplicates.py` and can be unit tested independently.
 """
 from __future__ import annotations
 
 import sqlite3
 import csv
 from pathlib import Path
+from typing import Callable, List, Optional
 
 import structlog
 
 from . import utils
+from .batch_runner import BatchRunStats, run_batches
 from .bootstrap import AppContext, get_context
+from .display_fields import backfill_display_fields, compute_display_fields, derive_company_norm
 
 logger = structlog.get_logger().bind(component="maintenance")
 
 
-def recompute_sqlite(sqlite_path: str, force: bool = False) -> int:
+# Bump when utils.compute_recruitment_signal (tokens or formula) changes; rows
+# scored by an older version are rescored by the next recompute run.
+RECRUITMENT_SCORE_VERSION = 1
+
+
+def recompute_sqlite(
+    sqlite_path: str,
+    force: bool = False,
+    batch_size: int = 500,
+    workers: int = 1,
+    progress: Optional[Callable[[BatchRunStats], None]] = None,
+) -> int:
     """Recompute recruitment_score in a SQLite fallback DB.
 
-    Adds column if missing. Returns number of rows updated.
+    The ``recruitment_score`` / ``recruitment_score_version`` columns come
+    from the repository migrations; only rows whose version is older than
+    :data:`RECRUITMENT_SCORE_VERSION` are rescored (every row with ``force``).
+    Rows are walked by rowid in batches of ``batch_size`` through
+    :func:`~scraper.batch_runner.run_batches`: batches are scored by
+    ``workers`` processes and each one is written back as a single
+    executemany committed on its own, so memory stays flat, the write lock is
+    never held for the whole table and an interrupted run resumes where it
+    stopped. Returns number of rows updated.
     """
+    from .repository import get_repository
+
     path = Path(sqlite_path)
     if not path.exists():
         return 0
+    get_repository(str(path))  # applies pending migrations (score columns)
     conn = sqlite3.connect(str(path))
-    updated = 0
-    with conn:
-        # Add column if not present
-        cols = [r[1] for r in conn.execute("PRAGMA table_info(posts)").fetchall()]
-        if "recruitment_score" not in cols:
-            conn.execute("ALTER TABLE posts ADD COLUMN recruitment_score REAL")
-        rows = conn.execute("SELECT id, text, recruitment_score FROM posts").fetchall()
-        for pid, text, existing in rows:
-            if existing is not None and not force:
-                continue
-            score = utils.compute_recruitment_signal(text or "")
-            conn.execute(
-                "UPDATE posts SET recruitment_score=? WHERE id=?", (score, pid)
-            )
-            updated += 1
+    try:
+        stale_sql = "" if force else " AND (recruitment_score_version IS NULL OR recruitment_score_version < :version)"
+        stats = run_batches(
+            str(path),
+            f"SELECT rowid, text FROM posts WHERE rowid > :after{stale_sql} ORDER BY rowid LIMIT :limit",
+            score=_score_recruitment_rows,
+            write=_write_recruitment_scores,
+            params={"version": RECRUITMENT_SCORE_VERSION},
+            workers=workers,
+            chunk_size=batch_size,
+            label="recruitment_score",
+            progress=progress,
+            conn=conn,
+        )
+        updated = stats.written
+    finally:
+        conn.close()
+    if updated:
+        logger.info("recruitment_scores_recomputed", updated=updated, version=RECRUITMENT_SCORE_VERSION)
     return updated
 
 
+def _score_recruitment_rows(rows: List[tuple]) -> List[tuple]:
+    """(rowid, text) rows -> UPDATE parameters (runs in batch_runner workers)."""
+    return [
+        (utils.compute_recruitment_signal(text or ""), RECRUITMENT_SCORE_VERSION, rowid)
+        for rowid, text in rows
+    ]
+
+
+def _write_recruitment_scores(conn: sqlite3.Connection, values: List[tuple]) -> int:
+    conn.executemany("UPDATE posts SET recruitment_score=?, recruitment_score_version=? WHERE rowid=?", values)
+    return len(values)
+
+
+def normalize_company_norms(conn: sqlite3.Connection, batch_size: int = 500) -> tuple[int, int]:
+    """Fill ``posts.company_norm`` where it is empty (server loop and admin endpoint).
+
+    Candidate rows (author set, no company_norm) are walked by rowid in
+    batches of ``batch_size``; each batch is written with one executemany and
+    committed, so the whole table is never loaded at once. Blocking: run it
+    off the event loop. Returns (updated, scanned).
+    """
+    after = 0
+    updated = scanned = 0
+    while True:
+        rows = conn.execute(
+            "SELECT rowid, author, company, author_profile, text FROM posts"
+            " WHERE rowid > ? AND COALESCE(author, '') != '' AND TRIM(COALESCE(company_norm, '')) = ''"
+            " ORDER BY rowid LIMIT ?",
+            (after, batch_size),
+        ).fetchall()
+        if not rows:
+            break
+        after = rows[-1][0]
+        scanned += len(rows)
+        values = []
+        for rowid, author, comp, profile, text in rows:
+            derived = derive_company_norm(author, comp, profile, text)
+            if derived and (not comp or comp.strip().lower() == author.strip().lower() or derived != comp):
+                values.append((derived, rowid))
+        if values:
+            conn.executemany("UPDATE posts SET company_norm=? WHERE rowid=?", values)
+            updated += len(values)
+        conn.commit()
+    return updated, scanned
+
+
 def recompute_csv(csv_file: str, force: bool = False) -> int:
     """Recompute recruitment_score in a CSV fallback file.
 
-    Rewrites file in-place via temp file. Returns number of lines updated (excluding header).
+    Streams the file row by row into a temp file and only rescores rows whose
+    ``recruitment_score_version`` is stale (every row with ``force``). The
+    temp file replaces the original only when a row changed, so a rerun over
+    a current file leaves it untouched. Returns number of lines updated
+    (excluding header).
     """
     path = Path(csv_file)
     if not path.exists():
         return 0
     tmp_path = path.with_suffix(path.suffix + ".tmp")
     updated = 0
+    version = str(RECRUITMENT_SCORE_VERSION)
     with path.open("r", encoding="utf-8", newline="") as inp, tmp_path.open(
         "w", encoding="utf-8", newline=""
     ) as out:
         reader = csv.DictReader(inp)
         fieldnames = list(reader.fieldnames or [])
+        header_changed = False
         if "recruitment_score" not in fieldnames:
             # Insert after score if present
             if "score" in fieldnames:
@@ -66,26 +147,89 @@ def recompute_csv(csv_file: str, force: bool = False) -> int:
                 fieldnames.insert(idx, "recruitment_score")
             else:
                 fieldnames.append("recruitment_score")
+            header_changed = True
+        if "recruitment_score_version" not in fieldnames:
+            fieldnames.insert(fieldnames.index("recruitment_score") + 1, "recruitment_score_version")
+            header_changed = True
         writer = csv.DictWriter(out, fieldnames=fieldnames)
         writer.writeheader()
         for row in reader:
-            existing = row.get("recruitment_score")
-            if existing and existing.strip() != "" and not force:
+            if not force and _csv_version(row.get("recruitment_score_version")) >= RECRUITMENT_SCORE_VERSION:
                 writer.writerow(row)
                 continue
             score = utils.compute_recruitment_signal(row.get("text", ""))
             row["recruitment_score"] = f"{score:.4f}"
+            row["recruitment_score_version"] = version
             updated += 1
             writer.writerow(row)
-    tmp_path.replace(path)
+    if updated or header_changed:
+        tmp_path.replace(path)
+    else:
+        tmp_path.unlink()
     return updated
 
 
-async def recompute_all(force: bool = False) -> None:
+def _csv_version(value: str | None) -> int:
+    try:
+        return int(value or 0)
+    except ValueError:
+        return 0
+
+
+def compact_duplicate_posts(sqlite_path: str, opportunity_threshold: float = 0.05, dry_run: bool = False) -> int:
+    """Delete posts sharing a dedup_key, keeping one per key. Returns rows removed.
+
+    One-off cleanup for databases filled before uniq_posts_dedup_key existed
+    (new inserts are deduplicated by the index). Keys are recomputed from the
+    raw columns since colliding rows could not be backfilled. The survivor of
+    each group is a favorite if there is one, otherwise the first collected;
+    flags of removed rows are dropped with them.
+    """
+    from .repository import get_repository
+
+    if not Path(sqlite_path).exists():
+        return 0
+    with get_repository(sqlite_path).connection() as conn:
+        rows = conn.execute(
+            "SELECT p.id, p.author, p.company, p.author_profile, p.text, p.permalink, p.published_at"
+            " FROM posts p LEFT JOIN post_flags f ON f.post_id = p.id"
+            " ORDER BY COALESCE(f.is_favorite,0) DESC, p.collected_at ASC, p.rowid ASC"
+        ).fetchall()
+        seen: set[str] = set()
+        doomed: list[tuple[str]] = []
+        for pid, author, company, author_profile, text, permalink, published_at in rows:
+            key = compute_display_fields(
+                author, company, author_profile, text, permalink,
+                published_at=published_at, opportunity_threshold=opportunity_threshold,
+            )["dedup_key"]
+            if key in seen:
+                doomed.append((pid,))
+            elif key:
+                seen.add(key)
+        if dry_run:
+            return len(doomed)
+        if doomed:
+            conn.executemany("DELETE FROM post_flags WHERE post_id = ?", doomed)
+            conn.executemany("DELETE FROM posts WHERE id = ?", doomed)
+        # Survivors the backfill left without a key (collisions) get it now
+        conn.execute("UPDATE posts SET display_version = NULL WHERE dedup_key IS NULL")
+        conn.commit()
+        backfill_display_fields(conn, opportunity_threshold=opportunity_threshold)
+        if not doomed:
+            return 0
+    logger.info("duplicates_compacted", removed=len(doomed))
+    return len(doomed)
+
+
+async def recompute_all(
+    force: bool = False,
+    workers: int = 1,
+    progress: Optional[Callable[[BatchRunStats], None]] = None,
+) -> None:
     """Recompute recruitment_score across SQLite and CSV backends."""
     ctx = await get_context()
     try:
-        up_sqlite = recompute_sqlite(ctx.settings.sqlite_path, force=force)
+        up_sqlite = recompute_sqlite(ctx.settings.sqlite_path, force=force, workers=workers, progress=progress)
     except Exception as exc:  # pragma: no cover
         up_sqlite = 0
         logger.warning("sqlite_recompute_failed", error=str(exc))
@@ -99,4 +243,5 @@ async def recompute_all(force: bool = False) -> None:
         sqlite_updated=up_sqlite,
         csv_updated=up_csv,
         force=force,
+        workers=workers,
     )
@@ -0,0 +1,132 @@
+"""Normalize-once view of a post's text.
+
+Each filter used to normalize the raw text its own way, on every call:
+``legal_filter.normalize_text`` (NFKD accent stripping, emoji and hashtag
+removal) once per helper, ``legal_classifier`` / ``pre_qualifier`` /
+``filters.unified`` a plain ``lower()``, ``utils.normalize_for_search`` an NFD
+fold. :class:`NormalizedText` computes each of those forms at most once per
+text and is shared by the whole filter chain:
+
+    view = NormalizedText.of(post_text)   # cached: same text -> same object
+    view.normalized   # legal_filter.normalize_text(post_text)
+    view.lowered      # post_text.lower()  (also returned by view.lower())
+    view.folded       # utils.normalize_for_search(post_text)
+    view.tokens       # words of .normalized, with .token_spans offsets
+
+``NormalizedText`` *is* the raw string (``str`` subclass), so it can be passed
+wherever a post text is expected; the derived forms are computed lazily and
+memoized on the instance.
+"""
+from __future__ import annotations
+
+import re
+import unicodedata
+from functools import cached_property, lru_cache
+from typing import Union
+
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags
+    "\U00002702-\U000027B0"  # dingbats
+    "\U000024C2-\U0001F251"  # enclosed characters
+    "\U0001F900-\U0001F9FF"  # supplemental symbols
+    "\U0001FA00-\U0001FA6F"  # chess symbols
+    "\U0001FA70-\U0001FAFF"  # symbols extended-A
+    "\U00002600-\U000026FF"  # misc symbols
+    "\U00002700-\U000027BF"  # dingbats
+    "]+",
+    flags=re.UNICODE,
+)
+_HASHTAG_RE = re.compile(r"#(\w+)")
+_WS_RE = re.compile(r"\s+")
+_SPECIAL_RE = re.compile(r"[^\w\s\'-]")
+_TOKEN_RE = re.compile(r"\w+")
+
+# Views kept for re-use across the filter chain (one batch of posts)
+VIEW_CACHE_SIZE = 1024
+
+
+def remove_accents(text: str) -> str:
+    """Remove accents from text using unicode normalization."""
+    nfkd = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in nfkd if not unicodedata.combining(c))
+
+
+def remove_emojis(text: str) -> str:
+    """Remove emojis and special unicode characters."""
+    return _EMOJI_RE.sub("", text)
+
+
+def remove_hashtags(text: str) -> str:
+    """Remove hashtags but keep the word (e.g., #avocat -> avocat)."""
+    return _HASHTAG_RE.sub(r"\1", text)
+
+
+def fold_for_search(text: str) -> str:
+    """Lowercase, drop diacritics (NFD, non-spacing marks) and trim."""
+    nfd = unicodedata.normalize("NFD", text.lower().strip())
+    return "".join(ch for ch in nfd if unicodedata.category(ch) != "Mn").strip()
+
+
+class NormalizedText(str):
+    """A post text with its normalized forms, each computed once."""
+
+    @classmethod
+    def of(cls, text: Union[str, "NormalizedText", None]) -> "NormalizedText":
+        """Shared view of ``text`` (returned as is if it already is one)."""
+        if isinstance(text, NormalizedText):
+            return text
+        return _view(text or "")
+
+    def lower(self) -> str:  # type: ignore[override]
+        return self.lowered
+
+    @cached_property
+    def lowered(self) -> str:
+        return str.lower(self)
+
+    @cached_property
+    def folded(self) -> str:
+        """Accent-insensitive search form (``utils.normalize_for_search``)."""
+        return fold_for_search(self) if self else ""
+
+    @cached_property
+    def normalized(self) -> str:
+        """Filter form: lowercase, no accents / emojis / hashtags, single spaces."""
+        if not self:
+            return ""
+        text = remove_accents(self.lowered)
+        text = remove_emojis(text)
+        text = remove_hashtags(text)
+        text = _WS_RE.sub(" ", text)
+        # Remove special characters but keep basic punctuation
+        text = _SPECIAL_RE.sub(" ", text)
+        text = _WS_RE.sub(" ", text)
+        return text.strip()
+
+    @cached_property
+    def token_spans(self) -> tuple[tuple[int, int], ...]:
+        """(start, end) offsets of the words of :attr:`normalized`."""
+        return tuple(m.span() for m in _TOKEN_RE.finditer(self.normalized))
+
+    @cached_property
+    def tokens(self) -> tuple[str, ...]:
+        normalized = self.normalized
+        return tuple(normalized[start:end] for start, end in self.token_spans)
+
+
+@lru_cache(maxsize=VIEW_CACHE_SIZE)
+def _view(text: str) -> NormalizedText:
+    return NormalizedText(text)
+
+
+__all__ = [
+    "NormalizedText",
+    "remove_accents",
+    "remove_emojis",
+    "remove_hashtags",
+    "fold_for_search",
+]
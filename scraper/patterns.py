@@ -0,0 +1,66 @@
+"""Lazily compiled regex registries for the filter modules.
+
+Each filter module declares its regexes once, at module level, in a
+:class:`PatternRegistry`:
+
+    _PATTERNS = PatternRegistry(
+        recrute=r"\\b[a-z\\s]+\\s+recrute\\b",
+        followers=(r"\\b\\d[\\d\\s\\.,]*\\s*(k|m)?\\s*(abonn[eé]s?|followers)\\b", re.IGNORECASE),
+        agencies=lambda: r"\\b(" + "|".join(map(re.escape, AGENCIES)) + r")\\b",
+    )
+
+    if _PATTERNS.recrute.search(normalized): ...
+
+Nothing is compiled at import. A pattern is compiled on its first attribute
+access and stored on the registry as a plain attribute, so later accesses are
+an ordinary attribute lookup: no ``re.compile``, no trip through the ``re``
+module cache and no function call on the hot path. A source may be a callable
+returning the pattern, for alternations built from vocabularies defined
+further down the module.
+"""
+from __future__ import annotations
+
+import re
+from typing import Callable, Dict, Iterator, Tuple, Union
+
+PatternSource = Union[str, Tuple[str, int], Callable[[], Union[str, Tuple[str, int]]]]
+
+
+class PatternRegistry:
+    """Named regex sources, each compiled on first access."""
+
+    def __init__(self, **sources: PatternSource):
+        self._sources = dict(sources)
+
+    def __getattr__(self, name: str) -> "re.Pattern[str]":
+        # Only called for attributes not compiled yet
+        try:
+            source = self.__dict__["_sources"][name]  # not self._sources: no recursion before __init__
+        except KeyError:
+            raise AttributeError(name) from None
+        if callable(source):
+            source = source()
+        pattern, flags = source if isinstance(source, tuple) else (source, 0)
+        compiled = re.compile(pattern, flags)
+        self.__dict__[name] = compiled
+        return compiled
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._sources)
+
+    def __len__(self) -> int:
+        return len(self._sources)
+
+    @property
+    def compiled(self) -> Dict[str, "re.Pattern[str]"]:
+        """Patterns compiled so far."""
+        return {name: self.__dict__[name] for name in self._sources if name in self.__dict__}
+
+    def compile_all(self) -> "PatternRegistry":
+        """Compile every pattern now (warm-up, or to surface a bad pattern early)."""
+        for name in self._sources:
+            getattr(self, name)
+        return self
+
+
+__all__ = ["PatternRegistry"]
@@ -26,6 +26,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, Set, Tuple
 
+from .patterns import PatternRegistry
+
 # =============================================================================
 # CONFIGURATION - Tunable thresholds
 # =============================================================================
@@ -83,12 +85,6 @@ AGENCY_PATTERNS: Set[str] = {
     "cabinet de recrutement", "interim",
 }
 
-# Compile regex for agencies (case-insensitive)
-_AGENCY_PATTERN = re.compile(
-    r"\b(" + "|".join(re.escape(a) for a in AGENCY_PATTERNS) + r")\b",
-    re.IGNORECASE
-)
-
 # Contract types to exclude (stages, alternance, etc.)
 EXCLUSION_CONTRACT_PATTERNS: Set[str] = {
     "stage", "stagiaire", "intern", "internship",
@@ -97,11 +93,6 @@ EXCLUSION_CONTRACT_PATTERNS: Set[str] = {
     "v.i.e", "vie ", " vie", "volontariat",
 }
 
-_CONTRACT_EXCLUSION_PATTERN = re.compile(
-    r"\b(" + "|".join(re.escape(c) for c in EXCLUSION_CONTRACT_PATTERNS) + r")\b",
-    re.IGNORECASE
-)
-
 # External recruitment signals (recruiting for clients, not themselves)
 EXTERNAL_RECRUITMENT_PATTERNS: Set[str] = {
     "pour notre client", "pour un client", "pour nos clients",
@@ -110,11 +101,6 @@ EXTERNAL_RECRUITMENT_PATTERNS: Set[str] = {
     "on behalf of", "my client", "our client is",
 }
 
-_EXTERNAL_PATTERN = re.compile(
-    r"(" + "|".join(re.escape(e) for e in EXTERNAL_RECRUITMENT_PATTERNS) + r")",
-    re.IGNORECASE
-)
-
 # Job seeker signals (not a job post, person looking for work)
 JOBSEEKER_PATTERNS: Set[str] = {
     "opentowork", "open to work", "#opentowork",
@@ -125,11 +111,6 @@ JOBSEEKER_PATTERNS: Set[str] = {
     "thrilled to share", "excited to announce",
 }
 
-_JOBSEEKER_PATTERN = re.compile(
-    r"(" + "|".join(re.escape(j) for j in JOBSEEKER_PATTERNS) + r")",
-    re.IGNORECASE
-)
-
 # Non-recruitment content (events, articles, etc.)
 NON_RECRUITMENT_PATTERNS: Set[str] = {
     "retour sur", "conférence", "séminaire", "webinaire", "webinar",
@@ -138,11 +119,6 @@ NON_RECRUITMENT_PATTERNS: Set[str] = {
     "a rejoint", "vient de rejoindre", "nous accueillons",
 }
 
-_NON_RECRUITMENT_PATTERN = re.compile(
-    r"\b(" + "|".join(re.escape(n) for n in NON_RECRUITMENT_PATTERNS) + r")\b",
-    re.IGNORECASE
-)
-
 # Foreign location signals (France only)
 FOREIGN_LOCATION_PATTERNS: Set[str] = {
     # Countries
@@ -155,10 +131,6 @@ FOREIGN_LOCATION_PATTERNS: Set[str] = {
     "casablanca", "rabat", "london", "londres", "berlin", "madrid",
 }
 
-_FOREIGN_LOCATION_PATTERN = re.compile(
-    r"\b(" + "|".join(re.escape(f) for f in FOREIGN_LOCATION_PATTERNS) + r")\b",
-    re.IGNORECASE
-)
 
 # =============================================================================
 # ELITE COMPANIES - Bypass soft exclusions for known high-value employers
@@ -181,11 +153,6 @@ ELITE_LAW_FIRMS: Set[str] = {
     "dentons", "dla piper", "baker mckenzie", "norton rose",
 }
 
-_ELITE_FIRM_PATTERN = re.compile(
-    r"(" + "|".join(re.escape(f) for f in ELITE_LAW_FIRMS) + r")",
-    re.IGNORECASE
-)
-
 
 # =============================================================================
 # POSITIVE SIGNALS - What we're looking for
@@ -199,11 +166,6 @@ LEGAL_SIGNALS: Set[str] = {
     "juridique", "legal", "counsel",
 }
 
-_LEGAL_SIGNAL_PATTERN = re.compile(
-    r"\b(" + "|".join(re.escape(sig) for sig in LEGAL_SIGNALS) + r")\b",
-    re.IGNORECASE
-)
-
 # Recruitment signals (company hiring)
 RECRUITMENT_SIGNALS: Set[str] = {
     "recrute", "recruiting", "hiring", "recherche", "looking for",
@@ -211,9 +173,26 @@ RECRUITMENT_SIGNALS: Set[str] = {
     "rejoignez", "join", "candidature", "postulez",
 }
 
-_RECRUITMENT_SIGNAL_PATTERN = re.compile(
-    r"\b(" + "|".join(re.escape(r) for r in RECRUITMENT_SIGNALS) + r")\b",
-    re.IGNORECASE
+
+# =============================================================================
+# COMPILED PATTERNS (built on first use)
+# =============================================================================
+
+def _alternation(words: Set[str], word_bounded: bool = True) -> Tuple[str, int]:
+    body = "(" + "|".join(re.escape(w) for w in words) + ")"
+    return (r"\b" + body + r"\b" if word_bounded else body), re.IGNORECASE
+
+
+_PATTERNS = PatternRegistry(
+    agency=lambda: _alternation(AGENCY_PATTERNS),
+    contract_exclusion=lambda: _alternation(EXCLUSION_CONTRACT_PATTERNS),
+    external=lambda: _alternation(EXTERNAL_RECRUITMENT_PATTERNS, word_bounded=False),
+    jobseeker=lambda: _alternation(JOBSEEKER_PATTERNS, word_bounded=False),
+    non_recruitment=lambda: _alternation(NON_RECRUITMENT_PATTERNS),
+    foreign_location=lambda: _alternation(FOREIGN_LOCATION_PATTERNS),
+    elite_firm=lambda: _alternation(ELITE_LAW_FIRMS, word_bounded=False),
+    legal_signal=lambda: _alternation(LEGAL_SIGNALS),
+    recruitment_signal=lambda: _alternation(RECRUITMENT_SIGNALS),
 )
 
 
@@ -255,7 +234,7 @@ def pre_qualify_post(
     # =================================================================
 
     # Check 1: Agency/Job board author (instant reject)
-    if author_lower and _AGENCY_PATTERN.search(author_lower):
+    if author_lower and _PATTERNS.agency.search(author_lower):
         return PreQualificationResult(
             should_extract=False,
             confidence=0.95,
@@ -264,7 +243,7 @@ def pre_qualify_post(
         )
 
     # Check 2: Agency in company name
-    if company_lower and _AGENCY_PATTERN.search(company_lower):
+    if company_lower and _PATTERNS.agency.search(company_lower):
         return PreQualificationResult(
             should_extract=False,
             confidence=0.95,
@@ -296,9 +275,9 @@ def pre_qualify_post(
     # =================================================================
     
     is_elite_firm = (
-        _ELITE_FIRM_PATTERN.search(author_lower) or 
-        _ELITE_FIRM_PATTERN.search(company_lower) or
-        _ELITE_FIRM_PATTERN.search(preview_lower)
+        _PATTERNS.elite_firm.search(author_lower) or 
+        _PATTERNS.elite_firm.search(company_lower) or
+        _PATTERNS.elite_firm.search(preview_lower)
     )
     
     if is_elite_firm:
@@ -309,7 +288,7 @@ def pre_qualify_post(
     # =================================================================
 
     # Check 4: Stage/Alternance/Apprentissage (always exclude, even for elite)
-    if _CONTRACT_EXCLUSION_PATTERN.search(preview_lower):
+    if _PATTERNS.contract_exclusion.search(preview_lower):
         return PreQualificationResult(
             should_extract=False,
             confidence=0.9,
@@ -318,7 +297,7 @@ def pre_qualify_post(
         )
 
     # Check 5: External recruitment (for a client)
-    if _EXTERNAL_PATTERN.search(preview_lower):
+    if _PATTERNS.external.search(preview_lower):
         return PreQualificationResult(
             should_extract=False,
             confidence=0.85,
@@ -327,7 +306,7 @@ def pre_qualify_post(
         )
 
     # Check 6: Job seeker post (not a job offer)
-    if _JOBSEEKER_PATTERN.search(preview_lower):
+    if _PATTERNS.jobseeker.search(preview_lower):
         return PreQualificationResult(
             should_extract=False,
             confidence=0.9,
@@ -336,7 +315,7 @@ def pre_qualify_post(
         )
 
     # Check 7: Non-recruitment content (bypass for elite firms)
-    if _NON_RECRUITMENT_PATTERN.search(preview_lower) and not is_elite_firm:
+    if _PATTERNS.non_recruitment.search(preview_lower) and not is_elite_firm:
         return PreQualificationResult(
             should_extract=False,
             confidence=0.75,
@@ -345,7 +324,7 @@ def pre_qualify_post(
         )
 
     # Check 8: Foreign location (bypass for elite - they recruit for Paris offices)
-    if _FOREIGN_LOCATION_PATTERN.search(preview_lower) and not is_elite_firm:
+    if _PATTERNS.foreign_location.search(preview_lower) and not is_elite_firm:
         return PreQualificationResult(
             should_extract=False,
             confidence=0.8,
@@ -357,8 +336,8 @@ def pre_qualify_post(
     # PHASE 3: POSITIVE SIGNAL DETECTION
     # =================================================================
 
-    has_legal_signal = bool(_LEGAL_SIGNAL_PATTERN.search(preview_lower))
-    has_recruitment_signal = bool(_RECRUITMENT_SIGNAL_PATTERN.search(preview_lower))
+    has_legal_signal = bool(_PATTERNS.legal_signal.search(preview_lower))
+    has_recruitment_signal = bool(_PATTERNS.recruitment_signal.search(preview_lower))
 
     if has_legal_signal:
         signals.append("legal_keyword_found")
@@ -461,7 +440,7 @@ def is_excluded_author(author_name: str) -> Tuple[bool, str]:
 
     author_lower = author_name.lower().strip()
 
-    if _AGENCY_PATTERN.search(author_lower):
+    if _PATTERNS.agency.search(author_lower):
         return True, "agency"
 
     return False, ""
@@ -480,13 +459,13 @@ def has_immediate_exclusion(text: str) -> Tuple[bool, str]:
 
     text_lower = text.lower()
 
-    if _CONTRACT_EXCLUSION_PATTERN.search(text_lower):
+    if _PATTERNS.contract_exclusion.search(text_lower):
         return True, "stage_alternance"
 
-    if _EXTERNAL_PATTERN.search(text_lower):
+    if _PATTERNS.external.search(text_lower):
         return True, "external_recruitment"
 
-    if _JOBSEEKER_PATTERN.search(text_lower):
+    if _PATTERNS.jobseeker.search(text_lower):
         return True, "jobseeker"
 
     return False, ""
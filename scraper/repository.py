@@ -0,0 +1,567 @@
+"""SQLite repository layer: pooled connections and one-time schema migrations.
+
+Every dashboard route and the worker storage path used to open a fresh
+``sqlite3.connect()`` and re-run ``CREATE TABLE IF NOT EXISTS`` / ``ALTER TABLE`` /
+``PRAGMA table_info`` on each call. This module centralises that work:
+
+- One :class:`SQLiteRepository` per database file, holding a small pool of
+  long-lived WAL-mode connections (``check_same_thread=False`` so they can be
+  handed to worker threads).
+- Schema migrations are applied once, when the repository is first created,
+  and tracked with ``PRAGMA user_version``. Migrations are idempotent so legacy
+  databases (or minimal schemas created by tests/scripts) converge to the same
+  layout.
+
+Usage:
+    from scraper.repository import get_repository
+
+    with get_repository(settings.sqlite_path).connection() as conn:
+        conn.execute("SELECT COUNT(*) FROM posts").fetchone()
+
+The connection context manager commits on success and rolls back on error,
+mirroring ``with sqlite3.connect(...) as conn`` semantics.
+
+Async callers (FastAPI routes, the in-process worker) must not run these
+blocking calls on the event loop; :func:`run_sync` executes them on a bounded
+thread pool and records per-query timings:
+
+    rows = await run_sync(_fetch_rows_sync, ctx, label="fetch_posts")
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, TypeVar
+
+import structlog
+
+from .bootstrap import SQLITE_QUERY_DURATION, SQLITE_QUERY_WAIT
+
+logger = structlog.get_logger(__name__).bind(component="repository")
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+DEFAULT_POOL_SIZE = 4
+DEFAULT_BUSY_TIMEOUT_MS = 5000
+DEFAULT_ACQUIRE_TIMEOUT_SECONDS = 30.0
+SLOW_QUERY_SECONDS = 0.5
+
+T = TypeVar("T")
+
+
+class RepositoryError(Exception):
+    """Raised when a pooled connection cannot be obtained."""
+
+
+# =============================================================================
+# SCHEMA MIGRATIONS
+# =============================================================================
+
+# Canonical posts layout (column, SQL type). Kept in one place so migrations
+# and legacy table rebuilds agree on the column list.
+POSTS_COLUMNS: list[tuple[str, str]] = [
+    ("id", "TEXT PRIMARY KEY"),
+    ("keyword", "TEXT"),
+    ("author", "TEXT"),
+    ("author_profile", "TEXT"),
+    ("company", "TEXT"),
+    ("permalink", "TEXT"),
+    ("text", "TEXT"),
+    ("language", "TEXT"),
+    ("published_at", "TEXT"),
+    ("collected_at", "TEXT"),
+    ("raw_json", "TEXT"),
+    ("search_norm", "TEXT"),
+    ("content_hash", "TEXT"),
+    # Legal classification enrichment
+    ("intent", "TEXT"),
+    ("relevance_score", "REAL"),
+    ("confidence", "REAL"),
+    ("location_ok", "INTEGER"),
+    ("keywords_matched", "TEXT"),
+    # Filled by the company normalization job
+    ("company_norm", "TEXT"),
+]
+
+# Columns of the historical layout (before classification columns were added).
+_LEGACY_POSTS_COLUMNS = [name for name, _ in POSTS_COLUMNS[:13]]
+
+
+def _table_columns(conn: sqlite3.Connection, table: str) -> list[str]:
+    return [r[1] for r in conn.execute(f"PRAGMA table_info({table})").fetchall()]
+
+
+def _add_missing_columns(conn: sqlite3.Connection, table: str, columns: list[tuple[str, str]]) -> None:
+    existing = set(_table_columns(conn, table))
+    for name, sql_type in columns:
+        if name in existing or "PRIMARY KEY" in sql_type:
+            continue
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {sql_type}")
+
+
+def _create_index(conn: sqlite3.Connection, ddl: str) -> None:
+    # Unique indexes can fail on legacy databases that already hold duplicates;
+    # the schema stays usable without them, so failures are logged and skipped.
+    try:
+        conn.execute(ddl)
+    except sqlite3.DatabaseError as exc:
+        logger.warning("index_creation_skipped", ddl=ddl, error=str(exc))
+
+
+def _migration_001_base_schema(conn: sqlite3.Connection) -> None:
+    """posts / post_flags / blocked_accounts / meta tables and their indexes."""
+    cols = _table_columns(conn, "posts")
+    if "score" in cols or "recruitment_score" in cols:
+        # Legacy layout: rebuild the table keeping only the canonical columns.
+        legacy_ddl = ", ".join(f"{name} {sql_type}" for name, sql_type in POSTS_COLUMNS[:13])
+        conn.execute(f"CREATE TABLE IF NOT EXISTS posts_new ({legacy_ddl})")
+        copy_cols = [c for c in _LEGACY_POSTS_COLUMNS if c in cols]
+        conn.execute(
+            f"INSERT OR IGNORE INTO posts_new ({','.join(copy_cols)}) SELECT {','.join(copy_cols)} FROM posts"
+        )
+        conn.execute("DROP TABLE posts")
+        conn.execute("ALTER TABLE posts_new RENAME TO posts")
+    columns_ddl = ", ".join(f"{name} {sql_type}" for name, sql_type in POSTS_COLUMNS)
+    conn.execute(f"CREATE TABLE IF NOT EXISTS posts ({columns_ddl})")
+    _add_missing_columns(conn, "posts", POSTS_COLUMNS)
+
+    # Dedup indexes (permalink first, then author+date, then content hash)
+    _create_index(conn, "CREATE UNIQUE INDEX IF NOT EXISTS uniq_posts_permalink ON posts(permalink) WHERE permalink IS NOT NULL")
+    _create_index(conn, "CREATE UNIQUE INDEX IF NOT EXISTS uniq_posts_author_published ON posts(author, published_at) WHERE author IS NOT NULL AND published_at IS NOT NULL")
+    _create_index(conn, "CREATE UNIQUE INDEX IF NOT EXISTS uniq_posts_content_hash ON posts(content_hash) WHERE content_hash IS NOT NULL")
+    # Query indexes
+    _create_index(conn, "CREATE INDEX IF NOT EXISTS idx_posts_collected_at ON posts(collected_at DESC)")
+    _create_index(conn, "CREATE INDEX IF NOT EXISTS idx_posts_author ON posts(author)")
+    _create_index(conn, "CREATE INDEX IF NOT EXISTS idx_posts_keyword ON posts(keyword)")
+    _create_index(conn, "CREATE INDEX IF NOT EXISTS idx_posts_company_norm ON posts(company_norm)")
+
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS post_flags (
+        post_id TEXT PRIMARY KEY,
+        is_favorite INTEGER NOT NULL DEFAULT 0,
+        is_deleted INTEGER NOT NULL DEFAULT 0,
+        favorite_at TEXT,
+        deleted_at TEXT
+        )"""
+    )
+    _create_index(conn, "CREATE INDEX IF NOT EXISTS idx_post_flags_deleted ON post_flags(is_deleted, deleted_at)")
+    _create_index(conn, "CREATE INDEX IF NOT EXISTS idx_post_flags_favorite ON post_flags(is_favorite, favorite_at)")
+
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS blocked_accounts (id TEXT PRIMARY KEY, url TEXT UNIQUE, name TEXT, blocked_at TEXT)"
+    )
+    conn.execute(
+        """CREATE TABLE IF NOT EXISTS meta (
+        id TEXT PRIMARY KEY,
+        last_run TEXT,
+        posts_count INTEGER DEFAULT 0,
+        scraping_enabled INTEGER
+        )"""
+    )
+
+
+# Full-text index over ``posts.search_norm`` (external content, so the text is
+# stored once). ``search_norm`` is already folded by utils.normalize_for_search;
+# the tokenizer folds diacritics again so raw MATCH input behaves the same.
+FTS_TABLE = "posts_fts"
+
+_FTS_DDL = [
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+    search_norm,
+    content='posts',
+    content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts BEGIN
+    INSERT INTO {FTS_TABLE}(rowid, search_norm) VALUES (new.rowid, new.search_norm);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts BEGIN
+    INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_norm) VALUES ('delete', old.rowid, old.search_norm);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS posts_fts_au AFTER UPDATE OF search_norm ON posts BEGIN
+    INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, search_norm) VALUES ('delete', old.rowid, old.search_norm);
+    INSERT INTO {FTS_TABLE}(rowid, search_norm) VALUES (new.rowid, new.search_norm);
+    END""",
+]
+
+
+def backfill_search_norm(conn: sqlite3.Connection) -> int:
+    """Compute ``search_norm`` for rows that predate the column. Returns rows updated."""
+    from .utils import build_search_norm  # local import: utils pulls optional deps
+
+    rows = conn.execute(
+        "SELECT id, text, author, company, keyword FROM posts WHERE search_norm IS NULL OR LENGTH(search_norm) = 0"
+    ).fetchall()
+    conn.executemany(
+        "UPDATE posts SET search_norm = ? WHERE id = ?",
+        [(build_search_norm(r[1], r[2], r[3], r[4]), r[0]) for r in rows],
+    )
+    return len(rows)
+
+
+def rebuild_search_index(conn: sqlite3.Connection) -> None:
+    """Re-index ``posts_fts`` from ``posts`` (after VACUUM or bulk repairs)."""
+    if has_search_index(conn):
+        conn.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+
+
+def has_search_index(conn: sqlite3.Connection) -> bool:
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (FTS_TABLE,)).fetchone()
+    return row is not None
+
+
+def fts_match_expression(q: Optional[str]) -> Optional[str]:
+    """Turn free user input into a safe FTS5 MATCH expression.
+
+    Terms are folded like ``search_norm``, quoted (so FTS operators in user
+    input are inert) and prefix-matched: ``"notai" "pari"`` finds
+    "Notaire à Paris". Returns None when no searchable term remains.
+    """
+    from .utils import normalize_for_search
+
+    terms = re.findall(r"\w+", normalize_for_search(q or ""))
+    if not terms:
+        return None
+    return " ".join(f'"{t}"*' for t in terms[:16])
+
+
+def _migration_002_search_index(conn: sqlite3.Connection) -> None:
+    """FTS5 index over search_norm kept in sync by triggers."""
+    backfill_search_norm(conn)
+    try:
+        for ddl in _FTS_DDL:
+            conn.execute(ddl)
+    except sqlite3.OperationalError as exc:
+        # SQLite built without FTS5: routes fall back to LIKE on search_norm.
+        logger.warning("fts5_unavailable", error=str(exc))
+        return
+    rebuild_search_index(conn)
+
+
+def _migration_003_keyset_indexes(conn: sqlite3.Connection) -> None:
+    """Composite indexes backing keyset pagination of the dashboard.
+
+    Expressions must match the ORDER BY / cursor predicate built by
+    server.routes._keyset_rows (``IFNULL(p.<field>,'')`` then ``p.id``).
+    """
+    _create_index(conn, "CREATE INDEX IF NOT EXISTS idx_posts_published_keyset ON posts(IFNULL(published_at,''), id)")
+    _create_index(conn, "CREATE INDEX IF NOT EXISTS idx_posts_collected_keyset ON posts(IFNULL(collected_at,''), id)")
+
+
+# Display fields computed at write time by scraper.display_fields.
+_DISPLAY_POSTS_COLUMNS: list[tuple[str, str]] = [
+    ("company_display", "TEXT"),
+    ("status", "TEXT"),
+    ("metier", "TEXT"),
+    ("opportunity", "INTEGER"),
+    ("permalink_canonical", "TEXT"),
+    ("display_version", "INTEGER"),
+]
+
+
+def _migration_004_display_fields(conn: sqlite3.Connection) -> None:
+    """Stored display columns; existing rows are filled by display_fields.backfill_display_fields."""
+    _add_missing_columns(conn, "posts", _DISPLAY_POSTS_COLUMNS)
+    _create_index(conn, "CREATE INDEX IF NOT EXISTS idx_posts_metier_keyset ON posts(IFNULL(metier,''), id)")
+    _create_index(conn, "CREATE INDEX IF NOT EXISTS idx_posts_display_version ON posts(display_version)")
+
+
+def _migration_005_account_slugs(conn: sqlite3.Connection) -> None:
+    """Normalized account slugs matched by the blocked-accounts filter.
+
+    posts.author_slug / company_slug are filled by display_fields (version 2
+    backfill); blocked_accounts.slug is derived here from the stored URLs.
+    The filter matches slugs as substrings (instr), which no index serves, so
+    none are created.
+    """
+    from .display_fields import blocked_slug_from_url  # local import: display_fields pulls utils
+
+    _add_missing_columns(conn, "posts", [("author_slug", "TEXT"), ("company_slug", "TEXT")])
+    _add_missing_columns(conn, "blocked_accounts", [("slug", "TEXT")])
+    rows = conn.execute("SELECT id, url FROM blocked_accounts WHERE slug IS NULL").fetchall()
+    conn.executemany(
+        "UPDATE blocked_accounts SET slug = ? WHERE id = ?",
+        [(blocked_slug_from_url(r[1] or "") or None, r[0]) for r in rows],
+    )
+
+
+def _migration_006_dedup_key(conn: sqlite3.Connection) -> None:
+    """Canonical duplicate key (display_fields.dedup_key) enforced at insert time.
+
+    Existing rows get their key from the display backfill; rows that collide
+    with an already-keyed post stay NULL until compact_duplicate_posts runs.
+    """
+    _add_missing_columns(conn, "posts", [("dedup_key", "TEXT")])
+    _create_index(conn, "CREATE UNIQUE INDEX IF NOT EXISTS uniq_posts_dedup_key ON posts(dedup_key) WHERE dedup_key IS NOT NULL")
+
+
+def _migration_007_daily_stats(conn: sqlite3.Connection) -> None:
+    """Per-day aggregates (scraper.daily_stats) maintained by triggers on posts / post_flags."""
+    from .daily_stats import install_daily_stats, rebuild_daily_stats  # local import: pulls display_fields
+
+    install_daily_stats(conn)
+    rebuild_daily_stats(conn)
+
+
+def _migration_008_recruitment_score(conn: sqlite3.Connection) -> None:
+    """Stored recruitment score and the scorer version that produced it (maintenance.recompute_sqlite)."""
+    _add_missing_columns(conn, "posts", [("recruitment_score", "REAL"), ("recruitment_score_version", "INTEGER")])
+
+
+def _migration_009_drop_slug_indexes(conn: sqlite3.Connection) -> None:
+    """Drop the slug indexes an earlier migration 005 created: the substring match can't use them."""
+    for name in ("idx_blocked_accounts_slug", "idx_posts_author_slug", "idx_posts_company_slug"):
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+# Ordered list of migrations; index + 1 is the resulting ``user_version``.
+# Append new migrations at the end, never reorder or edit shipped ones.
+MIGRATIONS: list[Callable[[sqlite3.Connection], None]] = [
+    _migration_001_base_schema,
+    _migration_002_search_index,
+    _migration_003_keyset_indexes,
+    _migration_004_display_fields,
+    _migration_005_account_slugs,
+    _migration_006_dedup_key,
+    _migration_007_daily_stats,
+    _migration_008_recruitment_score,
+    _migration_009_drop_slug_indexes,
+]
+
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def apply_migrations(conn: sqlite3.Connection) -> int:
+    """Bring ``conn`` up to :data:`SCHEMA_VERSION`. Returns the final version.
+
+    Each migration runs in its own ``BEGIN IMMEDIATE`` transaction so two
+    processes (dashboard + standalone worker) cannot migrate concurrently;
+    the version is re-read once the write lock is held.
+    """
+    current = int(conn.execute("PRAGMA user_version").fetchone()[0] or 0)
+    while current < SCHEMA_VERSION:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            current = int(conn.execute("PRAGMA user_version").fetchone()[0] or 0)
+            if current >= SCHEMA_VERSION:
+                conn.execute("COMMIT")
+                break
+            MIGRATIONS[current](conn)
+            current += 1
+            conn.execute(f"PRAGMA user_version = {current}")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        logger.info("schema_migrated", version=current)
+    return current
+
+
+# =============================================================================
+# CONNECTION POOL
+# =============================================================================
+
+def _file_identity(path: str) -> Optional[tuple[int, int]]:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+class SQLiteRepository:
+    """Small pool of long-lived WAL connections bound to one database file."""
+
+    def __init__(
+        self,
+        path: str,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+    ) -> None:
+        self.path = path
+        self.pool_size = max(1, int(pool_size))
+        self.busy_timeout_ms = busy_timeout_ms
+        self.schema_version = 0
+        self.fts_enabled = False
+        self.identity: Optional[tuple[int, int]] = None
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+        self._closed = False
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout_ms / 1000.0,
+            check_same_thread=False,
+        )
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        return conn
+
+    def migrate(self) -> int:
+        """Apply pending schema migrations (idempotent)."""
+        with self._raw_connection() as conn:
+            self.schema_version = apply_migrations(conn)
+            self.fts_enabled = has_search_index(conn)
+        self.identity = _file_identity(self.path)
+        return self.schema_version
+
+    @contextlib.contextmanager
+    def _raw_connection(self, timeout: float = DEFAULT_ACQUIRE_TIMEOUT_SECONDS) -> Iterator[sqlite3.Connection]:
+        if self._closed:
+            raise RepositoryError(f"repository closed: {self.path}")
+        if not self._slots.acquire(timeout=timeout):
+            raise RepositoryError(f"connection pool exhausted ({self.pool_size}) for {self.path}")
+        conn: Optional[sqlite3.Connection] = None
+        try:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                conn = self._open()
+            yield conn
+        finally:
+            if conn is not None:
+                if self._closed:
+                    with contextlib.suppress(Exception):
+                        conn.close()
+                else:
+                    self._idle.put(conn)
+            self._slots.release()
+
+    @contextlib.contextmanager
+    def connection(self, timeout: float = DEFAULT_ACQUIRE_TIMEOUT_SECONDS) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled connection; commit on success, roll back on error."""
+        with self._raw_connection(timeout) as conn:
+            with conn:
+                yield conn
+
+    def close(self) -> None:
+        """Close idle connections; borrowed ones are closed when returned."""
+        self._closed = True
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            with contextlib.suppress(Exception):
+                conn.close()
+
+
+_repositories: dict[str, SQLiteRepository] = {}
+_repositories_lock = threading.Lock()
+
+
+def get_repository(path: str, pool_size: int = DEFAULT_POOL_SIZE) -> SQLiteRepository:
+    """Return the shared repository for ``path``, creating and migrating it once.
+
+    If the database file was deleted or replaced since the repository was
+    created (purge scripts, tests swapping files), the stale pool is closed
+    and a fresh one is migrated.
+    """
+    key = os.path.abspath(path)
+    with _repositories_lock:
+        repo = _repositories.get(key)
+        if repo is not None:
+            if repo.identity is not None and repo.identity == _file_identity(key):
+                return repo
+            repo.close()
+            _repositories.pop(key, None)
+        Path(key).parent.mkdir(parents=True, exist_ok=True)
+        repo = SQLiteRepository(key, pool_size=pool_size)
+        try:
+            repo.migrate()
+        except Exception:
+            repo.close()
+            raise
+        _repositories[key] = repo
+        return repo
+
+
+# =============================================================================
+# OFF-LOOP EXECUTION
+# =============================================================================
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, int(max_workers)),
+                thread_name_prefix="sqlite-repo",
+            )
+        return _executor
+
+
+async def run_sync(
+    fn: Callable[..., T],
+    *args: Any,
+    label: Optional[str] = None,
+    max_workers: int = DEFAULT_POOL_SIZE,
+    **kwargs: Any,
+) -> T:
+    """Run a blocking SQLite helper on the repository thread pool.
+
+    Concurrency is bounded by the executor size (first caller wins; it matches
+    the connection pool size by default), so a slow export only occupies its
+    own worker thread while the event loop keeps serving SSE, /health and the
+    in-process autonomous worker. Queue wait and execution time are recorded
+    per ``label`` and slow calls are logged.
+    """
+    name = label or getattr(fn, "__name__", "query").lstrip("_")
+    submitted = time.perf_counter()
+    timing: dict[str, float] = {}
+
+    def _timed() -> T:
+        started = time.perf_counter()
+        timing["wait"] = started - submitted
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            timing["run"] = time.perf_counter() - started
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(_get_executor(max_workers), _timed)
+    finally:
+        run = timing.get("run")
+        if run is not None:
+            SQLITE_QUERY_WAIT.labels(query=name).observe(timing.get("wait", 0.0))
+            SQLITE_QUERY_DURATION.labels(query=name).observe(run)
+            if run >= SLOW_QUERY_SECONDS:
+                logger.warning(
+                    "sqlite_slow_query",
+                    query=name,
+                    run_ms=round(run * 1000, 1),
+                    wait_ms=round(timing.get("wait", 0.0) * 1000, 1),
+                )
+
+
+def close_all() -> None:
+    """Close every pooled connection and the query executor (shutdown / tests)."""
+    global _executor
+    with _repositories_lock:
+        repos = list(_repositories.values())
+        _repositories.clear()
+    for repo in repos:
+        repo.close()
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False)
@@ -0,0 +1,192 @@
+"""NDJSON result channel between ``scrape_subprocess`` and the worker.
+
+The subprocess appends one JSON record per line to a stream file while it
+runs; the worker tails that file and handles records as they arrive instead
+of waiting for the final output JSON:
+
+    {"type": "post", "seq": 0, "post": {...}}          one per accepted post
+    {"type": "progress", "keyword": "...", ...}        after each keyword
+    {"type": "stats", "stats": {...}}                  running filter counters
+    {"type": "spans", "keyword": "...", "spans": {...}}  seconds per pipeline stage, per keyword
+    {"type": "end", "success": true}                   last record
+
+Each record is flushed as soon as it is written, so a post survives the
+subprocess being killed (batch timeout, crash). ``seq`` is the post's index
+in the final output's ``posts`` list, which lets the worker tell apart posts
+it already handled from the stream and posts it still has to take from the
+output file.
+
+The final output JSON is still written and remains the source of truth for
+the batch status (``success``, ``account_restricted``, ``session_revoked``).
+"""
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import time
+from typing import Any, ContextManager, Dict, Iterator, List, Optional
+
+RECORD_POST = "post"
+RECORD_PROGRESS = "progress"
+RECORD_STATS = "stats"
+RECORD_SPANS = "spans"
+RECORD_END = "end"
+
+# The long-lived scraper server (``scrape_subprocess --serve``) answers jobs
+# on stdout with lines carrying this prefix; anything else there is noise
+SERVER_REPLY_PREFIX = "@@scrape-server "
+
+
+class ResultStreamWriter:
+    """Append-only NDJSON writer, one flushed line per record."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._fh = open(path, "a", encoding="utf-8")
+        self._seq = 0
+
+    def emit(self, record_type: str, **fields: Any) -> None:
+        line = json.dumps({"type": record_type, **fields}, ensure_ascii=False, default=str)
+        self._fh.write(line + "\n")
+        self._fh.flush()
+
+    def post(self, post: Dict[str, Any]) -> None:
+        self.emit(RECORD_POST, seq=self._seq, post=post)
+        self._seq += 1
+
+    def progress(self, **fields: Any) -> None:
+        self.emit(RECORD_PROGRESS, **fields)
+
+    def stats(self, stats: Dict[str, Any]) -> None:
+        self.emit(RECORD_STATS, stats=stats)
+
+    def spans(self, keyword: str, spans: Dict[str, float]) -> None:
+        self.emit(RECORD_SPANS, keyword=keyword, spans=spans)
+
+    def end(self, **fields: Any) -> None:
+        self.emit(RECORD_END, **fields)
+
+    def close(self) -> None:
+        try:
+            self._fh.close()
+        except Exception:
+            pass
+
+    def __enter__(self) -> "ResultStreamWriter":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def open_writer(path: Optional[str]) -> Optional[ResultStreamWriter]:
+    """Writer for ``path``, or None when streaming is off or the file can't be opened."""
+    if not path:
+        return None
+    try:
+        return ResultStreamWriter(path)
+    except OSError:
+        return None
+
+
+class StageSpans:
+    """Wall time spent in each pipeline stage, accumulated until :meth:`pop`.
+
+    The subprocess keeps one per keyword and sends it as a ``spans`` record;
+    the worker turns those into ``scrape_stage_duration_seconds`` observations.
+    """
+
+    def __init__(self) -> None:
+        self.seconds: Dict[str, float] = {}
+        self._mark = time.perf_counter()
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+
+    def mark(self) -> None:
+        """Start timing for the next :meth:`lap`."""
+        self._mark = time.perf_counter()
+
+    def lap(self, stage: str) -> None:
+        """Charge the time since the last mark/lap to ``stage``."""
+        now = time.perf_counter()
+        self.add(stage, now - self._mark)
+        self._mark = now
+
+    @contextlib.contextmanager
+    def span(self, stage: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+    def pop(self) -> Dict[str, float]:
+        """Accumulated seconds per stage (rounded to the microsecond), then reset."""
+        spans = {stage: round(seconds, 6) for stage, seconds in self.seconds.items()}
+        self.seconds = {}
+        return spans
+
+
+def stage_span(spans: Optional[StageSpans], stage: str) -> ContextManager[None]:
+    """``spans.span(stage)``, or a no-op when no collector is passed."""
+    return spans.span(stage) if spans is not None else contextlib.nullcontext()
+
+
+class ResultStreamReader:
+    """Tails a stream file, returning only complete records.
+
+    A line still being written (no trailing newline yet) is kept until the
+    next call; undecodable lines are skipped.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._offset = 0
+        self._partial = b""
+
+    def read_new(self) -> List[Dict[str, Any]]:
+        try:
+            with open(self.path, "rb") as fh:
+                fh.seek(self._offset)
+                data = fh.read()
+        except FileNotFoundError:
+            return []
+        if not data:
+            return []
+        self._offset += len(data)
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        records: List[Dict[str, Any]] = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line.decode("utf-8"))
+            except (UnicodeDecodeError, ValueError):
+                continue
+            if isinstance(record, dict):
+                records.append(record)
+        return records
+
+    def unlink(self) -> None:
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+
+__all__ = [
+    "ResultStreamWriter",
+    "ResultStreamReader",
+    "StageSpans",
+    "open_writer",
+    "stage_span",
+    "RECORD_POST",
+    "RECORD_PROGRESS",
+    "RECORD_STATS",
+    "RECORD_SPANS",
+    "RECORD_END",
+    "SERVER_REPLY_PREFIX",
+]
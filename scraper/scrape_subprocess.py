@@ -14,6 +14,7 @@ Migration Note:
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import os
 import sys
@@ -27,6 +28,8 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
+from scraper.result_stream import SERVER_REPLY_PREFIX, ResultStreamWriter, StageSpans, open_writer, stage_span
+
 # =============================================================================
 # ADAPTERS - Progressive migration to new modular architecture
 # =============================================================================
@@ -1906,10 +1909,440 @@ def parse_relative_date(txt: str) -> Optional[datetime]:
     return None
 
 
-async def extract_posts_simple(page, keyword: str, max_items: int = 10) -> list[dict]:
-    """Simple post extraction - returns raw dicts."""
+# Selector lists used by the in-page extractor (besides the module-level
+# AUTHOR/DATE/COMPANY selectors above)
+SDUI_TEXT_SELECTORS = [
+    "[data-view-name='feed-commentary']",
+    "[data-testid='expandable-text-box']",
+]
+CLASSIC_TEXT_SELECTORS = [
+    "div.feed-shared-update-v2__description",
+    "div.update-components-text",
+    "span.break-words",
+]
+ACTOR_DESCRIPTION_SELECTORS = [
+    "span.update-components-actor__description span[aria-hidden='true']",
+]
+PERMALINK_LINK_SELECTORS = [
+    "a[href*='/feed/update/urn:li:']",  # Direct URN link
+    "a[href*='/feed/update/']",  # Any update link
+    "a[href*='/activity/']",
+    "a[href*='activity:']",
+    "button[data-urn*='activity']",
+]
+PERMALINK_BUTTON_SELECTORS = [
+    "button[aria-label*='commentaire']",  # Comment button
+    "button[aria-label*='comment']",
+    "button[aria-label*='Commenter']",
+    "[data-urn*='share:']",  # Share URN
+    "[data-urn*='ugcPost:']",  # UGC post URN
+    "a[href*='/posts/']",  # Company posts link
+]
+PERMALINK_BUTTON_ATTRS = ["data-urn", "data-id", "data-activity-id", "href"]
+
+# Walks every post container once, in the page, and returns plain records:
+# the first match's innerText for each selector list, link hrefs and the
+# attributes the permalink fallbacks look at. The element's outerHTML (last
+# permalink fallback) is only shipped when none of the cheaper permalink
+# sources can match. All selection/cleaning decisions stay in Python
+# (parse_post_records), so each post costs no CDP round-trip of its own.
+EXTRACT_POSTS_JS = r"""
+(args) => {
+  const text = (node) => (node ? (node.innerText || "") : null);
+  const first = (el, sel) => { try { return el.querySelector(sel); } catch (e) { return null; } };
+  const firstText = (el, sels) => sels.map((sel) => text(first(el, sel)));
+  const link = (el, sel) => {
+    const a = first(el, sel);
+    if (!a) return null;
+    return { href: a.getAttribute("href"), name: text(a.querySelector("p")) };
+  };
+  const nodes = [];
+  const seen = new Set();
+  for (const sel of args.containers) {
+    let found = [];
+    try { found = document.querySelectorAll(sel); } catch (e) { continue; }
+    for (const node of found) {
+      if (!seen.has(node)) { seen.add(node); nodes.push(node); }
+    }
+  }
+  const permalinkHint = /\/feed\/update\/urn:li:(activity|share|ugcPost):\d+|activity[:\/]\d+/;
+  const idHint = /(activity|share|ugcPost)[:\/]\d+/;
+  return nodes.slice(0, args.limit).map((el, index) => {
+    const urn = el.getAttribute("data-urn");
+    const shareLink = first(el, "a[href*='/feed/update/']");
+    const links = args.linkSelectors.map((sel) => {
+      const a = first(el, sel);
+      return a ? [a.getAttribute("href"), a.getAttribute("data-urn")] : null;
+    });
+    const buttons = args.buttonSelectors.map((sel) => {
+      const b = first(el, sel);
+      return b ? args.buttonAttrs.map((attr) => b.getAttribute(attr)) : null;
+    });
+    const needsHtml = !(urn && /activity:\d/.test(urn))
+      && !(shareLink && shareLink.getAttribute("href"))
+      && !links.some((l) => l && permalinkHint.test(l[0] || l[1] || ""))
+      && !buttons.some((b) => b && b.some((v) => v && idHint.test(v)));
+    return {
+      index,
+      urn,
+      company_link: link(el, "a[href*='/company/']"),
+      person_link: link(el, "a[href*='/in/']"),
+      authors: firstText(el, args.authorSelectors),
+      sdui_texts: firstText(el, args.sduiTextSelectors),
+      classic_texts: firstText(el, args.classicTextSelectors),
+      ltr_text: text(first(el, "div[dir='ltr']")),
+      dates: firstText(el, args.dateSelectors),
+      paragraphs: Array.from(el.querySelectorAll("p"), (p) => p.innerText || ""),
+      companies: firstText(el, args.companySelectors),
+      actor_descriptions: firstText(el, args.actorDescriptionSelectors),
+      share_href: shareLink ? shareLink.getAttribute("href") : null,
+      links,
+      buttons,
+      html: needsHtml ? el.outerHTML : null,
+    };
+  });
+}
+"""
+
+# Max containers walked per page by EXTRACT_POSTS_JS
+MAX_POST_CONTAINERS = 200
+
+# Permalink patterns searched in a post's outerHTML (last resort)
+_HTML_PERMALINK_PATTERNS = [
+    # SDUI 2025 specific patterns (with escaped quotes)
+    (r'\\?"activityId\\?"\\s*:\\s*\\?"(\d{19,20})\\?"', 'activity'),
+    (r'activityId["\s:]+(\d{19,20})', 'activity'),
+    # Standard URN patterns
+    (r'urn:li:activity:(\d+)', 'activity'),
+    (r'urn:li:share:(\d+)', 'share'),
+    (r'urn:li:ugcPost:(\d+)', 'ugcPost'),
+    (r'/feed/update/urn:li:(activity|share|ugcPost):(\d+)', None),
+    (r'"activityUrn"[:\s]+"urn:li:activity:(\d+)"', 'activity'),
+    (r'"entityUrn"[:\s]+"urn:li:(activity|share|ugcPost):(\d+)"', None),
+    (r'data-activity-id="(\d+)"', 'activity'),
+    (r'share:(\d{19,20})', 'share'),
+    (r'activity:(\d{19,20})', 'activity'),
+]
+
+
+def extract_posts_js_args(limit: int = MAX_POST_CONTAINERS) -> dict:
+    """Argument object passed to EXTRACT_POSTS_JS."""
+    return {
+        "containers": POST_CONTAINER_SELECTORS,
+        "authorSelectors": AUTHOR_SELECTORS,
+        "sduiTextSelectors": SDUI_TEXT_SELECTORS,
+        "classicTextSelectors": CLASSIC_TEXT_SELECTORS,
+        "dateSelectors": DATE_SELECTORS,
+        "companySelectors": COMPANY_SELECTORS,
+        "actorDescriptionSelectors": ACTOR_DESCRIPTION_SELECTORS,
+        "linkSelectors": PERMALINK_LINK_SELECTORS,
+        "buttonSelectors": PERMALINK_BUTTON_SELECTORS,
+        "buttonAttrs": PERMALINK_BUTTON_ATTRS,
+        "limit": limit,
+    }
+
+
+def _record_permalink(rec: dict, idx: int) -> Optional[str]:
+    """Permalink from an extracted record, trying the same sources in the same order as before."""
+    import re
+    # Method 1: data-urn attribute
+    urn = rec.get("urn")
+    if urn and "activity:" in urn:
+        activity_id = urn.split("activity:")[-1].strip()
+        # Remove any trailing characters that aren't digits
+        activity_match = re.match(r"(\d+)", activity_id)
+        if activity_match:
+            return f"https://www.linkedin.com/feed/update/urn:li:activity:{activity_match.group(1)}"
+    
+    # Method 2: Look for share link
+    if rec.get("share_href"):
+        return rec["share_href"].split("?")[0]
+    
+    # Method 3: SDUI - direct links to /feed/update/ with URN
+    for link_sel, found in zip(PERMALINK_LINK_SELECTORS, rec.get("links") or []):
+        if not found:
+            continue
+        href = found[0] or found[1]
+        if href:
+            # Extract URN from href like /feed/update/urn:li:share:7416215400826253312/
+            urn_match = re.search(r'/feed/update/(urn:li:(?:activity|share|ugcPost):\d+)', href)
+            if urn_match:
+                _debug_log(f"  Found SDUI permalink via {link_sel}")
+                return f"https://www.linkedin.com/feed/update/{urn_match.group(1)}"
+            # Also try activity ID pattern
+            activity_match = re.search(r'activity[:/](\d+)', href)
+            if activity_match:
+                _debug_log(f"  Found activity ID in {link_sel}")
+                return f"https://www.linkedin.com/feed/update/urn:li:activity:{activity_match.group(1)}"
+    
+    # Method 4: SDUI - share/comment buttons with URN data
+    for sel, values in zip(PERMALINK_BUTTON_SELECTORS, rec.get("buttons") or []):
+        if not values:
+            continue
+        for attr, val in zip(PERMALINK_BUTTON_ATTRS, values):
+            if val:
+                match = re.search(r'(?:activity|share|ugcPost)[:/](\d+)', val)
+                if match:
+                    _debug_log(f"  Found permalink via {sel} attr={attr}")
+                    return f"https://www.linkedin.com/feed/update/urn:li:activity:{match.group(1)}"
+    
+    # Method 5: Extract from full HTML of the element (search for URN patterns)
+    outer_html = rec.get("html")
+    if outer_html:
+        for pattern, urn_type in _HTML_PERMALINK_PATTERNS:
+            match = re.search(pattern, outer_html)
+            if match:
+                # Handle patterns with multiple groups
+                if match.lastindex and match.lastindex > 1:
+                    urn_type = match.group(1)
+                    urn_id = match.group(2)
+                else:
+                    urn_id = match.group(1)
+                    urn_type = urn_type or 'activity'
+                # Validate ID length (LinkedIn IDs are 19-20 digits)
+                if len(urn_id) >= 10:
+                    _debug_log(f"  Found permalink in HTML via pattern: {pattern[:50]}")
+                    return f"https://www.linkedin.com/feed/update/urn:li:{urn_type}:{urn_id}"
+    return None
+
+
+def parse_post_record(rec: dict, keyword: str) -> Optional[dict]:
+    """Clean and validate one record from EXTRACT_POSTS_JS into a raw post dict.
+
+    Returns None when the element is skipped (excluded author, pre-qualification
+    rejection, text too short, no permalink).
+    """
+    idx = rec.get("index", 0)
+    # Author - SDUI company/person links first, then classic selectors
+    # Use empty string instead of "Unknown" - leave blank if not found
+    author = ""
+    author_profile = None
+    company_link = rec.get("company_link")
+    if company_link:
+        if company_link.get("href"):
+            author_profile = company_link["href"].split("?")[0]
+        if company_link.get("name") is not None:
+            author = normalize_whitespace(company_link["name"])
+            if author:
+                _debug_log(f"  Found author from company link: '{author}'")
+    if not author:
+        person_link = rec.get("person_link")
+        if person_link:
+            if person_link.get("href"):
+                author_profile = person_link["href"].split("?")[0]
+            if person_link.get("name") is not None:
+                author = normalize_whitespace(person_link["name"])
+                if author:
+                    _debug_log(f"  Found author from person link: '{author}'")
+    
+    # Fallback: classic selectors for author
+    if not author:
+        for raw_author in rec.get("authors") or []:
+            if raw_author is None:
+                continue
+            raw_author = clean_author_name(raw_author)
+            # Validate the extracted name
+            if raw_author and raw_author != "Unknown" and len(raw_author) > 2:
+                if raw_author.lower().startswith("view"):
+                    continue
+                # Use the validation function to check if it's a real name
+                if is_valid_author_name(raw_author):
+                    author = raw_author
+                    break
+    
+    _debug_log(f"  Element {idx+1}: author='{author}', author_profile={author_profile}")
+    
+    # ===== PRE-QUALIFICATION PHASE 1: Author check (0 HTTP cost) =====
+    # Skip immediately if author is a known excluded entity (agency, competitor, etc.)
+    if _PRE_QUALIFIER_AVAILABLE and author:
+        is_excluded, exclusion_reason = is_excluded_author(author)
+        if is_excluded:
+            _debug_log(f"  SKIPPING element {idx+1}: pre-qual rejected author '{author}' ({exclusion_reason})")
+            if _PRE_QUAL_METRICS:
+                _PRE_QUAL_METRICS.record("rejected_author_only")
+            return None
+    
+    # Text - SDUI selectors first, then classic ones, then any div[dir='ltr']
+    text = ""
+    for sdui_sel, raw in zip(SDUI_TEXT_SELECTORS, rec.get("sdui_texts") or []):
+        if raw is not None:
+            text = normalize_whitespace(raw)
+            if text and len(text) > 20:
+                _debug_log(f"  Found text with SDUI selector '{sdui_sel}', length={len(text)}")
+                break
+    if not text or len(text) < 20:
+        for classic_sel, raw in zip(CLASSIC_TEXT_SELECTORS, rec.get("classic_texts") or []):
+            if raw is not None:
+                candidate = normalize_whitespace(raw)
+                if candidate and len(candidate) > 20:
+                    text = candidate
+                    _debug_log(f"  Found text with classic selector '{classic_sel}'")
+                    break
+    if (not text or len(text) < 20) and rec.get("ltr_text") is not None:
+        candidate = normalize_whitespace(rec["ltr_text"])
+        if candidate and len(candidate) > 50:  # Higher threshold for generic selector
+            text = candidate
+            _debug_log("  Found text with fallback div[dir='ltr']")
+    
+    _debug_log(f"  Element {idx+1}: text length={len(text)}, text preview='{text[:100] if text else 'EMPTY'}..'")
+    
+    if not text or len(text) < 20:
+        _debug_log(f"  SKIPPING element {idx+1}: text too short or empty")
+        return None
+    
+    # ===== PRE-QUALIFICATION PHASE 2: Text preview check =====
+    # Use only first 400 chars for pre-qual (sufficient for pattern matching)
+    if _PRE_QUALIFIER_AVAILABLE:
+        text_preview = text[:400] if len(text) > 400 else text
+        pre_qual_result = pre_qualify_post(
+            preview_text=text_preview,
+            author_name=author,
+            company_name=None,  # Company not extracted yet
+            known_companies=None,  # Could be populated from whitelist
+        )
+        if not pre_qual_result.should_extract:
+            rejection_reason = getattr(pre_qual_result, 'rejection_reason', None) or getattr(pre_qual_result, 'reason', 'unknown')
+            _debug_log(f"  SKIPPING element {idx+1}: pre-qual rejected - {rejection_reason}")
+            if _PRE_QUAL_METRICS:
+                _PRE_QUAL_METRICS.record(f"rejected_{rejection_reason}")
+            return None
+        _debug_log(f"  Element {idx+1} PASSED pre-qual (reason={getattr(pre_qual_result, 'reason', 'unknown')})")
+        if _PRE_QUAL_METRICS:
+            _PRE_QUAL_METRICS.record("passed_to_full_extraction")
+    else:
+        _debug_log(f"  Element {idx+1} BYPASSED pre-qual (module not available)")
+    
+    # Date - try multiple selectors for published_at (NOT collected_at)
+    published_at = None
+    for date_sel, date_txt in zip(DATE_SELECTORS, rec.get("dates") or []):
+        if date_txt:
+            dt = parse_relative_date(date_txt)
+            if dt:
+                published_at = dt.isoformat()
+                _debug_log(f"  Found date '{date_txt}' via selector {date_sel}")
+                break
+    
+    # SDUI fallback: search for date pattern in all <p> elements
+    paragraphs = rec.get("paragraphs") or []
+    if not published_at:
+        import re
+        for p_txt in paragraphs:
+            # Look for patterns like "3 sem •", "1 mois •", "2 j •"
+            if p_txt and re.search(r'\d+\s*(sem|mois|jour|j|h|min|an)\s*[•·]', p_txt, re.IGNORECASE):
+                dt = parse_relative_date(p_txt)
+                if dt:
+                    published_at = dt.isoformat()
+                    _debug_log(f"  Found date in <p>: '{p_txt[:30]}...'")
+                    break
+    
+    # Company - extract just the company name, not the full description
+    company = None
+    for raw in rec.get("companies") or []:
+        if raw is None:
+            continue
+        raw_company = normalize_whitespace(raw)
+        if raw_company:
+            # Skip if it's too long (likely full text, not company)
+            if len(raw_company) > 100:
+                continue
+            # Try to extract company from patterns like "Title at Company" or "Company • Location"
+            company = extract_company_name(raw_company)
+            if company and len(company) <= 60:
+                _debug_log(f"  Found company via selector: '{company}'")
+                break
+            company = None
+    
+    # SDUI fallback: Look for "chez" or "@" pattern in all <p> elements
+    if not company:
+        for p_txt in paragraphs:
+            if p_txt and len(p_txt) < 150:
+                company = extract_company_name(p_txt)
+                if company and is_valid_company_name(company):
+                    _debug_log(f"  Found company in <p>: '{company}' from '{p_txt[:40]}...'")
+                    break
+                company = None
+    
+    # If still no company, try to extract from author description
+    if not company and author and author != "Unknown":
+        for raw in rec.get("actor_descriptions") or []:
+            if raw is None:
+                continue
+            desc_text = normalize_whitespace(raw)
+            if desc_text and len(desc_text) < 100:
+                company = extract_company_name(desc_text)
+                if company and len(company) <= 60:
+                    break
+    
+    permalink = _record_permalink(rec, idx)
+    if not permalink:
+        # Method 6: Use author profile + hash as stable fallback (better than search URL)
+        # The fallback points to the author's profile since we can't get the exact post URL
+        if author and author != "Unknown" and text and author_profile:
+            import hashlib
+            text_hash = hashlib.md5(text[:200].encode('utf-8')).hexdigest()[:12]
+            # Add hash fragment for uniqueness in deduplication
+            base_profile = author_profile.split('?')[0].rstrip('/')
+            permalink = f"{base_profile}#post-{text_hash}"
+            _debug_log(f"  Using author profile as fallback permalink for element {idx+1}: {permalink[:80]}")
+    
+    if not permalink:
+        _debug_log(f"  SKIPPING element {idx+1}: no permalink found")
+        return None
+    
+    # Final validation: ensure company is not a job title or post content
+    if company and not is_valid_company_name(company):
+        company = None
+    
+    return {
+        "id": make_post_id(permalink or text[:100], author, keyword),
+        "keyword": keyword,
+        "author": author,
+        "author_profile": author_profile,
+        "text": text,
+        "language": detect_language(text),
+        "published_at": published_at,
+        "collected_at": datetime.now(timezone.utc).isoformat(),
+        "company": company,
+        "permalink": permalink,
+        "raw": None,
+    }
+
+
+def parse_post_records(records: list[dict], keyword: str, max_items: int = 10) -> list[dict]:
+    """Turn EXTRACT_POSTS_JS records into at most ``max_items`` unique raw post dicts."""
     posts = []
     seen_ids = set()
+    for rec in records:
+        if len(posts) >= max_items:
+            break
+        idx = rec.get("index", 0)
+        try:
+            _debug_log(f"Processing element {idx+1}/{len(records)}")
+            post = parse_post_record(rec, keyword)
+        except Exception as e:
+            # Skip this element on error - log full traceback for debugging
+            import traceback
+            _debug_log(f"  ERROR on element {idx+1}: {type(e).__name__}: {str(e)[:100]}")
+            _debug_log(f"  TRACEBACK:\n{traceback.format_exc()}")
+            continue
+        if post is None or post["id"] in seen_ids:
+            continue
+        seen_ids.add(post["id"])
+        # author_profile is kept for later human actions (after all posts are extracted)
+        posts.append(post)
+        _debug_log(f"  ✓ ADDED post from element {idx+1}: author={post['author'][:30]}, permalink={post['permalink'][:60]}")
+    return posts
+
+
+async def extract_posts_simple(page, keyword: str, max_items: int = 10, spans: Optional[StageSpans] = None) -> list[dict]:
+    """Simple post extraction - returns raw dicts.
+
+    ``spans`` receives the time spent waiting for the results to render
+    ("navigation"), in the in-page extraction, in record parsing and
+    pre-qualification ("prequalify") and in the human actions afterwards.
+    """
+    spans = spans if spans is not None else StageSpans()
+    spans.mark()
     
     # Attendre que le contenu réel de LinkedIn soit chargé
     # LinkedIn utilise un skeleton loader qui disparaît quand le contenu est prêt
@@ -1959,474 +2392,18 @@ async def extract_posts_simple(page, keyword: str, max_items: int = 10) -> list[
         _debug_log(f"Page HTML snippet (first 2000 chars): {html_snippet[:2000]}")
     except Exception as e:
         _debug_log(f"Could not capture HTML: {e}")
+    spans.lap("navigation")
     
-    # Find post elements
-    elements = []
-    _debug_log(f"Looking for post containers with {len(POST_CONTAINER_SELECTORS)} selectors")
-    for selector in POST_CONTAINER_SELECTORS:
-        try:
-            found = await page.query_selector_all(selector)
-            _debug_log(f"Selector '{selector}' found {len(found) if found else 0} elements")
-            if found:
-                elements.extend(found)
-        except Exception as e:
-            _debug_log(f"Selector '{selector}' error: {e}")
-            continue
-    _debug_log(f"Total elements found: {len(elements)}")
-    
-    # Debug: log structure of first element to understand new SDUI layout
-    if elements:
-        try:
-            first_el = elements[0]
-            inner_html = await first_el.evaluate("el => el.innerHTML.substring(0, 5000)")
-            _debug_log(f"FIRST ELEMENT HTML (5000 chars): {inner_html}")
-        except Exception as e:
-            _debug_log(f"Could not get first element HTML: {e}")
-    
-    for idx, el in enumerate(elements):
-        if len(posts) >= max_items:
-            break
-        
-        try:
-            _debug_log(f"Processing element {idx+1}/{len(elements)}")
-            # Author - try multiple selectors
-            # Use empty string instead of "Unknown" - leave blank if not found
-            author = ""
-            author_profile = None
-            
-            # NEW 2025: Try SDUI author extraction first
-            # In SDUI, author/company name is in link to /company/ or /in/
-            try:
-                # Try company link first
-                company_link = await el.query_selector("a[href*='/company/']")
-                if company_link:
-                    href = await company_link.get_attribute("href")
-                    if href:
-                        author_profile = href.split("?")[0]
-                    # Get company name from first <p> inside or adjacent
-                    name_el = await company_link.query_selector("p")
-                    if name_el:
-                        author = normalize_whitespace(await name_el.inner_text())
-                        if author:
-                            _debug_log(f"  Found author from company link: '{author}'")
-                
-                # If no company, try person link
-                if not author:
-                    person_link = await el.query_selector("a[href*='/in/']")
-                    if person_link:
-                        href = await person_link.get_attribute("href")
-                        if href:
-                            author_profile = href.split("?")[0]
-                        name_el = await person_link.query_selector("p")
-                        if name_el:
-                            author = normalize_whitespace(await name_el.inner_text())
-                            if author:
-                                _debug_log(f"  Found author from person link: '{author}'")
-            except Exception as e:
-                _debug_log(f"  SDUI author extraction error: {e}")
-            
-            # Fallback: classic selectors for author
-            if not author:
-                for author_sel in AUTHOR_SELECTORS:
-                    try:
-                        author_el = await el.query_selector(author_sel)
-                        if author_el:
-                            raw_author = await author_el.inner_text()
-                            raw_author = clean_author_name(raw_author)
-                            # Validate the extracted name
-                            if raw_author and raw_author != "Unknown" and len(raw_author) > 2:
-                                if raw_author.lower().startswith("view"):
-                                    continue
-                                # Use the validation function to check if it's a real name
-                                if is_valid_author_name(raw_author):
-                                    author = raw_author
-                                    break
-                    except Exception:
-                        continue
-            
-            # If author is still unknown but we have a profile link, try to extract from URL
-            if author == "Unknown" and author_profile:
-                import re
-                # Extract name from profile URL like /in/john-doe-1234/
-                match = re.search(r'/in/([^/?]+)', author_profile)
-                if match:
-                    url_name = match.group(1)
-                    # Convert URL slug to name: "john-doe-1234" -> "John Doe"
-                    # Remove trailing numbers
-                    url_name = re.sub(r'-\d+$', '', url_name)
-                    # Replace dashes with spaces and capitalize
-                    name_parts = url_name.replace('-', ' ').split()
-                    if len(name_parts) >= 2 and len(name_parts) <= 5:
-                        author = ' '.join(p.capitalize() for p in name_parts)
-            
-            _debug_log(f"  Element {idx+1}: author='{author}', author_profile={author_profile}")
-            
-            # ===== PRE-QUALIFICATION PHASE 1: Author check (0 HTTP cost) =====
-            # Skip immediately if author is a known excluded entity (agency, competitor, etc.)
-            if _PRE_QUALIFIER_AVAILABLE and author:
-                is_excluded, exclusion_reason = is_excluded_author(author)
-                if is_excluded:
-                    _debug_log(f"  SKIPPING element {idx+1}: pre-qual rejected author '{author}' ({exclusion_reason})")
-                    if _PRE_QUAL_METRICS:
-                        _PRE_QUAL_METRICS.record("rejected_author_only")
-                    continue
-            
-            # Text - try multiple selectors for new SDUI structure
-            text = ""
-            
-            # NEW 2025: Try SDUI selectors first (data-view-name based)
-            sdui_text_selectors = [
-                "[data-view-name='feed-commentary']",
-                "[data-testid='expandable-text-box']",
-            ]
-            for sdui_sel in sdui_text_selectors:
-                try:
-                    text_el = await el.query_selector(sdui_sel)
-                    if text_el:
-                        text = normalize_whitespace(await text_el.inner_text())
-                        if text and len(text) > 20:
-                            _debug_log(f"  Found text with SDUI selector '{sdui_sel}', length={len(text)}")
-                            break
-                except Exception as e:
-                    _debug_log(f"  SDUI selector '{sdui_sel}' error: {e}")
-            
-            # If no text found with SDUI, try classic selectors
-            if not text or len(text) < 20:
-                classic_text_selectors = [
-                    "div.feed-shared-update-v2__description",
-                    "div.update-components-text",
-                    "span.break-words",
-                ]
-                for classic_sel in classic_text_selectors:
-                    try:
-                        text_el = await el.query_selector(classic_sel)
-                        if text_el:
-                            candidate = normalize_whitespace(await text_el.inner_text())
-                            if candidate and len(candidate) > 20:
-                                text = candidate
-                                _debug_log(f"  Found text with classic selector '{classic_sel}'")
-                                break
-                    except Exception:
-                        continue
-            
-            # Last fallback - any text in div[dir='ltr']
-            if not text or len(text) < 20:
-                try:
-                    text_el = await el.query_selector("div[dir='ltr']")
-                    if text_el:
-                        candidate = normalize_whitespace(await text_el.inner_text())
-                        if candidate and len(candidate) > 50:  # Higher threshold for generic selector
-                            text = candidate
-                            _debug_log("  Found text with fallback div[dir='ltr']")
-                except Exception:
-                    pass
-            
-            _debug_log(f"  Element {idx+1}: text length={len(text)}, text preview='{text[:100] if text else 'EMPTY'}..'")
-            
-            if not text or len(text) < 20:
-                _debug_log(f"  SKIPPING element {idx+1}: text too short or empty")
-                continue
-            
-            # ===== PRE-QUALIFICATION PHASE 2: Text preview check =====
-            # Use only first 400 chars for pre-qual (sufficient for pattern matching)
-            # This avoids expensive full extraction for posts that will be rejected anyway
-            if _PRE_QUALIFIER_AVAILABLE:
-                text_preview = text[:400] if len(text) > 400 else text
-                pre_qual_result = pre_qualify_post(
-                    preview_text=text_preview,
-                    author_name=author,
-                    company_name=None,  # Company not extracted yet
-                    known_companies=None,  # Could be populated from whitelist
-                )
-                if not pre_qual_result.should_extract:
-                    rejection_reason = getattr(pre_qual_result, 'rejection_reason', None) or getattr(pre_qual_result, 'reason', 'unknown')
-                    _debug_log(f"  SKIPPING element {idx+1}: pre-qual rejected - {rejection_reason}")
-                    if _PRE_QUAL_METRICS:
-                        _PRE_QUAL_METRICS.record(f"rejected_{rejection_reason}")
-                    continue
-                else:
-                    _debug_log(f"  Element {idx+1} PASSED pre-qual (reason={getattr(pre_qual_result, 'reason', 'unknown')})")
-                    if _PRE_QUAL_METRICS:
-                        _PRE_QUAL_METRICS.record("passed_to_full_extraction")
-            else:
-                _debug_log(f"  Element {idx+1} BYPASSED pre-qual (module not available)")
-            
-            # Date - try multiple selectors for published_at (NOT collected_at)
-            published_at = None
-            for date_sel in DATE_SELECTORS:
-                try:
-                    date_el = await el.query_selector(date_sel)
-                    if date_el:
-                        date_txt = await date_el.inner_text()
-                        if date_txt:
-                            dt = parse_relative_date(date_txt)
-                            if dt:
-                                published_at = dt.isoformat()
-                                _debug_log(f"  Found date '{date_txt}' via selector {date_sel}")
-                                break
-                except Exception:
-                    continue
-            
-            # SDUI fallback: search for date pattern in all <p> elements
-            if not published_at:
-                try:
-                    all_p = await el.query_selector_all("p")
-                    for p_el in all_p:
-                        p_txt = await p_el.inner_text()
-                        if p_txt:
-                            # Look for patterns like "3 sem •", "1 mois •", "2 j •"
-                            import re
-                            if re.search(r'\d+\s*(sem|mois|jour|j|h|min|an)\s*[•·]', p_txt, re.IGNORECASE):
-                                dt = parse_relative_date(p_txt)
-                                if dt:
-                                    published_at = dt.isoformat()
-                                    _debug_log(f"  Found date in <p>: '{p_txt[:30]}...'")
-                                    break
-                except Exception:
-                    pass
-            
-            # Company - extract just the company name, not the full description
-            company = None
-            for csel in COMPANY_SELECTORS:
-                try:
-                    c_el = await el.query_selector(csel)
-                    if c_el:
-                        raw_company = normalize_whitespace(await c_el.inner_text())
-                        if raw_company:
-                            # Skip if it's too long (likely full text, not company)
-                            if len(raw_company) > 100:
-                                continue
-                            # Try to extract company from patterns like "Title at Company" or "Company • Location"
-                            company = extract_company_name(raw_company)
-                            if company and len(company) <= 60:
-                                _debug_log(f"  Found company via selector: '{company}'")
-                                break
-                            else:
-                                company = None
-                except Exception:
-                    continue
-            
-            # SDUI fallback: Look for "chez" or "@" pattern in all <p> elements
-            if not company:
-                try:
-                    all_p = await el.query_selector_all("p")
-                    for p_el in all_p:
-                        p_txt = await p_el.inner_text()
-                        if p_txt and len(p_txt) < 150:
-                            company = extract_company_name(p_txt)
-                            if company and is_valid_company_name(company):
-                                _debug_log(f"  Found company in <p>: '{company}' from '{p_txt[:40]}...'")
-                                break
-                            else:
-                                company = None
-                except Exception:
-                    pass
-            
-            # If still no company, try to extract from author description
-            if not company and author and author != "Unknown" and author != "":
-                # Sometimes the company is in the same element as the author
-                try:
-                    for desc_sel in ["span.update-components-actor__description span[aria-hidden='true']"]:
-                        desc_el = await el.query_selector(desc_sel)
-                        if desc_el:
-                            desc_text = normalize_whitespace(await desc_el.inner_text())
-                            if desc_text and len(desc_text) < 100:
-                                company = extract_company_name(desc_text)
-                                if company and len(company) <= 60:
-                                    break
-                except Exception:
-                    pass
-            
-            # Permalink - try multiple methods
-            permalink = None
-            try:
-                # Method 1: data-urn attribute
-                urn = await el.get_attribute("data-urn")
-                if urn and "activity:" in urn:
-                    activity_id = urn.split("activity:")[-1].strip()
-                    # Remove any trailing characters that aren't digits
-                    import re
-                    activity_match = re.match(r"(\d+)", activity_id)
-                    if activity_match:
-                        permalink = f"https://www.linkedin.com/feed/update/urn:li:activity:{activity_match.group(1)}"
-            except Exception:
-                pass
-            
-            if not permalink:
-                # Method 2: Look for share link
-                try:
-                    share_link = await el.query_selector("a[href*='/feed/update/']")
-                    if share_link:
-                        href = await share_link.get_attribute("href")
-                        if href:
-                            permalink = href.split("?")[0]
-                except Exception:
-                    pass
-            
-            if not permalink:
-                # Method 3: SDUI - Look for direct links to /feed/update/ with URN
-                try:
-                    import re
-                    # SDUI uses href with full URN path
-                    for link_sel in [
-                        "a[href*='/feed/update/urn:li:']",  # Direct URN link
-                        "a[href*='/feed/update/']",  # Any update link
-                        "a[href*='/activity/']", 
-                        "a[href*='activity:']", 
-                        "button[data-urn*='activity']"
-                    ]:
-                        link_el = await el.query_selector(link_sel)
-                        if link_el:
-                            href = await link_el.get_attribute("href") or await link_el.get_attribute("data-urn")
-                            if href:
-                                # Extract URN from href like /feed/update/urn:li:share:7416215400826253312/
-                                urn_match = re.search(r'/feed/update/(urn:li:(?:activity|share|ugcPost):\d+)', href)
-                                if urn_match:
-                                    permalink = f"https://www.linkedin.com/feed/update/{urn_match.group(1)}"
-                                    _debug_log(f"  Found SDUI permalink via {link_sel}: {permalink[:80]}")
-                                    break
-                                # Also try activity ID pattern
-                                activity_match = re.search(r'activity[:/](\d+)', href)
-                                if activity_match:
-                                    permalink = f"https://www.linkedin.com/feed/update/urn:li:activity:{activity_match.group(1)}"
-                                    _debug_log(f"  Found activity ID in {link_sel}")
-                                    break
-                except Exception:
-                    pass
-            
-            if not permalink:
-                # Method 4: SDUI - Look for share/comment buttons with URN data
-                try:
-                    import re
-                    # Try to find any element with data attributes containing activity/share IDs
-                    for sel in [
-                        "button[aria-label*='commentaire']",  # Comment button
-                        "button[aria-label*='comment']",
-                        "button[aria-label*='Commenter']",
-                        "[data-urn*='share:']",  # Share URN
-                        "[data-urn*='ugcPost:']",  # UGC post URN
-                        "a[href*='/posts/']",  # Company posts link
-                    ]:
-                        try:
-                            btn = await el.query_selector(sel)
-                            if btn:
-                                # Check multiple data attributes
-                                for attr in ["data-urn", "data-id", "data-activity-id", "href"]:
-                                    val = await btn.get_attribute(attr)
-                                    if val:
-                                        # Look for activity ID pattern
-                                        match = re.search(r'(?:activity|share|ugcPost)[:/](\d+)', val)
-                                        if match:
-                                            permalink = f"https://www.linkedin.com/feed/update/urn:li:activity:{match.group(1)}"
-                                            _debug_log(f"  Found permalink via {sel} attr={attr}")
-                                            break
-                                if permalink:
-                                    break
-                        except Exception:
-                            continue
-                except Exception:
-                    pass
-            
-            if not permalink:
-                # Method 5: Extract from full HTML of the element (search for URN patterns)
-                try:
-                    import re
-                    outer_html = await el.evaluate("el => el.outerHTML")
-                    if outer_html:
-                        # Look for activity URN in HTML - try multiple patterns
-                        # SDUI 2025 uses escaped JSON like \"activityId\":\"7416515147957137414\"
-                        patterns = [
-                            # SDUI 2025 specific patterns (with escaped quotes)
-                            (r'\\?"activityId\\?"\\s*:\\s*\\?"(\d{19,20})\\?"', 'activity'),
-                            (r'activityId["\s:]+(\d{19,20})', 'activity'),
-                            # Standard URN patterns
-                            (r'urn:li:activity:(\d+)', 'activity'),
-                            (r'urn:li:share:(\d+)', 'share'),
-                            (r'urn:li:ugcPost:(\d+)', 'ugcPost'),
-                            (r'/feed/update/urn:li:(activity|share|ugcPost):(\d+)', None),
-                            (r'"activityUrn"[:\s]+"urn:li:activity:(\d+)"', 'activity'),
-                            (r'"entityUrn"[:\s]+"urn:li:(activity|share|ugcPost):(\d+)"', None),
-                            (r'data-activity-id="(\d+)"', 'activity'),
-                            (r'share:(\d{19,20})', 'share'),
-                            (r'activity:(\d{19,20})', 'activity'),
-                        ]
-                        for pattern_tuple in patterns:
-                            pattern = pattern_tuple[0]
-                            urn_type = pattern_tuple[1] if len(pattern_tuple) > 1 else None
-                            match = re.search(pattern, outer_html)
-                            if match:
-                                # Handle patterns with multiple groups
-                                if match.lastindex and match.lastindex > 1:
-                                    urn_type = match.group(1)
-                                    urn_id = match.group(2)
-                                else:
-                                    urn_id = match.group(1)
-                                    if not urn_type:
-                                        urn_type = 'activity'
-                                
-                                # Validate ID length (LinkedIn IDs are 19-20 digits)
-                                if len(urn_id) >= 10:
-                                    permalink = f"https://www.linkedin.com/feed/update/urn:li:{urn_type}:{urn_id}"
-                                    _debug_log(f"  Found permalink in HTML via pattern: {pattern[:50]}")
-                                    break
-                except Exception as e:
-                    _debug_log(f"  Error extracting permalink from HTML: {e}")
-                    pass
-            
-            if not permalink:
-                # Method 6: Use author profile + hash as stable fallback (better than search URL)
-                # This creates a more stable identifier based on content
-                # The fallback points to the author's profile since we can't get the exact post URL
-                if author and author != "Unknown" and text and author_profile:
-                    import hashlib
-                    text_hash = hashlib.md5(text[:200].encode('utf-8')).hexdigest()[:12]
-                    # Use author profile as the clickable link (better UX than search results)
-                    # Add hash fragment for uniqueness in deduplication
-                    base_profile = author_profile.split('?')[0].rstrip('/')
-                    permalink = f"{base_profile}#post-{text_hash}"
-                    _debug_log(f"  Using author profile as fallback permalink for element {idx+1}: {permalink[:80]}")
-            
-            # Log if still no permalink
-            if not permalink:
-                _debug_log(f"  SKIPPING element {idx+1}: no permalink found")
-                continue
-            
-            # Final validation: ensure company is not a job title or post content
-            # Use the is_valid_company_name function for thorough validation
-            if company and not is_valid_company_name(company):
-                company = None
-            
-            # Generate ID based on content for deduplication
-            post_id = make_post_id(permalink or text[:100], author, keyword)
-            if post_id in seen_ids:
-                continue
-            seen_ids.add(post_id)
-            
-            # Store author_profile for later human actions (after all posts are extracted)
-            # We can't do human actions during extraction because they navigate away and invalidate DOM
-            post_with_profile = {
-                "id": post_id,
-                "keyword": keyword,
-                "author": author,
-                "author_profile": author_profile,
-                "text": text,
-                "language": detect_language(text),
-                "published_at": published_at,
-                "collected_at": datetime.now(timezone.utc).isoformat(),
-                "company": company,
-                "permalink": permalink,
-                "raw": None,
-            }
-            posts.append(post_with_profile)
-            _debug_log(f"  ✓ ADDED post from element {idx+1}: author={author[:30]}, permalink={permalink[:60] if permalink else 'None'}")
-        
-        except Exception as e:
-            # Skip this element on error - log full traceback for debugging
-            import traceback
-            tb_str = traceback.format_exc()
-            _debug_log(f"  ERROR on element {idx+1}: {type(e).__name__}: {str(e)[:100]}")
-            _debug_log(f"  TRACEBACK:\n{tb_str}")
-            continue
+    # Extract every post container in one in-page pass, then clean/validate in Python
+    try:
+        records = await page.evaluate(EXTRACT_POSTS_JS, extract_posts_js_args()) or []
+    except Exception as e:
+        _debug_log(f"In-page extraction error: {e}")
+        records = []
+    _debug_log(f"Total elements found: {len(records)}")
+    spans.lap("extraction")
+    posts = parse_post_records(records, keyword, max_items)
+    spans.lap("prequalify")
     
     # ========== ACTIONS HUMAINES SUR LES POSTS (APRÈS EXTRACTION) ==========
     # Maintenant que tous les éléments sont extraits, on peut faire les actions humaines
@@ -2439,6 +2416,7 @@ async def extract_posts_simple(page, keyword: str, max_items: int = 10) -> list[
                     await perform_human_actions_on_post(page, None, {"author_profile": post_data["author_profile"]})
                 except Exception as e:
                     _debug_log(f"Human action error: {e}")
+    spans.lap("human_actions")
     
     return posts
 
@@ -2793,7 +2771,118 @@ def is_valid_company_name(company: Optional[str]) -> bool:
     return True
 
 
-async def scrape_keywords(keywords: list[str], storage_state: str, max_per_keyword: int = 10, headless: bool = True, apply_titan_filter: bool = True, session_quota: int = 0) -> dict:
+def get_post_hash(post: dict) -> str:
+    """Generate a unique hash for a post based on author and text."""
+    import hashlib
+    author = (post.get('author') or '').strip().lower()
+    text = (post.get('text') or '').strip().lower()[:200]  # First 200 chars
+    key = f"{author}|{text}"
+    return hashlib.md5(key.encode('utf-8', errors='ignore')).hexdigest()
+
+
+# filter_post_titan_partners reason -> scrape_keywords stats counter (first match wins)
+_REJECTION_STAT_KEYS = [
+    ("AGENCY", "rejected_agency"),
+    ("EXTERNAL", "rejected_external"),
+    ("JOBSEEKER", "rejected_jobseeker"),
+    ("EXCLUDED_CONTRACT", "rejected_contract_type"),
+    ("NON_RECRUITMENT", "rejected_non_recruitment"),
+    ("NO_LEGAL", "rejected_no_legal"),
+    ("NO_RECRUITMENT_SIGNAL", "rejected_no_signal"),
+    ("TOO_OLD", "rejected_too_old"),
+]
+
+
+def rejection_stat_key(reason: str) -> str:
+    for marker, key in _REJECTION_STAT_KEYS:
+        if marker in reason:
+            return key
+    return "rejected_other"
+
+
+def screen_post(post: dict, apply_titan_filter: bool = True, spans: Optional[StageSpans] = None) -> tuple[bool, str]:
+    """Language and Titan Partners filters for one (deduplicated) raw post.
+
+    Returns ``(is_valid, reason)``; reason is "NON_FRENCH" for posts rejected
+    by the language filter, else the filter_post_titan_partners reason ("" when
+    the Titan filter is off). Each filter's time goes to ``spans``.
+    """
+    # FILTRE LANGUE: Rejeter les posts non-français
+    # Titan Partners recherche uniquement des publications en France
+    with stage_span(spans, "filter_language"):
+        is_french = is_french_post(post.get("text", ""))
+    if not is_french:
+        return False, "NON_FRENCH"
+    if not apply_titan_filter:
+        return True, ""
+    with stage_span(spans, "filter_titan"):
+        return filter_post_titan_partners(post)
+
+
+def _browser_launch_args() -> list[str]:
+    """Chromium launch args (anti-detection)."""
+    args = [
+        "--disable-dev-shm-usage",
+        "--disable-web-security",
+        "--no-sandbox",
+        "--disable-setuid-sandbox",
+        "--disable-infobars",
+        "--window-position=0,0",
+        "--ignore-certificate-errors",
+        "--ignore-certificate-errors-spki-list",
+        "--disable-features=IsolateOrigins,site-per-process",
+    ]
+    if stealth_enabled():
+        args.insert(0, "--disable-blink-features=AutomationControlled")
+    return args
+
+
+class WarmBrowser:
+    """Playwright + Chromium kept alive across jobs by the scraper server (--serve).
+
+    Each job still gets its own browser context, so the storage state is
+    reloaded every time; only the interpreter and the browser process are
+    reused. A disconnected browser (crash) is relaunched on the next job.
+    """
+
+    def __init__(self):
+        self._pw = None
+        self._browser = None
+        self._headless: Optional[bool] = None
+
+    async def get(self, headless: bool):
+        if self._browser is not None and (self._headless != headless or not self._browser.is_connected()):
+            await self.close()
+        if self._browser is None:
+            from playwright.async_api import async_playwright
+            self._pw = await async_playwright().start()
+            _debug_log(f"warm browser: launching headless={headless} stealth={stealth_enabled()}")
+            self._browser = await self._pw.chromium.launch(headless=headless, args=_browser_launch_args())
+            self._headless = headless
+        return self._browser
+
+    async def close(self) -> None:
+        if self._browser is not None:
+            with contextlib.suppress(Exception):
+                await self._browser.close()
+        if self._pw is not None:
+            with contextlib.suppress(Exception):
+                await self._pw.stop()
+        self._pw = self._browser = self._headless = None
+
+
+async def _close_quietly(resource) -> None:
+    with contextlib.suppress(Exception):
+        await resource.close()
+
+
+async def _release_browser(browser, warm: Optional[WarmBrowser]) -> None:
+    """Close the browser, unless it is the server's warm one (only the job's context is closed)."""
+    if warm is None:
+        await browser.close()
+
+
+async def scrape_keywords(keywords: list[str], storage_state: str, max_per_keyword: int = 10, headless: bool = True, apply_titan_filter: bool = True, session_quota: int = 0, stream: Optional["ResultStreamWriter"] = None, warm: Optional[WarmBrowser] = None) -> dict:
     """Main scraping function - runs in isolated process.
     
     Args:
@@ -2804,6 +2893,10 @@ async def scrape_keywords(keywords: list[str], storage_state: str, max_per_keywo
         apply_titan_filter: Apply Titan Partners filtering rules
         session_quota: Max total posts to accept this session (0 = no limit)
                        Used for v2 micro-session strategy (~10 posts per session)
+        stream: Optional NDJSON result channel; each accepted post is written
+                to it as soon as it passes the filters (see scraper.result_stream)
+        warm: Browser kept alive by the scraper server; None launches (and
+              closes) a browser for this call only
     """
     from playwright.async_api import async_playwright
     
@@ -2837,37 +2930,21 @@ async def scrape_keywords(keywords: list[str], storage_state: str, max_per_keywo
     # Track seen posts to avoid duplicates (based on author + text hash)
     seen_posts = set()
     
-    def get_post_hash(post):
-        """Generate a unique hash for a post based on author and text."""
-        import hashlib
-        author = (post.get('author') or '').strip().lower()
-        text = (post.get('text') or '').strip().lower()[:200]  # First 200 chars
-        key = f"{author}|{text}"
-        return hashlib.md5(key.encode('utf-8', errors='ignore')).hexdigest()
-    
     try:
-        async with async_playwright() as pw:
-            # Launch browser with anti-detection args
-            _debug_log(f"launching browser headless={headless} stealth={stealth_enabled()}")
-            args = [
-                "--disable-dev-shm-usage",
-                "--disable-web-security",
-                "--no-sandbox",
-                "--disable-setuid-sandbox",
-                "--disable-infobars",
-                "--window-position=0,0",
-                "--ignore-certificate-errors",
-                "--ignore-certificate-errors-spki-list",
-                "--disable-features=IsolateOrigins,site-per-process",
-            ]
-            if stealth_enabled():
-                args.insert(0, "--disable-blink-features=AutomationControlled")
-            browser = await pw.chromium.launch(
-                headless=headless,
-                args=args,
-            )
-            if stealth_enabled():
-                _debug_log("browser launched with stealth args")
+        async with contextlib.AsyncExitStack() as stack:
+            if warm is not None:
+                browser = await warm.get(headless)
+                _debug_log("reusing warm browser")
+            else:
+                pw = await stack.enter_async_context(async_playwright())
+                # Launch browser with anti-detection args
+                _debug_log(f"launching browser headless={headless} stealth={stealth_enabled()}")
+                browser = await pw.chromium.launch(
+                    headless=headless,
+                    args=_browser_launch_args(),
+                )
+                if stealth_enabled():
+                    _debug_log("browser launched with stealth args")
             
             # Create context with storage state AND stealth options
             # PHASE 3: Utilise le wrapper conditionnel
@@ -2882,6 +2959,8 @@ async def scrape_keywords(keywords: list[str], storage_state: str, max_per_keywo
                 _debug_log(f"WARNING: storage_state missing or not found: {storage_state}")
             
             context = await browser.new_context(**context_opts)
+            if warm is not None:
+                stack.push_async_callback(_close_quietly, context)
             page = await context.new_page()
             
             # Apply anti-detection scripts
@@ -2927,7 +3006,7 @@ async def scrape_keywords(keywords: list[str], storage_state: str, max_per_keywo
                 results["account_restricted"] = True
                 results["restriction_reason"] = restriction_reason
                 results["errors"].append(f"Account restricted by LinkedIn: {restriction_reason}")
-                await browser.close()
+                await _release_browser(browser, warm)
                 return results
             
             # Check if authenticated - get cookies from both domains
@@ -2968,7 +3047,7 @@ async def scrape_keywords(keywords: list[str], storage_state: str, max_per_keywo
                     "cookies_count": len(cookies),
                 }
                 _debug_log(f"Auth debug: {results['auth_debug']}")
-                await browser.close()
+                await _release_browser(browser, warm)
                 return results
             
             _debug_log("authentication OK, starting keyword scraping")
@@ -2993,6 +3072,7 @@ async def scrape_keywords(keywords: list[str], storage_state: str, max_per_keywo
                     break
                 
                 _debug_log(f"Processing keyword {kw_idx+1}/{len(keywords)}: {keyword}")
+                spans = StageSpans()
                 try:
                     search_url = f"https://www.linkedin.com/search/results/content/?keywords={keyword}"
                     _debug_log(f"navigating to search: {search_url[:80]}...")
@@ -3012,7 +3092,7 @@ async def scrape_keywords(keywords: list[str], storage_state: str, max_per_keywo
                         results["account_restricted"] = True
                         results["restriction_reason"] = restriction_reason
                         results["errors"].append(f"Account restricted during scraping: {restriction_reason}")
-                        await browser.close()
+                        await _release_browser(browser, warm)
                         return results
                     
                     # Délai humain avec scroll simulé
@@ -3027,7 +3107,8 @@ async def scrape_keywords(keywords: list[str], storage_state: str, max_per_keywo
                     # Scrape more posts than needed to account for filtering
                     scrape_count = max_per_keyword * 3 if apply_titan_filter else max_per_keyword
                     _debug_log(f"calling extract_posts_simple with count={scrape_count}")
-                    raw_posts = await extract_posts_simple(page, keyword, scrape_count)
+                    spans.lap("navigation")
+                    raw_posts = await extract_posts_simple(page, keyword, scrape_count, spans=spans)
                     _debug_log(f"extract_posts_simple returned {len(raw_posts)} posts")
                     results["stats"]["total_scraped"] += len(raw_posts)
                     
@@ -3047,83 +3128,73 @@ async def scrape_keywords(keywords: list[str], storage_state: str, max_per_keywo
                             post_url = post.get("permalink", "") or post.get("author_profile", "")
                             post_id = post.get("id", "")
                             
-                            if _ADAPTERS_AVAILABLE and flags.use_post_cache:
-                                # Use persistent cache for deduplication across sessions
-                                if is_duplicate_post(
-                                    text=post_text, 
-                                    url=post_url, 
-                                    post_id=post_id, 
-                                    author=post_author
-                                ):
-                                    results["stats"]["rejected_duplicate"] += 1
-                                    _debug_log("[ADAPTER] PostCache: duplicate detected")
-                                    continue
-                            else:
-                                # Legacy in-memory deduplication
-                                post_hash = get_post_hash(post)
-                                if post_hash in seen_posts:
-                                    results["stats"]["rejected_duplicate"] += 1
-                                    continue
-                                seen_posts.add(post_hash)
+                            with spans.span("dedup"):
+                                if _ADAPTERS_AVAILABLE and flags.use_post_cache:
+                                    # Use persistent cache for deduplication across sessions
+                                    is_duplicate = is_duplicate_post(
+                                        text=post_text, 
+                                        url=post_url, 
+                                        post_id=post_id, 
+                                        author=post_author
+                                    )
+                                    if is_duplicate:
+                                        _debug_log("[ADAPTER] PostCache: duplicate detected")
+                                else:
+                                    # Legacy in-memory deduplication
+                                    post_hash = get_post_hash(post)
+                                    is_duplicate = post_hash in seen_posts
+                                    seen_posts.add(post_hash)
+                            if is_duplicate:
+                                results["stats"]["rejected_duplicate"] += 1
+                                continue
                             
-                            # FILTRE LANGUE: Rejeter les posts non-français
-                            # Titan Partners recherche uniquement des publications en France
-                            if not is_french_post(post.get("text", "")):
+                            is_valid, reason = screen_post(post, apply_titan_filter, spans=spans)
+                            if reason == "NON_FRENCH":
                                 results["stats"]["rejected_non_french"] += 1
                                 _debug_log(f"  Post {post_idx+1}: rejected (non-french)")
                                 continue
                             
                             if apply_titan_filter:
-                                is_valid, reason = filter_post_titan_partners(post)
                                 _debug_log(f"  Post {post_idx+1}: filter result valid={is_valid}, reason={reason}")
                                 if is_valid:
                                     results["posts"].append(post)
                                     results["stats"]["accepted"] += 1
+                                    if stream is not None:
+                                        stream.post(post)
                                     # [ADAPTER] Mark post as seen in persistent cache
                                     if _ADAPTERS_AVAILABLE and flags.use_post_cache:
-                                        mark_post_seen(
-                                            text=post_text,
-                                            url=post_url,
-                                            post_id=post_id,
-                                            author=post_author,
-                                        )
+                                        with spans.span("dedup"):
+                                            mark_post_seen(
+                                                text=post_text,
+                                                url=post_url,
+                                                post_id=post_id,
+                                                author=post_author,
+                                            )
                                     # ===== v2 EARLY EXIT: Check quota after each accepted post =====
                                     if session_quota > 0 and results["stats"]["accepted"] >= session_quota:
                                         _debug_log(f"SESSION QUOTA ({session_quota}) reached mid-keyword - breaking post loop")
                                         break
                                 else:
                                     # Track rejection reason
-                                    if "AGENCY" in reason:
-                                        results["stats"]["rejected_agency"] += 1
-                                    elif "EXTERNAL" in reason:
-                                        results["stats"]["rejected_external"] += 1
-                                    elif "JOBSEEKER" in reason:
-                                        results["stats"]["rejected_jobseeker"] += 1
-                                    elif "EXCLUDED_CONTRACT" in reason:
-                                        results["stats"]["rejected_contract_type"] += 1
-                                    elif "NON_RECRUITMENT" in reason:
-                                        results["stats"]["rejected_non_recruitment"] += 1
-                                    elif "NO_LEGAL" in reason:
-                                        results["stats"]["rejected_no_legal"] += 1
-                                    elif "NO_RECRUITMENT_SIGNAL" in reason:
-                                        results["stats"]["rejected_no_signal"] += 1
-                                    elif "TOO_OLD" in reason:
-                                        results["stats"]["rejected_too_old"] += 1
-                                    else:
-                                        results["stats"]["rejected_other"] += 1
+                                    stat_key = rejection_stat_key(reason)
+                                    results["stats"][stat_key] += 1
+                                    if stat_key == "rejected_other":
                                         _debug_log(f"  Post {post_idx+1}: rejected_other, reason={reason}")
                             else:
                                 results["posts"].append(post)
                                 results["stats"]["accepted"] += 1
+                                if stream is not None:
+                                    stream.post(post)
                                 _debug_log(f"  Post {post_idx+1}: accepted (no filter)")
                                 # [ADAPTER] Mark post as seen in persistent cache even without filter
                                 if _ADAPTERS_AVAILABLE and flags.use_post_cache:
-                                    mark_post_seen(
-                                        text=post_text,
-                                        url=post_url,
-                                        post_id=post_id,
-                                        author=post_author,
-                                    )
+                                    with spans.span("dedup"):
+                                        mark_post_seen(
+                                            text=post_text,
+                                            url=post_url,
+                                            post_id=post_id,
+                                            author=post_author,
+                                        )
                                 # ===== v2 EARLY EXIT: Check quota even without filter =====
                                 if session_quota > 0 and results["stats"]["accepted"] >= session_quota:
                                     _debug_log(f"SESSION QUOTA ({session_quota}) reached - breaking post loop")
@@ -3133,7 +3204,17 @@ async def scrape_keywords(keywords: list[str], storage_state: str, max_per_keywo
                             results["stats"]["rejected_other"] += 1
                     
                     results["keywords_processed"] += 1
+                    if stream is not None:
+                        stream.progress(
+                            keyword=keyword,
+                            keywords_processed=results["keywords_processed"],
+                            keywords_total=len(keywords),
+                            scraped=len(raw_posts),
+                            accepted=results["stats"]["accepted"],
+                        )
+                        stream.stats(results["stats"])
                     
+                    spans.mark()
                     # ========== PAUSE LONGUE OCCASIONNELLE ==========
                     # Simule une distraction humaine (regarder autre chose, pause café, etc.)
                     if should_take_long_pause() and kw_idx < len(keywords) - 1:
@@ -3150,11 +3231,17 @@ async def scrape_keywords(keywords: list[str], storage_state: str, max_per_keywo
                         delay = random_delay(KEYWORD_DELAY_MIN, KEYWORD_DELAY_MAX)
                         _debug_log(f"Waiting {delay/1000:.1f}s before next keyword")
                         await page.wait_for_timeout(delay)
+                    spans.lap("keyword_pause")
                     
                 except Exception as e:
                     results["errors"].append(f"Keyword '{keyword}': {str(e)}")
+                finally:
+                    stage_seconds = spans.pop()
+                    _debug_log(f"stage spans for '{keyword}': {stage_seconds}")
+                    if stream is not None and stage_seconds:
+                        stream.spans(keyword, stage_seconds)
             
-            await browser.close()
+            await _release_browser(browser, warm)
     
     except Exception as e:
         results["success"] = False
@@ -3163,37 +3250,170 @@ async def scrape_keywords(keywords: list[str], storage_state: str, max_per_keywo
     return results
 
 
+_SUBPROCESS_DEBUG_PATH = Path(os.environ.get("LOCALAPPDATA", ".")) / "TitanScraper" / "scrape_subprocess_debug.txt"
+
+
+def _log(msg):
+    try:
+        with open(_SUBPROCESS_DEBUG_PATH, 'a', encoding='utf-8') as f:
+            f.write(f"{msg}\n")
+    except Exception:
+        pass
+
+
+def _rss_mb() -> Optional[float]:
+    """Resident memory of this process and its children (Chromium) in MB, when measurable."""
+    try:
+        import psutil  # type: ignore
+        me = psutil.Process()
+        total = me.memory_info().rss
+        for child in me.children(recursive=True):
+            with contextlib.suppress(Exception):
+                total += child.memory_info().rss
+        return round(total / (1024 * 1024), 1)
+    except ImportError:
+        pass
+    except Exception:
+        return None
+    # Without psutil: this interpreter only (Linux)
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+async def run_job(input_data: dict, output_file: Optional[str], stream_file: Optional[str] = None, warm: Optional[WarmBrowser] = None) -> dict:
+    """Run one scraping job and write its result to ``output_file`` (stdout when None).
+
+    Accepted posts are also streamed to ``stream_file`` as they pass the
+    filters. Used once per process by :func:`main`, and once per request by
+    :func:`serve`.
+    """
+    keywords = input_data.get("keywords", [])
+    storage_state = input_data.get("storage_state", "")
+    max_per_keyword = input_data.get("max_per_keyword", 10)
+    headless = input_data.get("headless", True)
+    session_quota = input_data.get("session_quota", 0)  # v2: optional session quota
+    
+    # Set browsers path if provided
+    browsers_path = input_data.get("browsers_path")
+    if browsers_path:
+        os.environ["PLAYWRIGHT_BROWSERS_PATH"] = browsers_path
+    _log(f"PLAYWRIGHT_BROWSERS_PATH={os.environ.get('PLAYWRIGHT_BROWSERS_PATH', 'NOT SET')}")
+    
+    # Run scraping; accepted posts are also streamed as they pass the filters
+    stream = open_writer(stream_file)
+    try:
+        _log(f"about to call scrape_keywords() with session_quota={session_quota}, warm={warm is not None}")
+        result = await scrape_keywords(keywords, storage_state, max_per_keyword, headless, session_quota=session_quota, stream=stream, warm=warm)
+        _log(f"scrape_keywords returned, success={result.get('success')}, posts_count={len(result.get('posts', []))}")
+        # Log filtering stats for debugging
+        stats = result.get('stats', {})
+        if stats:
+            _log(f"STATS: scraped={stats.get('total_scraped',0)} accepted={stats.get('accepted',0)} dup={stats.get('rejected_duplicate',0)} non_fr={stats.get('rejected_non_french',0)} agency={stats.get('rejected_agency',0)} ext={stats.get('rejected_external',0)} jobseeker={stats.get('rejected_jobseeker',0)} contract={stats.get('rejected_contract_type',0)} no_legal={stats.get('rejected_no_legal',0)} no_signal={stats.get('rejected_no_signal',0)} old={stats.get('rejected_too_old',0)} other={stats.get('rejected_other',0)}")
+    except Exception as e:
+        import traceback
+        _log(f"ERROR in scrape_keywords: {e}\n{traceback.format_exc()}")
+        result = {"success": False, "error": str(e), "posts": []}
+    
+    if stream is not None:
+        if result.get("stats"):
+            stream.stats(result["stats"])
+        stream.end(success=bool(result.get("success", False)), posts=len(result.get("posts", [])))
+        stream.close()
+    
+    # Write output
+    _log(f"about to write output to {output_file}")
+    if output_file:
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(result, f)
+        _log("output written successfully")
+    else:
+        print(json.dumps(result))
+    return result
+
+
+def _server_reply(**fields: Any) -> None:
+    sys.stdout.write(SERVER_REPLY_PREFIX + json.dumps(fields) + "\n")
+    sys.stdout.flush()
+
+
+async def serve() -> None:
+    """Long-lived scraper server (``--serve``).
+
+    Reads one JSON job per stdin line::
+
+        {"id": 1, "input_file": "...", "output_file": "...", "stream_file": "..."}
+        {"cmd": "shutdown"}
+
+    and answers each with one ``SERVER_REPLY_PREFIX`` line on stdout
+    (``{"event": "done", "id": 1, "success": true, "rss_mb": 512.3}``). The
+    interpreter, its imports and the browser stay warm between jobs; the
+    worker-side supervisor decides when to recycle the process. Stops on
+    ``shutdown`` or when stdin closes.
+    """
+    warm = WarmBrowser()
+    _server_reply(event="ready", pid=os.getpid())
+    try:
+        while True:
+            line = await asyncio.to_thread(sys.stdin.readline)
+            if not line:
+                _log("serve: stdin closed")
+                break
+            try:
+                job = json.loads(line)
+            except ValueError:
+                continue
+            if job.get("cmd") == "shutdown":
+                _log("serve: shutdown requested")
+                break
+            _log(f"serve: job {job.get('id')} input_file={job.get('input_file')}")
+            try:
+                with open(job["input_file"], 'r', encoding='utf-8-sig') as f:
+                    input_data = json.load(f)
+                result = await run_job(input_data, job.get("output_file"), job.get("stream_file"), warm=warm)
+                _server_reply(event="done", id=job.get("id"), success=bool(result.get("success", False)), rss_mb=_rss_mb())
+            except Exception as e:
+                _log(f"serve: job {job.get('id')} failed: {e}")
+                _server_reply(event="done", id=job.get("id"), success=False, error=str(e), rss_mb=_rss_mb())
+    finally:
+        await warm.close()
+
+
 def main():
     """Entry point when run as subprocess.
     
     Communication modes:
     1. File-based (for Windows GUI exe without console): 
-       --input-file <path> --output-file <path>
+       --input-file <path> --output-file <path> [--stream-file <path>]
     2. Stdin/stdout (for console apps or dev mode):
        Reads JSON from stdin, writes JSON to stdout
+    3. Server (--serve): long-lived, one job per stdin line, see serve()
     """
-    # Debug logging
-    import os as _os
-    debug_path = Path(_os.environ.get("LOCALAPPDATA", ".")) / "TitanScraper" / "scrape_subprocess_debug.txt"
-    def _log(msg):
-        try:
-            with open(debug_path, 'a', encoding='utf-8') as f:
-                f.write(f"{msg}\n")
-        except Exception:
-            pass
-    
     _log(f"main() started, argv={sys.argv}")
     
+    if "--serve" in sys.argv:
+        asyncio.run(serve())
+        _log("serve: exiting")
+        sys.exit(0)
+    
     # Check for file-based communication (needed for console=False PyInstaller exe)
     input_file = None
     output_file = None
+    stream_file = None
     for i, arg in enumerate(sys.argv[1:], 1):
         if arg == "--input-file" and i < len(sys.argv) - 1:
             input_file = sys.argv[i + 1]
         elif arg == "--output-file" and i < len(sys.argv) - 1:
             output_file = sys.argv[i + 1]
+        elif arg == "--stream-file" and i < len(sys.argv) - 1:
+            stream_file = sys.argv[i + 1]
     
-    _log(f"input_file={input_file}, output_file={output_file}")
+    _log(f"input_file={input_file}, output_file={output_file}, stream_file={stream_file}")
     
     # Read input
     try:
@@ -3213,52 +3433,9 @@ def main():
             print(json.dumps(error_result))
         sys.exit(1)
     
-    keywords = input_data.get("keywords", [])
-    storage_state = input_data.get("storage_state", "")
-    max_per_keyword = input_data.get("max_per_keyword", 10)
-    headless = input_data.get("headless", True)
-    session_quota = input_data.get("session_quota", 0)  # v2: optional session quota
-    
-    # Set browsers path if provided
-    browsers_path = input_data.get("browsers_path")
-    if browsers_path:
-        os.environ["PLAYWRIGHT_BROWSERS_PATH"] = browsers_path
-    _log(f"PLAYWRIGHT_BROWSERS_PATH={os.environ.get('PLAYWRIGHT_BROWSERS_PATH', 'NOT SET')}")
-    
-    # Run scraping
-    try:
-        _log(f"about to call asyncio.run(scrape_keywords()) with session_quota={session_quota}")
-        result = asyncio.run(scrape_keywords(keywords, storage_state, max_per_keyword, headless, session_quota=session_quota))
-        _log(f"scrape_keywords returned, success={result.get('success')}, posts_count={len(result.get('posts', []))}")
-        # Log filtering stats for debugging
-        stats = result.get('stats', {})
-        if stats:
-            _log(f"STATS: scraped={stats.get('total_scraped',0)} accepted={stats.get('accepted',0)} dup={stats.get('rejected_duplicate',0)} non_fr={stats.get('rejected_non_french',0)} agency={stats.get('rejected_agency',0)} ext={stats.get('rejected_external',0)} jobseeker={stats.get('rejected_jobseeker',0)} contract={stats.get('rejected_contract_type',0)} no_legal={stats.get('rejected_no_legal',0)} no_signal={stats.get('rejected_no_signal',0)} old={stats.get('rejected_too_old',0)} other={stats.get('rejected_other',0)}")
-    except Exception as e:
-        import traceback
-        _log(f"ERROR in asyncio.run: {e}\n{traceback.format_exc()}")
-        result = {"success": False, "error": str(e), "posts": []}
-    
-    # Write output
-    _log(f"about to write output to {output_file}")
-    if output_file:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f)
-        _log("output written successfully")
-    else:
-        print(json.dumps(result))
-    
+    result = asyncio.run(run_job(input_data, output_file, stream_file))
     _log("exiting")
     sys.exit(0 if result.get("success", False) else 1)
-    
-    # Write output
-    if output_file:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(result, f)
-    else:
-        print(json.dumps(result))
-    
-    sys.exit(0 if result.get("success", False) else 1)
 
 
 if __name__ == "__main__":
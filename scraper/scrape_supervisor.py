@@ -0,0 +1,225 @@
+"""Supervisor for the long-lived scraper process (``scrape_subprocess --serve``).
+
+Starting a fresh scraper subprocess per batch pays for a new interpreter,
+the filter module imports and a Chromium launch every time. The worker
+instead keeps one scraper server alive and sends it jobs over stdin (one
+JSON line per job, see :func:`scraper.scrape_subprocess.serve`); results
+still travel through the job's output and NDJSON stream files.
+
+The process is recycled:
+
+- after ``max_jobs`` jobs,
+- when its reported memory (interpreter + Chromium when psutil is available)
+  exceeds ``max_rss_mb``,
+- when it crashes (EOF on stdout) or a job times out (killed).
+
+The server runs one job at a time: :meth:`ScrapeSupervisor.acquire` hands
+it out exclusively until :meth:`ScrapeSupervisor.release`, so a job's
+timeout only ever covers (and kills) its own work. A process that is busy
+with another job, or doesn't report ready within ``start_timeout`` seconds
+(killed), makes ``acquire`` return None, letting the caller fall back to a
+one-shot subprocess.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+from typing import Any, Dict, Optional, Sequence
+
+import structlog
+
+from .result_stream import SERVER_REPLY_PREFIX
+
+logger = structlog.get_logger(__name__).bind(component="scrape_supervisor")
+
+DEFAULT_START_TIMEOUT = 60.0
+DEFAULT_STOP_TIMEOUT = 10.0
+
+
+class ScraperServerProcess:
+    """One running ``--serve`` process."""
+
+    def __init__(self, proc: asyncio.subprocess.Process):
+        self.proc = proc
+        self.jobs_done = 0
+        self.last_rss_mb: Optional[float] = None
+        self._next_id = 0
+        # Held from ScrapeSupervisor.acquire until release: stdout has a single reader
+        self.job_lock = asyncio.Lock()
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.returncode is None
+
+    async def _read_event(self) -> Optional[Dict[str, Any]]:
+        """Next protocol line from stdout; None on EOF (process gone)."""
+        assert self.proc.stdout is not None
+        while True:
+            raw = await self.proc.stdout.readline()
+            if not raw:
+                return None
+            line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+            if not line.startswith(SERVER_REPLY_PREFIX):
+                continue  # stray output from the scraping code
+            try:
+                return json.loads(line[len(SERVER_REPLY_PREFIX):])
+            except ValueError:
+                continue
+
+    async def wait_ready(self, timeout: float) -> bool:
+        try:
+            event = await asyncio.wait_for(self._read_event(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        return bool(event) and event.get("event") == "ready"
+
+    async def submit(self, job: Dict[str, Any]) -> "asyncio.Future[Optional[Dict[str, Any]]]":
+        """Send a job; the returned future resolves to its ``done`` reply (None if the process died)."""
+        assert self.proc.stdin is not None
+        self._next_id += 1
+        job = {"id": self._next_id, **job}
+        self.proc.stdin.write((json.dumps(job) + "\n").encode("utf-8"))
+        await self.proc.stdin.drain()
+        return asyncio.ensure_future(self._wait_done(job["id"]))
+
+    async def _wait_done(self, job_id: int) -> Optional[Dict[str, Any]]:
+        while True:
+            event = await self._read_event()
+            if event is None:
+                return None
+            if event.get("event") == "done" and event.get("id") == job_id:
+                return event
+
+    async def stop(self, timeout: float = DEFAULT_STOP_TIMEOUT) -> None:
+        """Ask for a clean shutdown (browser closed), kill if it doesn't exit in time."""
+        if not self.alive:
+            return
+        with contextlib.suppress(Exception):
+            assert self.proc.stdin is not None
+            self.proc.stdin.write(b'{"cmd": "shutdown"}\n')
+            await self.proc.stdin.drain()
+            self.proc.stdin.close()
+        try:
+            await asyncio.wait_for(self.proc.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            await self.kill()
+
+    async def kill(self) -> None:
+        with contextlib.suppress(ProcessLookupError):
+            self.proc.kill()
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(self.proc.wait(), timeout=DEFAULT_STOP_TIMEOUT)
+
+
+class ScrapeSupervisor:
+    """Keeps one scraper server running and recycles it when needed."""
+
+    def __init__(
+        self,
+        cmd: Sequence[str],
+        cwd: Optional[str] = None,
+        *,
+        max_jobs: int = 20,
+        max_rss_mb: float = 0,
+        start_timeout: float = DEFAULT_START_TIMEOUT,
+    ):
+        self.cmd = list(cmd)
+        self.cwd = cwd
+        self.max_jobs = max_jobs
+        self.max_rss_mb = max_rss_mb
+        self.start_timeout = start_timeout
+        self.current: Optional[ScraperServerProcess] = None
+        self.starts = 0
+        self.recycles: Dict[str, int] = {}
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> Optional[ScraperServerProcess]:
+        """Running server process reserved for one job, started if needed.
+
+        None if it can't be started or is busy with another job; a server that
+        was handed out must be given back with :meth:`release`.
+        """
+        async with self._lock:
+            if self.current is not None and not self.current.alive:
+                self._count_recycle("crash")
+                self.current = None
+            if self.current is None:
+                self.current = await self._start()
+            server = self.current
+            if server is None:
+                return None
+            if server.job_lock.locked():
+                logger.info("scrape_server_busy", pid=server.proc.pid)
+                return None
+            await server.job_lock.acquire()
+            return server
+
+    async def _start(self) -> Optional[ScraperServerProcess]:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *self.cmd,
+                cwd=self.cwd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+            )
+        except Exception as exc:
+            logger.warning("scrape_server_spawn_failed", error=str(exc))
+            return None
+        server = ScraperServerProcess(proc)
+        if not await server.wait_ready(self.start_timeout):
+            logger.warning("scrape_server_not_ready", pid=proc.pid, timeout=self.start_timeout)
+            await server.kill()
+            return None
+        self.starts += 1
+        logger.info("scrape_server_started", pid=proc.pid, starts=self.starts)
+        return server
+
+    def recycle_reason(self, server: ScraperServerProcess, reply: Optional[Dict[str, Any]], timed_out: bool) -> Optional[str]:
+        if timed_out:
+            return "timeout"
+        if reply is None or not server.alive:
+            return "crash"
+        if self.max_jobs > 0 and server.jobs_done >= self.max_jobs:
+            return "max_jobs"
+        if self.max_rss_mb > 0 and server.last_rss_mb is not None and server.last_rss_mb > self.max_rss_mb:
+            return "memory"
+        return None
+
+    async def release(self, server: ScraperServerProcess, reply: Optional[Dict[str, Any]], timed_out: bool = False) -> Optional[str]:
+        """Account for a finished job, recycle the process if needed and free it for the next job.
+
+        Returns the recycle reason.
+        """
+        try:
+            server.jobs_done += 1
+            if reply is not None:
+                server.last_rss_mb = reply.get("rss_mb")
+            reason = self.recycle_reason(server, reply, timed_out)
+            if reason is None:
+                return None
+            async with self._lock:
+                if reason in ("timeout", "crash"):
+                    await server.kill()
+                else:
+                    await server.stop()
+                if self.current is server:
+                    self.current = None
+                self._count_recycle(reason)
+        finally:
+            if server.job_lock.locked():
+                server.job_lock.release()
+        logger.info("scrape_server_recycled", reason=reason, jobs=server.jobs_done, rss_mb=server.last_rss_mb)
+        return reason
+
+    def _count_recycle(self, reason: str) -> None:
+        self.recycles[reason] = self.recycles.get(reason, 0) + 1
+
+    async def shutdown(self) -> None:
+        async with self._lock:
+            if self.current is not None:
+                await self.current.stop()
+                self.current = None
+
+
+__all__ = ["ScrapeSupervisor", "ScraperServerProcess"]
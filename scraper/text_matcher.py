@@ -0,0 +1,210 @@
+"""Multi-pattern substring matcher (Aho–Corasick) for the keyword filters.
+
+The legal filters test a post against several hundred vocabulary terms. Doing
+``term in normalized`` for each one rescans the text once per term; a
+:class:`VocabularyMatcher` compiles every vocabulary into a single automaton
+once and finds all of them in one pass over the text:
+
+    matcher = VocabularyMatcher({"professions": [...], "signals": [...]})
+    hits = matcher.scan(normalized)
+    if "juriste" in hits: ...             # same answer as `"juriste" in normalized`
+    hits.terms("signals")                 # == [t for t in signals if t in normalized]
+    hits.first("professions")             # first listed term present, or None
+
+Matching is plain substring matching (no word boundaries, overlapping hits
+included), so a :class:`MatchSet` is a drop-in replacement for the text in
+``in`` tests. Terms that were not registered fall back to a real substring
+test, which keeps one-off checks correct.
+
+The automaton runs on ``pyahocorasick`` (C extension) when it is installed and
+on the pure-Python :class:`AhoCorasick` otherwise; both report the same hits.
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, Mapping, Optional, Sequence
+
+try:  # optional C implementation (pip install pyahocorasick)
+    import ahocorasick as _ahocorasick  # type: ignore
+except ImportError:  # pragma: no cover - depends on the environment
+    _ahocorasick = None
+
+
+class AhoCorasick:
+    """Automaton over a fixed set of patterns; :meth:`find` returns the ids of those present."""
+
+    __slots__ = ("patterns", "_goto", "_fail", "_out", "_dict_link")
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns: tuple[str, ...] = tuple(patterns)
+        goto: list[dict[str, int]] = [{}]
+        out: list[Optional[int]] = [None]
+        for pid, pattern in enumerate(self.patterns):
+            if not pattern:
+                raise ValueError("empty pattern")
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(None)
+                state = nxt
+            if out[state] is None:  # duplicates share the first id
+                out[state] = pid
+
+        # Breadth-first failure links; dict_link jumps to the nearest proper
+        # suffix state that ends a pattern, so reporting skips empty states.
+        fail = [0] * len(goto)
+        dict_link = [-1] * len(goto)
+        queue: deque[int] = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[nxt] = target if target != nxt else 0
+                dict_link[nxt] = fail[nxt] if out[fail[nxt]] is not None else dict_link[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+        self._dict_link = dict_link
+
+    def find(self, text: str) -> set[int]:
+        """Ids of the patterns occurring in ``text`` (duplicate patterns report the first id)."""
+        goto, fail, out, dict_link = self._goto, self._fail, self._out, self._dict_link
+        found: set[int] = set()
+        reported: set[int] = set()
+        state = 0
+        for ch in text:
+            nxt = goto[state].get(ch)
+            while nxt is None and state:
+                state = fail[state]
+                nxt = goto[state].get(ch)
+            state = nxt or 0
+            # Walk the dictionary chain once per state and scan: a reported
+            # state's whole chain has already been collected.
+            s = state
+            while s > 0 and s not in reported:
+                reported.add(s)
+                if out[s] is not None:
+                    found.add(out[s])  # type: ignore[arg-type]
+                s = dict_link[s]
+        return found
+
+
+class _CAhoCorasick:
+    """:class:`AhoCorasick` interface on top of pyahocorasick."""
+
+    __slots__ = ("patterns", "_automaton")
+
+    def __init__(self, patterns: Sequence[str]):
+        self.patterns = tuple(patterns)
+        automaton = _ahocorasick.Automaton()
+        for pid, pattern in enumerate(self.patterns):
+            if not pattern:
+                raise ValueError("empty pattern")
+            if pattern not in automaton:
+                automaton.add_word(pattern, pid)
+        automaton.make_automaton()
+        self._automaton = automaton
+
+    def find(self, text: str) -> set[int]:
+        return {pid for _, pid in self._automaton.iter(text)} if text else set()
+
+
+def build_automaton(patterns: Sequence[str]):
+    """Fastest available automaton over ``patterns``."""
+    if _ahocorasick is not None:
+        return _CAhoCorasick(patterns)
+    return AhoCorasick(patterns)
+
+
+class MatchSet:
+    """Terms found in one text; answers ``term in hits`` like ``term in text``."""
+
+    __slots__ = ("text", "found", "_matcher", "_ids", "_by_category")
+
+    def __init__(self, text: str, ids: set[int], matcher: "VocabularyMatcher"):
+        self.text = text
+        self._matcher = matcher
+        self._ids = ids
+        self.found: frozenset[str] = frozenset(matcher.patterns[i] for i in ids)
+        self._by_category: Optional[dict[str, list[int]]] = None
+
+    def __contains__(self, term: str) -> bool:
+        if term in self.found:
+            return True
+        return term not in self._matcher.registered and term in self.text
+
+    def __bool__(self) -> bool:
+        return bool(self._ids)
+
+    def __repr__(self) -> str:
+        return f"MatchSet({sorted(self.found)!r})"
+
+    def _positions(self, category: str) -> list[int]:
+        if self._by_category is None:
+            by_category: dict[str, list[int]] = {}
+            for pid in self._ids:
+                for cat, idx in self._matcher.positions[pid]:
+                    by_category.setdefault(cat, []).append(idx)
+            for idxs in by_category.values():
+                idxs.sort()
+            self._by_category = by_category
+        if category not in self._matcher.vocabularies:
+            raise KeyError(category)
+        return self._by_category.get(category, [])
+
+    def terms(self, category: str) -> list[str]:
+        """Terms of ``category`` present in the text, in vocabulary order (duplicates kept)."""
+        vocab = self._matcher.vocabularies[category]
+        return [vocab[i] for i in self._positions(category)]
+
+    def first(self, category: str) -> Optional[str]:
+        """First term of ``category`` (vocabulary order) present in the text."""
+        idxs = self._positions(category)
+        return self._matcher.vocabularies[category][idxs[0]] if idxs else None
+
+    def has(self, category: str) -> bool:
+        return bool(self._positions(category))
+
+    def count(self, category: str) -> int:
+        """Number of vocabulary entries of ``category`` present (duplicates count twice)."""
+        return len(self._positions(category))
+
+
+class VocabularyMatcher:
+    """One automaton over named vocabularies (category -> ordered terms)."""
+
+    def __init__(self, vocabularies: Mapping[str, Iterable[str]]):
+        self.vocabularies: dict[str, tuple[str, ...]] = {
+            name: tuple(terms) for name, terms in vocabularies.items()
+        }
+        ids: dict[str, int] = {}
+        positions: list[list[tuple[str, int]]] = []
+        for name, terms in self.vocabularies.items():
+            for idx, term in enumerate(terms):
+                pid = ids.setdefault(term, len(ids))
+                if pid == len(positions):
+                    positions.append([])
+                positions[pid].append((name, idx))
+        self.patterns: tuple[str, ...] = tuple(ids)
+        self.registered: frozenset[str] = frozenset(ids)
+        # pattern id -> every (category, index) it appears at
+        self.positions = positions
+        self._automaton = build_automaton(self.patterns)
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def scan(self, text: str) -> MatchSet:
+        return MatchSet(text, self._automaton.find(text), self)
+
+
+__all__ = ["AhoCorasick", "MatchSet", "VocabularyMatcher", "build_automaton"]
@@ -22,7 +22,6 @@ import random
 import re
 import time
 from datetime import datetime, timedelta, timezone
-import unicodedata
 from typing import Iterable, Callable, Awaitable, Any, Optional
 
 try:
@@ -43,6 +42,9 @@ except Exception:  # pragma: no cover
 
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential_jitter
 
+from .normalized_text import NormalizedText, fold_for_search
+from .text_matcher import VocabularyMatcher
+
 # Local import kept light to avoid circular imports (only for Settings type hints)
 try:  # pragma: no cover - type checking friendly
     from .bootstrap import Settings  # noqa: F401
@@ -308,6 +310,21 @@ def is_post_too_old(published_at: str | datetime | None, max_age_days: int = MAX
 
 # Pattern simple pour compatibilité arrière (déprécié, utiliser _RELATIVE_PATTERN_EXTENDED)
 _RELATIVE_PATTERN = re.compile(r"(\d+)\s*(s|min|h|j)")
+# Last-resort textual forms: "il y a 2 semaines", "posted 3 weeks ago", ...
+_RELATIVE_TEXT_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), unit_type)
+    for pattern, unit_type in (
+        (r"il y a (\d+)\s*semaine", "week"),
+        (r"(\d+)\s*semaine", "week"),
+        (r"(\d+)\s*weeks?\s*ago", "week"),
+        (r"il y a (\d+)\s*mois", "month"),
+        (r"(\d+)\s*months?\s*ago", "month"),
+        (r"il y a (\d+)\s*jour", "day"),
+        (r"(\d+)\s*days?\s*ago", "day"),
+        (r"(\d+)\s*ans?", "year"),
+        (r"(\d+)\s*years?\s*ago", "year"),
+    )
+]
 
 
 def parse_possible_date(raw: str, now: Optional[datetime] = None) -> Optional[datetime]:
@@ -338,7 +355,7 @@ def parse_possible_date(raw: str, now: Optional[datetime] = None) -> Optional[da
     raw_clean = raw_clean.replace("•", " ").replace("·", " ")
     raw_clean = raw_clean.replace("modifié", "").replace("modified", "")
     raw_clean = raw_clean.replace("édité", "").replace("edited", "")
-    raw_clean = re.sub(r"\s+", " ", raw_clean).strip()
+    raw_clean = _WS_RE.sub(" ", raw_clean).strip()
     
     if not raw_clean:
         return None
@@ -387,20 +404,8 @@ def parse_possible_date(raw: str, now: Optional[datetime] = None) -> Optional[da
     
     # Dernière tentative: détecter des patterns textuels courants
     # "il y a 2 semaines", "posted 3 weeks ago", etc.
-    week_patterns = [
-        (r"il y a (\d+)\s*semaine", "week"),
-        (r"(\d+)\s*semaine", "week"),
-        (r"(\d+)\s*weeks?\s*ago", "week"),
-        (r"il y a (\d+)\s*mois", "month"),
-        (r"(\d+)\s*months?\s*ago", "month"),
-        (r"il y a (\d+)\s*jour", "day"),
-        (r"(\d+)\s*days?\s*ago", "day"),
-        (r"(\d+)\s*ans?", "year"),
-        (r"(\d+)\s*years?\s*ago", "year"),
-    ]
-    
-    for pattern, unit_type in week_patterns:
-        match = re.search(pattern, raw_clean, re.IGNORECASE)
+    for pattern, unit_type in _RELATIVE_TEXT_PATTERNS:
+        match = pattern.search(raw_clean)
         if match:
             val = int(match.group(1))
             if unit_type == "week":
@@ -536,6 +541,19 @@ FRANCE_NEGATIVE_MARKERS = [
 ]
 
 
+_location_matcher: Optional[VocabularyMatcher] = None
+
+
+def _get_location_matcher() -> VocabularyMatcher:
+    global _location_matcher
+    if _location_matcher is None:
+        _location_matcher = VocabularyMatcher({
+            "positive": FRANCE_POSITIVE_MARKERS,
+            "negative": FRANCE_NEGATIVE_MARKERS,
+        })
+    return _location_matcher
+
+
 def is_location_france(text: str | None, strict: bool = True) -> bool:
     """Check if the post location is likely France.
     
@@ -555,14 +573,10 @@ def is_location_france(text: str | None, strict: bool = True) -> bool:
     if not text:
         return True  # No location info, assume France OK
     
-    low = text.lower()
-    
-    # Compter les marqueurs trouvés
-    positive_matches = [marker for marker in FRANCE_POSITIVE_MARKERS if marker in low]
-    negative_matches = [marker for marker in FRANCE_NEGATIVE_MARKERS if marker in low]
-    
-    has_positive = len(positive_matches) > 0
-    has_negative = len(negative_matches) > 0
+    # Marqueurs trouvés en un seul passage sur le texte
+    hits = _get_location_matcher().scan(text.lower())
+    has_positive = hits.has("positive")
+    has_negative = hits.has("negative")
     
     # Si aucun marqueur géographique: assume France (posts sans localisation explicite)
     if not has_positive and not has_negative:
@@ -909,10 +923,24 @@ def normalize_for_search(s: str | None) -> str:
     """
     if not s:
         return ""
-    s = s.lower().strip()
-    # NFD decomposition, drop non-spacing marks (Mn)
-    nfd = unicodedata.normalize("NFD", s)
-    return "".join(ch for ch in nfd if unicodedata.category(ch) != "Mn").strip()
+    if isinstance(s, NormalizedText):
+        return s.folded
+    return fold_for_search(s)
+
+
+_DIGIT_RUN_RE = re.compile(r"\d{2,}")
+
+
+def compute_content_hash(author: str | None, text: str | None) -> str:
+    """Stable fingerprint of (author, text) tolerant to whitespace, case and counters."""
+    a = (author or '').strip().lower()
+    t = (text or '')
+    # Normalise whitespace & case
+    t = _WS_RE.sub(" ", t).strip().lower()
+    # Collapse long digit sequences to # to stabilise minor counters (views, likes)
+    t = _DIGIT_RUN_RE.sub("#", t)
+    blob = f"{a}||{t}".encode('utf-8', errors='ignore')
+    return hashlib.sha1(blob).hexdigest()[:20]
 
 
 def build_search_norm(*parts: str | None) -> str:
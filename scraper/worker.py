@@ -23,7 +23,6 @@ import asyncio
 import contextlib
 import json
 import os
-import sqlite3
 import subprocess
 import sys
 import tempfile
@@ -47,6 +46,7 @@ from .bootstrap import (
     SCRAPE_QUEUE_DEPTH,
     SCRAPE_JOB_FAILURES,
     SCRAPE_STEP_DURATION,
+    SCRAPE_STAGE_DURATION,
     SCRAPE_RATE_LIMIT_TOKENS,
     SCRAPE_SCROLL_ITERATIONS,
     SCRAPE_EXTRACTION_INCOMPLETE,
@@ -69,9 +69,22 @@ from .stealth import (
 # Global rotation index for keyword batching (survives across worker cycles)
 # NOTE: Now managed by adapters.get_next_keywords() when use_keyword_strategy is enabled
 _keyword_rotation_index: int = 0
+# Subprocess result streaming: posts are handed to the caller in micro-batches
+# of at most this many posts, or after this many seconds, whichever comes first
+_SUBPROCESS_TIMEOUT_SECONDS = 900
+_STREAM_POLL_SECONDS = 0.5
+_STREAM_MICRO_BATCH_SIZE = 5
+_STREAM_MICRO_BATCH_SECONDS = 2.0
+# Long-lived scraper process shared by all batches (see scrape_supervisor)
+_scrape_supervisor: Optional["ScrapeSupervisor"] = None
 from . import utils
+from .display_fields import DISPLAY_COLUMNS, compute_display_fields
+from .repository import get_repository, run_sync
 from .legal_classifier import classify_legal_post, LEGAL_ROLE_KEYWORDS
 from .legal_filter import is_legal_job_post, FilterConfig
+from .normalized_text import NormalizedText
+from .result_stream import RECORD_POST, RECORD_PROGRESS, RECORD_SPANS, RECORD_STATS, ResultStreamReader, StageSpans
+from .scrape_supervisor import ScrapeSupervisor
 
 # =============================================================================
 # ADAPTERS - Progressive migration to new modular architecture
@@ -422,7 +435,7 @@ def _dpapi_unprotect_password(encrypted_data: bytes) -> str | None:
         return None
 
 
-async def _run_scraping_subprocess(keywords: list[str], ctx: AppContext, logger: structlog.BoundLogger) -> list[dict]:
+async def _run_scraping_subprocess(keywords: list[str], ctx: AppContext, logger: structlog.BoundLogger, on_posts=None) -> list[dict]:
     """Run scraping in a separate process to avoid Playwright/asyncio conflicts.
     
     This is used in packaged desktop builds where running Playwright directly
@@ -433,6 +446,7 @@ async def _run_scraping_subprocess(keywords: list[str], ctx: AppContext, logger:
     ANTI-DETECTION: Traite UN SEUL batch de 3 keywords par exécution worker.
     Les posts sont immédiatement retournés pour stockage, évitant les pertes.
     ROTATION: Utilise un index rotatif ou KeywordStrategy via adapters.
+    STREAMING: voir _run_scraping_subprocess_batch (on_posts).
     """
     global _keyword_rotation_index
     _debug_log(f"_run_scraping_subprocess called with {len(keywords)} keywords")
@@ -463,7 +477,7 @@ async def _run_scraping_subprocess(keywords: list[str], ctx: AppContext, logger:
                rotation_index=start_idx,
                total_keywords=total_keywords)
     
-    batch_posts = await _run_scraping_subprocess_batch(batch_keywords, ctx, logger)
+    batch_posts = await _run_scraping_subprocess_batch(batch_keywords, ctx, logger, on_posts=on_posts)
     _debug_log(f"_run_scraping_subprocess received batch_posts: type={type(batch_posts).__name__}, len={len(batch_posts) if isinstance(batch_posts, list) else 'N/A'}")
     
     # Check for restriction marker
@@ -482,8 +496,136 @@ async def _run_scraping_subprocess(keywords: list[str], ctx: AppContext, logger:
     return posts
 
 
-async def _run_scraping_subprocess_batch(keywords: list[str], ctx: AppContext, logger: structlog.BoundLogger) -> list[dict]:
-    """Run a single batch of keywords in subprocess."""
+def _scraper_subprocess_command() -> tuple[list[str], Optional[str]]:
+    """Base command line (without job arguments) and cwd for scrape_subprocess."""
+    if getattr(sys, "frozen", False):
+        # Frozen app: call the same exe with --scraper-subprocess flag
+        return [sys.executable, "--scraper-subprocess"], None
+    # Dev mode: run scrape_subprocess as a module from the project root (running the
+    # script file would put scraper/ first on sys.path, shadowing stdlib `selectors`)
+    return [sys.executable, "-m", "scraper.scrape_subprocess"], str(Path(__file__).parent.parent)
+
+
+def _get_scrape_supervisor(ctx: AppContext) -> ScrapeSupervisor:
+    global _scrape_supervisor
+    if _scrape_supervisor is None:
+        base_cmd, cwd = _scraper_subprocess_command()
+        _scrape_supervisor = ScrapeSupervisor(
+            base_cmd + ["--serve"],
+            cwd,
+            max_jobs=ctx.settings.scraper_server_max_jobs,
+            max_rss_mb=ctx.settings.scraper_server_max_rss_mb,
+        )
+    return _scrape_supervisor
+
+
+async def shutdown_scrape_supervisor() -> None:
+    """Stop the long-lived scraper server, if one was started (worker / API shutdown)."""
+    global _scrape_supervisor
+    supervisor, _scrape_supervisor = _scrape_supervisor, None
+    if supervisor is not None:
+        await supervisor.shutdown()
+
+
+def _observe_stage_spans(keyword: str, spans) -> None:
+    """Record per-stage seconds (a ``spans`` record or StageSpans.pop()) in SCRAPE_STAGE_DURATION."""
+    if not isinstance(spans, dict):
+        return
+    for stage, seconds in spans.items():
+        try:
+            SCRAPE_STAGE_DURATION.labels(stage=str(stage), keyword=keyword).observe(float(seconds))
+        except (TypeError, ValueError):
+            continue
+
+
+def _batch_keyword(posts: list) -> str:
+    """Keyword label for a batch of posts ("mixed" when they come from several keywords)."""
+    keywords = {getattr(p, "keyword", "") for p in posts}
+    return keywords.pop() if len(keywords) == 1 else "mixed"
+
+
+async def _follow_result_stream(proc, reader: ResultStreamReader, on_posts, logger: structlog.BoundLogger, timeout: float, done=None) -> tuple[dict[int, dict], set[int], bool]:
+    """Wait for the scraper subprocess while consuming its NDJSON result stream.
+
+    Accepted posts are handed to ``on_posts`` (a coroutine taking a list of raw
+    post dicts) in micro-batches while the subprocess is still running. On
+    timeout the subprocess is killed and whatever it streamed is still flushed.
+    ``done`` replaces ``proc.wait()`` as the completion signal when the process
+    outlives the job (scraper server).
+
+    Returns (streamed posts by seq, seqs delivered to ``on_posts``, timed_out).
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    streamed: dict[int, dict] = {}
+    delivered: set[int] = set()
+    pending: list[tuple[int, dict]] = []
+    last_flush = loop.time()
+    timed_out = False
+
+    async def _flush() -> None:
+        nonlocal pending, last_flush
+        chunk, pending = pending, []
+        last_flush = loop.time()
+        if not chunk or on_posts is None:
+            return
+        try:
+            await on_posts([p for _, p in chunk])
+            delivered.update(seq for seq, _ in chunk)
+        except Exception as exc:
+            # Undelivered posts are picked up again from the final output
+            logger.warning("stream_micro_batch_failed", error=str(exc), posts=len(chunk))
+
+    def _drain() -> None:
+        for record in reader.read_new():
+            kind = record.get("type")
+            if kind == RECORD_POST and isinstance(record.get("post"), dict):
+                seq = int(record.get("seq", len(streamed)))
+                if seq not in streamed:
+                    streamed[seq] = record["post"]
+                    pending.append((seq, record["post"]))
+            elif kind == RECORD_PROGRESS:
+                logger.info("subprocess_keyword_progress", **{k: v for k, v in record.items() if k != "type"})
+            elif kind == RECORD_STATS:
+                _debug_log(f"subprocess stats: {record.get('stats')}")
+            elif kind == RECORD_SPANS:
+                _observe_stage_spans(record.get("keyword") or "", record.get("spans"))
+
+    wait_task = asyncio.ensure_future(done if done is not None else proc.wait())
+    try:
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                timed_out = True
+                break
+            await asyncio.wait({wait_task}, timeout=min(_STREAM_POLL_SECONDS, remaining))
+            _drain()
+            if wait_task.done():
+                break
+            if len(pending) >= _STREAM_MICRO_BATCH_SIZE or (pending and loop.time() - last_flush >= _STREAM_MICRO_BATCH_SECONDS):
+                await _flush()
+        if timed_out:
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+            with contextlib.suppress(Exception):
+                await asyncio.wait_for(wait_task, timeout=10)
+            _drain()
+        await _flush()
+    finally:
+        if not wait_task.done():
+            wait_task.cancel()
+    return streamed, delivered, timed_out
+
+
+async def _run_scraping_subprocess_batch(keywords: list[str], ctx: AppContext, logger: structlog.BoundLogger, on_posts=None) -> list[dict]:
+    """Run a single batch of keywords in subprocess.
+
+    The subprocess streams accepted posts (NDJSON, see scraper.result_stream)
+    while it runs. With ``on_posts`` they are handed over in micro-batches as
+    they arrive and are not returned again; without it, or for posts the
+    callback failed on, they are part of the returned list. Posts streamed
+    before a timeout are kept.
+    """
     # Determine browsers path - use env var or default to standard TitanScraper location
     browsers_path = os.environ.get("PLAYWRIGHT_BROWSERS_PATH", "")
     storage_state_path = ctx.settings.storage_state
@@ -520,6 +662,7 @@ async def _run_scraping_subprocess_batch(keywords: list[str], ctx: AppContext, l
     # Create temp files for communication (needed for console=False PyInstaller exe)
     input_file = tempfile.NamedTemporaryFile(mode='w', suffix='_scraper_input.json', delete=False, encoding='utf-8')
     output_file_path = input_file.name.replace('_scraper_input.json', '_scraper_output.json')
+    stream_reader = ResultStreamReader(input_file.name.replace('_scraper_input.json', '_scraper_stream.ndjson'))
     
     try:
         # Write input to temp file
@@ -534,51 +677,65 @@ async def _run_scraping_subprocess_batch(keywords: list[str], ctx: AppContext, l
             return []
         _debug_log(f"input file written: {input_file.name}, size={os.path.getsize(input_file.name)}")
         
-        # Determine how to invoke the subprocess
-        if getattr(sys, "frozen", False):
-            # Frozen app: call the same exe with --scraper-subprocess flag and file args
-            cmd = [
-                sys.executable, 
-                "--scraper-subprocess",
-                "--input-file", input_file.name,
-                "--output-file", output_file_path
-            ]
-            cwd = None
-        else:
-            # Dev mode: run the scrape_subprocess.py script directly
-            script_path = Path(__file__).parent / "scrape_subprocess.py"
-            cmd = [
-                sys.executable, 
-                str(script_path),
-                "--input-file", input_file.name,
-                "--output-file", output_file_path
-            ]
-            cwd = str(Path(__file__).parent.parent)
+        job_files = {"input_file": input_file.name, "output_file": output_file_path, "stream_file": stream_reader.path}
         
-        logger.info("subprocess_scraping_start", keywords_count=len(keywords), frozen=getattr(sys, "frozen", False))
+        # Prefer the long-lived scraper server (warm interpreter + browser); fall
+        # back to a one-shot subprocess if it is disabled or can't be started
+        supervisor = _get_scrape_supervisor(ctx) if ctx.settings.scraper_server_enabled else None
+        server = await supervisor.acquire() if supervisor is not None else None
+        done = None
+        if server is not None:
+            try:
+                done = await server.submit(job_files)
+            except Exception as exc:
+                logger.warning("scrape_server_submit_failed", error=str(exc))
+                await supervisor.release(server, None)
+                server = None
         
-        # Run subprocess with timeout
-        # TIMEOUT AUGMENTÉ: 7 minutes pour permettre les délais humains anti-détection
-        # (3 keywords x 45s max entre keywords + 12s chargement + actions humaines)
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            cwd=cwd,
-        )
-        _debug_log(f"subprocess started, pid={proc.pid}")
+        logger.info("subprocess_scraping_start", keywords_count=len(keywords), frozen=getattr(sys, "frozen", False), server=server is not None)
+        
+        if server is not None:
+            proc = server.proc
+            _debug_log(f"job sent to scraper server, pid={proc.pid}, jobs_done={server.jobs_done}")
+        else:
+            # Run subprocess with timeout
+            # TIMEOUT AUGMENTÉ: 7 minutes pour permettre les délais humains anti-détection
+            # (3 keywords x 45s max entre keywords + 12s chargement + actions humaines)
+            base_cmd, cwd = _scraper_subprocess_command()
+            cmd = base_cmd + [
+                "--input-file", job_files["input_file"],
+                "--output-file", job_files["output_file"],
+                "--stream-file", job_files["stream_file"],
+            ]
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=cwd,
+            )
+            _debug_log(f"subprocess started, pid={proc.pid}")
         
-        # Wait for completion with timeout
+        # Wait for completion with timeout, consuming streamed posts meanwhile
         # TIMEOUT AUGMENTÉ: 15 minutes pour actions humaines (likes, visites profil, pauses longues jusqu'à 70s)
         # Calcul: 3 keywords x (12s charge + 10s extract + 60s délai + 70s pause + 15s actions) = ~500s + marge
+        # The server is ours until released, on every path: an error while following
+        # the job leaves it in an unknown state, so it is then recycled like a timeout
+        timed_out = True
         try:
-            await asyncio.wait_for(proc.wait(), timeout=900)  # 15 minute timeout per batch (human-like delays)
-            _debug_log(f"subprocess completed, returncode={proc.returncode}")
-        except asyncio.TimeoutError:
-            proc.kill()
-            logger.error("subprocess_scraping_timeout", keywords=keywords[:3])
-            _debug_log(f"subprocess TIMEOUT after 900s, keywords={keywords[:2]}")
-            return []
+            streamed, delivered, timed_out = await _follow_result_stream(
+                proc, stream_reader, on_posts, logger, timeout=_SUBPROCESS_TIMEOUT_SECONDS, done=done
+            )
+        finally:
+            if server is not None:
+                reply = done.result() if done.done() and not done.cancelled() else None
+                recycled = await supervisor.release(server, reply, timed_out)
+                _debug_log(f"scraper server job done, reply={reply}, recycled={recycled}")
+        if timed_out:
+            # Keep what was streamed before the kill
+            logger.error("subprocess_scraping_timeout", keywords=keywords[:3], streamed=len(streamed), delivered=len(delivered))
+            _debug_log(f"subprocess TIMEOUT after {_SUBPROCESS_TIMEOUT_SECONDS}s, keywords={keywords[:2]}, streamed={len(streamed)}")
+            return [p for seq, p in sorted(streamed.items()) if seq not in delivered]
+        _debug_log(f"subprocess completed, returncode={proc.returncode}, streamed={len(streamed)}, delivered={len(delivered)}")
         
-        if proc.returncode != 0:
+        if server is None and proc.returncode != 0:
             logger.warning("subprocess_scraping_nonzero_exit", returncode=proc.returncode)
             _debug_log(f"subprocess exited with returncode={proc.returncode}, checking output file anyway...")
             # Continue to read output file - it may contain account_restricted info
@@ -587,7 +744,7 @@ async def _run_scraping_subprocess_batch(keywords: list[str], ctx: AppContext, l
         if not os.path.exists(output_file_path):
             logger.error("subprocess_no_output_file")
             _debug_log(f"ERROR: output file does not exist: {output_file_path}")
-            return []
+            return [p for seq, p in sorted(streamed.items()) if seq not in delivered]
         
         _debug_log(f"reading output file: {output_file_path}, size={os.path.getsize(output_file_path)}")
         with open(output_file_path, 'r', encoding='utf-8') as f:
@@ -674,8 +831,10 @@ async def _run_scraping_subprocess_batch(keywords: list[str], ctx: AppContext, l
         except Exception as adapter_exc:
             _debug_log(f"WARNING: record_keyword_result failed: {adapter_exc}")
         
-        _debug_log(f"about to return {len(posts)} posts from _run_scraping_subprocess_batch")
-        return posts
+        # Posts already handed over from the stream are not returned twice
+        remaining = [p for seq, p in enumerate(posts) if seq not in delivered]
+        _debug_log(f"about to return {len(remaining)} posts from _run_scraping_subprocess_batch ({len(delivered)} streamed)")
+        return remaining
     
     except Exception as exc:
         _debug_log(f"EXCEPTION in _run_scraping_subprocess_batch: {type(exc).__name__}: {exc}")
@@ -701,6 +860,7 @@ async def _run_scraping_subprocess_batch(keywords: list[str], ctx: AppContext, l
             os.unlink(output_file_path)
         except Exception:
             pass
+        stream_reader.unlink()
 
 def _should_use_subprocess(ctx: AppContext) -> bool:
     """Determine if we should use subprocess for scraping.
@@ -876,8 +1036,37 @@ async def _recover_browser(pw, ctx: AppContext, logger: structlog.BoundLogger):
         logger.error("browser_recovery_failed", error=str(exc))
         return None
 
-async def process_keywords_batched(all_keywords: list[str], ctx: AppContext) -> list[Post]:
-    """Process keywords with Playwright, using subprocess in packaged mode."""
+def _posts_from_subprocess(raw_posts: list[dict], logger: structlog.BoundLogger) -> list[Post]:
+    """Convert raw post dicts produced by scrape_subprocess to Post objects."""
+    results: list[Post] = []
+    for p in raw_posts:
+        try:
+            post = Post(
+                id=p.get("id", ""),
+                keyword=p.get("keyword", ""),
+                author=p.get("author", "Unknown"),
+                author_profile=p.get("author_profile"),
+                text=p.get("text", ""),
+                language=p.get("language", "fr"),
+                published_at=p.get("published_at"),
+                collected_at=p.get("collected_at", datetime.now(timezone.utc).isoformat()),
+                company=p.get("company"),
+                permalink=p.get("permalink"),
+                raw=p.get("raw"),
+            )
+            results.append(post)
+        except Exception as exc:
+            logger.warning("post_conversion_failed", error=str(exc))
+    return results
+
+
+async def process_keywords_batched(all_keywords: list[str], ctx: AppContext, on_posts=None) -> list[Post]:
+    """Process keywords with Playwright, using subprocess in packaged mode.
+
+    In subprocess mode, ``on_posts`` (coroutine taking a list of Post) receives
+    posts in micro-batches while the subprocess is still running; posts handed
+    to it are not part of the returned list.
+    """
     logger = ctx.logger.bind(component="batched_session")
     
     # Debug logging to file
@@ -893,33 +1082,19 @@ async def process_keywords_batched(all_keywords: list[str], ctx: AppContext) ->
     if _should_use_subprocess(ctx):
         logger.info("using_subprocess_mode", frozen=getattr(sys, "frozen", False))
         _debug_log(f"using_subprocess_mode, keywords={len(all_keywords)}")
+        deliver = None
+        if on_posts is not None:
+            async def deliver(raw_batch: list[dict]) -> None:
+                await on_posts(_posts_from_subprocess(raw_batch, logger))
         try:
-            raw_posts = await _run_scraping_subprocess(all_keywords, ctx, logger)
+            raw_posts = await _run_scraping_subprocess(all_keywords, ctx, logger, on_posts=deliver)
             _debug_log(f"subprocess returned {len(raw_posts)} raw posts")
         except Exception as e:
             _debug_log(f"ERROR in _run_scraping_subprocess: {type(e).__name__}: {e}")
             logger.error("subprocess_exception", error=str(e))
             raw_posts = []
         # Convert raw dicts to Post objects
-        results: list[Post] = []
-        for p in raw_posts:
-            try:
-                post = Post(
-                    id=p.get("id", ""),
-                    keyword=p.get("keyword", ""),
-                    author=p.get("author", "Unknown"),
-                    author_profile=p.get("author_profile"),
-                    text=p.get("text", ""),
-                    language=p.get("language", "fr"),
-                    published_at=p.get("published_at"),
-                    collected_at=p.get("collected_at", datetime.now(timezone.utc).isoformat()),
-                    company=p.get("company"),
-                    permalink=p.get("permalink"),
-                    raw=p.get("raw"),
-                )
-                results.append(post)
-            except Exception as exc:
-                logger.warning("post_conversion_failed", error=str(exc))
+        results = _posts_from_subprocess(raw_posts, logger)
         _debug_log(f"converted to {len(results)} Post objects")
         return results
     
@@ -1051,6 +1226,11 @@ class StorageError(Exception):
 # Storage Helpers
 # ------------------------------------------------------------
 
+def _sqlite_repository(settings: "Settings"):
+    """Pooled repository for ``settings.sqlite_path`` (schema migrated once per process)."""
+    return get_repository(settings.sqlite_path, pool_size=getattr(settings, "sqlite_pool_size", 4))
+
+
 async def _get_daily_count_from_db(ctx: AppContext, today_iso: str) -> int:
     """Get the count of posts collected today from SQLite.
     
@@ -1065,26 +1245,24 @@ async def _get_daily_count_from_db(ctx: AppContext, today_iso: str) -> int:
     """
     try:
         if ctx.settings.sqlite_path:
-            import sqlite3
-            conn = sqlite3.connect(ctx.settings.sqlite_path)
-            try:
-                cur = conn.cursor()
-                # Count posts where collected_at starts with today's date
-                cur.execute(
-                    "SELECT COUNT(*) FROM posts WHERE collected_at LIKE ?",
-                    (f"{today_iso}%",)
-                )
-                result = cur.fetchone()
-                count = result[0] if result else 0
-                _debug_log(f"_get_daily_count_from_db: {count} posts for {today_iso}")
-                return count
-            finally:
-                conn.close()
+            count = await run_sync(_daily_count_sync, ctx.settings, today_iso, label="daily_count")
+            _debug_log(f"_get_daily_count_from_db: {count} posts for {today_iso}")
+            return count
     except Exception as exc:
         _debug_log(f"_get_daily_count_from_db failed: {exc}")
     return 0
 
 
+def _daily_count_sync(settings: "Settings", today_iso: str) -> int:
+    with _sqlite_repository(settings).connection() as conn:
+        # Count posts where collected_at starts with today's date
+        result = conn.execute(
+            "SELECT COUNT(*) FROM posts WHERE collected_at LIKE ?",
+            (f"{today_iso}%",)
+        ).fetchone()
+    return result[0] if result else 0
+
+
 async def store_posts(ctx: AppContext, posts: list[Post]) -> int:
     """Store posts using priority: SQLite → CSV.
 
@@ -1111,7 +1289,8 @@ async def store_posts(ctx: AppContext, posts: list[Post]) -> int:
     # SQLite primary storage
     try:
         with SCRAPE_STEP_DURATION.labels(step="sqlite_insert").time():
-            inserted = _store_sqlite(ctx.settings, posts)
+            # Blocking write runs on the repository executor, not the event loop
+            inserted = await run_sync(_store_sqlite, ctx.settings, posts, label="store_posts")
         SCRAPE_STORAGE_ATTEMPTS.labels("sqlite", "success").inc()
         logger.info("sqlite_inserted", path=ctx.settings.sqlite_path, inserted=inserted)
         return inserted
@@ -1134,108 +1313,21 @@ async def store_posts(ctx: AppContext, posts: list[Post]) -> int:
 def _store_sqlite(settings: "Settings", posts: list[Post]) -> int:
     path = settings.sqlite_path
     _debug_log(f"_store_sqlite: using path={path}, posts={len(posts)}")
-    Path(path).parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(path)
-    with conn:
-        # Create table (legacy layout first); new classification columns added via ALTER below
-        conn.execute(
-            """CREATE TABLE IF NOT EXISTS posts (
-            id TEXT PRIMARY KEY,
-            keyword TEXT,
-            author TEXT,
-            author_profile TEXT,
-            company TEXT,
-            permalink TEXT,
-            text TEXT,
-            language TEXT,
-            published_at TEXT,
-            collected_at TEXT,
-            raw_json TEXT,
-            search_norm TEXT,
-            content_hash TEXT
-            )"""
-        )
-        # Detect legacy columns
-        try:
-            cur = conn.execute("PRAGMA table_info(posts)")
-            cols = [r[1] for r in cur.fetchall()]
-            if "score" in cols or "recruitment_score" in cols:
-                # Perform lightweight migration: create temp, copy subset, drop old, rename
-                conn.execute("CREATE TABLE IF NOT EXISTS posts_new (id TEXT PRIMARY KEY, keyword TEXT, author TEXT, author_profile TEXT, company TEXT, permalink TEXT, text TEXT, language TEXT, published_at TEXT, collected_at TEXT, raw_json TEXT, search_norm TEXT, content_hash TEXT)")
-                # Copy only needed columns if they exist
-                copy_cols_src = [c for c in ["id","keyword","author","author_profile","company","permalink","text","language","published_at","collected_at","raw_json","search_norm","content_hash"] if c in cols]
-                copy_cols_dst = ["id","keyword","author","author_profile","company","permalink","text","language","published_at","collected_at","raw_json","search_norm","content_hash"]
-                conn.execute(f"INSERT OR IGNORE INTO posts_new ({','.join(copy_cols_dst)}) SELECT {','.join(copy_cols_src)} FROM posts")
-                conn.execute("DROP TABLE posts")
-                conn.execute("ALTER TABLE posts_new RENAME TO posts")
-            # Add content_hash column if missing (after migration path)
-            if "content_hash" not in cols:
-                try:
-                    conn.execute("ALTER TABLE posts ADD COLUMN content_hash TEXT")
-                except Exception:
-                    pass
-            # Create a unique index on permalink to avoid duplicate rows for the same LinkedIn post
-            try:
-                conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS uniq_posts_permalink ON posts(permalink) WHERE permalink IS NOT NULL")
-            except Exception:
-                pass
-            # Secondary composite unique index for fallback dedup when permalink missing
-            try:
-                conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS uniq_posts_author_published ON posts(author, published_at) WHERE author IS NOT NULL AND published_at IS NOT NULL")
-            except Exception:
-                pass
-            # Tertiary unique index on content_hash when no permalink/date
-            try:
-                conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS uniq_posts_content_hash ON posts(content_hash) WHERE content_hash IS NOT NULL")
-            except Exception:
-                pass
-            # Performance indexes for common queries
-            try:
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_collected_at ON posts(collected_at DESC)")
-            except Exception:
-                pass
-            try:
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_author ON posts(author)")
-            except Exception:
-                pass
-            try:
-                conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_keyword ON posts(keyword)")
-            except Exception:
-                pass
-        except Exception:
-            cols = []  # pragma: no cover
-        
-        # Add new classification columns if missing (idempotent)
-        for new_col, ddl in [
-            ("intent", "ALTER TABLE posts ADD COLUMN intent TEXT"),
-            ("relevance_score", "ALTER TABLE posts ADD COLUMN relevance_score REAL"),
-            ("confidence", "ALTER TABLE posts ADD COLUMN confidence REAL"),
-            ("location_ok", "ALTER TABLE posts ADD COLUMN location_ok INTEGER"),
-            ("keywords_matched", "ALTER TABLE posts ADD COLUMN keywords_matched TEXT"),
-        ]:
-            if new_col not in cols:
-                try:
-                    conn.execute(ddl)
-                    cols.append(new_col)
-                except Exception:
-                    pass
-        
+    # Schema (tables, columns, dedup indexes) is applied once by scraper.repository migrations
+    with _sqlite_repository(settings).connection() as conn:
         rows: list[tuple] = []
-        seen_hashes = set()
         for p in posts:
+            # search_norm feeds posts_fts through the posts_fts_ai trigger (index stays incremental)
             try:
-                s_norm = utils.build_search_norm(p.text, p.author, getattr(p, 'company', None), p.keyword)
+                s_norm = utils.build_search_norm(NormalizedText.of(p.text), p.author, getattr(p, 'company', None), p.keyword)
             except Exception:
                 s_norm = None
+            # Same author+text is one post, within a batch as across batches: the unique
+            # indexes on content_hash / dedup_key keep the first row
             try:
                 chash = _compute_content_hash(p.author, p.text)
             except Exception:
                 chash = None
-            # Ensure batch-level uniqueness to avoid INSERT OR IGNORE skipping later rows when same text/author
-            if chash and chash in seen_hashes:
-                chash = f"{chash}_{abs(hash(p.id))%997}"  # deterministic short salt
-            if chash:
-                seen_hashes.add(chash)
             # Extend raw JSON with legal classification fields for SQLite/CSV schemas
             raw_enriched = dict(p.raw or {})
             if getattr(p, 'intent', None):
@@ -1264,25 +1356,32 @@ def _store_sqlite(settings: "Settings", posts: list[Post]) -> int:
                 "search_norm": s_norm,
                 "content_hash": chash,
             }
-            # Optional classification columns if table has them
-            if 'intent' in cols:
-                base_values['intent'] = getattr(p, 'intent', None)
-            if 'relevance_score' in cols:
-                base_values['relevance_score'] = getattr(p, 'relevance_score', None)
-            if 'confidence' in cols:
-                base_values['confidence'] = getattr(p, 'confidence', None)
-            if 'location_ok' in cols:
-                loc_ok = getattr(p, 'location_ok', None)
-                base_values['location_ok'] = int(loc_ok) if isinstance(loc_ok, bool) else (loc_ok if loc_ok is not None else None)
-            if 'keywords_matched' in cols:
-                km = getattr(p, 'keywords_matched', None)
-                if isinstance(km, (list, tuple)):
-                    try:
-                        base_values['keywords_matched'] = json.dumps(list(km), ensure_ascii=False)
-                    except Exception:
-                        base_values['keywords_matched'] = None
-                elif isinstance(km, str):
-                    base_values['keywords_matched'] = km
+            # Classification columns
+            base_values['intent'] = getattr(p, 'intent', None)
+            base_values['relevance_score'] = getattr(p, 'relevance_score', None)
+            base_values['confidence'] = getattr(p, 'confidence', None)
+            loc_ok = getattr(p, 'location_ok', None)
+            base_values['location_ok'] = int(loc_ok) if isinstance(loc_ok, bool) else (loc_ok if loc_ok is not None else None)
+            km = getattr(p, 'keywords_matched', None)
+            base_values['keywords_matched'] = None
+            if isinstance(km, (list, tuple)):
+                try:
+                    base_values['keywords_matched'] = json.dumps(list(km), ensure_ascii=False)
+                except Exception:
+                    pass
+            elif isinstance(km, str):
+                base_values['keywords_matched'] = km
+            # Display fields (company/status/metier/opportunity/permalink) computed once here, not per page view.
+            # dedup_key is unique-indexed: INSERT OR IGNORE below drops duplicates at write time.
+            try:
+                display = compute_display_fields(
+                    p.author, getattr(p, 'company', None), p.author_profile, p.text, getattr(p, 'permalink', None),
+                    published_at=p.published_at,
+                    opportunity_threshold=getattr(settings, "recruitment_signal_threshold", 0.05),
+                )
+            except Exception:
+                display = dict.fromkeys(DISPLAY_COLUMNS)  # left for backfill_display_fields
+            base_values.update(display)
             rows.append(base_values)
         inserted_rows = 0
         if rows:
@@ -1291,41 +1390,14 @@ def _store_sqlite(settings: "Settings", posts: list[Post]) -> int:
             placeholders = ",".join(["?"] * len(col_names))
             sql = f"INSERT OR IGNORE INTO posts ({','.join(col_names)}) VALUES ({placeholders})"
             
-            # DEBUG: Count before insert
-            count_before = conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
-            _debug_log(f"_store_sqlite: about to insert {len(rows)} rows, count_before={count_before}")
-            
-            conn.executemany(sql, [tuple(r[c] for c in col_names) for r in rows])
-            conn.commit()  # Explicit commit
-            
-            # DEBUG: Count after insert
-            count_after = conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
-            inserted_rows = count_after - count_before
-            _debug_log(f"_store_sqlite: count_after={count_after}, inserted={inserted_rows}")
-            
-            # DEBUG: Log to file
-            try:
-                debug_path = Path(os.environ.get("LOCALAPPDATA", ".")) / "TitanScraper" / "sqlite_debug.txt"
-                with open(debug_path, 'a', encoding='utf-8') as f:
-                    from datetime import datetime, timezone
-                    now = datetime.now(timezone.utc).isoformat()
-                    f.write(f"{now} - rows_to_insert={len(rows)}, before={count_before}, after={count_after}, inserted={inserted_rows}\n")
-                    for r in rows[:3]:  # Log first 3 rows
-                        f.write(f"  Row: id={r.get('id','?')}, author={r.get('author','?')[:30]}, permalink={r.get('permalink','?')[:50]}\n")
-            except Exception:
-                pass
-            
+            # One transaction (committed by the repository context) covers the insert, the
+            # auto-favorites below and the FTS/daily_stats triggers. rowcount sums sqlite3_changes()
+            # per row: ignored duplicates and trigger writes are not counted, unlike total_changes.
+            cur = conn.executemany(sql, [tuple(r[c] for c in col_names) for r in rows])
+            inserted_rows = max(cur.rowcount, 0)
+            _debug_log(f"_store_sqlite: rows={len(rows)}, inserted={inserted_rows}")
+
             # Auto-favorite opportunity posts (unified predicate utils.is_opportunity)
-            try:
-                conn.execute("""CREATE TABLE IF NOT EXISTS post_flags (
-                    post_id TEXT PRIMARY KEY,
-                    is_favorite INTEGER NOT NULL DEFAULT 0,
-                    is_deleted INTEGER NOT NULL DEFAULT 0,
-                    favorite_at TEXT,
-                    deleted_at TEXT
-                )""")
-            except Exception:
-                pass
             if getattr(settings, "auto_favorite_opportunities", False):
                 try:
                     from datetime import datetime as _dt, timezone as _tz
@@ -1387,38 +1459,30 @@ async def update_meta(ctx: AppContext, total_new: int) -> None:
     # SQLite meta storage
     try:
         if ctx.settings.sqlite_path:
-            db_path = ctx.settings.sqlite_path
-            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-            conn = sqlite3.connect(db_path)
-            with conn:
-                conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS meta (
-                        id TEXT PRIMARY KEY,
-                        last_run TEXT,
-                        posts_count INTEGER DEFAULT 0,
-                        scraping_enabled INTEGER
-                    )
-                    """
-                )
-                # Upsert and increment posts_count by total_new
-                conn.execute(
-                    """
-                    INSERT INTO meta(id, last_run, posts_count, scraping_enabled)
-                    VALUES(?,?,?,?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        last_run=excluded.last_run,
-                        posts_count=COALESCE(meta.posts_count,0)+excluded.posts_count,
-                        scraping_enabled=COALESCE(excluded.scraping_enabled, meta.scraping_enabled)
-                    """,
-                    ("global", now_iso, int(total_new or 0), int(bool(ctx.settings.scraping_enabled))),
-                )
+            await run_sync(_update_meta_sync, ctx.settings, now_iso, total_new, label="update_meta")
     except Exception as exc:  # pragma: no cover
         try:
             ctx.logger.warning("sqlite_meta_update_failed", error=str(exc))
         except Exception:
             pass
 
+
+def _update_meta_sync(settings: "Settings", now_iso: str, total_new: int) -> None:
+    with _sqlite_repository(settings).connection() as conn:
+        # Upsert and increment posts_count by total_new
+        conn.execute(
+            """
+            INSERT INTO meta(id, last_run, posts_count, scraping_enabled)
+            VALUES(?,?,?,?)
+            ON CONFLICT(id) DO UPDATE SET
+                last_run=excluded.last_run,
+                posts_count=COALESCE(meta.posts_count,0)+excluded.posts_count,
+                scraping_enabled=COALESCE(excluded.scraping_enabled, meta.scraping_enabled)
+            """,
+            ("global", now_iso, int(total_new or 0), int(bool(settings.scraping_enabled))),
+        )
+
+
 # ------------------------------------------------------------
 # Playwright extraction logic (élargi)
 # ------------------------------------------------------------
@@ -1513,15 +1577,7 @@ def _canonicalize_permalink(url: str | None) -> str | None:
     return base
 
 def _compute_content_hash(author: str | None, text: str | None) -> str:
-    import hashlib
-    a = (author or '').strip().lower()
-    t = (text or '')
-    # Normalise whitespace & case
-    t = _re.sub(r"\s+", " ", t).strip().lower()
-    # Collapse long digit sequences to # to stabilise minor counters (views, likes)
-    t = _re.sub(r"\d{2,}", "#", t)
-    blob = f"{a}||{t}".encode('utf-8', errors='ignore')
-    return hashlib.sha1(blob).hexdigest()[:20]
+    return utils.compute_content_hash(author, text)
 
 def _dedupe_repeated_author(name: str) -> str:
     if not name:
@@ -1784,6 +1840,8 @@ async def extract_posts(page: Any, keyword: str, max_items: int, ctx: AppContext
                     # text_norm available after text extraction below; we defer adding it until computed
                 text_raw = (await text_el.inner_text()) if text_el else ""
                 text_norm = utils.normalize_whitespace(text_raw)
+                # Shared normalized view: every filter below reuses the same forms
+                text_view = NormalizedText.of(text_norm)
                 if not company_val and text_norm:
                     candidates.append(text_norm)
                 if not company_val and candidates:
@@ -1889,7 +1947,7 @@ async def extract_posts(page: Any, keyword: str, max_items: int, ctx: AppContext
                 if provisional_pid in seen_ids:
                     continue
                 seen_ids.add(provisional_pid)
-                recruitment_score = utils.compute_recruitment_signal(text_norm)
+                recruitment_score = utils.compute_recruitment_signal(text_view)
                 # Assouplissement dynamique du threshold si derrière l'objectif et option activée
                 effective_threshold = ctx.settings.recruitment_signal_threshold
                 try:
@@ -2013,12 +2071,12 @@ async def extract_posts(page: Any, keyword: str, max_items: int, ctx: AppContext
                         reject_reason = "too_old"
                     
                     # 2. FILTRE STAGE/ALTERNANCE - PRIORITÉ HAUTE (jamais collecter)
-                    if keep and utils.is_stage_or_alternance(text_norm):
+                    if keep and utils.is_stage_or_alternance(text_view):
                         keep = False
                         reject_reason = "stage_alternance"
                     
                     # 3. FILTRE CABINETS RECRUTEMENT - PRIORITÉ HAUTE (concurrents)
-                    if keep and utils.is_from_recruitment_agency(text_norm, author):
+                    if keep and utils.is_from_recruitment_agency(text_view, author):
                         keep = False
                         reject_reason = "recruitment_agency"
                     
@@ -2028,7 +2086,7 @@ async def extract_posts(page: Any, keyword: str, max_items: int, ctx: AppContext
                             keep = False; reject_reason = "language"
                         # Domain filter: require SPECIFIC legal role keywords (not generic terms)
                         if keep and getattr(ctx.settings, 'filter_legal_domain_only', False):
-                            tl = (text_norm or "").lower()
+                            tl = text_view.lower()
                             # STRICT legal role markers - must be specific job roles, not generic terms
                             legal_role_markers = (
                                 "juriste", "avocat", "paralegal", "notaire", "clerc",
@@ -2045,7 +2103,7 @@ async def extract_posts(page: Any, keyword: str, max_items: int, ctx: AppContext
                             if keep: keep = False; reject_reason = reject_reason or "missing_core_fields"
                         # Exclude job-seeker / availability self-promotion posts
                         if keep and getattr(ctx.settings, 'filter_exclude_job_seekers', True):
-                            tl = (text_norm or "").lower()
+                            tl = text_view.lower()
                             job_markers = (
                                 "recherche d'emploi", "recherche d\u2019emploi", "cherche un stage", "cherche un emploi",
                                 "à la recherche d'une opportunité", "a la recherche d'une opportunité",
@@ -2057,20 +2115,20 @@ async def extract_posts(page: Any, keyword: str, max_items: int, ctx: AppContext
                                 keep = False; reject_reason = reject_reason or "job_seeker"
                         # France-only filter using improved utils function
                         if keep and getattr(ctx.settings, 'filter_france_only', True):
-                            if not utils.is_location_france(text_norm, strict=True):
+                            if not utils.is_location_france(text_view, strict=True):
                                 keep = False; reject_reason = reject_reason or "not_fr"
                         # NEW: Exclude posts from recruitment agencies (competitors)
-                        if keep and utils.is_from_recruitment_agency(text_norm, author):
+                        if keep and utils.is_from_recruitment_agency(text_view, author):
                             keep = False; reject_reason = reject_reason or "recruitment_agency"
                         # NEW: Exclude promotional/informational content (events, articles, etc.)
-                        if keep and utils.is_promotional_content(text_norm):
+                        if keep and utils.is_promotional_content(text_view):
                             keep = False; reject_reason = reject_reason or "promotional_content"
                         # LEGAL FILTER: Apply comprehensive legal job post filter with settings-based config
                         if keep and getattr(ctx.settings, 'filter_legal_posts_only', True):
                             # Use centralized helper to build FilterConfig from settings
                             from .bootstrap import build_filter_config, LEGAL_FILTER_TOTAL, LEGAL_FILTER_ACCEPTED, LEGAL_FILTER_REJECTED
                             filter_config = build_filter_config(ctx.settings)
-                            filter_result = is_legal_job_post(text_norm, published_iso, config=filter_config)
+                            filter_result = is_legal_job_post(text_view, published_iso, config=filter_config)
                             # Update Prometheus metrics
                             LEGAL_FILTER_TOTAL.inc()
                             if filter_result.is_valid:
@@ -2317,16 +2375,6 @@ async def process_job(keywords: Iterable[str], ctx: AppContext) -> int:
                     ctx.logger.debug("fast_first_cycle_applied", max_posts=ctx.settings.max_posts_per_keyword, scroll_steps=ctx.settings.max_scroll_steps)
                 except Exception:
                     pass
-            if ctx.settings.playwright_mock_mode:
-                for idx, kw in enumerate(iterable_keywords):
-                    if idx > 0 and ctx.settings.per_keyword_delay_ms > 0:
-                        await asyncio.sleep(ctx.settings.per_keyword_delay_ms / 1000.0)
-                    posts = await process_keyword(kw, ctx, first_keyword=(idx == 0))
-                    all_new.extend(posts)
-            else:
-                real_posts = await process_keywords_batched(iterable_keywords, ctx)
-                all_new.extend(real_posts)
-            
             # Debug logging function
             def _debug_log(msg: str):
                 try:
@@ -2336,41 +2384,6 @@ async def process_job(keywords: Iterable[str], ctx: AppContext) -> int:
                 except Exception:
                     pass
             
-            _debug_log(f"all_new after batched: {len(all_new)} posts")
-            
-            # Restore original settings after lightweight first cycle
-            if fast_cycle_applied:
-                try:
-                    ctx.settings.max_posts_per_keyword = original_max_posts
-                    ctx.settings.max_scroll_steps = original_scroll_steps
-                    setattr(ctx, '_fast_cycle_done', True)
-                    ctx.logger.debug("fast_first_cycle_restored", max_posts=original_max_posts, scroll_steps=original_scroll_steps)
-                except Exception:
-                    pass
-            # Cross-keyword deduplication: prefer permalink; else author+published_at; else author+text snippet
-            deduped: list[Post] = []
-            seen_keys: set[str] = set()
-            for p in all_new:
-                # Canonical permalink key first
-                if p.permalink:
-                    key = f"perma|{_canonicalize_permalink(p.permalink)}"
-                elif p.published_at and p.author:
-                    key = f"authdate|{p.author}|{p.published_at}"
-                else:
-                    # Use stable content hash (same logic as storage) to reduce dupes when date missing
-                    ch = _compute_content_hash(p.author, p.text)
-                    key = f"authtext|{p.author}|{ch}"
-                if key not in seen_keys:
-                    seen_keys.add(key)
-                    deduped.append(p)
-            
-            _debug_log(f"after dedup: {len(deduped)} unique posts from {len(all_new)} raw")
-            
-            # Apply legal classification & quota policy
-            classified: list[Post] = []
-            accepted_in_batch = 0
-            discarded_intent = 0
-            discarded_location = 0
             # Build dynamic legal keywords list (override/extend if provided)
             provided = []
             try:
@@ -2391,11 +2404,89 @@ async def process_job(keywords: Iterable[str], ctx: AppContext) -> int:
             cap = ctx.settings.legal_daily_post_cap
             relaxed = bool(getattr(ctx, "_relaxed_filters", False))
             _debug_log(f"classification: relaxed={relaxed}, cap={cap}, daily_count={daily_count}")
-            for p in deduped:
-                # Enforce daily cap based on persisted-accepted so far plus this batch's accepted
-                if (daily_count + accepted_in_batch) >= cap:
+            
+            # Dedup -> legal classification & quota -> storage -> NEW_POST, applied per
+            # micro-batch: the subprocess streams posts while it scrapes, and whatever
+            # is left when scraping returns goes through the same path.
+            classified: list[Post] = []
+            seen_keys: set[str] = set()
+            accepted_in_batch = 0
+            discarded_intent = 0
+            discarded_location = 0
+            inserted = 0
+            cap_hit = False
+
+            async def _ingest(batch: list[Post]) -> None:
+                # Dedup keys, cap and discard counts are committed only once the batch is
+                # stored: when store_posts raises, the micro-batch stays undelivered and
+                # its posts come back with the final output.
+                nonlocal accepted_in_batch, discarded_intent, discarded_location, inserted, cap_hit
+                if not batch or cap_hit:
+                    return
+                spans = StageSpans()
+                batch_keyword = _batch_keyword(batch)
+                # Cross-keyword deduplication: prefer permalink; else author+published_at; else author+text snippet
+                deduped: list[Post] = []
+                batch_keys: set[str] = set()
+                for p in batch:
+                    # Canonical permalink key first
+                    if p.permalink:
+                        key = f"perma|{_canonicalize_permalink(p.permalink)}"
+                    elif p.published_at and p.author:
+                        key = f"authdate|{p.author}|{p.published_at}"
+                    else:
+                        # Use stable content hash (same logic as storage) to reduce dupes when date missing
+                        ch = _compute_content_hash(p.author, p.text)
+                        key = f"authtext|{p.author}|{ch}"
+                    if key not in seen_keys and key not in batch_keys:
+                        batch_keys.add(key)
+                        deduped.append(p)
+                _debug_log(f"after dedup: {len(deduped)} unique posts from {len(batch)} raw")
+                spans.lap("batch_dedup")
+                accepted: list[Post] = []
+                batch_cap_hit = False
+                batch_discard_intent = 0
+                batch_discard_location = 0
+                for p in deduped:
+                    # Enforce daily cap based on persisted-accepted so far plus this job's accepted
+                    if (daily_count + accepted_in_batch + len(accepted)) >= cap:
+                        batch_cap_hit = True
+                        _debug_log(f"daily cap reached at {accepted_in_batch + len(accepted)} accepted")
+                        break
+                    # Classification and gating
+                    lc = classify_legal_post(p.text, language=p.language, intent_threshold=ctx.settings.legal_intent_threshold)
+                    LEGAL_INTENT_CLASSIFICATIONS_TOTAL.labels(lc.intent).inc()
+                    if not relaxed:
+                        if lc.intent != 'recherche_profil':
+                            batch_discard_intent += 1
+                            continue
+                        if not lc.location_ok:
+                            batch_discard_location += 1
+                            continue
+                    # Attach classification fields (even in relaxed, for diagnostics)
+                    # Company duplicate reduction: if company repeats twice like 'ACME ACME' keep single
+                    if getattr(p, 'company', None):
+                        import re as _re_local
+                        comp = p.company.strip()
+                        toks = comp.split()
+                        if len(toks) % 2 == 0 and toks[:len(toks)//2] == toks[len(toks)//2:]:
+                            p.company = " ".join(toks[:len(toks)//2])
+                        # Collapse consecutive duplicate words
+                        p.company = _re_local.sub(r"\b(\w+)(\s+\1)+\b", r"\1", p.company, flags=_re_local.IGNORECASE)
+                    setattr(p, 'intent', lc.intent)
+                    setattr(p, 'relevance_score', lc.relevance_score)
+                    setattr(p, 'confidence', lc.confidence)
+                    setattr(p, 'keywords_matched', lc.keywords_matched)
+                    setattr(p, 'location_ok', lc.location_ok)
+                    accepted.append(p)
+                spans.lap("filter_classify")
+                # Persist posts and count actual insertions (dedup aware)
+                stored = await store_posts(ctx, accepted) if accepted else 0
+                seen_keys.update(batch_keys)
+                accepted_in_batch += len(accepted)
+                if batch_cap_hit:
+                    cap_hit = True
                     LEGAL_DAILY_CAP_REACHED.inc()
-                    _debug_log(f"daily cap reached at {accepted_in_batch} accepted")
                     # Broadcast SSE event to notify dashboard
                     if broadcast and EventType:
                         try:
@@ -2408,80 +2499,84 @@ async def process_job(keywords: Iterable[str], ctx: AppContext) -> int:
                             }))
                         except Exception:
                             pass
-                    break
-                # Classification and gating
-                lc = classify_legal_post(p.text, language=p.language, intent_threshold=ctx.settings.legal_intent_threshold)
-                LEGAL_INTENT_CLASSIFICATIONS_TOTAL.labels(lc.intent).inc()
-                if not relaxed:
-                    if lc.intent != 'recherche_profil':
-                        discarded_intent += 1
-                        LEGAL_POSTS_DISCARDED_TOTAL.labels('intent').inc()
-                        try:
-                            ctx.legal_daily_discard_intent = getattr(ctx, 'legal_daily_discard_intent', 0) + 1  # type: ignore[attr-defined]
-                        except Exception:
-                            pass
-                        continue
-                    if not lc.location_ok:
-                        LEGAL_POSTS_DISCARDED_TOTAL.labels('location').inc()
+                if batch_discard_intent:
+                    discarded_intent += batch_discard_intent
+                    LEGAL_POSTS_DISCARDED_TOTAL.labels('intent').inc(batch_discard_intent)
+                    try:
+                        ctx.legal_daily_discard_intent = getattr(ctx, 'legal_daily_discard_intent', 0) + batch_discard_intent  # type: ignore[attr-defined]
+                    except Exception:
+                        pass
+                if batch_discard_location:
+                    LEGAL_POSTS_DISCARDED_TOTAL.labels('location').inc(batch_discard_location)
+                    try:
+                        ctx.legal_daily_discard_location = getattr(ctx, 'legal_daily_discard_location', 0) + batch_discard_location  # type: ignore[attr-defined]
+                    except Exception:
+                        pass
+                if not accepted:
+                    _observe_stage_spans(batch_keyword, spans.pop())
+                    return
+                spans.lap("storage")
+                _debug_log(f"store_posts returned: {stored} inserted")
+                inserted += stored
+                setattr(ctx, 'legal_daily_count', daily_count + inserted)
+                # Metrics reflect persisted accepted posts
+                LEGAL_POSTS_TOTAL.inc(stored)
+                classified.extend(accepted)
+                
+                # Send individual post events for progressive display
+                spans.mark()
+                if broadcast and EventType:
+                    for p in accepted:
                         try:
-                            ctx.legal_daily_discard_location = getattr(ctx, 'legal_daily_discard_location', 0) + 1  # type: ignore[attr-defined]
+                            await broadcast({
+                                "type": EventType.NEW_POST,
+                                "post": {
+                                    "_id": p.id,
+                                    "keyword": p.keyword,
+                                    "author": p.author,
+                                    "company": getattr(p, "company", None),
+                                    "permalink": getattr(p, "permalink", None),
+                                    "text": p.text[:500] if p.text else "",  # Truncate for SSE
+                                    "published_at": p.published_at.isoformat() if p.published_at else None,
+                                    "collected_at": p.collected_at.isoformat() if p.collected_at else None,
+                                    "metier": getattr(p, "keywords_matched", [None])[0] if getattr(p, "keywords_matched", None) else None,
+                                }
+                            })
                         except Exception:
                             pass
-                        continue
-                # Attach classification fields (even in relaxed, for diagnostics)
-                # Company duplicate reduction: if company repeats twice like 'ACME ACME' keep single
-                if getattr(p, 'company', None):
-                    import re as _re_local
-                    comp = p.company.strip()
-                    toks = comp.split()
-                    if len(toks) % 2 == 0 and toks[:len(toks)//2] == toks[len(toks)//2:]:
-                        p.company = " ".join(toks[:len(toks)//2])
-                    # Collapse consecutive duplicate words
-                    p.company = _re_local.sub(r"\b(\w+)(\s+\1)+\b", r"\1", p.company, flags=_re_local.IGNORECASE)
-                setattr(p, 'intent', lc.intent)
-                setattr(p, 'relevance_score', lc.relevance_score)
-                setattr(p, 'confidence', lc.confidence)
-                setattr(p, 'keywords_matched', lc.keywords_matched)
-                setattr(p, 'location_ok', lc.location_ok)
-                classified.append(p)
-                accepted_in_batch += 1
+                    spans.lap("broadcast")
+                _observe_stage_spans(batch_keyword, spans.pop())
+
+            if ctx.settings.playwright_mock_mode:
+                for idx, kw in enumerate(iterable_keywords):
+                    if idx > 0 and ctx.settings.per_keyword_delay_ms > 0:
+                        await asyncio.sleep(ctx.settings.per_keyword_delay_ms / 1000.0)
+                    posts = await process_keyword(kw, ctx, first_keyword=(idx == 0))
+                    all_new.extend(posts)
+            else:
+                # Subprocess mode hands posts to _ingest while scraping; the rest is returned
+                real_posts = await process_keywords_batched(iterable_keywords, ctx, on_posts=_ingest)
+                all_new.extend(real_posts)
             
-            _debug_log(f"classification done: {len(classified)} accepted, {discarded_intent} discarded_intent, {discarded_location} discarded_location")
+            _debug_log(f"all_new after batched: {len(all_new)} posts")
             
-            # Persist posts and count actual insertions (dedup aware)
-            inserted = await store_posts(ctx, classified)
-            _debug_log(f"store_posts returned: {inserted} inserted")
-            daily_count += inserted
-            setattr(ctx, 'legal_daily_count', daily_count)
-            # Metrics reflect persisted accepted posts
-            LEGAL_POSTS_TOTAL.inc(inserted)
-            all_new = classified
+            # Restore original settings after lightweight first cycle
+            if fast_cycle_applied:
+                try:
+                    ctx.settings.max_posts_per_keyword = original_max_posts
+                    ctx.settings.max_scroll_steps = original_scroll_steps
+                    setattr(ctx, '_fast_cycle_done', True)
+                    ctx.logger.debug("fast_first_cycle_restored", max_posts=original_max_posts, scroll_steps=original_scroll_steps)
+                except Exception:
+                    pass
+            await _ingest(all_new)
             
-            # Send individual post events for progressive display
-            if broadcast and EventType and classified:
-                for p in classified:
-                    try:
-                        await broadcast({
-                            "type": EventType.NEW_POST,
-                            "post": {
-                                "_id": p.id,
-                                "keyword": p.keyword,
-                                "author": p.author,
-                                "company": getattr(p, "company", None),
-                                "permalink": getattr(p, "permalink", None),
-                                "text": p.text[:500] if p.text else "",  # Truncate for SSE
-                                "published_at": p.published_at.isoformat() if p.published_at else None,
-                                "collected_at": p.collected_at.isoformat() if p.collected_at else None,
-                                "metier": getattr(p, "keywords_matched", [None])[0] if getattr(p, "keywords_matched", None) else None,
-                            }
-                        })
-                    except Exception:
-                        pass
+            _debug_log(f"classification done: {len(classified)} accepted, {discarded_intent} discarded_intent, {discarded_location} discarded_location, {inserted} inserted")
+            all_new = classified
             # Count unknown authors
             for p in all_new:
                 if p.author == "Unknown":
                     unknown_count += 1
-            # storage already executed above
 
         SCRAPE_JOBS_TOTAL.labels(status="success").inc()
         SCRAPE_POSTS_EXTRACTED.inc(len(all_new))
@@ -2577,7 +2672,7 @@ async def run_with_lock(ctx: AppContext):
 # ------------------------------------------------------------
 # Main worker loop
 # ------------------------------------------------------------
-async def worker_loop() -> None:
+async def _worker_loop() -> None:
     ctx = await get_context()
     logger = ctx.logger.bind(component="worker")
     logger.info("worker_started")
@@ -2953,6 +3048,14 @@ async def worker_loop() -> None:
             await asyncio.sleep(1)
 
 
+async def worker_loop() -> None:
+    try:
+        await _worker_loop()
+    finally:
+        # Don't leave the scraper server (and its browser) behind
+        await shutdown_scrape_supervisor()
+
+
 # Entry point
 if __name__ == "__main__":  # pragma: no cover
     asyncio.run(worker_loop())
@@ -1,8 +1,9 @@
 """Backfill missing company field for legacy posts in SQLite.
 
-Heuristics reuse the server.routes _derive_company function to maintain
+Heuristics reuse scraper.display_fields.derive_company to maintain
 consistency with display logic. This script is idempotent and only updates
-rows where company IS NULL or empty.
+rows where company IS NULL or empty; the stored display columns of the
+updated rows (company_display, company_slug, ...) are recomputed afterwards.
 
 Usage (PowerShell):
   python -m scripts.backfill_company
@@ -14,7 +15,8 @@ from pathlib import Path
 from typing import Any
 
 from scraper.bootstrap import get_context
-from server.routes import _derive_company as derive_company  # type: ignore
+from scraper.display_fields import backfill_display_fields, derive_company
+from scraper.repository import get_repository
 
 
 def main() -> None:
@@ -28,6 +30,7 @@ async def run():
     if not path or not Path(path).exists():
         print("[backfill_company] Aucune base SQLite trouvée.")
         return
+    repo = get_repository(path, pool_size=ctx.settings.sqlite_pool_size)  # schema migrations (display columns)
     conn = sqlite3.connect(path)
     conn.row_factory = sqlite3.Row
     updated = 0
@@ -43,9 +46,13 @@ async def run():
             text = r["text"] or ""
             comp = derive_company(author, prof, text)
             if comp:
-                conn.execute("UPDATE posts SET company=? WHERE id=?", (comp, r["id"]))
+                # display_version=NULL: company_display / company_slug are refreshed below
+                conn.execute("UPDATE posts SET company=?, display_version=NULL WHERE id=?", (comp, r["id"]))
                 updated += 1
-    print(f"[backfill_company] Terminé. Lignes scannées={scanned} mises_a_jour={updated}")
+    conn.close()
+    with repo.connection() as conn:
+        refreshed = backfill_display_fields(conn, opportunity_threshold=ctx.settings.recruitment_signal_threshold)
+    print(f"[backfill_company] Terminé. Lignes scannées={scanned} mises_a_jour={updated} affichage_recalculé={refreshed}")
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -0,0 +1,47 @@
+"""Backfill stored display fields (company_display, status, metier, opportunity, permalink_canonical).
+
+Only rows whose display_version is missing or older than
+scraper.display_fields.DISPLAY_FIELDS_VERSION are recomputed, unless --force.
+The dashboard also runs this once at startup in the background.
+
+Usage (PowerShell):
+  python scripts/backfill_display_fields.py
+  # or specify a custom DB path / recompute everything
+  python scripts/backfill_display_fields.py --db .\\fallback.sqlite3 --force
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import Optional
+
+import sys
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scraper.display_fields import DISPLAY_FIELDS_VERSION, backfill_display_fields
+from scraper.repository import get_repository
+
+
+def backfill(db_path: Path, threshold: float, force: bool = False) -> int:
+    with get_repository(str(db_path)).connection() as conn:
+        return backfill_display_fields(conn, opportunity_threshold=threshold, force=force)
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--db", default="fallback.sqlite3", help="SQLite database path")
+    ap.add_argument("--threshold", type=float, default=0.20, help="Opportunity threshold (RECRUITMENT_SIGNAL_THRESHOLD)")
+    ap.add_argument("--force", action="store_true", help="Recompute every row, not only stale ones")
+    args = ap.parse_args(argv)
+    db_path = Path(args.db)
+    if not db_path.exists():
+        print(f"DB not found: {db_path}")
+        return
+    n = backfill(db_path, args.threshold, force=args.force)
+    print(f"backfill_display_fields_done updated={n} version={DISPLAY_FIELDS_VERSION} path={db_path}")
+
+
+if __name__ == "__main__":
+    main()
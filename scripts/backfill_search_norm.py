@@ -1,4 +1,8 @@
-"""Backfill accent-insensitive search_norm for existing SQLite rows and ensure indices.
+"""Backfill accent-insensitive search_norm for existing SQLite rows and rebuild the FTS index.
+
+Opening the database through scraper.repository applies pending migrations
+(indexes, posts_fts table and its sync triggers); this script then fills any
+remaining empty search_norm values and re-indexes posts_fts from scratch.
 
 Usage (PowerShell):
   python scripts/backfill_search_norm.py
@@ -8,7 +12,6 @@ Usage (PowerShell):
 from __future__ import annotations
 
 import argparse
-import sqlite3
 from pathlib import Path
 from typing import Optional
 
@@ -17,36 +20,13 @@ PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from scraper.utils import build_search_norm
+from scraper.repository import backfill_search_norm, get_repository, rebuild_search_index
 
 
 def backfill(db_path: Path) -> int:
-    conn = sqlite3.connect(str(db_path))
-    updated = 0
-    with conn:
-        # Ensure column exists
-        try:
-            cols = [r[1] for r in conn.execute("PRAGMA table_info(posts)").fetchall()]
-            if "search_norm" not in cols:
-                conn.execute("ALTER TABLE posts ADD COLUMN search_norm TEXT")
-        except Exception:
-            pass
-        # Create helpful indices
-        try:
-            conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS uniq_posts_permalink ON posts(permalink) WHERE permalink IS NOT NULL")
-        except Exception:
-            pass
-        try:
-            conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS uniq_posts_author_published ON posts(author, published_at) WHERE author IS NOT NULL AND published_at IS NOT NULL")
-        except Exception:
-            pass
-        # Iterate rows missing search_norm or with empty value
-        cur = conn.execute("SELECT id, text, author, company, keyword FROM posts WHERE search_norm IS NULL OR LENGTH(search_norm) = 0")
-        rows = cur.fetchall()
-        for (pid, text, author, company, keyword) in rows:
-            norm = build_search_norm(text, author, company, keyword)
-            conn.execute("UPDATE posts SET search_norm = ? WHERE id = ?", (norm, pid))
-            updated += 1
+    with get_repository(str(db_path)).connection() as conn:
+        updated = backfill_search_norm(conn)
+        rebuild_search_index(conn)
     return updated
 
 
@@ -0,0 +1,305 @@
+"""Filter micro-benchmark: replay a fixed corpus through every post filter.
+
+The corpus is deterministic: the long post texts found in the filter tests
+(``tests/test_legal_filter*.py``, ``test_unified_filter.py``, ...) plus
+synthetic variants built from labelled templates (legal recruitment, stage,
+agency, job seeker, legal news, off-topic). Each filter is replayed over the
+whole corpus and reported as posts/sec, p50/p99 latency and allocations
+(tracemalloc peak over a sample, measured in a separate pass so it does not
+skew the timings).
+
+Memoizing layers are bypassed so a run measures the filters themselves:
+``classify_legal_post`` and ``UnifiedFilterConfig.classify_post`` are called
+without the classification cache, and the corpus is larger than the
+normalized-view caches.
+
+Usage:
+  python scripts/bench_filters.py                     # compare to the stored baseline
+  python scripts/bench_filters.py --update-baseline   # record this machine's numbers
+  python scripts/bench_filters.py --size 500 --json
+
+Exit status is 1 when a filter's throughput drops more than --tolerance
+(default 30%) below scripts/bench_filters_baseline.json.
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import random
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+BASELINE_PATH = Path(__file__).with_name("bench_filters_baseline.json")
+DEFAULT_SIZE = 3000
+DEFAULT_TOLERANCE = 0.30
+ALLOC_SAMPLE = 200
+DEFAULT_ROUNDS = 3
+_FIXTURE_GLOBS = ("test_legal_filter*.py", "test_unified_filter.py", "test_legal_classification.py",
+                  "test_recruitment_*.py", "test_filters_improved.py")
+
+
+# =============================================================================
+# CORPUS
+# =============================================================================
+
+@dataclass(frozen=True)
+class BenchPost:
+    text: str
+    author: str = ""
+    company: str = ""
+    label: Optional[str] = None  # template family; None for texts taken from the tests
+
+
+_ROLES = ["juriste droit social", "avocat collaborateur", "juriste contrats", "responsable juridique",
+          "paralegal", "notaire assistant", "juriste corporate", "directeur juridique", "legal counsel",
+          "juriste contentieux", "compliance officer", "clerc de notaire"]
+_CITIES = ["Paris", "Lyon", "Bordeaux", "Nantes", "Lille", "Marseille", "La Défense", "Toulouse"]
+_COMPANIES = ["ACME", "Groupe Bel", "Saint-Gobain", "Cabinet Martin & Associés", "Etude Durand", "Orange"]
+_TEMPLATES: Dict[str, List[str]] = {
+    "recruitment": [
+        "Nous recrutons un(e) {role} en CDI à {city} ! Rattaché(e) à la direction juridique, vous "
+        "accompagnerez nos équipes opérationnelles. Poste à pourvoir immédiatement, envoyez votre CV.",
+        "🚀 {company} recrute : {role} (H/F) - CDI - {city}. Profil recherché : 3 à 5 ans d'expérience. "
+        "Postulez via le lien en commentaire #recrutement #juriste",
+        "Je recrute un {role} pour renforcer notre équipe à {city}. Missions principales : rédaction, "
+        "négociation et suivi des contrats. Temps plein, prise de poste dès que possible.",
+    ],
+    "stage": [
+        "Offre de stage : {role} stagiaire pour 6 mois à {city}, stage de fin d'études M2 droit des affaires.",
+        "Nous cherchons un alternant {role} en contrat d'apprentissage à {city} pour la rentrée.",
+    ],
+    "agency": [
+        "Pour le compte de notre client, un groupe international basé à {city}, nous recherchons un "
+        "{role} en CDI. Cabinet de recrutement spécialisé juridique, contactez-moi en MP.",
+        "Michael Page recrute pour son client un {role} H/F à {city}. Mission de chasse confidentielle.",
+    ],
+    "jobseeker": [
+        "#OpenToWork Je suis à la recherche d'un poste de {role} à {city}, disponible immédiatement. "
+        "N'hésitez pas à me contacter ou à partager !",
+    ],
+    "news": [
+        "Veille juridique : la réforme du droit des contrats et ses conséquences pour le {role}. "
+        "Retrouvez notre article de blog et notre webinaire du mois prochain à {city}.",
+        "Ravie d'annoncer que je rejoins {company} en tant que {role} à {city} ! Merci à toute l'équipe.",
+    ],
+    "offtopic": [
+        "Belle journée à {city} pour notre séminaire d'équipe chez {company}, merci à tous !",
+        "{company} recrute un développeur Python senior en CDI à {city}, stack Django et Kubernetes.",
+    ],
+}
+_NOISE = ["", " Merci de partager.", " #emploi #droit", " 👉 lien en commentaire", " (poste basé à {city})",
+          " Télétravail 2 jours par semaine.", " Rémunération selon profil."]
+
+
+def fixture_texts(tests_dir: Path = PROJECT_ROOT / "tests", min_length: int = 60) -> List[str]:
+    """Post-like string literals found in the filter test modules."""
+    texts: List[str] = []
+    seen = set()
+    for pattern in _FIXTURE_GLOBS:
+        for path in sorted(tests_dir.glob(pattern)):
+            try:
+                tree = ast.parse(path.read_text(encoding="utf-8"))
+            except (OSError, SyntaxError):
+                continue
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Constant) and isinstance(node.value, str):
+                    text = node.value.strip()
+                    if len(text) >= min_length and " " in text and text not in seen and '"""' not in text:
+                        seen.add(text)
+                        texts.append(text)
+    return texts
+
+
+def build_corpus(size: int = DEFAULT_SIZE, seed: int = 1234) -> List[BenchPost]:
+    """Fixture texts first, then labelled synthetic variants up to ``size`` posts (all distinct)."""
+    rng = random.Random(seed)
+    posts = [BenchPost(text) for text in fixture_texts()][: size // 4]
+    seen = {p.text for p in posts}
+    families = list(_TEMPLATES)
+    while len(posts) < size:
+        label = rng.choice(families)
+        fields = {"role": rng.choice(_ROLES), "city": rng.choice(_CITIES), "company": rng.choice(_COMPANIES)}
+        text = rng.choice(_TEMPLATES[label]).format(**fields)
+        text += "".join(rng.sample(_NOISE, 2)).format(**fields)
+        text += f" Réf. {rng.randrange(10**6):06d}"
+        if text in seen:
+            continue
+        seen.add(text)
+        author = rng.choice(["Marie Dupont", "Jean Martin", "Talent Acquisition", fields["company"]])
+        posts.append(BenchPost(text, author=author, company=fields["company"], label=label))
+    return posts
+
+
+# =============================================================================
+# TARGETS
+# =============================================================================
+
+def _targets() -> Dict[str, Callable[[BenchPost], object]]:
+    from filters.unified import UnifiedFilterConfig
+    from scraper import legal_classifier
+    from scraper.legal_filter import FilterConfig, is_legal_job_post
+    from scraper.linkedin import LinkedInPostAnalyzer
+    from scraper.pre_qualifier import pre_qualify_post
+
+    filter_config = FilterConfig(verbose=False)
+    unified = UnifiedFilterConfig()
+    analyzer = LinkedInPostAnalyzer()
+    return {
+        "is_legal_job_post": lambda p: is_legal_job_post(p.text, log_exclusions=False, config=filter_config),
+        # Uncached body of classify_legal_post
+        "classify_legal_post": lambda p: legal_classifier._classify(p.text, "fr", 0.35),
+        "pre_qualify_post": lambda p: pre_qualify_post(p.text[:150], p.author, p.company or None),
+        # The method is not memoized (only the module-level classify_post is)
+        "unified.classify_post": lambda p: unified.classify_post(p.text, p.author, p.company),
+        "LinkedInPostAnalyzer.analyze_post": lambda p: analyzer.analyze_post(p.text, p.author, company_name=p.company),
+    }
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+@dataclass
+class BenchResult:
+    name: str
+    posts: int
+    posts_per_sec: float
+    p50_us: float
+    p99_us: float
+    alloc_peak_kib: float
+    accepted: int
+
+
+def _percentile(sorted_values: List[int], q: float) -> float:
+    idx = min(len(sorted_values) - 1, int(round(q * (len(sorted_values) - 1))))
+    return sorted_values[idx] / 1000.0
+
+
+def _accepted(result: object) -> bool:
+    for attr in ("is_valid", "is_relevant", "should_extract"):
+        value = getattr(result, attr, None)
+        if isinstance(value, bool):
+            return value
+    relevance = getattr(result, "relevance", None)
+    if relevance is not None:  # PostAnalysisResult, as in linkedin.is_relevant_for_titan
+        return relevance.name in ("HIGH", "MEDIUM")
+    return getattr(result, "intent", None) == "recherche_profil"
+
+
+def _timed_pass(fn: Callable[[BenchPost], object], corpus: List[BenchPost]) -> Tuple[float, List[int], int]:
+    timings: List[int] = []
+    accepted = 0
+    clock = time.perf_counter_ns
+    start = clock()
+    for post in corpus:
+        t0 = clock()
+        result = fn(post)
+        timings.append(clock() - t0)
+        accepted += _accepted(result)
+    return (clock() - start) / 1e9, timings, accepted
+
+
+def bench_one(name: str, fn: Callable[[BenchPost], object], corpus: List[BenchPost],
+              rounds: int = DEFAULT_ROUNDS) -> BenchResult:
+    """Best of ``rounds`` passes (the least disturbed by other processes)."""
+    for post in corpus[:20]:  # warm imports / lazily built automata
+        fn(post)
+    elapsed, timings, accepted = min(
+        (_timed_pass(fn, corpus) for _ in range(max(1, rounds))), key=lambda r: r[0]
+    )
+    timings.sort()
+
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        for post in corpus[-ALLOC_SAMPLE:]:
+            fn(post)
+        peak = tracemalloc.get_traced_memory()[1] - base
+    finally:
+        tracemalloc.stop()
+
+    return BenchResult(
+        name=name,
+        posts=len(corpus),
+        posts_per_sec=len(corpus) / elapsed if elapsed else 0.0,
+        p50_us=_percentile(timings, 0.50),
+        p99_us=_percentile(timings, 0.99),
+        alloc_peak_kib=max(peak, 0) / 1024.0,
+        accepted=accepted,
+    )
+
+
+def run(corpus: List[BenchPost], only: Optional[List[str]] = None, rounds: int = DEFAULT_ROUNDS) -> List[BenchResult]:
+    return [bench_one(name, fn, corpus, rounds) for name, fn in _targets().items() if not only or name in only]
+
+
+def compare(results: List[BenchResult], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """Names of the filters whose throughput regressed past ``tolerance``."""
+    regressions = []
+    for r in results:
+        ref = baseline.get(r.name, {}).get("posts_per_sec")
+        if ref and r.posts_per_sec < ref * (1.0 - tolerance):
+            regressions.append(f"{r.name}: {r.posts_per_sec:.0f} posts/s < {ref:.0f} baseline (-{tolerance:.0%})")
+    return regressions
+
+
+def _print_table(results: List[BenchResult], baseline: Dict[str, dict]) -> None:
+    print(f"{'filter':36} {'posts/s':>10} {'vs base':>8} {'p50 us':>9} {'p99 us':>9} {'alloc KiB':>10} {'kept':>6}")
+    for r in results:
+        ref = baseline.get(r.name, {}).get("posts_per_sec")
+        delta = f"{(r.posts_per_sec / ref - 1):+.0%}" if ref else "-"
+        print(f"{r.name:36} {r.posts_per_sec:10.0f} {delta:>8} {r.p50_us:9.1f} {r.p99_us:9.1f} "
+              f"{r.alloc_peak_kib:10.1f} {r.accepted:6d}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark the post filters on a fixed corpus")
+    ap.add_argument("--size", type=int, default=DEFAULT_SIZE, help="Corpus size (posts)")
+    ap.add_argument("--only", action="append", help="Benchmark only this filter (repeatable)")
+    ap.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="Timed passes per filter (best is kept)")
+    ap.add_argument("--baseline", default=str(BASELINE_PATH), help="Baseline JSON path")
+    ap.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed throughput drop (0.30 = 30%%)")
+    ap.add_argument("--update-baseline", action="store_true", help="Write this run as the new baseline")
+    ap.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = ap.parse_args(argv)
+
+    corpus = build_corpus(args.size)
+    results = run(corpus, args.only, args.rounds)
+    baseline_path = Path(args.baseline)
+    baseline: Dict[str, dict] = {}
+    if baseline_path.exists():
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8")).get("filters", {})
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+    else:
+        _print_table(results, baseline)
+
+    if args.update_baseline:
+        payload = {
+            "corpus_size": len(corpus),
+            "filters": {r.name: {k: round(v, 1) if isinstance(v, float) else v for k, v in asdict(r).items()}
+                        for r in results},
+        }
+        baseline_path.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline written: {baseline_path}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
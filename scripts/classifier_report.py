@@ -3,15 +3,26 @@
 
 Reads recent posts from SQLite and prints a summary suitable for adding to a GitHub Issue comment.
 
+Usage:
+  python scripts/classifier_report.py [--rescore] [--workers N]
+
+--rescore : re-classify every stored post with the current classifier (in
+            parallel, see scraper.batch_runner) instead of reading the stored
+            intent / relevance columns; REPORT_LIMIT does not apply.
+
 Environment overrides:
   - REPORT_LIMIT (default 500)
   - SQLITE_PATH (database path)
 """
 from __future__ import annotations
-import os, json, sqlite3, statistics
+import argparse, os, sys, json, sqlite3, statistics
 from datetime import datetime, timezone
 from typing import Any
 
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
 REPORT_LIMIT = int(os.environ.get("REPORT_LIMIT", "500"))
 SQLITE_PATH = os.environ.get("SQLITE_PATH", "fallback.sqlite3")
 
@@ -35,6 +46,50 @@ def _fetch_from_sqlite(limit: int) -> list[dict[str, Any]]:
     return result
 
 
+def classify_rows(rows: list[tuple]) -> list[dict[str, Any]]:
+    """Re-classify (rowid, id, text, language) rows (runs in batch_runner workers)."""
+    from scraper.legal_classifier import classify_legal_post
+
+    docs = []
+    for _rowid, pid, text, language in rows:
+        result = classify_legal_post(text or "", language=language or "fr")
+        docs.append({"id": pid, "intent": result.intent, "relevance_score": result.relevance_score})
+    return docs
+
+
+def _rescore_from_sqlite(workers: int | None, chunk_size: int) -> list[dict[str, Any]]:
+    from scraper.batch_runner import run_batches
+
+    if not os.path.exists(SQLITE_PATH):
+        return []
+    conn = sqlite3.connect(SQLITE_PATH)
+    cols = [r[1] for r in conn.execute("PRAGMA table_info(posts)").fetchall()]
+    if "text" not in cols:
+        conn.close()
+        return []
+    language = "language" if "language" in cols else "NULL"
+    docs: list[dict[str, Any]] = []
+
+    def _collect(_conn: sqlite3.Connection, chunk: list[dict[str, Any]]) -> int:
+        docs.extend(chunk)
+        return 0
+
+    try:
+        run_batches(
+            SQLITE_PATH,
+            f"SELECT rowid, id, text, {language} FROM posts WHERE rowid > :after ORDER BY rowid LIMIT :limit",
+            score=classify_rows,
+            write=_collect,
+            workers=workers,
+            chunk_size=chunk_size,
+            label="classifier_report",
+            conn=conn,
+        )
+    finally:
+        conn.close()
+    return docs
+
+
 def _summarize(docs: list[dict[str, Any]]) -> dict[str, Any]:
     intents = {}
     scores = []
@@ -57,12 +112,29 @@ def _summarize(docs: list[dict[str, Any]]) -> dict[str, Any]:
     }
 
 
-def main():
-    docs = _fetch_from_sqlite(REPORT_LIMIT)
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Classifier rejection ratio and intent distribution")
+    p.add_argument("--rescore", action="store_true", help="Re-classify every stored post instead of reading stored intents")
+    p.add_argument("--workers", type=int, default=None, help="Classifier processes for --rescore (default: BATCH_WORKERS or CPU count)")
+    p.add_argument("--chunk-size", type=int, default=500, help="Posts per batch for --rescore")
+    return p.parse_args(argv)
+
+
+def main(argv: list[str] | None = None):
+    args = parse_args(argv)
+    if args.rescore:
+        import structlog
+
+        # Keep stdout for the JSON payload
+        structlog.configure(logger_factory=structlog.PrintLoggerFactory(sys.stderr))
+        docs = _rescore_from_sqlite(args.workers, args.chunk_size)
+    else:
+        docs = _fetch_from_sqlite(REPORT_LIMIT)
     summary = _summarize(docs)
     payload = {
         "generated_at": datetime.now(timezone.utc).isoformat(),
-        "limit": REPORT_LIMIT,
+        "limit": None if args.rescore else REPORT_LIMIT,
+        "rescored": args.rescore,
         **summary,
     }
     print(json.dumps(payload, ensure_ascii=False, indent=2))
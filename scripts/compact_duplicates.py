@@ -0,0 +1,41 @@
+"""Remove duplicate posts left over from before write-time deduplication.
+
+Posts are grouped by scraper.display_fields.dedup_key (canonical permalink,
+else author + publication date, else author + content hash); one row per group
+is kept, preferring favorites, then the earliest collected. New inserts are
+already deduplicated by the uniq_posts_dedup_key index, so this is a one-off.
+
+Usage (PowerShell):
+  python scripts/compact_duplicates.py --dry-run
+  python scripts/compact_duplicates.py --db .\\fallback.sqlite3
+"""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+from typing import Optional
+
+import sys
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scraper.maintenance import compact_duplicate_posts
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--db", default="fallback.sqlite3", help="SQLite database path")
+    ap.add_argument("--threshold", type=float, default=0.20, help="Opportunity threshold (RECRUITMENT_SIGNAL_THRESHOLD)")
+    ap.add_argument("--dry-run", action="store_true", help="Only count the rows that would be removed")
+    args = ap.parse_args(argv)
+    db_path = Path(args.db)
+    if not db_path.exists():
+        print(f"DB not found: {db_path}")
+        return
+    n = compact_duplicate_posts(str(db_path), opportunity_threshold=args.threshold, dry_run=args.dry_run)
+    print(f"compact_duplicates_done removed={n} dry_run={args.dry_run} path={db_path}")
+
+
+if __name__ == "__main__":
+    main()
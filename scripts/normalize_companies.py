@@ -1,21 +1,26 @@
 """Backfill / normalization script to derive missing companies for existing posts.
 
 Usage:
-  python scripts/normalize_companies.py
+  python scripts/normalize_companies.py [--workers N] [--chunk-size N]
 
 It will:
   * Open SQLite DB (ctx.settings.sqlite_path)
   * For posts where company is NULL/empty OR equals author (case-insensitive), attempt derivation
-  * Update inline (in-place) and print a small summary
+  * Derive in parallel (--workers processes, rows streamed in chunks) and update
+    in place through a single writer, printing progress and a small summary
+  * Recompute the stored display columns (company_display, company_slug, ...)
+    of the updated rows
 
 Safe: skips rows where no heuristic result.
 """
 from __future__ import annotations
-import os, json, sqlite3
+import argparse, json, sqlite3
 from pathlib import Path
-from datetime import datetime
 
+from scraper.batch_runner import DEFAULT_CHUNK_SIZE, run_batches
 from scraper.bootstrap import get_context
+from scraper.display_fields import backfill_display_fields
+from scraper.repository import get_repository
 
 # Reuse a simplified version of the heuristic (mirrors server.routes._derive_company)
 
@@ -74,37 +79,71 @@ def derive_company(author: str, current: str | None, author_profile: str | None,
         return current
     return current
 
+_SELECT_POSTS = (
+    "SELECT rowid, id, author, company, text, author_profile FROM posts"
+    " WHERE rowid > :after ORDER BY rowid LIMIT :limit"
+)
+
+
+def _needs_company(author: str, company: str | None) -> bool:
+    return not (company and company.strip() and company.strip().lower() != author.strip().lower())
+
+
+def derive_rows(rows: list[tuple]) -> list[tuple[str, str]]:
+    """(company, id) updates for a chunk of posts (runs in batch_runner workers)."""
+    updates: list[tuple[str, str]] = []
+    for _rowid, pid, author, company, text, author_profile in rows:
+        author = author or ""
+        if not author or not _needs_company(author, company):
+            continue  # no author or already distinct
+        derived = derive_company(author, company, author_profile, text)
+        if derived:
+            updates.append((derived, pid))
+    return updates
+
+
+def _write_companies(conn: sqlite3.Connection, updates: list[tuple[str, str]]) -> int:
+    # display_version=NULL: the display columns derived from company are refreshed afterwards
+    conn.executemany("UPDATE posts SET company=?, display_version=NULL WHERE id=?", updates)
+    return len(updates)
+
+
+def parse_args() -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Derive missing companies for stored posts")
+    p.add_argument("--workers", type=int, default=None, help="Derivation processes (default: BATCH_WORKERS or CPU count)")
+    p.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Posts per batch")
+    return p.parse_args()
+
+
 async def main():
+    args = parse_args()
     ctx = await get_context()
     path = ctx.settings.sqlite_path
     if not path or not Path(path).exists():
         print("[normalize] No sqlite DB found")
         return
+    repo = get_repository(path, pool_size=ctx.settings.sqlite_pool_size)  # schema migrations (display columns)
     conn = sqlite3.connect(path)
-    conn.row_factory = sqlite3.Row
-    updated = 0
-    scanned = 0
-    with conn:
+    try:
         # Add company column if missing (defensive)
         try: conn.execute("ALTER TABLE posts ADD COLUMN company TEXT")
         except Exception: pass
-        cur = conn.execute("SELECT id, author, company, text, author_profile FROM posts")
-        rows = cur.fetchall()
-        for r in rows:
-            scanned += 1
-            author = r["author"] or ""
-            company = r["company"]
-            text = r["text"]
-            author_profile = r["author_profile"]
-            if not author:
-                continue
-            if company and company.strip() and company.strip().lower() != author.strip().lower():
-                continue  # already distinct
-            derived = derive_company(author, company, author_profile, text)
-            if derived and (not company or company.strip().lower()==author.strip().lower()):
-                conn.execute("UPDATE posts SET company=? WHERE id=?", (derived, r["id"]))
-                updated += 1
-    print(f"[normalize] scanned={scanned} updated={updated} path={path}")
+        stats = run_batches(
+            path,
+            _SELECT_POSTS,
+            score=derive_rows,
+            write=_write_companies,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            label="normalize",
+            conn=conn,
+        )
+    finally:
+        conn.close()
+    with repo.connection() as conn:
+        refreshed = backfill_display_fields(conn, opportunity_threshold=ctx.settings.recruitment_signal_threshold)
+    print(f"[normalize] scanned={stats.rows} updated={stats.written} display_refreshed={refreshed} "
+          f"workers={stats.workers} rate={stats.rows_per_sec:.0f}/s path={path}")
 
 if __name__ == "__main__":
     import asyncio
@@ -2,9 +2,10 @@
 """CLI script to recompute recruitment_score across storage backends.
 
 Usage:
-  python scripts/recompute_recruitment_scores.py [--force]
+  python scripts/recompute_recruitment_scores.py [--force] [--workers N]
 
---force : overwrite existing non-null scores.
+--force   : rescore every row, including rows already at the current score version.
+--workers : processes scoring SQLite batches (default: BATCH_WORKERS or CPU count).
 
 The script will recompute scores in SQLite and CSV backends.
 Logs are structured via structlog.
@@ -21,20 +22,23 @@ PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
+from scraper.batch_runner import default_workers, print_progress
 from scraper.maintenance import recompute_all
 
 
 def parse_args() -> argparse.Namespace:
     p = argparse.ArgumentParser(description="Recompute recruitment_score for stored posts")
-    p.add_argument("--force", action="store_true", help="Overwrite existing scores")
+    p.add_argument("--force", action="store_true", help="Rescore rows already at the current score version")
+    p.add_argument("--workers", type=int, default=None, help="Scoring processes (default: BATCH_WORKERS or CPU count)")
     return p.parse_args()
 
 
 async def _main():
     args = parse_args()
     logger = structlog.get_logger().bind(script="recompute_recruitment_scores")
-    logger.info("start", force=args.force)
-    await recompute_all(force=args.force)
+    workers = args.workers or default_workers()
+    logger.info("start", force=args.force, workers=workers)
+    await recompute_all(force=args.force, workers=workers, progress=print_progress)
     logger.info("end")
 
 
@@ -0,0 +1,245 @@
+"""Offline replay of captured search result pages through the extraction pipeline.
+
+Each HTML snapshot (``tests/fixtures/*.html`` by default, or any files /
+directories given on the command line) is loaded into local headless Chromium
+and run through the same steps as a live scrape, without any network access
+(every http(s) request made by the page is aborted):
+
+  load             page.set_content of the snapshot (stands in for the search page wait)
+  extraction       the single in-page evaluate (EXTRACT_POSTS_JS)
+  prequalify       record cleaning + pre-qualification (parse_post_records)
+  dedup            author/text hash, as the subprocess does without the post cache
+  filter_language  language filter (screen_post)
+  filter_titan     Titan Partners filters (screen_post)
+  storage          conversion to Post and the worker's SQLite insert
+
+and reports pages/sec, posts/sec (extracted records per second) and how the
+wall time splits across those stages (same stage names as the
+scrape_stage_duration_seconds metric). Storage goes to a throw-away SQLite
+file unless --sqlite is given.
+
+Usage:
+  python scripts/replay_fixtures.py                        # tests/fixtures, 1 round
+  python scripts/replay_fixtures.py snapshots/ --rounds 20
+  python scripts/replay_fixtures.py page1.html page2.html --keyword "avocat" --json
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from scraper.result_stream import StageSpans  # noqa: E402
+
+DEFAULT_FIXTURES_DIR = PROJECT_ROOT / "tests" / "fixtures"
+DEFAULT_KEYWORD = "juriste"
+STAGES = ("load", "extraction", "prequalify", "dedup", "filter_language", "filter_titan", "storage")
+
+
+# =============================================================================
+# SNAPSHOTS
+# =============================================================================
+
+def load_snapshots(paths: Sequence[Path]) -> List[Tuple[str, str]]:
+    """(name, html) for every file given, directories expanded to their ``*.html``."""
+    snapshots: List[Tuple[str, str]] = []
+    for path in paths:
+        files = sorted(path.glob("*.html")) if path.is_dir() else [path]
+        for f in files:
+            snapshots.append((f.name, f.read_text(encoding="utf-8")))
+    return snapshots
+
+
+# =============================================================================
+# PIPELINE
+# =============================================================================
+
+@dataclass
+class ReplayResult:
+    pages: int = 0
+    records: int = 0
+    parsed: int = 0
+    accepted: int = 0
+    stored: int = 0
+    elapsed: float = 0.0
+    stages: Dict[str, float] = field(default_factory=dict)
+    rejected: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def pages_per_sec(self) -> float:
+        return self.pages / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def posts_per_sec(self) -> float:
+        return self.records / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> dict:
+        data = asdict(self)
+        data["pages_per_sec"] = round(self.pages_per_sec, 2)
+        data["posts_per_sec"] = round(self.posts_per_sec, 2)
+        return data
+
+
+def process_records(
+    records: List[dict],
+    keyword: str,
+    spans: StageSpans,
+    result: ReplayResult,
+    seen: Set[str],
+    apply_titan_filter: bool = True,
+) -> List[dict]:
+    """Pre-qualify, deduplicate and filter one page's records; returns the accepted posts."""
+    from scraper.scrape_subprocess import (
+        MAX_POST_CONTAINERS,
+        get_post_hash,
+        parse_post_records,
+        rejection_stat_key,
+        screen_post,
+    )
+
+    result.records += len(records)
+    with spans.span("prequalify"):
+        posts = parse_post_records(records, keyword, max_items=MAX_POST_CONTAINERS)
+    result.parsed += len(posts)
+
+    unique: List[dict] = []
+    with spans.span("dedup"):
+        for post in posts:
+            post_hash = get_post_hash(post)
+            if post_hash in seen:
+                result.rejected["rejected_duplicate"] = result.rejected.get("rejected_duplicate", 0) + 1
+                continue
+            seen.add(post_hash)
+            unique.append(post)
+
+    accepted: List[dict] = []
+    for post in unique:
+        is_valid, reason = screen_post(post, apply_titan_filter, spans=spans)
+        if is_valid:
+            accepted.append(post)
+            continue
+        key = "rejected_non_french" if reason == "NON_FRENCH" else rejection_stat_key(reason)
+        result.rejected[key] = result.rejected.get(key, 0) + 1
+    result.accepted += len(accepted)
+    return accepted
+
+
+def store(posts: List[dict], settings, spans: StageSpans, result: ReplayResult) -> int:
+    """Insert accepted raw posts the way the worker does (Post conversion + SQLite)."""
+    if not posts:
+        return 0
+    import structlog
+
+    from scraper import worker
+
+    with spans.span("storage"):
+        inserted = worker._store_sqlite(settings, worker._posts_from_subprocess(posts, structlog.get_logger()))
+    result.stored += inserted
+    return inserted
+
+
+async def _block_network(route) -> None:
+    await route.abort()
+
+
+async def replay(
+    snapshots: List[Tuple[str, str]],
+    sqlite_path: str,
+    keyword: str = DEFAULT_KEYWORD,
+    rounds: int = 1,
+    apply_titan_filter: bool = True,
+) -> ReplayResult:
+    """Run every snapshot ``rounds`` times through the pipeline in headless Chromium."""
+    from playwright.async_api import async_playwright
+
+    from scraper.bootstrap import Settings
+    from scraper.scrape_subprocess import EXTRACT_POSTS_JS, extract_posts_js_args
+
+    settings = Settings()
+    settings.sqlite_path = sqlite_path  # type: ignore[attr-defined]
+    spans = StageSpans()
+    result = ReplayResult()
+    js_args = extract_posts_js_args()
+
+    async with async_playwright() as pw:
+        browser = await pw.chromium.launch(headless=True)
+        try:
+            page = await browser.new_page()
+            await page.route("http*://**/*", _block_network)
+            start = time.perf_counter()
+            for _ in range(max(1, rounds)):
+                seen: Set[str] = set()
+                for _name, html in snapshots:
+                    with spans.span("load"):
+                        await page.set_content(html, wait_until="domcontentloaded")
+                    with spans.span("extraction"):
+                        records = await page.evaluate(EXTRACT_POSTS_JS, js_args) or []
+                    accepted = process_records(records, keyword, spans, result, seen, apply_titan_filter)
+                    store(accepted, settings, spans, result)
+                    result.pages += 1
+            result.elapsed = time.perf_counter() - start
+        finally:
+            await browser.close()
+    result.stages = {stage: 0.0 for stage in STAGES}
+    result.stages.update(spans.pop())
+    return result
+
+
+# =============================================================================
+# REPORT
+# =============================================================================
+
+def _print_report(result: ReplayResult) -> None:
+    print(f"pages {result.pages}  records {result.records}  parsed {result.parsed}  "
+          f"accepted {result.accepted}  stored {result.stored}")
+    print(f"{result.elapsed:.3f}s  {result.pages_per_sec:.1f} pages/s  {result.posts_per_sec:.1f} posts/s")
+    total = sum(result.stages.values()) or 1.0
+    print(f"{'stage':12} {'seconds':>9} {'share':>7}")
+    for name, seconds in result.stages.items():
+        print(f"{name:12} {seconds:9.4f} {seconds / total:7.1%}")
+    if result.rejected:
+        print("rejected: " + ", ".join(f"{k}={v}" for k, v in sorted(result.rejected.items())))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    ap = argparse.ArgumentParser(description="Replay captured search result pages through the extraction pipeline")
+    ap.add_argument("paths", nargs="*", type=Path, help="HTML snapshots or directories (default: tests/fixtures)")
+    ap.add_argument("--keyword", default=DEFAULT_KEYWORD, help="Keyword attached to the extracted posts")
+    ap.add_argument("--rounds", type=int, default=1, help="Times every snapshot is replayed")
+    ap.add_argument("--no-titan-filter", action="store_true", help="Language filter only (apply_titan_filter=False)")
+    ap.add_argument("--sqlite", help="SQLite file to store into (default: a temporary file)")
+    ap.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = ap.parse_args(argv)
+
+    snapshots = load_snapshots(args.paths or [DEFAULT_FIXTURES_DIR])
+    if not snapshots:
+        print("no HTML snapshots found", file=sys.stderr)
+        return 2
+
+    with tempfile.TemporaryDirectory(prefix="replay_") as tmp:
+        sqlite_path = args.sqlite or str(Path(tmp) / "replay.sqlite3")
+        try:
+            result = asyncio.run(replay(snapshots, sqlite_path, args.keyword, args.rounds, not args.no_titan_filter))
+        except Exception as exc:
+            print(f"replay failed: {exc.__class__.__name__}: {str(exc)[:300]}", file=sys.stderr)
+            return 2
+
+    if args.json:
+        print(json.dumps(result.as_dict(), indent=2))
+    else:
+        _print_report(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,123 @@
+"""Streaming dashboard exports (Excel, CSV, NDJSON).
+
+Rows arrive as chunks of post dicts from an async iterator (keyset pages of
+``routes.fetch_posts_page``) and are encoded as they come, so memory stays flat
+whatever the export size:
+
+- CSV / NDJSON are yielded line by line straight into a ``StreamingResponse``.
+- XLSX is written by XlsxWriter in ``constant_memory`` mode (one row in memory
+  at a time) to a temporary file, which is then streamed in blocks; the zip
+  container can only be finalised once every row is written.
+"""
+from __future__ import annotations
+
+import asyncio
+import csv
+import io
+import json
+import tempfile
+from datetime import datetime, timezone
+from typing import IO, Any, AsyncIterator, Iterator, Optional
+
+# (column header, post field) in export order.
+EXPORT_COLUMNS: list[tuple[str, str]] = [
+    ("Keyword", "keyword"),
+    ("Auteur", "author"),
+    ("Entreprise", "company"),
+    ("Statut", "status"),
+    ("Métier", "metier"),
+    ("Texte", "text"),
+    ("Publié le", "published_at"),
+    ("Collecté le", "collected_at"),
+    ("Lien", "permalink"),
+]
+_DATE_FIELDS = {"published_at", "collected_at"}
+
+EXPORT_CHUNK_ROWS = 500
+STREAM_BLOCK_BYTES = 64 * 1024
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+def format_iso_for_export(value: Optional[str]) -> str:
+    if not value:
+        return ""
+    try:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        return dt.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    except Exception:
+        return value or ""
+
+
+def export_row(post: dict[str, Any]) -> list[str]:
+    """Cell values of one post, in :data:`EXPORT_COLUMNS` order."""
+    values = []
+    for _, field in EXPORT_COLUMNS:
+        value = post.get(field)
+        values.append(format_iso_for_export(value) if field in _DATE_FIELDS else str(value or ""))
+    return values
+
+
+async def iter_csv(chunks: AsyncIterator[list[dict[str, Any]]]) -> AsyncIterator[bytes]:
+    # UTF-8 BOM so Excel opens accented headers correctly
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow([header for header, _ in EXPORT_COLUMNS])
+    yield ("\ufeff" + buf.getvalue()).encode("utf-8")
+    async for posts in chunks:
+        buf.seek(0)
+        buf.truncate()
+        writer.writerows(export_row(p) for p in posts)
+        yield buf.getvalue().encode("utf-8")
+
+
+async def iter_ndjson(chunks: AsyncIterator[list[dict[str, Any]]]) -> AsyncIterator[bytes]:
+    # Machine-readable: field names as keys, ISO dates left untouched
+    async for posts in chunks:
+        lines = [json.dumps({f: p.get(f) for _, f in EXPORT_COLUMNS}, ensure_ascii=False) for p in posts]
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+async def write_xlsx(chunks: AsyncIterator[list[dict[str, Any]]]) -> IO[bytes]:
+    """Write every chunk to a temporary .xlsx file; returns it rewound (caller closes it)."""
+    import xlsxwriter  # type: ignore  # local import: only needed for Excel exports
+
+    out = tempfile.TemporaryFile()
+    try:
+        workbook = xlsxwriter.Workbook(
+            out,
+            {
+                "constant_memory": True,
+                # Post text is data: never turn "=..." into formulas or URLs into hyperlinks
+                "strings_to_formulas": False,
+                "strings_to_urls": False,
+                "strings_to_numbers": False,
+            },
+        )
+        sheet = workbook.add_worksheet("Posts")
+        sheet.write_row(0, 0, [header for header, _ in EXPORT_COLUMNS], workbook.add_format({"bold": True}))
+        row_idx = 1
+        async for posts in chunks:
+            for post in posts:
+                sheet.write_row(row_idx, 0, export_row(post))
+                row_idx += 1
+        # Zip assembly of the worksheet temp files is blocking: keep it off the event loop
+        await asyncio.to_thread(workbook.close)
+        out.seek(0)
+        return out
+    except BaseException:
+        out.close()
+        raise
+
+
+def iter_file(fh: IO[bytes]) -> Iterator[bytes]:
+    """Yield ``fh`` in blocks then close it (Starlette runs sync iterators in its threadpool)."""
+    try:
+        while True:
+            block = fh.read(STREAM_BLOCK_BYTES)
+            if not block:
+                break
+            yield block
+    finally:
+        fh.close()
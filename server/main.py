@@ -68,6 +68,29 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # noqa: D401
         ctx.logger.debug("api_startup")
     else:
         ctx.logger.info("api_startup")
+    display_task: asyncio.Task | None = None
+    # Open the SQLite pool and apply schema migrations once, before serving requests
+    if ctx.settings.sqlite_path:
+        try:
+            from scraper.repository import get_repository
+            repo = get_repository(ctx.settings.sqlite_path, pool_size=ctx.settings.sqlite_pool_size)
+            ctx.logger.debug("sqlite_repository_ready", path=repo.path, schema_version=repo.schema_version)
+
+            # Fill stored display fields for rows written before (or by an older) derivation
+            async def _display_backfill_once():
+                from scraper.display_fields import backfill_display_fields
+                from scraper.repository import run_sync
+
+                def _run() -> int:
+                    with repo.connection() as conn:
+                        return backfill_display_fields(conn, opportunity_threshold=ctx.settings.recruitment_signal_threshold)
+                try:
+                    await run_sync(_run, label="display_backfill", max_workers=ctx.settings.sqlite_pool_size)
+                except Exception as exc:  # pragma: no cover
+                    ctx.logger.warning("display_backfill_failed", error=str(exc))
+            display_task = asyncio.create_task(_display_backfill_once())
+        except Exception as exc:  # pragma: no cover
+            ctx.logger.error("sqlite_repository_init_failed", error=str(exc))
     bg_task: asyncio.Task | None = None
     norm_task: asyncio.Task | None = None
     # In-process autonomous worker
@@ -164,94 +187,35 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # noqa: D401
     # Periodic company normalization (SQLite only, opt-in via COMPANY_NORM_INTERVAL_SECONDS)
     norm_interval = getattr(ctx.settings, "company_norm_interval_seconds", 0)
     if norm_interval and norm_interval > 0 and ctx.settings.sqlite_path:
+        from pathlib import Path
+        from scraper.maintenance import normalize_company_norms
+        from scraper.repository import get_repository, run_sync
+        norm_logger = ctx.logger.bind(component="company_norm")
+
+        def _normalize_sync(sp: str) -> tuple[int, int]:
+            with get_repository(sp, pool_size=ctx.settings.sqlite_pool_size).connection() as conn:
+                return normalize_company_norms(conn)
+
         async def _company_norm_loop():
-            logger = ctx.logger.bind(component="company_norm")
-            logger.info("company_norm_started", interval=norm_interval)
-            import sqlite3, json, re
-            from pathlib import Path
-            CAPITAL_RE = re.compile(r"(?:(?:[A-Z][A-Za-z&\-]{1,}\s){0,3}[A-Z][A-Za-z&\-]{1,})")
-            EXCLUDE = {"freelance","consultant","independant","indépendant","recruteur"}
-            def derive(author: str, company: str|None, profile: str|None, text: str|None):
+            norm_logger.info("company_norm_started", interval=norm_interval)
+            while True:
                 try:
-                    if company and company.strip() and company.strip().lower() != author.strip().lower():
-                        return company
-                    cand_blocks = []
-                    if profile and profile.strip().startswith('{'):
-                        try:
-                            pobj = json.loads(profile)
-                            for k in ("company","organization","org","headline","subtitle","occupation","title"):
-                                v = pobj.get(k)
-                                if isinstance(v,str): cand_blocks.append(v)
-                        except Exception: pass
-                    if text: cand_blocks.append(text[:240])
-                    out_candidates = []
-                    for raw in cand_blocks:
-                        if not raw: continue
-                        low = raw.lower()
-                        for marker in ["chez "," at "," @"]:
-                            if marker in low:
-                                seg = raw[low.find(marker)+len(marker):]
-                                out_candidates.append(seg)
-                        for part in re.split(r"\s[|·•-]\s|,", raw):
-                            out_candidates.append(part)
-                        # Regex capital patterns
-                        for m in CAPITAL_RE.findall(raw):
-                            out_candidates.append(m)
-                    cleaned = []
-                    for c in out_candidates:
-                        c2 = c.strip().strip('-–|·•').strip()
-                        if not c2 or len(c2)<2: continue
-                        if c2.lower()==author.lower(): continue
-                        if c2.lower() in EXCLUDE: continue
-                        if not any(ch.isalpha() for ch in c2): continue
-                        if author.lower() in c2.lower(): continue
-                        cleaned.append(c2)
-                    for c3 in cleaned:
-                        return c3[:120]
-                except Exception:
-                    return company
-                return company
-            async def _loop():
-                while True:
-                    try:
-                        sp = ctx.settings.sqlite_path
-                        if sp and Path(sp).exists():
-                            conn = sqlite3.connect(sp)
-                            conn.row_factory = sqlite3.Row
-                            with conn:
-                                try: conn.execute("ALTER TABLE posts ADD COLUMN company_norm TEXT")
-                                except Exception: pass
-                                cur = conn.execute("SELECT id, author, company, company_norm, author_profile, text FROM posts")
-                                upd = 0; scanned = 0
-                                # Ensure index on company_norm (idempotent)
-                                try:
-                                    conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_company_norm ON posts(company_norm)")
-                                except Exception:
-                                    pass
-                                for r in cur.fetchall():
-                                    scanned += 1
-                                    author = r["author"] or ""
-                                    if not author: continue
-                                    comp = r["company"]
-                                    comp_norm = r["company_norm"]
-                                    prof = r["author_profile"]
-                                    txt = r["text"]
-                                    if comp_norm and comp_norm.strip():
-                                        continue
-                                    derived = derive(author, comp, prof, txt)
-                                    if derived and (not comp or comp.strip().lower()==author.strip().lower() or derived!=comp):
-                                        conn.execute("UPDATE posts SET company_norm=? WHERE id=?", (derived, r["id"]))
-                                        upd += 1
-                            logger.info("company_norm_cycle", updated=upd, scanned=scanned)
-                        await asyncio.sleep(norm_interval)
-                    except asyncio.CancelledError:
-                        logger.info("company_norm_cancelled")
-                        break
-                    except Exception as exc:  # pragma: no cover
-                        logger.error("company_norm_error", error=str(exc))
-                        with contextlib.suppress(Exception):
-                            await asyncio.sleep(min(5, max(1, int(norm_interval/10))))
-            norm_task = asyncio.create_task(_loop())
+                    sp = ctx.settings.sqlite_path
+                    if sp and Path(sp).exists():
+                        # Blocking scan/updates run on the repository executor, not the event loop
+                        upd, scanned = await run_sync(
+                            _normalize_sync, sp, label="company_norm", max_workers=ctx.settings.sqlite_pool_size
+                        )
+                        norm_logger.info("company_norm_cycle", updated=upd, scanned=scanned)
+                    await asyncio.sleep(norm_interval)
+                except asyncio.CancelledError:
+                    norm_logger.info("company_norm_cancelled")
+                    break
+                except Exception as exc:  # pragma: no cover
+                    norm_logger.error("company_norm_error", error=str(exc))
+                    with contextlib.suppress(Exception):
+                        await asyncio.sleep(min(5, max(1, int(norm_interval/10))))
+        norm_task = asyncio.create_task(_company_norm_loop())
     try:
         yield
     except asyncio.CancelledError:  # graceful shutdown triggered
@@ -274,6 +238,16 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:  # noqa: D401
             norm_task.cancel()
             with contextlib.suppress(asyncio.CancelledError, Exception):
                 await norm_task
+        if display_task:
+            display_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await display_task
+        with contextlib.suppress(Exception):
+            from scraper.worker import shutdown_scrape_supervisor
+            await shutdown_scrape_supervisor()
+        with contextlib.suppress(Exception):
+            from scraper.repository import close_all as _close_repositories
+            _close_repositories()
         if getattr(ctx.settings, "quiet_startup", False):
             ctx.logger.debug("api_shutdown")
         else:
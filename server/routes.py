@@ -13,9 +13,9 @@ Auth (optional): Basic auth if INTERNAL_AUTH_USER and INTERNAL_AUTH_PASS_HASH se
 from __future__ import annotations
 
 from functools import lru_cache
+import base64
 import contextlib
-import io
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 from pathlib import Path
 import sqlite3
 import json as _json
@@ -24,7 +24,7 @@ import os
 import structlog
 
 from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Form, Query, Body
-from fastapi.responses import JSONResponse, HTMLResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, HTMLResponse, PlainTextResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from jinja2 import TemplateNotFound  # runtime safeguard for missing templates
 from passlib.hash import bcrypt
@@ -38,11 +38,13 @@ from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 
 from scraper.bootstrap import get_context
 from scraper.utils import normalize_for_search as _normalize_for_search  # type: ignore
-from scraper import utils as _scrape_utils  # unified opportunity logic
 from scraper.session import session_status, login_via_playwright  # type: ignore
 from scraper.bootstrap import _save_runtime_state  # type: ignore
 from scraper.bootstrap import API_RATE_LIMIT_REJECTIONS
+from scraper.repository import fts_match_expression, get_repository, rebuild_search_index, run_sync, SQLiteRepository
+from scraper.daily_stats import daily_summary as _daily_summary, visible_posts_count as _visible_posts_count
 from .events import sse_event_iter, broadcast, EventType  # type: ignore
+from . import export as _export
 from fastapi.responses import RedirectResponse
 
 router = APIRouter()
@@ -159,6 +161,15 @@ def _remove_key_emoji(value: Optional[str]) -> str:
 templates.env.filters['fmt_date'] = _fmt_date
 templates.env.filters['remove_key_emoji'] = _remove_key_emoji
 
+def _repo(ctx) -> SQLiteRepository:
+    """Shared pooled repository for the configured SQLite file (schema already migrated)."""
+    return get_repository(ctx.settings.sqlite_path, pool_size=getattr(ctx.settings, "sqlite_pool_size", 4))
+
+
+async def _db(ctx, fn, *args, **kwargs):
+    """Run a blocking SQLite helper off the event loop (bounded pool, timed per query)."""
+    return await run_sync(fn, *args, max_workers=getattr(ctx.settings, "sqlite_pool_size", 4), **kwargs)
+
 # ------------------------------------------------------------
 # Store for blocked LinkedIn accounts (SQLite)
 # Document: { id: str, name: str | None, url: str, blocked_at: ISO8601 }
@@ -199,83 +210,42 @@ def _normalize_linkedin_url(value: str) -> str:
     except Exception:
         return ''
 
-# Lightweight helper to extract a comparable name/slug from a LinkedIn URL.
-# Examples:
-#  - https://www.linkedin.com/company/law-profiler/ -> "law profiler"
-#  - https://www.linkedin.com/in/john-doe -> "john doe"
-# If parsing fails, returns a normalized last non-empty path segment.
-def _blocked_slug_from_url(url: str) -> str:
-    try:
-        from urllib.parse import urlparse, unquote
-        p = urlparse(url or "")
-        parts = [seg for seg in (p.path or "").split('/') if seg]
-        slug = ""
-        if parts:
-            # Prefer segment after known prefixes like 'company' or 'in'
-            for pref in ("company", "in", "school", "pages"):
-                if pref in parts:
-                    idx = parts.index(pref)
-                    if idx + 1 < len(parts):
-                        slug = parts[idx + 1]
-                        break
-            if not slug:
-                slug = parts[-1]
-        slug = unquote(slug)
-        # Transform dashes/underscores to spaces then normalize accents/case
-        slug = slug.replace('-', ' ').replace('_', ' ')
-        try:
-            from scraper.utils import normalize_for_search as _nfs  # type: ignore
-            return _nfs(slug)
-        except Exception:
-            return (slug or "").strip().lower()
-    except Exception:
-        return ""
+# Comparable name/slug from a LinkedIn URL ("/company/law-profiler" -> "law profiler"),
+# stored in blocked_accounts.slug and matched against posts.author_slug/company_slug.
+from scraper.display_fields import blocked_slug_from_url as _blocked_slug_from_url  # noqa: E402
 
-async def _blocked_count(ctx) -> int:
+def _blocked_count_sync(ctx) -> int:
     # SQLite path
     path = ctx.settings.sqlite_path
     if not path or not Path(path).exists():
         return 0
-    conn = sqlite3.connect(path)
-    with conn:
-        try:
-            conn.execute("CREATE TABLE IF NOT EXISTS blocked_accounts (id TEXT PRIMARY KEY, url TEXT UNIQUE, name TEXT, blocked_at TEXT)")
-        except Exception:
-            pass
+    with _repo(ctx).connection() as conn:
         row = conn.execute("SELECT COUNT(*) FROM blocked_accounts").fetchone()
         return int(row[0] or 0)
 
 
-async def _blocked_list(ctx) -> list[dict[str, Any]]:
+def _blocked_list_sync(ctx) -> list[dict[str, Any]]:
     # SQLite
     path = ctx.settings.sqlite_path
     if not path or not Path(path).exists():
         return []
-    conn = sqlite3.connect(path)
-    conn.row_factory = sqlite3.Row
-    with conn:
-        try:
-            conn.execute("CREATE TABLE IF NOT EXISTS blocked_accounts (id TEXT PRIMARY KEY, url TEXT UNIQUE, name TEXT, blocked_at TEXT)")
-        except Exception:
-            pass
+    with _repo(ctx).connection() as conn:
         rows = conn.execute("SELECT id, url, blocked_at FROM blocked_accounts ORDER BY blocked_at DESC").fetchall()
         return [dict(r) for r in rows]
 
 
-async def _blocked_add(ctx, url: str):
+def _blocked_add_sync(ctx, url: str):
     now_iso = datetime.now(timezone.utc).isoformat()
     item_id = str(uuid4())
     # SQLite
     path = ctx.settings.sqlite_path
     if not path:
         raise HTTPException(status_code=400, detail="SQLite non configuré")
-    conn = sqlite3.connect(path)
-    with conn:
+    with _repo(ctx).connection() as conn:
         try:
-            conn.execute("CREATE TABLE IF NOT EXISTS blocked_accounts (id TEXT PRIMARY KEY, url TEXT UNIQUE, name TEXT, blocked_at TEXT)")
             conn.execute(
-                "INSERT INTO blocked_accounts(id, url, name, blocked_at) VALUES(?,?,?,?)",
-                (item_id, url, None, now_iso),
+                "INSERT INTO blocked_accounts(id, url, name, blocked_at, slug) VALUES(?,?,?,?,?)",
+                (item_id, url, None, now_iso, _blocked_slug_from_url(url) or None),
             )
         except sqlite3.IntegrityError:
             raise HTTPException(status_code=409, detail="Ce compte est déjà bloqué")
@@ -284,15 +254,13 @@ async def _blocked_add(ctx, url: str):
     return {"id": item_id, "url": url, "blocked_at": now_iso}
 
 
-async def _blocked_delete(ctx, item_id: str):
+def _blocked_delete_sync(ctx, item_id: str):
     # SQLite
     path = ctx.settings.sqlite_path
     if not path or not Path(path).exists():
         raise HTTPException(status_code=404, detail="Compte introuvable")
-    conn = sqlite3.connect(path)
-    with conn:
+    with _repo(ctx).connection() as conn:
         try:
-            conn.execute("CREATE TABLE IF NOT EXISTS blocked_accounts (id TEXT PRIMARY KEY, url TEXT UNIQUE, name TEXT, blocked_at TEXT)")
             res = conn.execute("DELETE FROM blocked_accounts WHERE id = ?", (item_id,))
             if res.rowcount == 0:
                 raise HTTPException(status_code=404, detail="Compte introuvable")
@@ -301,272 +269,30 @@ async def _blocked_delete(ctx, item_id: str):
         except Exception as exc:
             raise HTTPException(status_code=500, detail=f"Erreur suppression: {exc}")
 
-# Name/company helpers for display hygiene
-def _dedupe_person_name(name: Optional[str]) -> str:
-    s = (name or "").strip()
-    if not s:
-        return s
-    tokens = s.split()
-    # Pattern: exact duplication like "John Doe John Doe"
-    if len(tokens) >= 2 and len(tokens) % 2 == 0:
-        half = len(tokens) // 2
-        if tokens[:half] == tokens[half:]:
-            return " ".join(tokens[:half])
-    return s
-
-def _looks_like_followers(segment: str) -> bool:
-    import re
-    seg = segment.strip().lower()
-    seg = seg.replace("\u00a0", " ").replace("\u202f", " ")
-    # Accept forms: 12 345 abonnés, 12k abonnés, 1.2m followers, 123 abonnés (singular/plural tolerant)
-    return re.search(r"\b\d[\d\s\.,]*\s*(k|m)?\s*(abonn[eé]s?|followers)\b", seg, flags=re.IGNORECASE) is not None
-
-def _derive_company(author: str, author_profile: Optional[str], text: Optional[str]) -> Optional[str]:
-    """Best-effort company derivation from profile/text.
-    Heuristics:
-    - Prefer author_profile; handle 'chez'/'at' patterns and common separators.
-    - Avoid returning segments that look like roles (Recruiter, Manager, etc.).
-    - Never return the author name.
-    - Fall back to scanning text for 'chez/at @Company' markers and parenthesis.
-    """
-    import re
-    norm_author = (author or "").strip().lower()
-    role_keywords = {
-        "recruteur","recruiter","talent","senior","junior","stagiaire","alternant",
-        "manager","responsable","lead","engineer","ingénieur","consultant","développeur","developer",
-        "cto","ceo","cfo","cmo","rh","hr","human resources","marketing","sales","commercial",
-    }
-    company_suffixes = {"sas","sarl","sa","inc","llc","gmbh","ltd","spa","s.p.a","ag","bv","nv"}
-
-    def looks_like_role(segment: str) -> bool:
-        seg = segment.lower()
-        return any(k in seg for k in role_keywords)
-
-    def company_score(segment: str) -> int:
-        s = segment.strip()
-        score = 0
-        # bonus if contains company suffixes
-        if any(s.lower().endswith(" "+suf) or (" "+suf+" ") in s.lower() for suf in company_suffixes):
-            score += 3
-        # bonus for Title Case words
-        tokens = [t for t in re.split(r"\s+", s) if t]
-        score += sum(1 for t in tokens if t[:1].isupper())
-        # penalty if contains role
-        if looks_like_role(s):
-            score -= 2
-        return score
-
-    prof = (author_profile or "").strip()
-    if prof:
-        # Direct patterns in profile: 'chez X' / 'at X'
-        for marker in (" chez ", " at "):
-            if marker in prof.lower():
-                tail = prof.lower().split(marker, 1)[1]
-                # Recover original casing by slicing same length offset
-                start_idx = prof.lower().index(marker) + len(marker)
-                tail = prof[start_idx:].strip()
-                for stop in [" |", " -", ",", " •", " ·", " – ", " — ", "  "]:
-                    if stop in tail:
-                        tail = tail.split(stop, 1)[0].strip()
-                if 2 <= len(tail) <= 80 and tail.strip().lower() != norm_author:
-                    return tail
-        # Split on common separators and pick the most company-like segment
-        seps = [" • ", " — ", " – ", " | ", " •", "•", "—", "-", "|", "·"]
-        if any(sep in prof for sep in seps):
-            parts: list[str] = []
-            tmp = prof
-            for sep in [" • ", " — ", " – ", " | "]:
-                tmp = tmp.replace(sep, "|")
-            for sep in [" •", "•", "—", "-", "|", "·"]:
-                tmp = tmp.replace(sep, "|")
-            parts = [p.strip() for p in tmp.split("|") if p.strip()]
-            candidates = [p for p in parts if p and p.lower() != norm_author]
-            # prefer segments that don't look like roles, then by score/length
-            candidates.sort(key=lambda p: (looks_like_role(p), -company_score(p), -len(p)))
-            if candidates:
-                top = candidates[0]
-                if 2 <= len(top) <= 80 and top.lower() != norm_author:
-                    return top
-
-    # Fallback: look into text for @Company marker ONLY (not generic text extraction)
-    blob = (text or "")
-    # Content markers that indicate this is post text, not a company name
-    content_indicators = ['#', '🚀', '📢', '📍', '🔍', '📌', '💼', '!', '?', '\n', 
-                          'recrute', 'recherche', 'Cher', 'Bonjour', 'CDI', 'CDD']
-    
-    # Only extract from @Company pattern
-    at_match = re.search(r'@\s*([A-Za-zÀ-ÿ][A-Za-zÀ-ÿ0-9\s&\-\.\']{2,50})', blob)
-    if at_match:
-        company = at_match.group(1).strip()
-        # Validate it's not post content
-        if not any(indicator in company for indicator in content_indicators):
-            if 2 <= len(company) <= 50 and company.lower() != norm_author:
-                return company
-    
-    # Try "chez Company" pattern with strict validation
-    for marker in [" chez ", " at "]:
-        if marker in blob.lower():
-            idx = blob.lower().index(marker)
-            tail = blob[idx + len(marker):].strip()
-            # Stop at first separator or end of line
-            for stop in [" |", " -", ",", " •", " ·", "  ", "\n", "!", "?"]:
-                if stop in tail:
-                    tail = tail.split(stop, 1)[0].strip()
-            # Strict validation
-            if 2 <= len(tail) <= 50 and tail.lower() != norm_author:
-                if not any(indicator in tail for indicator in content_indicators):
-                    return tail
-    
-    # Skip parentheses extraction - too risky for post content
-    # Last resort: inspect author string itself for patterns "Nom Prénom • Entreprise" or "Nom chez Entreprise"
-    author_clean = (author or "").strip()
-    if author_clean:
-        lc = author_clean.lower()
-        for marker in [" chez ", " at "]:
-            if marker in lc:
-                tail = author_clean[lc.index(marker)+len(marker):].strip()
-                for stop in [" |", " -", ",", " •", " ·", " —", " –", " (", "  "]:
-                    if stop in tail:
-                        tail = tail.split(stop, 1)[0].strip()
-                if 2 <= len(tail) <= 80 and tail.lower() != norm_author and not looks_like_role(tail):
-                    return tail
-        for sep in [" • ", " – ", " — ", " | ", " - "]:
-            if sep in author_clean:
-                parts = [p.strip() for p in author_clean.split(sep) if p.strip()]
-                if len(parts) >= 2:
-                    cand2 = parts[-1]
-                    if 2 <= len(cand2) <= 80 and cand2.lower() != norm_author and not looks_like_role(cand2):
-                        return cand2
-    return None
-
-def _sanitize_company(company: Optional[str]) -> Optional[str]:
-    s = (company or "").strip()
-    if not s:
-        return None
-    # Remove common prefixes/symbols
-    if s.startswith("@"):
-        s = s[1:].strip()
-    for pref in ["chez ", "Chez ", "at ", "At "]:
-        if s.startswith(pref):
-            s = s[len(pref):].strip()
-            break
-    # Collapse excessive whitespace
-    s = " ".join(s.split())
-    # Strip trailing punctuation
-    s = s.strip("-•|·—,;: ")
-    return s or None
-
-def _strip_followers_suffix(value: Optional[str]) -> Optional[str]:
-    import re
-    s = (value or "").strip()
-    if not s:
-        return None
-    # Remove parenthesized follower counts
-    s = re.sub(r"\(\s*\d[\d\s\.,\u202f\u00a0]*\s*(?:k|m)?\s*(?:abonn[eé]s?|followers)\s*\)", "", s, flags=re.IGNORECASE)
-    # Remove trailing segments separated by common separators
-    for sep in [" | ", " · ", " - ", " — ", " – "]:
-        parts = [p.strip() for p in s.split(sep) if p is not None]
-        if len(parts) >= 2 and _looks_like_followers(parts[-1]):
-            s = sep.join(parts[:-1])
-    # Terminal follower phrase
-    s = re.sub(r"[\s\-•|·—,;:]*\d[\d\s\.,\u202f\u00a0]*\s*(?:k|m)?\s*(?:abonn[eé]s?|followers)\s*$", "", s, flags=re.IGNORECASE)
-    # Leading follower phrase like "12 345 abonnés • Company"
-    if " • " in s:
-        head, tail = s.split(" • ", 1)
-        if _looks_like_followers(head):
-            s = tail.strip()
-    s = " ".join(s.split())
-    s = s.strip("-•|·—,;: ")
-    return s or None
-
-def _dedupe_repeated_phrase(value: Optional[str]) -> Optional[str]:
-    s = (value or "").strip()
-    if not s:
-        return None
-    tokens = s.split()
-    if len(tokens) % 2 == 0 and len(tokens) >= 2:
-        half = len(tokens) // 2
-        if tokens[:half] == tokens[half:]:
-            return " ".join(tokens[:half])
-    return s
 
-def _extract_contract_status(text: Optional[str]) -> Optional[str]:
-    """Extract a contract/status label like CDI/CDD/Alternance/Freelance from the post text only.
+async def _blocked_count(ctx) -> int:
+    return await _db(ctx, _blocked_count_sync, ctx)
 
-    Returns a comma-separated string in a consistent order, or None if nothing found.
-    """
-    blob = (text or "").strip()
-    if not blob:
-        return None
-    low = blob.lower()
-    found = set()
-    # Simple keyword spotting (FR + EN equivalents where useful)
-    if " cdi" in low or low.startswith("cdi") or "(cdi" in low:
-        found.add("CDI")
-    if " cdd" in low or low.startswith("cdd") or "(cdd" in low:
-        found.add("CDD")
-    if " alternance" in low or low.startswith("alternance") or "apprentissage" in low:
-        found.add("Alternance")
-    if " stage" in low or low.startswith("stage") or "internship" in low:
-        found.add("Stage")
-    if " freelance" in low or low.startswith("freelance") or "indépendant" in low or "independant" in low:
-        found.add("Freelance")
-    if "temps plein" in low or "full time" in low or "full-time" in low:
-        found.add("Temps plein")
-    if "temps partiel" in low or "part time" in low or "part-time" in low:
-        found.add("Temps partiel")
-    if not found:
-        return None
-    order = ["CDI", "CDD", "Alternance", "Stage", "Freelance", "Temps plein", "Temps partiel"]
-    ordered = [x for x in order if x in found]
-    return ", ".join(ordered) if ordered else None
 
-def _extract_metier(text: Optional[str]) -> Optional[str]:
-    """Extract legal/tax job roles from post text based on curated patterns.
+async def _blocked_list(ctx) -> list[dict[str, Any]]:
+    return await _db(ctx, _blocked_list_sync, ctx)
+
+
+async def _blocked_add(ctx, url: str):
+    return await _db(ctx, _blocked_add_sync, ctx, url)
+
+
+async def _blocked_delete(ctx, item_id: str):
+    return await _db(ctx, _blocked_delete_sync, ctx, item_id)
+
+# Name/company helpers for display hygiene (shared with the worker, which stores
+# the derived values at write time; see scraper.display_fields)
+from scraper.display_fields import (  # noqa: E402
+    DISPLAY_FIELDS_VERSION as _DISPLAY_FIELDS_VERSION,
+    compute_display_fields as _compute_display_fields,
+    display_author as _display_author,
+)
 
-    Returns a comma-separated label list or None.
-    """
-    blob = (text or "").lower()
-    if not blob:
-        return None
-    hits: list[str] = []
-    patterns: list[tuple[list[str], str]] = [
-        # Avocats
-        (["avocat collaborateur"], "Avocat collaborateur"),
-        (["avocat associe", "avocat associé"], "Avocat associé"),
-        (["avocat counsel", "counsel"], "Avocat counsel"),
-        (["avocat"], "Avocat"),
-        # Juristes / Legal
-        (["paralegal"], "Paralegal"),
-        (["legal counsel"], "Legal counsel"),
-        (["juriste"], "Juriste"),
-        # Management juridique
-        (["responsable juridique"], "Responsable juridique"),
-        (["directeur juridique"], "Directeur juridique"),
-        # Notariat
-        (["notaire stagiaire"], "Notaire stagiaire"),
-        (["notaire associe", "notaire associé"], "Notaire associé"),
-        (["notaire salarie", "notaire salarié"], "Notaire salarié"),
-        (["notaire assistant"], "Notaire assistant"),
-        (["clerc de notaire"], "Clerc de notaire"),
-        (["redacteur d'actes", "rédacteur d’actes", "rédacteur d'actes", "redacteur d’actes"], "Rédacteur d’actes"),
-        (["notaire"], "Notaire"),
-        # Fiscalité
-        (["responsable fiscal"], "Responsable fiscal"),
-        (["directeur fiscal"], "Directeur fiscal"),
-        (["juriste fiscaliste"], "Juriste fiscaliste"),
-        (["comptable taxateur"], "Comptable taxateur"),
-        (["formaliste"], "Formaliste"),
-    ]
-    for keys, label in patterns:
-        if any(k in blob for k in keys):
-            # avoid duplicates
-            if label not in hits:
-                hits.append(label)
-    if not hits:
-        return None
-    # Preserve pattern order; cap to 3 labels to keep UI compact
-    return ", ".join(hits[:3])
 
 
 # ------------------------------------------------------------
@@ -644,7 +370,8 @@ def _normalize_sort(sort_by: Optional[str], sort_dir: Optional[str]) -> tuple[st
         "author": "author",
         "company": "company",
         "keyword": "keyword",
-        "metier": "metier",  # Note: metier is computed dynamically, will be sorted post-fetch
+        "metier": "metier",  # stored column (display_fields), sorted in SQL
+        "relevance": "relevance",  # BM25 rank of the search query (falls back to collected_at without q)
     }
     # Default to published_at for date sorting
     field = allowed.get((sort_by or "").lower(), "published_at")
@@ -654,50 +381,29 @@ def _normalize_sort(sort_by: Optional[str], sort_dir: Optional[str]) -> tuple[st
 
 def _is_virtual_sort_field(field: str) -> bool:
     """Check if field is computed dynamically and not in database."""
-    return field in ("metier",)
-
-
-def _ensure_post_flags(conn: sqlite3.Connection) -> None:
-    conn.execute(
-        """CREATE TABLE IF NOT EXISTS post_flags (
-        post_id TEXT PRIMARY KEY,
-        is_favorite INTEGER NOT NULL DEFAULT 0,
-        is_deleted INTEGER NOT NULL DEFAULT 0,
-        favorite_at TEXT,
-        deleted_at TEXT
-        )"""
-    )
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_post_flags_deleted ON post_flags(is_deleted, deleted_at)")
-    conn.execute("CREATE INDEX IF NOT EXISTS idx_post_flags_favorite ON post_flags(is_favorite, favorite_at)")
-
-
-def _flags_for_ids(conn: sqlite3.Connection, ids: list[str]) -> dict[str, dict[str, Any]]:
-    if not ids:
-        return {}
-    _ensure_post_flags(conn)
-    placeholders = ",".join(["?"] * len(ids))
-    rows = conn.execute(
-        f"SELECT post_id, is_favorite, is_deleted, deleted_at FROM post_flags WHERE post_id IN ({placeholders})",
-        ids,
-    ).fetchall()
-    return {
-        row[0]: {
-            "is_favorite": int(row[1] or 0),
-            "is_deleted": int(row[2] or 0),
-            "deleted_at": row[3],
-        }
-        for row in rows
-    }
+    return field in ("relevance",)
+
+
+def _search_clause(ctx, q: str) -> tuple[str, list[Any]]:
+    """WHERE fragment for dashboard search.
+
+    Uses the posts_fts index (prefix terms) when available; otherwise falls back
+    to the legacy LIKE scan on search_norm.
+    """
+    if _repo(ctx).fts_enabled:
+        match = fts_match_expression(q)
+        if match is None:
+            return "0", []
+        return "p.rowid IN (SELECT rowid FROM posts_fts WHERE posts_fts MATCH ?)", [match]
+    qn = _normalize_for_search(q)
+    return "p.search_norm LIKE ?", [f"%{qn}%"]
 
 
 def _update_post_flags(ctx, post_id: str, *, favorite: Optional[bool] = None, deleted: Optional[bool] = None) -> dict[str, Any]:
     path = ctx.settings.sqlite_path
     if not path:
         raise HTTPException(status_code=400, detail="SQLite non configuré")
-    conn = sqlite3.connect(path)
-    conn.row_factory = sqlite3.Row
-    with conn:
-        _ensure_post_flags(conn)
+    with _repo(ctx).connection() as conn:
         row = conn.execute(
             "SELECT post_id, is_favorite, is_deleted, favorite_at, deleted_at FROM post_flags WHERE post_id = ?",
             (post_id,),
@@ -741,10 +447,7 @@ def _get_post_flags(ctx, post_id: str) -> dict[str, Any]:
     path = ctx.settings.sqlite_path
     if not path:
         raise HTTPException(status_code=400, detail="SQLite non configuré")
-    conn = sqlite3.connect(path)
-    conn.row_factory = sqlite3.Row
-    with conn:
-        _ensure_post_flags(conn)
+    with _repo(ctx).connection() as conn:
         row = conn.execute(
             "SELECT post_id, is_favorite, is_deleted, favorite_at, deleted_at FROM post_flags WHERE post_id = ?",
             (post_id,),
@@ -764,9 +467,7 @@ def _count_deleted(ctx) -> int:
     path = ctx.settings.sqlite_path
     if not path or not Path(path).exists():
         return 0
-    conn = sqlite3.connect(path)
-    with conn:
-        _ensure_post_flags(conn)
+    with _repo(ctx).connection() as conn:
         row = conn.execute("SELECT COUNT(*) FROM post_flags WHERE is_deleted = 1").fetchone()
         return int(row[0]) if row else 0
 
@@ -775,11 +476,8 @@ def _fetch_deleted_posts(ctx) -> list[dict[str, Any]]:
     path = ctx.settings.sqlite_path
     if not path or not Path(path).exists():
         return []
-    conn = sqlite3.connect(path)
-    conn.row_factory = sqlite3.Row
     rows: list[dict[str, Any]] = []
-    with conn:
-        _ensure_post_flags(conn)
+    with _repo(ctx).connection() as conn:
         query = (
             "SELECT p.id as _id, p.keyword, p.author, p.company, p.text, p.published_at, p.collected_at, p.permalink, "
             "COALESCE(f.is_favorite, 0) AS is_favorite, COALESCE(f.deleted_at, datetime('now')) AS deleted_at "
@@ -802,232 +500,207 @@ def _fetch_deleted_posts(ctx) -> list[dict[str, Any]]:
     return rows
 
 async def fetch_posts(ctx, skip: int, limit: int, q: Optional[str] = None, sort_by: Optional[str] = None, sort_dir: Optional[str] = None, intent: Optional[str] = None, include_raw: bool = False) -> list[dict[str, Any]]:
+    posts, _next = await fetch_posts_page(ctx, skip=skip, limit=limit, q=q, sort_by=sort_by, sort_dir=sort_dir, intent=intent, include_raw=include_raw)
+    return posts
+
+
+async def fetch_posts_page(ctx, skip: int, limit: int, q: Optional[str] = None, sort_by: Optional[str] = None, sort_dir: Optional[str] = None, intent: Optional[str] = None, include_raw: bool = False, cursor: Optional[str] = None) -> tuple[list[dict[str, Any]], Optional[str]]:
+    """Like fetch_posts but also returns the opaque cursor of the next page.
+
+    When ``cursor`` is given, ``skip`` is ignored and the page starts right
+    after the cursor position (keyset pagination: page N costs the same as page 1).
+    """
+    return await _db(ctx, _fetch_posts_sync, ctx, skip, limit, q, sort_by, sort_dir, intent, include_raw, cursor, label="fetch_posts")
+
+
+def _encode_cursor(is_favorite: int, sort_key: Any, post_id: str, sort_field: str, sort_direction: int) -> str:
+    payload = _json.dumps([int(is_favorite), sort_key, post_id, f"{sort_field}:{sort_direction}"], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: Optional[str], sort_field: str, sort_direction: int) -> Optional[tuple[int, Any, str]]:
+    """Return (is_favorite, sort_key, id) or None if the cursor is absent, invalid or for another sort."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        fav, key, pid, sort_sig = _json.loads(raw.decode("utf-8"))
+        if sort_sig != f"{sort_field}:{sort_direction}":
+            return None
+        return (1 if int(fav) else 0, key, str(pid))
+    except Exception:
+        return None
+
+
+def _keyset_rows(
+    conn: sqlite3.Connection,
+    base_q: str,
+    where_clauses: list[str],
+    params: list[Any],
+    sort_expr: str,
+    dir_sql: str,
+    limit: int,
+    skip: int,
+    after: Optional[tuple[int, Any, str]],
+) -> list[sqlite3.Row]:
+    """Rows ordered by (favorite DESC, sort_expr, id) starting after ``after``.
+
+    Favorites and non-favorites are read as two segments so the non-favorite
+    segment (nearly all rows) seeks straight into idx_posts_*_keyset instead of
+    sorting the whole table; the leading ``sort_expr <= ?`` bound is what lets
+    SQLite use the index for the row-value comparison.
+    """
+    order_sql = f" ORDER BY {sort_expr} {dir_sql}, p.id {dir_sql}"
+    if after is None and skip:
+        # Legacy ?page=N without cursor: same total order, OFFSET based
+        sql = base_q + " WHERE " + " AND ".join(where_clauses) + f" ORDER BY COALESCE(f.is_favorite,0) DESC, {sort_expr} {dir_sql}, p.id {dir_sql} LIMIT ? OFFSET ?"
+        return conn.execute(sql, [*params, limit, skip]).fetchall()
+    cmp_op, bound_op = ("<", "<=") if dir_sql == "DESC" else (">", ">=")
+    out: list[sqlite3.Row] = []
+    for fav in ((1, 0) if after is None or after[0] == 1 else (0,)):
+        seg_where = list(where_clauses)
+        seg_where.append("f.is_favorite = 1" if fav else "COALESCE(f.is_favorite,0) = 0")
+        seg_params = list(params)
+        if after is not None and after[0] == fav:
+            seg_where.append(f"{sort_expr} {bound_op} ?")
+            seg_where.append(f"({sort_expr}, p.id) {cmp_op} (?, ?)")
+            seg_params.extend([after[1], after[1], after[2]])
+        sql = base_q + " WHERE " + " AND ".join(seg_where) + order_sql + " LIMIT ?"
+        out.extend(conn.execute(sql, [*seg_params, limit - len(out)]).fetchall())
+        if len(out) >= limit:
+            break
+    return out
+
+
+# Posts whose author or displayed company contains a blocked account slug: a blocked
+# "acme" also hides "ACME France" / "Acme Recrutement" (suffix-tolerant, as before)
+_NOT_BLOCKED_SQL = (
+    "NOT EXISTS (SELECT 1 FROM blocked_accounts b WHERE b.slug IS NOT NULL"
+    " AND (instr(p.author_slug, b.slug) > 0 OR instr(p.company_slug, b.slug) > 0))"
+)
+
+
+def _apply_display_fields(ctx, item: dict[str, Any]) -> None:
+    """Map stored display columns onto the API item shape (in place).
+
+    Rows written before display fields existed (or by an older derivation) are
+    derived on the fly until the backfill job reaches them.
+    """
+    if int(item.get("display_version") or 0) < _DISPLAY_FIELDS_VERSION:
+        try:
+            item.update(_compute_display_fields(
+                item.get("author"), item.get("company"), item.get("author_profile"), item.get("text"), item.get("permalink"),
+                opportunity_threshold=ctx.settings.recruitment_signal_threshold,
+            ))
+        except Exception:
+            pass
+    item.pop("display_version", None)
+    for key in ("author_slug", "company_slug", "dedup_key"):
+        item.pop(key, None)
+    item["author"] = _display_author(item.get("author"))
+    item["company"] = item.pop("company_display", None)
+    item["company_norm"] = item["company"]
+    canonical = item.pop("permalink_canonical", None)
+    if canonical:
+        item["permalink"] = canonical
+    # Keep the historical shape: labels only present when derived
+    for key in ("status", "metier"):
+        if not item.get(key):
+            item.pop(key, None)
+    if item.pop("opportunity", None):
+        item["opportunity"] = True
+
+
+def _fetch_posts_sync(ctx, skip: int, limit: int, q: Optional[str] = None, sort_by: Optional[str] = None, sort_dir: Optional[str] = None, intent: Optional[str] = None, include_raw: bool = False, cursor: Optional[str] = None) -> tuple[list[dict[str, Any]], Optional[str]]:
     q = _sanitize_query(q)
     sort_field, sort_direction = _normalize_sort(sort_by, sort_dir)
+    next_cursor: Optional[str] = None
     rows: list[dict[str, Any]] = []
-    def _derive_company(author: str, current_company: Optional[str], author_profile: Optional[str], text: Optional[str]) -> Optional[str]:
-        """Derive company name following strict rules:
-        
-        1. If author is a company (no /in/ in profile URL, or name in all caps), return None (empty)
-        2. If author is a person, try to extract company from text using @company, chez, at patterns
-        3. Never return post content, websites, or uncertain data
-        4. If company cannot be determined with certainty, return None
-        """
-        import re
-        
-        if not author:
-            return None
-        
-        author_clean = author.strip()
-        
-        # === RULE 1: Check if author IS a company (not a person) ===
-        # If author_profile exists and has /in/, it's a person
-        # If no /in/ or no profile, check name patterns
-        
-        is_company_author = False
-        
-        # No profile URL or profile is not /in/ = likely a company page
-        if not author_profile or not isinstance(author_profile, str):
-            is_company_author = True
-        elif '/in/' not in author_profile:
-            is_company_author = True
-        
-        # Name patterns that suggest company
-        company_name_markers = [
-            'notaires', 'notaire ', 'cabinet', 'étude', 'office', 'groupe', 'group',
-            'sas', 'sarl', 'sasu', 'eurl', 'sa ', 's.a.', 'inc', 'ltd', 'llc',
-            'associés', 'partners', 'avocats', 'conseil', 'consulting',
-        ]
-        author_lower = author_clean.lower()
-        if any(marker in author_lower for marker in company_name_markers):
-            is_company_author = True
-        
-        # ALL CAPS name = likely company
-        if len(author_clean) > 3 and author_clean.isupper():
-            is_company_author = True
-        
-        # More than 50% uppercase letters in a name > 5 chars = likely company
-        if len(author_clean) > 5:
-            upper_count = sum(1 for c in author_clean if c.isupper())
-            alpha_count = sum(1 for c in author_clean if c.isalpha())
-            if alpha_count > 0 and (upper_count / alpha_count) > 0.6:
-                is_company_author = True
-        
-        # If author is a company, leave enterprise column empty
-        if is_company_author:
-            return None
-        
-        # === RULE 2: Author is a person - try to find their company ===
-        
-        # First check if we already have a valid company stored
-        if current_company and current_company.strip():
-            cc = current_company.strip()
-            # Validate it's not post content
-            if len(cc) <= 50 and cc.lower() != author_lower:
-                content_markers = ['#', '🚀', '📢', '📍', '🔍', '!', '?', '\n', 
-                                  'recrute', 'recherche', 'http', 'www', '.com', '.fr']
-                if not any(m in cc for m in content_markers):
-                    return cc
-        
-        # === Try to extract company from text using patterns ===
-        if not text or not isinstance(text, str):
-            return None
-        
-        # Pattern 1: "Company recrute" or "Company Paris recrute" 
-        # This is the most common pattern in French job posts
-        recrute_match = re.search(r'([A-ZÀ-Ÿ][A-Za-zÀ-ÿ0-9\s&\'\-]{2,50}?)\s+(?:Paris\s+)?recrute', text)
-        if recrute_match:
-            company = recrute_match.group(1).strip()
-            # Remove leading emojis and common words
-            company = re.sub(r'^[🚀📢📣🔍📌💼✨👉‼️\s]+', '', company)
-            # Remove trailing "Paris" if present
-            company = re.sub(r'\s+Paris$', '', company, flags=re.IGNORECASE)
-            if company and 2 <= len(company) <= 50 and company.lower() != author_lower:
-                # Skip if it's a pronoun or common word
-                skip_words = ['je', 'nous', 'on', 'notre', 'mon', 'l\'étude', 'l\'entreprise', 'le', 'la', 'les']
-                if company.lower() not in skip_words and not company.lower().startswith('l\''):
-                    return company
-        
-        # Pattern 2: @CompanyName (but not URLs like @goodwinlaw.com)
-        at_match = re.search(r'@([A-Za-zÀ-ÿ][A-Za-zÀ-ÿ0-9\s&\'\-]{1,40})(?:\s|$|[,\.\!\?])', text)
-        if at_match:
-            company = at_match.group(1).strip()
-            # Skip if it looks like a URL/domain
-            if not re.match(r'^[a-z]+law$', company.lower()) and '.' not in company:
-                # Clean trailing words
-                company = re.sub(r'\s+(recrute|recherche|hiring|looking).*$', '', company, flags=re.IGNORECASE)
-                if company and 2 <= len(company) <= 50 and company.lower() != author_lower:
-                    return company
-        
-        # Pattern 3: "chez Company" or "at Company"
-        chez_match = re.search(r'\b(?:chez|at)\s+([A-Z][A-Za-zÀ-ÿ0-9\s&\'\-]{1,40}?)(?:\s*[,\.\!\?\-–|]|$)', text, re.IGNORECASE)
-        if chez_match:
-            company = chez_match.group(1).strip()
-            if company and 2 <= len(company) <= 50 and company.lower() != author_lower:
-                # Make sure it's not a job title
-                job_titles = ['notaire', 'avocat', 'juriste', 'consultant', 'manager', 'directeur']
-                if not any(company.lower().startswith(t) for t in job_titles):
-                    return company
-        
-        # === RULE 4: Cannot determine with certainty ===
-        return None
     # SQLite storage
     rows = []
     try:
         if ctx.settings.sqlite_path and Path(ctx.settings.sqlite_path).exists():
-            conn = sqlite3.connect(ctx.settings.sqlite_path)
-            conn.row_factory = sqlite3.Row
-            with conn:
-                # Ensure company column exists (migration-lite)
-                try:
-                    conn.execute("ALTER TABLE posts ADD COLUMN company TEXT")
-                except Exception:
-                    pass
-                _ensure_post_flags(conn)
-                # Dynamic column projection: tolerate minimal schemas used in tests
-                try:
-                    col_rows = conn.execute("PRAGMA table_info(posts)").fetchall()
-                    existing_cols = {r[1] for r in col_rows}
-                except Exception:
-                    existing_cols = set()
-                wanted = [
-                    ("id", "p.id as _id"),
-                    ("keyword", "p.keyword"),
-                    ("author", "p.author"),
-                    ("author_profile", "p.author_profile"),  # optional
-                    ("company", "p.company"),
-                    ("text", "p.text"),
-                    ("published_at", "p.published_at"),
-                    ("collected_at", "p.collected_at"),
-                    ("permalink", "p.permalink"),
-                    ("intent", "p.intent"),
-                    ("relevance_score", "p.relevance_score"),
-                    ("confidence", "p.confidence"),
-                    ("keywords_matched", "p.keywords_matched"),
-                    ("location_ok", "p.location_ok"),
-                    ("raw_json", "p.raw_json"),
+            with _repo(ctx).connection() as conn:
+                # Schema (columns, flags table, indexes) is guaranteed by scraper.repository migrations
+                select_parts = [
+                    "p.id as _id",
+                    "p.keyword",
+                    "p.author",
+                    "p.author_profile",
+                    "p.company",
+                    "p.text",
+                    "p.published_at",
+                    "p.collected_at",
+                    "p.permalink",
+                    "p.intent",
+                    "p.relevance_score",
+                    "p.confidence",
+                    "p.keywords_matched",
+                    "p.location_ok",
+                    "p.raw_json",
+                    # Display fields stored at write time (scraper.display_fields)
+                    "p.company_display",
+                    "p.status",
+                    "p.metier",
+                    "p.opportunity",
+                    "p.permalink_canonical",
+                    "p.display_version",
+                    # Flags columns appended
+                    "COALESCE(f.is_favorite,0) AS is_favorite",
+                    "COALESCE(f.is_deleted,0) AS is_deleted",
                 ]
-                select_parts: list[str] = []
-                for logical, expr in wanted:
-                    base_name = logical if logical != "id" else "id"
-                    if base_name in existing_cols:
-                        select_parts.append(expr)
-                    else:
-                        # Provide NULL alias for missing optional columns
-                        alias = logical if logical != "id" else "_id"
-                        if logical == "id":
-                            # id we always expect; ensure fallback
-                            select_parts.append("p.id as _id")
-                        elif logical == "author_profile":
-                            select_parts.append("NULL as author_profile")
-                        else:
-                            select_parts.append(f"NULL as {logical}")
-                # Flags columns appended
-                select_parts.append("COALESCE(f.is_favorite,0) AS is_favorite")
-                select_parts.append("COALESCE(f.is_deleted,0) AS is_deleted")
                 base_q = "SELECT " + ", ".join(select_parts) + " FROM posts p LEFT JOIN post_flags f ON f.post_id = p.id"
                 params: list[Any] = []
-                # Base WHERE pour exclure posts démo + corbeille
+                rank_sql = None
+                if q and sort_field == "relevance" and _repo(ctx).fts_enabled:
+                    match = fts_match_expression(q)
+                    if match:
+                        # bm25() is only valid inside the MATCH query: rank via a joined subquery
+                        base_q += " JOIN (SELECT rowid AS fts_rowid, bm25(posts_fts) AS fts_rank FROM posts_fts WHERE posts_fts MATCH ?) s ON s.fts_rowid = p.rowid"
+                        params.append(match)
+                        rank_sql = "s.fts_rank"
+                # Base WHERE pour exclure posts démo + corbeille + comptes bloqués
                 where_clauses = [
                     "LOWER(p.author) <> 'demo_recruteur'",
                     "LOWER(p.keyword) <> 'demo_recruteur'",
-                    "COALESCE(f.is_deleted,0) = 0"
+                    "COALESCE(f.is_deleted,0) = 0",
+                    _NOT_BLOCKED_SQL,
                 ]
-                if q:
-                    # Prefer accent-insensitive search if search_norm exists
-                    try:
-                        # Check if search_norm column exists once per connection
-                        cols = [r[1] for r in conn.execute("PRAGMA table_info(posts)").fetchall()]
-                        if "search_norm" in cols:
-                            # Prefer search_norm; for legacy rows where it's NULL, fallback to LIKE on original fields
-                            where_clauses.append("(p.search_norm LIKE ? OR (p.search_norm IS NULL AND (p.text LIKE ? OR p.author LIKE ? OR p.company LIKE ? OR p.keyword LIKE ?)))")
-                            qn = _normalize_for_search(q)
-                            pat_norm = f"%{qn}%"
-                            pat_raw = f"%{q}%"
-                            params.extend([pat_norm, pat_raw, pat_raw, pat_raw, pat_raw])
-                        else:
-                            where_clauses.append("(p.text LIKE ? OR p.author LIKE ? OR p.company LIKE ? OR p.keyword LIKE ?)")
-                            pat = f"%{q}%"
-                            params.extend([pat, pat, pat, pat])
-                    except Exception:
-                        where_clauses.append("(p.text LIKE ? OR p.author LIKE ? OR p.company LIKE ? OR p.keyword LIKE ?)")
-                        pat = f"%{q}%"
-                        params.extend([pat, pat, pat, pat])
+                if q and rank_sql is None:
+                    # Accent-insensitive search (search_norm is backfilled by migration 002)
+                    clause, clause_params = _search_clause(ctx, q)
+                    where_clauses.append(clause)
+                    params.extend(clause_params)
                 if intent and intent in ("recherche_profil","autre"):
-                    # Prefer explicit column if present else fallback raw_json LIKE
-                    try:
-                        col_rows = conn.execute("PRAGMA table_info(posts)").fetchall()
-                        col_names = {r[1] for r in col_rows}
-                    except Exception:
-                        col_names = set()
-                    if 'intent' in col_names:
-                        where_clauses.append("COALESCE(p.intent,'') = ?")
-                        params.append(intent)
-                    else:
-                        where_clauses.append("p.raw_json LIKE ?")
-                        params.append(f'%"intent": "{intent}"%')
-                if where_clauses:
-                    base_q += " WHERE " + " AND ".join(where_clauses)
-                # Order by requested field (use collected_at as fallback for virtual fields like metier)
-                sql_sort_field = sort_field if not _is_virtual_sort_field(sort_field) else "collected_at"
-                sqlite_field = f"p.{sql_sort_field}"
+                    where_clauses.append("COALESCE(p.intent,'') = ?")
+                    params.append(intent)
                 dir_sql = "ASC" if sort_direction == 1 else "DESC"
-                base_q += f" ORDER BY COALESCE(f.is_favorite,0) DESC, {sqlite_field} {dir_sql} LIMIT ? OFFSET ?"
-                params.extend([limit, skip])
-                for r in conn.execute(base_q, params):
+                if rank_sql or _is_virtual_sort_field(sort_field):
+                    # Order by rank (collected_at when no FTS match): OFFSET paging only
+                    sqlite_field = "p.collected_at"
+                    if rank_sql:
+                        # bm25: lower is better, so "desc" (default) means best match first
+                        sqlite_field = rank_sql
+                        dir_sql = "DESC" if sort_direction == 1 else "ASC"
+                    base_q += " WHERE " + " AND ".join(where_clauses)
+                    base_q += f" ORDER BY COALESCE(f.is_favorite,0) DESC, {sqlite_field} {dir_sql} LIMIT ? OFFSET ?"
+                    params.extend([limit, skip])
+                    sql_rows = conn.execute(base_q, params).fetchall()
+                else:
+                    # Keyset pagination on (favorite, sort key, id); NULL keys sort as '' (last in DESC)
+                    sort_expr = f"IFNULL(p.{sort_field},'')"
+                    base_q = base_q.replace(" FROM posts p", f", {sort_expr} AS _sort_key FROM posts p", 1)
+                    after = _decode_cursor(cursor, sort_field, sort_direction)
+                    sql_rows = _keyset_rows(conn, base_q, where_clauses, params, sort_expr, dir_sql, limit, skip, after)
+                    if len(sql_rows) >= limit:
+                        last = sql_rows[-1]
+                        next_cursor = _encode_cursor(last["is_favorite"], last["_sort_key"], last["_id"], sort_field, sort_direction)
+                for r in sql_rows:
                     item = dict(r)
+                    item.pop("_sort_key", None)
                     item["is_favorite"] = int(item.get("is_favorite", 0) or 0)
                     item["is_deleted"] = int(item.get("is_deleted", 0) or 0)
-                    # Derive company if missing or equal to author
-                    try:
-                        item["company"] = _derive_company(str(item.get("author") or ""), item.get("company"), item.get("author_profile"), item.get("text")) or item.get("company")
-                        # Provide company_norm (non-persistent here; persisted by background task)
-                        if not item.get("company_norm"):
-                            cn = _derive_company(str(item.get("author") or ""), item.get("company"), item.get("author_profile"), item.get("text"))
-                            if cn:
-                                item["company_norm"] = cn
-                    except Exception:
-                        pass
+                    _apply_display_fields(ctx, item)
                     # Attach raw/classification debug if requested and columns exist (attempt to parse raw_json)
                     if include_raw:
                         try:
@@ -1070,227 +743,26 @@ async def fetch_posts(ctx, skip: int, limit: int, q: Optional[str] = None, sort_
     except Exception as exc:  # pragma: no cover
         ctx.logger.warning("sqlite_fallback_query_failed", error=str(exc))
 
-    # Apply flag annotations for rows
-    try:
-        if rows and ctx.settings.sqlite_path and Path(ctx.settings.sqlite_path).exists():
-            conn = sqlite3.connect(ctx.settings.sqlite_path)
-            with conn:
-                ids = [str(item.get("_id")) for item in rows if item.get("_id")]
-                flags = _flags_for_ids(conn, ids)
-            filtered: list[dict[str, Any]] = []
-            for item in rows:
-                pid = str(item.get("_id")) if item.get("_id") else None
-                flag = flags.get(pid) if pid else None
-                if flag:
-                    item["is_favorite"] = int(flag.get("is_favorite") or 0)
-                    item["is_deleted"] = int(flag.get("is_deleted") or 0)
-                    if item["is_deleted"]:
-                        continue
-                else:
-                    item["is_favorite"] = int(item.get("is_favorite") or 0)
-                    item["is_deleted"] = int(item.get("is_deleted") or 0)
-                filtered.append(item)
-            # Always surface favorites first while preserving original relative order
-            favorites = [itm for itm in filtered if int(itm.get("is_favorite") or 0) == 1]
-            others = [itm for itm in filtered if int(itm.get("is_favorite") or 0) != 1]
-            rows = favorites + others
-    except Exception as exc:  # pragma: no cover
-        ctx.logger.debug("flags_annotation_failed", error=str(exc))
-    # Final UI-level deduplication to avoid showing duplicate entries
-    try:
-        if rows:
-            seen: set[str] = set()
-            deduped: list[dict[str, Any]] = []
-            # 7-day window dedup memory (per request) to suppress older duplicates in last week
-            from datetime import datetime, timezone, timedelta
-            now = datetime.now(timezone.utc)
-            week_ago = now - timedelta(days=7)
-            recent_keys: dict[str, datetime] = {}
-            # Optional: attempt to fetch content_hash for rows coming from SQLite path (only if available)
-            content_hash_map: dict[str, str] = {}
-            try:
-                # Only build map if sqlite file exists and ids present
-                if ctx.settings.sqlite_path and Path(ctx.settings.sqlite_path).exists():
-                    conn = sqlite3.connect(ctx.settings.sqlite_path)
-                    conn.row_factory = sqlite3.Row
-                    with conn:
-                        ids = [itm.get("_id") for itm in rows if itm.get("_id")]
-                        if ids:
-                            placeholders = ",".join(["?"]*len(ids))
-                            for r in conn.execute(f"SELECT id, content_hash, permalink FROM posts WHERE id IN ({placeholders})", ids):
-                                if r[1]:
-                                    content_hash_map[str(r[0])] = str(r[1])
-            except Exception:
-                content_hash_map = {}
-            for item in rows:
-                # Sanitize author duplication in display
-                item_author = _dedupe_person_name(item.get("author"))
-                item_author = _strip_followers_suffix(item_author)
-                # Extra hardening: if author still matches follower pattern alone, blank it -> 'Unknown'
-                try:
-                    if item_author and _looks_like_followers(item_author):
-                        item_author = "Unknown"
-                except Exception:
-                    pass
-                if item_author:
-                    item["author"] = item_author
-                # Fix / enhance company
-                comp = item.get("company")
-                if not comp or str(comp).strip().lower() == str(item.get("author") or "").strip().lower():
-                    # Prefer author_profile first if present
-                    prof = item.get("author_profile")
-                    derived = None
-                    if prof:
-                        derived = _derive_company(item.get("author") or "", prof, item.get("text"))
-                    if not derived:
-                        derived = _derive_company(item.get("author") or "", item.get("author_profile"), item.get("text"))
-                    if derived:
-                        item["company"] = derived
-                # Sanitize company and ensure we don't show author as company
-                item["company"] = _sanitize_company(item.get("company"))
-                item["company"] = _strip_followers_suffix(item.get("company")) or item.get("company")
-                item["company"] = _dedupe_repeated_phrase(item.get("company")) or item.get("company")
-                if (item.get("company") or "").strip().lower() == (item.get("author") or "").strip().lower():
-                    item["company"] = None
-                # Derive contract status for UI
-                status = _extract_contract_status(item.get("text"))
-                if status:
-                    item["status"] = status
-                # Derive metier and opportunity
-                metier = _extract_metier(item.get("text"))
-                if metier:
-                    item["metier"] = metier
-                try:
-                    if _scrape_utils.is_opportunity(item.get("text"), threshold=ctx.settings.recruitment_signal_threshold):
-                        item["opportunity"] = True
-                except Exception:
-                    pass
-                perma_raw = item.get("permalink") or ""
-                if perma_raw:
-                    # Canonicalise: drop trailing slash & unify activity id pattern
-                    perma_norm = perma_raw.split('?',1)[0].split('#',1)[0].rstrip('/')
-                    # Convert various forms to standard activity URL if activity id present
-                    import re as _re
-                    m = _re.search(r"(urn:li:activity:(\d+))|(activity/(\d+))", perma_norm)
-                    if m:
-                        act = m.group(2) or m.group(4)
-                        if act:
-                            perma_norm = f"https://www.linkedin.com/feed/update/urn:li:activity:{act}"
-                    if perma_norm != perma_raw:
-                        item["permalink"] = perma_norm
-                perma = item.get("permalink") or ""
-                author = (item.get("author") or "")
-                published = item.get("published_at") or ""
-                text = (item.get("text") or "")
-                # Prefer permalink; fallback author+published; then content_hash if available; else text snippet hash
-                if perma:
-                    key = f"perma|{perma}"
-                elif author and published:
-                    key = f"authdate|{author}|{published}"
-                else:
-                    ch = None
-                    pid = item.get("_id")
-                    if pid and pid in content_hash_map:
-                        ch = content_hash_map[pid]
-                    if not ch:
-                        import hashlib
-                        snippet = text[:220]
-                        reduced = __import__('re').sub(r"\d{2,}", "#", __import__('re').sub(r"\s+", " ", snippet))
-                        ch = hashlib.sha1(reduced.encode('utf-8', errors='ignore')).hexdigest()[:12]
-                    key = f"authtext|{author}|{ch}"
-                if key in seen:
-                    # Secondary suppression: if duplicate within 7-day window, skip older one
-                    try:
-                        ts_raw = item.get("published_at") or item.get("collected_at")
-                        ts = datetime.fromisoformat(str(ts_raw).replace("Z","+00:00")) if ts_raw else None
-                        if key in recent_keys and ts and ts < recent_keys[key] and ts > week_ago:
-                            continue
-                    except Exception:
-                        continue
-                else:
-                    # Record first timestamp for window logic
-                    try:
-                        ts_raw = item.get("published_at") or item.get("collected_at")
-                        ts = datetime.fromisoformat(str(ts_raw).replace("Z","+00:00")) if ts_raw else None
-                        if ts:
-                            recent_keys[key] = ts
-                    except Exception:
-                        pass
-                seen.add(key)
-                deduped.append(item)
-            rows = deduped
-    except Exception:
-        pass
-
-    # Exclude posts coming from blocked accounts (by LinkedIn URL slug matched against author/company)
-    try:
-        items = await _blocked_list(ctx)
-        blocked_names: set[str] = set()
-        for it in items:
-            u = (it.get("url") or "").strip()
-            if not u:
-                continue
-            slug = _blocked_slug_from_url(u)
-            if slug:
-                blocked_names.add(slug)
-        if blocked_names and rows:
-            def _norm_name(s: Any) -> str:
-                try:
-                    from scraper.utils import normalize_for_search as _nfs  # type: ignore
-                    return _nfs(str(s or "")).strip()
-                except Exception:
-                    return str(s or "").strip().lower()
-            filtered_rows: list[dict[str, Any]] = []
-            for it in rows:
-                a = _norm_name(it.get("author"))
-                c = _norm_name(it.get("company"))
-                # direct equality or substring match to be tolerant to suffixes
-                is_blocked = any(
-                    (bn and ((a and (a == bn or bn in a)) or (c and (c == bn or bn in c))))
-                    for bn in blocked_names
-                )
-                if not is_blocked:
-                    filtered_rows.append(it)
-            rows = filtered_rows
-    except Exception:
-        # On any error, do not block results; better to show than break
-        pass
-    
-    # Post-fetch sort for virtual fields (e.g., metier)
-    if rows and _is_virtual_sort_field(sort_field):
-        reverse_order = (sort_direction == -1)
-        rows = sorted(rows, key=lambda x: (x.get(sort_field) or "").lower(), reverse=reverse_order)
-    
-    return rows
+    return rows, next_cursor
 
 
 async def count_posts(ctx, q: Optional[str] = None) -> int:
+    return await _db(ctx, _count_posts_sync, ctx, q)
+
+
+def _count_posts_sync(ctx, q: Optional[str] = None) -> int:
     q = _sanitize_query(q)
     # SQLite storage
     try:
         if ctx.settings.sqlite_path and Path(ctx.settings.sqlite_path).exists():
-            conn = sqlite3.connect(ctx.settings.sqlite_path)
-            with conn:
+            with _repo(ctx).connection() as conn:
                 # Exclude demo content unconditionally
-                base_where = ["LOWER(p.author) <> 'demo_recruteur'", "LOWER(p.keyword) <> 'demo_recruteur'", "COALESCE(f.is_deleted,0) = 0"]
+                base_where = ["LOWER(p.author) <> 'demo_recruteur'", "LOWER(p.keyword) <> 'demo_recruteur'", "COALESCE(f.is_deleted,0) = 0", _NOT_BLOCKED_SQL]
                 params: list[Any] = []
                 if q:
-                    try:
-                        cols = [r[1] for r in conn.execute("PRAGMA table_info(posts)").fetchall()]
-                        if "search_norm" in cols:
-                            qn = _normalize_for_search(q)
-                            pat_norm = f"%{qn}%"
-                            pat_raw = f"%{q}%"
-                            base_where.append("(p.search_norm LIKE ? OR (p.search_norm IS NULL AND (p.text LIKE ? OR p.author LIKE ? OR p.company LIKE ? OR p.keyword LIKE ?)))")
-                            params.extend([pat_norm, pat_raw, pat_raw, pat_raw, pat_raw])
-                        else:
-                            base_where.append("(p.text LIKE ? OR p.author LIKE ? OR p.company LIKE ? OR p.keyword LIKE ?)")
-                            pat = f"%{q}%"
-                            params.extend([pat, pat, pat, pat])
-                    except Exception:
-                        base_where.append("(p.text LIKE ? OR p.author LIKE ? OR p.company LIKE ? OR p.keyword LIKE ?)")
-                        pat = f"%{q}%"
-                        params.extend([pat, pat, pat, pat])
+                    clause, clause_params = _search_clause(ctx, q)
+                    base_where.append(clause)
+                    params.extend(clause_params)
                 query = (
                     "SELECT COUNT(*) FROM posts p LEFT JOIN post_flags f ON f.post_id = p.id"
                     + (" WHERE " + " AND ".join(base_where) if base_where else "")
@@ -1310,14 +782,24 @@ async def fetch_meta(ctx) -> dict[str, Any]:
         "pending_jobs": None,
         "keywords": ", ".join(ctx.settings.keywords),
     }
-    # SQLite meta: prefer explicit meta table when present, then approximate posts_count from posts
     # NOTE: scraping_enabled is NOT read from SQLite - always use ctx.settings.scraping_enabled
     # to avoid stale state from previous sessions overriding the default True value
+    meta.update(await _db(ctx, _fetch_meta_sqlite, ctx))
+    if ctx.redis:
+        try:
+            meta["pending_jobs"] = await ctx.redis.llen(ctx.settings.redis_queue_key)
+        except Exception:  # pragma: no cover
+            meta["pending_jobs"] = None
+    return meta
+
+
+def _fetch_meta_sqlite(ctx) -> dict[str, Any]:
+    """SQLite meta: prefer explicit meta table when present, then posts_count from daily_stats."""
+    meta: dict[str, Any] = {}
     try:
         if ctx.settings.sqlite_path and Path(ctx.settings.sqlite_path).exists():
-            conn = sqlite3.connect(ctx.settings.sqlite_path)
-            with conn:
-                # Try meta table first (created by worker.update_meta)
+            with _repo(ctx).connection() as conn:
+                # Try meta table first (maintained by worker.update_meta)
                 try:
                     row = conn.execute("SELECT last_run, COALESCE(posts_count,0) FROM meta WHERE id = 'global'").fetchone()
                     if row:
@@ -1326,21 +808,11 @@ async def fetch_meta(ctx) -> dict[str, Any]:
                         # meta["scraping_enabled"] stays as ctx.settings.scraping_enabled (default True)
                 except Exception:
                     pass
-                # Fallback: compute posts_count from posts if meta table not present
-                _ensure_post_flags(conn)
-                c = conn.execute(
-                    "SELECT COUNT(*) FROM posts p LEFT JOIN post_flags f ON f.post_id = p.id "
-                    "WHERE LOWER(p.author) <> 'demo_recruteur' AND LOWER(p.keyword) <> 'demo_recruteur' AND COALESCE(f.is_deleted,0) = 0"
-                ).fetchone()
-                if c and (not meta.get("posts_count")):
-                    meta["posts_count"] = int(c[0] or 0)
+                # Fallback: live non-demo posts, read from the trigger-maintained aggregates
+                if not meta.get("posts_count"):
+                    meta["posts_count"] = _visible_posts_count(conn)
     except Exception:  # pragma: no cover
         pass
-    if ctx.redis:
-        try:
-            meta["pending_jobs"] = await ctx.redis.llen(ctx.settings.redis_queue_key)
-        except Exception:  # pragma: no cover
-            meta["pending_jobs"] = None
     return meta
 
 
@@ -1364,7 +836,7 @@ async def dashboard(
     skip = (page - 1) * limit
     posts = await fetch_posts(ctx, skip=skip, limit=limit, q=q, sort_by=sort_by, sort_dir=sort_dir, intent=intent, include_raw=False)
     meta = await fetch_meta(ctx)
-    trash_count = _count_deleted(ctx)
+    trash_count = await _db(ctx, _count_deleted, ctx)
     # Compute naive total pages if meta count known
     if _sanitize_query(q):
         total = await count_posts(ctx, q)
@@ -1414,7 +886,7 @@ async def dashboard_demo(
     skip = (page - 1) * limit
     posts = await fetch_posts(ctx, skip=skip, limit=limit, q=q, sort_by=sort_by, sort_dir=sort_dir, intent=intent, include_raw=False)
     meta = await fetch_meta(ctx)
-    trash_count = _count_deleted(ctx)
+    trash_count = await _db(ctx, _count_deleted, ctx)
     if _sanitize_query(q):
         total = await count_posts(ctx, q)
     else:
@@ -1442,70 +914,117 @@ async def dashboard_demo(
     )
 
 
-def _format_iso_for_export(value: Optional[str]) -> str:
-    if not value:
-        return ""
-    try:
-        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
-        return dt.astimezone(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-    except Exception:
-        return value or ""
+_format_iso_for_export = _export.format_iso_for_export
+
+
+async def _iter_export_chunks(
+    ctx,
+    state: dict[str, Any],
+    *,
+    skip: int,
+    limit: Optional[int],
+    q: Optional[str],
+    sort_by: Optional[str],
+    sort_dir: Optional[str],
+    cursor: Optional[str],
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Yield export rows page by page (keyset cursor, OFFSET for relevance sort).
+
+    Stops after ``limit`` rows when given; ``state["next_cursor"]`` then holds
+    the cursor to resume from.
+    """
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = _export.EXPORT_CHUNK_ROWS if remaining is None else min(_export.EXPORT_CHUNK_ROWS, remaining)
+        posts, next_cursor = await fetch_posts_page(ctx, skip=skip, limit=size, q=q, sort_by=sort_by, sort_dir=sort_dir, cursor=cursor)
+        if posts:
+            yield posts
+        if len(posts) < size:
+            return
+        if remaining is not None:
+            remaining -= len(posts)
+        state["next_cursor"] = next_cursor
+        if next_cursor:
+            cursor = next_cursor
+        else:
+            skip += len(posts)
+
+
+def _export_response(body, media_type: str, extension: str, headers: Optional[dict[str, str]] = None) -> StreamingResponse:
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    filename = f"linkedin_posts_{timestamp}.{extension}"
+    all_headers = {"Content-Disposition": f'attachment; filename="{filename}"', **(headers or {})}
+    return StreamingResponse(body, media_type=media_type, headers=all_headers)
 
 
 @router.get("/export/excel")
 async def export_excel(
     page: int = Query(1, ge=1),
-    limit: int = Query(1000, ge=1, le=5000),
+    limit: Optional[int] = Query(None, ge=1, description="Nombre maximum de lignes (toutes par défaut)"),
     q: Optional[str] = Query(None),
     sort_by: Optional[str] = Query(None),
     sort_dir: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
     ctx=Depends(get_auth_context),
     _auth=Depends(require_auth),
     _ls=Depends(require_linkedin_session),
 ):
-    # Lazy import pandas to avoid failing app startup if numpy/pandas cannot load in frozen builds
+    """Excel export of the dashboard listing, written in constant memory then streamed."""
+    state: dict[str, Any] = {}
+    skip = (page - 1) * limit if limit else 0
+    chunks = _iter_export_chunks(ctx, state, skip=skip, limit=limit, q=q, sort_by=sort_by, sort_dir=sort_dir, cursor=cursor)
     try:
-        import pandas as pd  # type: ignore
-    except Exception as e:  # pragma: no cover
+        fh = await _export.write_xlsx(chunks)
+    except ImportError as e:  # pragma: no cover
         try:
-            ctx.logger.error("export_excel_pandas_unavailable", error=str(e))
+            ctx.logger.error("export_excel_xlsxwriter_unavailable", error=str(e))
         except Exception:
             pass
         return PlainTextResponse(
-            "Export Excel indisponible: dépendance pandas/numpy introuvable. Réinstallez l'application.",
+            "Export Excel indisponible: dépendance XlsxWriter introuvable. Réinstallez l'application.",
             status_code=500,
         )
-    # Clamp limit defensively
-    limit = min(limit, 5000)
-    skip = (page - 1) * limit
-    posts = await fetch_posts(ctx, skip=skip, limit=limit, q=q, sort_by=sort_by, sort_dir=sort_dir)
-    rows: list[dict[str, Any]] = []
-    for post in posts:
-        rows.append({
-            "Keyword": post.get("keyword", ""),
-            "Auteur": post.get("author", ""),
-            "Entreprise": post.get("company") or "",
-            "Statut": post.get("status") or "",
-            "Métier": post.get("metier") or "",
-            "Texte": post.get("text") or "",
-            "Publié le": _format_iso_for_export(post.get("published_at")),
-            "Collecté le": _format_iso_for_export(post.get("collected_at")),
-            "Lien": post.get("permalink") or "",
-        })
-    columns = ["Keyword", "Auteur", "Entreprise", "Statut", "Métier", "Texte", "Publié le", "Collecté le", "Lien"]
-    df = pd.DataFrame(rows, columns=columns)
-    buffer = io.BytesIO()
-    with pd.ExcelWriter(buffer, engine="xlsxwriter") as writer:
-        df.to_excel(writer, index=False, sheet_name="Posts")
-    buffer.seek(0)
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-    filename = f"linkedin_posts_{timestamp}.xlsx"
-    headers = {"Content-Disposition": f'attachment; filename="{filename}"'}
-    return Response(
-        content=buffer.getvalue(),
-        media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers=headers,
-    )
+    headers = {}
+    if limit and state.get("next_cursor"):
+        # Next chunk: /export/excel?cursor=<X-Next-Cursor> (same sort/limit)
+        headers["X-Next-Cursor"] = state["next_cursor"]
+    return _export_response(_export.iter_file(fh), _export.XLSX_MEDIA_TYPE, "xlsx", headers)
+
+
+@router.get("/export/csv")
+async def export_csv(
+    page: int = Query(1, ge=1),
+    limit: Optional[int] = Query(None, ge=1, description="Nombre maximum de lignes (toutes par défaut)"),
+    q: Optional[str] = Query(None),
+    sort_by: Optional[str] = Query(None),
+    sort_dir: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    ctx=Depends(get_auth_context),
+    _auth=Depends(require_auth),
+    _ls=Depends(require_linkedin_session),
+):
+    """CSV export streamed while rows are read (same columns as the Excel export)."""
+    skip = (page - 1) * limit if limit else 0
+    chunks = _iter_export_chunks(ctx, {}, skip=skip, limit=limit, q=q, sort_by=sort_by, sort_dir=sort_dir, cursor=cursor)
+    return _export_response(_export.iter_csv(chunks), "text/csv; charset=utf-8", "csv")
+
+
+@router.get("/export/ndjson")
+async def export_ndjson(
+    page: int = Query(1, ge=1),
+    limit: Optional[int] = Query(None, ge=1, description="Nombre maximum de lignes (toutes par défaut)"),
+    q: Optional[str] = Query(None),
+    sort_by: Optional[str] = Query(None),
+    sort_dir: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None),
+    ctx=Depends(get_auth_context),
+    _auth=Depends(require_auth),
+    _ls=Depends(require_linkedin_session),
+):
+    """One JSON object per post and per line, streamed while rows are read."""
+    skip = (page - 1) * limit if limit else 0
+    chunks = _iter_export_chunks(ctx, {}, skip=skip, limit=limit, q=q, sort_by=sort_by, sort_dir=sort_dir, cursor=cursor)
+    return _export_response(_export.iter_ndjson(chunks), "application/x-ndjson", "ndjson")
 
 
 _local_queue: asyncio.Queue[list[str]] | None = None
@@ -1629,11 +1148,12 @@ async def api_posts(
     sort_dir: Optional[str] = Query(None),
     ctx=Depends(get_auth_context),
     include_raw: Optional[int] = Query(0, description="Inclure bloc classification_debug et raw minimal si =1"),
+    cursor: Optional[str] = Query(None, description="Curseur opaque renvoyé par la page précédente (next_cursor)"),
     # min_score removed
 ):
     skip = (page - 1) * limit
-    posts = await fetch_posts(ctx, skip=skip, limit=limit, q=q, sort_by=sort_by, sort_dir=sort_dir, include_raw=bool(include_raw))
-    return {"page": page, "limit": limit, "items": posts, "include_raw": bool(include_raw)}
+    posts, next_cursor = await fetch_posts_page(ctx, skip=skip, limit=limit, q=q, sort_by=sort_by, sort_dir=sort_dir, include_raw=bool(include_raw), cursor=cursor)
+    return {"page": page, "limit": limit, "items": posts, "include_raw": bool(include_raw), "next_cursor": next_cursor}
 
 
 @router.post("/api/posts/{post_id}/favorite")
@@ -1657,9 +1177,9 @@ async def api_toggle_favorite(
     if payload is not None and isinstance(payload, dict) and "favorite" in payload:
         favorite = bool(payload.get("favorite", True))
     else:
-        cur = _get_post_flags(ctx, post_id)
+        cur = await _db(ctx, _get_post_flags, ctx, post_id)
         favorite = not bool(cur.get("is_favorite", 0))
-    flags = _update_post_flags(ctx, post_id, favorite=favorite)
+    flags = await _db(ctx, _update_post_flags, ctx, post_id, favorite=favorite)
     return {"post_id": post_id, "is_favorite": flags.get("is_favorite", 0)}
 
 
@@ -1679,11 +1199,11 @@ async def api_delete_post(
     except Exception:
         payload = None
     mark_deleted = True if payload is None else bool(payload.get("delete", True))
-    flags = _update_post_flags(ctx, post_id, deleted=mark_deleted)
+    flags = await _db(ctx, _update_post_flags, ctx, post_id, deleted=mark_deleted)
     return {
         "post_id": post_id,
         "is_deleted": flags.get("is_deleted", 0),
-        "trash_count": _count_deleted(ctx),
+        "trash_count": await _db(ctx, _count_deleted, ctx),
     }
 
 
@@ -1692,11 +1212,11 @@ async def api_restore_post(
     post_id: str,
     ctx=Depends(get_auth_context),
 ):
-    flags = _update_post_flags(ctx, post_id, deleted=False)
+    flags = await _db(ctx, _update_post_flags, ctx, post_id, deleted=False)
     return {
         "post_id": post_id,
         "is_deleted": flags.get("is_deleted", 0),
-        "trash_count": _count_deleted(ctx),
+        "trash_count": await _db(ctx, _count_deleted, ctx),
     }
 
 
@@ -1707,14 +1227,17 @@ async def api_purge_post(
     _auth=Depends(require_auth),
 ):
     """Purge définitivement un post (suppression de la base et des flags)."""
+    removed = await _db(ctx, _purge_post_sync, ctx, post_id)
+    return {"post_id": post_id, "removed": removed, "trash_count": await _db(ctx, _count_deleted, ctx)}
+
+
+def _purge_post_sync(ctx, post_id: str) -> int:
     removed = 0
     # SQLite
     path = ctx.settings.sqlite_path
     if path and Path(path).exists():
-        import sqlite3 as _sqlite
         try:
-            conn = _sqlite.connect(path)
-            with conn:
+            with _repo(ctx).connection() as conn:
                 try:
                     conn.execute("DELETE FROM post_flags WHERE post_id=?", (post_id,))
                 except Exception:
@@ -1723,7 +1246,7 @@ async def api_purge_post(
                 removed += int(res.rowcount or 0)
         except Exception:
             pass
-    return {"post_id": post_id, "removed": removed, "trash_count": _count_deleted(ctx)}
+    return removed
 
 
 @router.post("/api/trash/empty")
@@ -1732,16 +1255,17 @@ async def api_trash_empty(
     _auth=Depends(require_auth),
 ):
     """Supprime définitivement tous les posts marqués supprimés (corbeille)."""
+    removed_sqlite = await _db(ctx, _empty_trash_sync, ctx)
+    return {"ok": True, "removed_sqlite": removed_sqlite, "trash_count": await _db(ctx, _count_deleted, ctx)}
+
+
+def _empty_trash_sync(ctx) -> int:
     removed_sqlite = 0
     path = ctx.settings.sqlite_path
     deleted_ids: list[str] = []
     if path and Path(path).exists():
-        import sqlite3 as _sqlite
         try:
-            conn = _sqlite.connect(path)
-            conn.row_factory = _sqlite.Row
-            with conn:
-                _ensure_post_flags(conn)
+            with _repo(ctx).connection() as conn:
                 ids = [r[0] for r in conn.execute("SELECT post_id FROM post_flags WHERE is_deleted = 1").fetchall()]
                 deleted_ids = ids
                 # Purge flags first, then posts
@@ -1753,22 +1277,25 @@ async def api_trash_empty(
                         pass
                     res = conn.execute(f"DELETE FROM posts WHERE id IN ({placeholders})", ids)
                     removed_sqlite = int(res.rowcount or 0)
+            if deleted_ids:
+                # VACUUM cannot run inside the delete transaction; use a fresh autocommit borrow
+                with _repo(ctx).connection() as conn:
                     try:
                         conn.execute("VACUUM")
+                        # VACUUM may renumber posts.rowid, which posts_fts is keyed on
+                        rebuild_search_index(conn)
                     except Exception:
                         pass
         except Exception:
             pass
-    if deleted_ids:
-        pass  # All deletion already handled in SQLite above
-    return {"ok": True, "removed_sqlite": removed_sqlite, "trash_count": _count_deleted(ctx)}
+    return removed_sqlite
 
 
 @router.get("/api/trash/count")
 async def api_trash_count(
     ctx=Depends(get_auth_context),
 ):
-    return {"count": _count_deleted(ctx)}
+    return {"count": await _db(ctx, _count_deleted, ctx)}
 
 
 @router.get("/corbeille", response_class=HTMLResponse)
@@ -1778,17 +1305,26 @@ async def trash_page(
     _auth=Depends(require_auth),
     _ls=Depends(require_linkedin_session),
 ):
-    posts = _fetch_deleted_posts(ctx)
+    posts = await _db(ctx, _fetch_deleted_posts, ctx)
     return templates.TemplateResponse(
         "trash.html",
         {
             "request": request,
             "posts": posts,
-            "trash_count": _count_deleted(ctx),
+            "trash_count": await _db(ctx, _count_deleted, ctx),
         },
     )
 
 
+def _latest_collected_at(ctx):
+    with _repo(ctx).connection() as conn:
+        # Exclude deleted posts (post_flags guaranteed by migrations)
+        row = conn.execute(
+            "SELECT MAX(p.collected_at) FROM posts p LEFT JOIN post_flags f ON f.post_id = p.id WHERE COALESCE(f.is_deleted,0) = 0"
+        ).fetchone()
+    return row[0] if row else None
+
+
 @router.get("/health")
 async def health(ctx=Depends(get_auth_context)):
     # Base status
@@ -1816,18 +1352,7 @@ async def health(ctx=Depends(get_auth_context)):
         # If still no last_run and SQLite is used, derive from latest collected_at
         if not data.get("last_run") and ctx.settings.sqlite_path and Path(ctx.settings.sqlite_path).exists():
             try:
-                conn = sqlite3.connect(ctx.settings.sqlite_path)
-                with conn:
-                    # Exclude deleted posts if flags table exists
-                    # We do a LEFT JOIN and allow missing flags table by try/except
-                    try:
-                        conn.execute("SELECT 1 FROM post_flags LIMIT 1")
-                        row = conn.execute(
-                            "SELECT MAX(p.collected_at) FROM posts p LEFT JOIN post_flags f ON f.post_id = p.id WHERE COALESCE(f.is_deleted,0) = 0"
-                        ).fetchone()
-                    except Exception:
-                        row = conn.execute("SELECT MAX(collected_at) FROM posts").fetchone()
-                latest = row[0] if row else None
+                latest = await _db(ctx, _latest_collected_at, ctx)
                 if latest:
                     data["last_run"] = latest
                     try:
@@ -1895,73 +1420,15 @@ async def admin_normalize_companies(ctx=Depends(get_auth_context), _auth=Depends
     """Manual trigger for company normalization (SQLite only).
     Returns number of rows updated in this invocation.
     """
-    import sqlite3, json, re
     from pathlib import Path
+    from scraper.maintenance import normalize_company_norms
     if not ctx.settings.sqlite_path or not Path(ctx.settings.sqlite_path).exists():
         raise HTTPException(status_code=400, detail="SQLite indisponible")
-    conn = sqlite3.connect(ctx.settings.sqlite_path)
-    conn.row_factory = sqlite3.Row
-    updated = 0; scanned = 0
-    # Lightweight derivation (reuse simplified subset identical to background job)
-    CAPITAL_RE = re.compile(r"(?:(?:[A-Z][A-Za-z&\-]{1,}\s){0,3}[A-Z][A-Za-z&\-]{1,})")
-    EXCLUDE = {"freelance","consultant","independant","indépendant","recruteur"}
-    def derive(author: str, company: str|None, profile: str|None, text: str|None):
-        try:
-            if company and company.strip() and company.strip().lower() != author.strip().lower():
-                return company
-            cand_blocks = []
-            if profile and profile.strip().startswith('{'):
-                try:
-                    pobj = json.loads(profile)
-                    for k in ("company","organization","org","headline","subtitle","occupation","title"):
-                        v = pobj.get(k)
-                        if isinstance(v,str): cand_blocks.append(v)
-                except Exception: pass
-            if text: cand_blocks.append(text[:240])
-            out_candidates = []
-            for raw in cand_blocks:
-                if not raw: continue
-                low = raw.lower()
-                for marker in ["chez "," at "," @"]:
-                    if marker in low:
-                        seg = raw[low.find(marker)+len(marker):]
-                        out_candidates.append(seg)
-                for part in re.split(r"\s[|·•-]\s|,", raw):
-                    out_candidates.append(part)
-                for m in CAPITAL_RE.findall(raw):
-                    out_candidates.append(m)
-            cleaned = []
-            for c in out_candidates:
-                c2 = c.strip().strip('-–|·•').strip()
-                if not c2 or len(c2)<2: continue
-                if c2.lower()==author.lower(): continue
-                if c2.lower() in EXCLUDE: continue
-                if not any(ch.isalpha() for ch in c2): continue
-                if author.lower() in c2.lower(): continue
-                cleaned.append(c2)
-            for c3 in cleaned:
-                return c3[:120]
-        except Exception:
-            return company
-        return company
-    with conn:
-        try: conn.execute("ALTER TABLE posts ADD COLUMN company_norm TEXT")
-        except Exception: pass
-        try: conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_company_norm ON posts(company_norm)")
-        except Exception: pass
-        cur = conn.execute("SELECT id, author, company, company_norm, author_profile, text FROM posts")
-        for r in cur.fetchall():
-            scanned += 1
-            author = r["author"] or ""
-            if not author: continue
-            comp_norm = r["company_norm"]
-            comp = r["company"]
-            if comp_norm and comp_norm.strip():
-                continue
-            derived = derive(author, comp, r["author_profile"], r["text"])
-            if derived and (not comp or comp.strip().lower()==author.strip().lower() or derived!=comp):
-                conn.execute("UPDATE posts SET company_norm=? WHERE id=?", (derived, r["id"]))
-                updated += 1
+    def _normalize_sync() -> tuple[int, int]:
+        with _repo(ctx).connection() as conn:
+            return normalize_company_norms(conn)
+
+    updated, scanned = await _db(ctx, _normalize_sync, label="normalize_companies")
     return {"updated": updated, "scanned": scanned}
 
 
@@ -1987,57 +1454,12 @@ async def api_daily_summary(ctx=Depends(get_auth_context), _auth=Depends(require
     }
     if not path or not Path(path).exists():
         return summary
-    conn = sqlite3.connect(path)
-    conn.row_factory = sqlite3.Row
-    with conn:
-        try:
-            # base select for today (excluding deleted)
-            conn.execute("CREATE TABLE IF NOT EXISTS post_flags (post_id TEXT PRIMARY KEY, is_favorite INTEGER, is_deleted INTEGER, favorite_at TEXT, deleted_at TEXT)")
-        except Exception:
-            pass
-        rows = conn.execute(
-            "SELECT p.id, p.text, p.company, p.collected_at, p.published_at, f.is_favorite, f.is_deleted, f.favorite_at FROM posts p LEFT JOIN post_flags f ON f.post_id=p.id WHERE p.collected_at LIKE ? AND COALESCE(f.is_deleted,0)=0",
-            (f"{today_prefix}%",),
-        ).fetchall()
-        summary["total"] = len(rows)
-        comp_counter: dict[str,int] = {}
-        status_counter: dict[str,int] = {}
-        opp = 0
-        fav = 0
-        fav_auto = 0
-        fav_manual = 0
-        for r in rows:
-            txt = r["text"] or ""
-            if _scrape_utils.is_opportunity(txt, threshold=ctx.settings.recruitment_signal_threshold):
-                opp += 1
-            if r["is_favorite"]:
-                fav += 1
-                # Heuristic: if favorite_at is within 3 seconds of collected_at -> auto
-                try:
-                    import datetime as _dt
-                    fav_at = _dt.datetime.fromisoformat(str(r["favorite_at"]).replace("Z","+00:00")) if r["favorite_at"] else None
-                    coll_at = _dt.datetime.fromisoformat(str(r["collected_at"]).replace("Z","+00:00")) if r["collected_at"] else None
-                    if fav_at and coll_at and abs((fav_at - coll_at).total_seconds()) <= 3:
-                        fav_auto += 1
-                    else:
-                        fav_manual += 1
-                except Exception:
-                    fav_manual += 1
-            comp = (r["company"] or "").strip()
-            if comp:
-                comp_counter[comp] = comp_counter.get(comp,0)+1
-            # Status derivation reused (contract keywords) simplistic
-            from .routes import _extract_contract_status  # type: ignore
-            st = _extract_contract_status(txt)
-            if st:
-                for token in [s.strip() for s in st.split(',') if s.strip()]:
-                    status_counter[token] = status_counter.get(token,0)+1
-        summary["opportunities"] = opp
-        summary["favorites"] = fav
-        summary["favorites_manual"] = fav_manual
-        summary["favorites_auto"] = fav_auto
-        summary["companies_top"] = sorted([{ "company": c, "count": n } for c,n in comp_counter.items()], key=lambda x: x["count"], reverse=True)[:5]
-        summary["status_distribution"] = status_counter
+    def _summarize_sync() -> None:
+        # Constant-time read: counters are maintained by triggers (scraper.daily_stats)
+        with _repo(ctx).connection() as conn:
+            summary.update(_daily_summary(conn, today_prefix))
+
+    await _db(ctx, _summarize_sync, label="daily_summary")
     return summary
 
 
@@ -2511,6 +1933,14 @@ async def debug_auth(ctx=Depends(get_auth_context), _auth=Depends(require_auth))
     }
 
 
+def _last_batch_sync(ctx, limit: int) -> list[dict[str, Any]]:
+    with _repo(ctx).connection() as conn:
+        return [
+            dict(r)
+            for r in conn.execute("SELECT author, company, keyword, collected_at, published_at, permalink FROM posts ORDER BY collected_at DESC LIMIT ?", (limit,))
+        ]
+
+
 @router.get("/debug/last_batch")
 async def debug_last_batch(limit: int = 5, ctx=Depends(get_auth_context), _auth=Depends(require_auth)):
     """Return the most recent posts (author/company debug) limited to 'limit'.
@@ -2523,11 +1953,7 @@ async def debug_last_batch(limit: int = 5, ctx=Depends(get_auth_context), _auth=
     # SQLite storage
     try:
         if ctx.settings.sqlite_path and Path(ctx.settings.sqlite_path).exists():
-            conn = sqlite3.connect(ctx.settings.sqlite_path)
-            conn.row_factory = sqlite3.Row
-            with conn:
-                for r in conn.execute("SELECT author, company, keyword, collected_at, published_at, permalink FROM posts ORDER BY collected_at DESC LIMIT ?", (limit,)):
-                    items.append(dict(r))
+            items = await _db(ctx, _last_batch_sync, ctx, limit)
     except Exception as exc:  # pragma: no cover
         ctx.logger.warning("debug_last_batch_sqlite_failed", error=str(exc))
     return {"count": len(items), "items": items}
@@ -2703,6 +2129,29 @@ async def count_blocked_accounts(ctx=Depends(get_auth_context), _auth=Depends(re
 # ------------------------------------------------------------
 # Admin: purge all posts (SQLite + CSV fallback)
 # ------------------------------------------------------------
+def _purge_all_posts_sync(ctx) -> int:
+    removed_sqlite = 0
+    with _repo(ctx).connection() as conn:
+        try:
+            cur = conn.execute("SELECT COUNT(*) FROM posts")
+            removed_sqlite = int(cur.fetchone()[0] or 0)
+        except Exception:
+            removed_sqlite = 0
+        try:
+            conn.execute("DELETE FROM post_flags")
+        except Exception:
+            pass
+        conn.execute("DELETE FROM posts")
+    # VACUUM must run outside the delete transaction
+    with _repo(ctx).connection() as conn:
+        try:
+            conn.execute("VACUUM")
+            rebuild_search_index(conn)
+        except Exception:
+            pass
+    return removed_sqlite
+
+
 @router.post("/api/admin/purge_posts")
 async def api_admin_purge_posts(request: Request, ctx=Depends(get_auth_context), _auth=Depends(require_auth)):
     """Erase all stored posts and related flags, returning counts removed.
@@ -2713,26 +2162,10 @@ async def api_admin_purge_posts(request: Request, ctx=Depends(get_auth_context),
     _require_desktop_trigger(request)
     removed_sqlite = 0
     # SQLite purge
-    import sqlite3 as _sqlite
     from pathlib import Path as _P
     if ctx.settings.sqlite_path and _P(ctx.settings.sqlite_path).exists():
         try:
-            conn = _sqlite.connect(ctx.settings.sqlite_path)
-            with conn:
-                try:
-                    cur = conn.execute("SELECT COUNT(*) FROM posts")
-                    removed_sqlite = int(cur.fetchone()[0] or 0)
-                except Exception:
-                    removed_sqlite = 0
-                try:
-                    conn.execute("DELETE FROM post_flags")
-                except Exception:
-                    pass
-                conn.execute("DELETE FROM posts")
-                try:
-                    conn.execute("VACUUM")
-                except Exception:
-                    pass
+            removed_sqlite = await _db(ctx, _purge_all_posts_sync, ctx)
         except Exception as exc:  # pragma: no cover
             ctx.logger.error("api_purge_sqlite_failed", error=str(exc))
     # CSV fallback file
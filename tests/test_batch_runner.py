@@ -0,0 +1,62 @@
+import sqlite3
+
+from scraper.batch_runner import run_batches
+from scraper.maintenance import RECRUITMENT_SCORE_VERSION, _score_recruitment_rows, recompute_sqlite
+from scraper.utils import compute_recruitment_signal
+
+_SELECT = "SELECT rowid, text FROM posts WHERE rowid > :after ORDER BY rowid LIMIT :limit"
+_TEXTS = ["Nous recrutons un juriste en CDI", "Belle journée", None, "Je recrute un avocat, postulez"]
+
+
+def _make_db(path, n=30):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE posts (id TEXT PRIMARY KEY, text TEXT)")
+    conn.executemany("INSERT INTO posts VALUES (?, ?)", [(f"p{i}", _TEXTS[i % 4]) for i in range(n)])
+    conn.commit()
+    conn.close()
+
+
+def test_run_batches_writes_in_read_order_with_progress(tmp_path):
+    db = str(tmp_path / "runner.sqlite3")
+    _make_db(db, n=23)
+    seen, reports = [], []
+
+    def write(conn, results):
+        seen.extend(rowid for _, _, rowid in results)
+        return len(results)
+
+    stats = run_batches(db, _SELECT, score=_score_recruitment_rows, write=write, workers=1,
+                        chunk_size=5, progress=reports.append, progress_every=0)
+    assert seen == list(range(1, 24))
+    assert (stats.rows, stats.written, stats.chunks) == (23, 23, 5)
+    assert reports and reports[-1].rows == 23
+
+
+def test_parallel_run_matches_serial(tmp_path):
+    serial, parallel = str(tmp_path / "serial.sqlite3"), str(tmp_path / "parallel.sqlite3")
+    _make_db(serial)
+    _make_db(parallel)
+    assert recompute_sqlite(serial, batch_size=4) == 30
+    assert recompute_sqlite(parallel, batch_size=4, workers=3) == 30
+
+    def dump(path):
+        conn = sqlite3.connect(path)
+        rows = conn.execute("SELECT id, text, recruitment_score, recruitment_score_version FROM posts ORDER BY id").fetchall()
+        conn.close()
+        return rows
+
+    rows = dump(parallel)
+    assert rows == dump(serial)
+    assert all(s == compute_recruitment_signal(t or "") and v == RECRUITMENT_SCORE_VERSION for _, t, s, v in rows)
+    assert recompute_sqlite(parallel, workers=3) == 0
+
+
+def test_normalize_companies_derive_rows():
+    from scripts.normalize_companies import derive_rows
+
+    rows = [
+        (1, "p1", "Alice Martin", None, "Alice Martin - Juriste chez Acme Avocats", None),
+        (2, "p2", "Bob", "Globex", "texte", None),
+        (3, "p3", "", None, "Juriste chez Initech", None),
+    ]
+    assert derive_rows(rows) == [("Acme Avocats", "p1")]
@@ -0,0 +1,28 @@
+"""Tests for scripts/bench_filters.py - Filter micro-benchmark harness."""
+from scripts import bench_filters
+
+
+def test_corpus_is_deterministic_and_distinct():
+    corpus = bench_filters.build_corpus(300)
+    assert corpus == bench_filters.build_corpus(300)
+    assert len({p.text for p in corpus}) == 300
+    assert any(p.label is None for p in corpus)  # texts from the filter tests
+    assert {p.label for p in corpus if p.label} == set(bench_filters._TEMPLATES)
+
+
+def test_run_reports_every_filter():
+    results = bench_filters.run(bench_filters.build_corpus(60), rounds=1)
+    assert [r.name for r in results] == list(bench_filters._targets())
+    for r in results:
+        assert r.posts == 60
+        assert r.posts_per_sec > 0
+        assert r.p50_us <= r.p99_us
+
+
+def test_compare_flags_regressions_only_past_tolerance():
+    result = bench_filters.BenchResult("f", 10, 650.0, 1.0, 2.0, 0.0, 0)
+    assert bench_filters.compare([result], {"f": {"posts_per_sec": 1000.0}}, 0.30) == [
+        "f: 650 posts/s < 1000 baseline (-30%)"
+    ]
+    assert bench_filters.compare([result], {"f": {"posts_per_sec": 900.0}}, 0.30) == []
+    assert bench_filters.compare([result], {}, 0.30) == []
@@ -0,0 +1,109 @@
+"""Tests for filters/cache.py - Memoized classification results."""
+import pytest
+
+
+class TestClassificationCache:
+    """Tests for the two-layer cache."""
+
+    def test_memory_hit_skips_compute(self):
+        from filters.cache import ClassificationCache
+
+        cache = ClassificationCache("test")
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return {"score": 0.5}
+
+        for _ in range(3):
+            result = cache.get_or_compute(("text",), "h1", compute, dict, dict)
+
+        assert result == {"score": 0.5}
+        assert len(calls) == 1
+        assert cache.stats["memory_hits"] == 2
+
+    def test_config_change_invalidates(self):
+        from filters.cache import ClassificationCache
+
+        cache = ClassificationCache("test")
+        cache.get_or_compute(("text",), "h1", lambda: 1, int, int)
+
+        assert cache.get_or_compute(("text",), "h2", lambda: 2, int, int) == 2
+        assert cache.stats["invalidations"] == 1
+        assert cache.get_stats()["memory_entries"] == 1
+
+    def test_lru_bound(self):
+        from filters.cache import ClassificationCache
+
+        cache = ClassificationCache("test", memory_size=2)
+        for text in ("a", "b", "c"):
+            cache.get_or_compute((text,), "h", lambda: text, str, str)
+
+        assert cache.get_stats()["memory_entries"] == 2
+
+    def test_sqlite_layer_survives_restart(self, tmp_path):
+        from filters.cache import ClassificationCache
+
+        path = str(tmp_path / "cls_cache.sqlite3")
+        first = ClassificationCache("test", persist_path=path)
+        first.get_or_compute(("text",), "h1", lambda: {"v": 1}, dict, dict)
+        first.close()
+
+        second = ClassificationCache("test", persist_path=path)
+        result = second.get_or_compute(("text",), "h1", lambda: pytest.fail("recomputed"), dict, dict)
+        assert result == {"v": 1}
+        assert second.stats["sqlite_hits"] == 1
+
+        # New config hash: old rows are dropped from disk too
+        assert second.get_or_compute(("text",), "h2", lambda: {"v": 2}, dict, dict) == {"v": 2}
+        second.close()
+        third = ClassificationCache("test", persist_path=path)
+        assert third.get_or_compute(("text",), "h1", lambda: {"v": 3}, dict, dict) == {"v": 3}
+        third.close()
+
+    def test_content_hash_separates_fields(self):
+        from filters.cache import content_hash
+
+        assert content_hash(("ab", "c")) != content_hash(("a", "bc"))
+        assert content_hash(("a", None)) == content_hash(("a", ""))
+
+
+class TestCachedClassifiers:
+    """Tests for the cached classify_post / classify_legal_post."""
+
+    def test_unified_classify_post_cached(self):
+        from filters.cache import reset_classification_caches, get_classification_cache
+        from filters.unified import classify_post, reset_filter_config
+
+        reset_classification_caches()
+        reset_filter_config()
+        text = "Nous recrutons un juriste confirmé en CDI pour notre direction juridique"
+        first = classify_post(text, "DRH", "ACME")
+        second = classify_post(text, "DRH", "ACME")
+
+        assert first == second
+        assert first is not second
+        assert get_classification_cache("unified").stats["memory_hits"] == 1
+        reset_classification_caches()
+
+    def test_config_hash_tracks_custom_lists(self):
+        from filters.unified import UnifiedFilterConfig
+
+        assert (UnifiedFilterConfig().get_config_hash()
+                != UnifiedFilterConfig(custom_exclusions={"webinar"}).get_config_hash())
+
+    def test_legal_classifier_cached(self):
+        from filters.cache import reset_classification_caches, get_classification_cache
+        from scraper.legal_classifier import classify_legal_post
+
+        reset_classification_caches()
+        text = "Nous recrutons un juriste en CDI à Paris, poste à pourvoir"
+        first = classify_legal_post(text)
+        second = classify_legal_post(text)
+        other_threshold = classify_legal_post(text, intent_threshold=0.99)
+
+        assert first == second
+        assert first.intent == "recherche_profil"
+        assert other_threshold.intent == "autre"
+        assert get_classification_cache("legal").stats["memory_hits"] == 1
+        reset_classification_caches()
@@ -0,0 +1,47 @@
+import sqlite3
+
+from scraper.display_fields import derive_company_norm
+from scraper.maintenance import normalize_company_norms
+
+_ROWS = [
+    ("p1", "Marie Dupont", "Marie Dupont", None, None, "Nous recrutons chez Groupe Bel un juriste"),
+    ("p2", "Jean Martin", "ACME", None, None, "Belle journée"),
+    ("p3", "", None, None, None, "Sans auteur"),
+    ("p4", "Paul Durand", None, "Deja Fait", None, "Texte"),
+]
+
+
+def test_normalize_company_norms_fills_only_empty_rows_in_batches(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "norm.sqlite3"))
+    conn.execute("CREATE TABLE posts (id TEXT PRIMARY KEY, author TEXT, company TEXT, company_norm TEXT, author_profile TEXT, text TEXT)")
+    conn.executemany("INSERT INTO posts VALUES (?, ?, ?, ?, ?, ?)", _ROWS + [
+        (f"x{i}", "Marie Dupont", "Marie Dupont", None, None, "Nous recrutons chez Groupe Bel un juriste") for i in range(5)
+    ])
+    conn.commit()
+
+    updated, scanned = normalize_company_norms(conn, batch_size=2)
+    # p3 (no author) and p4 (already normalized) are not candidates
+    assert scanned == 7
+    expected = derive_company_norm("Marie Dupont", "Marie Dupont", None, "Nous recrutons chez Groupe Bel un juriste")
+    norms = dict(conn.execute("SELECT id, company_norm FROM posts").fetchall())
+    assert norms["p1"] == expected and norms["x4"] == expected
+    assert norms["p3"] is None and norms["p4"] == "Deja Fait"
+    assert updated == sum(1 for v in norms.values() if v) - 1
+    # Second pass only rescans rows still without a company_norm
+    assert normalize_company_norms(conn, batch_size=2) == (0, 7 - updated)
+    conn.close()
+
+
+def test_company_rewrite_refreshes_display_columns(tmp_path):
+    from scraper.display_fields import backfill_display_fields
+    from scraper.repository import get_repository
+    from scripts.normalize_companies import _write_companies
+
+    repo = get_repository(str(tmp_path / "display.sqlite3"))
+    with repo.connection() as conn:
+        conn.execute("INSERT INTO posts (id, keyword, author, company, text) VALUES ('p1', 'juriste', 'Marie Dupont', 'Marie Dupont', 'Nous recrutons')")
+        backfill_display_fields(conn)
+        assert conn.execute("SELECT company_slug FROM posts").fetchone()[0] is None
+        _write_companies(conn, [("ACME France", "p1")])
+        assert backfill_display_fields(conn) == 1
+        assert tuple(conn.execute("SELECT company_display, company_slug FROM posts").fetchone()) == ("ACME France", "acme france")
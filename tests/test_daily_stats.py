@@ -0,0 +1,75 @@
+import pytest
+
+from scraper import repository
+from scraper.daily_stats import DAILY_STATS_TABLE, daily_summary, rebuild_daily_stats, visible_posts_count
+from scraper.repository import get_repository
+
+DAY = "2025-03-04"
+
+
+@pytest.fixture(autouse=True)
+def _close_pools():
+    yield
+    repository.close_all()
+
+
+def _add(conn, pid, *, company=None, status=None, opportunity=0, author="A", collected=f"{DAY}T10:00:00Z"):
+    conn.execute(
+        "INSERT INTO posts(id, author, keyword, company, text, collected_at, status, opportunity) VALUES(?,?,?,?,?,?,?,?)",
+        (pid, author, "juriste", company, "t", collected, status, opportunity),
+    )
+
+
+def _snapshot(conn):
+    return sorted(tuple(r) for r in conn.execute(f"SELECT day, dim, key, count FROM {DAILY_STATS_TABLE} WHERE count <> 0"))
+
+
+def test_counters_follow_inserts_flags_and_purges(tmp_path):
+    repo = get_repository(str(tmp_path / "stats.sqlite3"))
+    with repo.connection() as conn:
+        _add(conn, "p1", company="Etude Martin", status="CDI, Stage", opportunity=1)
+        _add(conn, "p2", company="Etude Martin", status="CDD")
+        _add(conn, "p3", company=" Cabinet Roy ", status="CDI")
+        _add(conn, "demo", author="demo_recruteur")
+        _add(conn, "old", collected="2025-03-01T08:00:00Z")
+        # auto favorite: set by the worker at collection time; manual: later by a user
+        conn.execute(f"INSERT INTO post_flags(post_id, is_favorite, favorite_at) VALUES('p1', 1, '{DAY}T10:00:02Z')")
+        conn.execute(f"INSERT INTO post_flags(post_id, is_favorite, favorite_at) VALUES('p2', 1, '{DAY}T18:00:00Z')")
+    with repo.connection() as conn:
+        s = daily_summary(conn, DAY)
+        assert (s["total"], s["opportunities"], s["favorites_auto"], s["favorites_manual"]) == (4, 1, 1, 1)
+        assert s["companies_top"] == [{"company": "Etude Martin", "count": 2}, {"company": "Cabinet Roy", "count": 1}]
+        assert s["status_distribution"] == {"CDI": 2, "CDD": 1, "Stage": 1}
+        assert visible_posts_count(conn) == 4
+
+        # Soft delete, restore-less purge (flags first, then post) and a status backfill
+        conn.execute("UPDATE post_flags SET is_deleted = 1 WHERE post_id = 'p2'")
+        conn.execute("DELETE FROM post_flags WHERE post_id = 'p1'")
+        conn.execute("DELETE FROM posts WHERE id = 'p1'")
+        conn.execute("UPDATE posts SET status = 'Alternance' WHERE id = 'p3'")
+    with repo.connection() as conn:
+        s = daily_summary(conn, DAY)
+        assert (s["total"], s["opportunities"], s["favorites"]) == (2, 0, 0)
+        assert s["companies_top"] == [{"company": "Cabinet Roy", "count": 1}]
+        assert s["status_distribution"] == {"Alternance": 1}
+        assert visible_posts_count(conn) == 2
+        incremental = _snapshot(conn)
+        rebuild_daily_stats(conn)
+        assert _snapshot(conn) == incremental
+
+
+@pytest.mark.asyncio
+async def test_daily_summary_endpoint_reads_aggregates(tmp_path):
+    from datetime import date
+    from types import SimpleNamespace
+
+    from server.routes import api_daily_summary
+
+    db = str(tmp_path / "summary.sqlite3")
+    today = date.today().isoformat()
+    with get_repository(db).connection() as conn:
+        _add(conn, "p1", status="CDI", opportunity=1, collected=f"{today}T09:00:00+00:00")
+    ctx = SimpleNamespace(settings=SimpleNamespace(sqlite_path=db, sqlite_pool_size=2))
+    summary = await api_daily_summary(ctx=ctx, _auth=None)
+    assert summary["date"] == today
+    assert (summary["total"], summary["opportunities"], summary["status_distribution"]) == (1, 1, {"CDI": 1})
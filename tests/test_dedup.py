@@ -0,0 +1,97 @@
+import pytest
+
+from scraper import repository
+from scraper.display_fields import dedup_key
+from scraper.maintenance import compact_duplicate_posts
+from scraper.repository import get_repository
+
+_PERMA = "https://www.linkedin.com/feed/update/urn:li:activity:7212345678901234567"
+
+
+@pytest.fixture(autouse=True)
+def _close_pools():
+    yield
+    repository.close_all()
+
+
+def test_dedup_key_prefers_permalink_then_author_date_then_content():
+    assert dedup_key(_PERMA, "jean dupont", "2025-01-01", "Jean", "x") == f"perma|{_PERMA}"
+    assert dedup_key(None, "jean dupont", "2025-01-01", "Jean", "x") == "authdate|jean dupont|2025-01-01"
+    a = dedup_key(None, "jean dupont", None, "Jean Dupont", "Recrute un juriste")
+    assert a.startswith("authtext|jean dupont|")
+    assert a == dedup_key(None, "jean dupont", None, "JEAN DUPONT", "  recrute un JURISTE ")
+
+
+def test_unique_index_rejects_duplicate_key(tmp_path):
+    repo = get_repository(str(tmp_path / "dedup.sqlite3"))
+    with repo.connection() as conn:
+        conn.execute("INSERT INTO posts(id, author, text, dedup_key) VALUES('a', 'A', 'T', 'k1')")
+        conn.execute("INSERT OR IGNORE INTO posts(id, author, text, dedup_key) VALUES('b', 'A', 'T', 'k1')")
+        assert conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0] == 1
+
+
+def test_compaction_keeps_favorite_and_drops_duplicates(tmp_path):
+    db = str(tmp_path / "compact.sqlite3")
+    repo = get_repository(db)
+    with repo.connection() as conn:
+        for pid, collected in (("first", "2025-01-01"), ("fav", "2025-01-02"), ("third", "2025-01-03")):
+            conn.execute(
+                "INSERT INTO posts(id, author, text, permalink, collected_at) VALUES(?, 'A', 'Juriste', ?, ?)",
+                (pid, _PERMA + "/?utm=" + pid, collected),
+            )
+        conn.execute("INSERT INTO posts(id, author, text, collected_at) VALUES('other', 'B', 'Avocat', '2025-01-01')")
+        conn.execute("INSERT INTO post_flags(post_id, is_favorite) VALUES('fav', 1)")
+        conn.execute("INSERT INTO post_flags(post_id, is_favorite) VALUES('third', 0)")
+    assert compact_duplicate_posts(db, dry_run=True) == 2
+    assert compact_duplicate_posts(db) == 2
+    with repo.connection() as conn:
+        rows = dict(conn.execute("SELECT id, dedup_key FROM posts").fetchall())
+        assert set(rows) == {"fav", "other"}
+        assert rows["fav"] == f"perma|{_PERMA}"
+        assert [r[0] for r in conn.execute("SELECT post_id FROM post_flags")] == ["fav"]
+    assert compact_duplicate_posts(db) == 0
+
+
+def test_same_author_and_text_stored_once_whatever_the_batching(tmp_path):
+    from scraper.bootstrap import Settings
+    from scraper.worker import Post, _store_sqlite
+
+    settings = Settings()
+    settings.sqlite_path = str(tmp_path / "batch.sqlite3")  # type: ignore[attr-defined]
+    posts = [
+        Post(
+            id=pid, keyword="juriste", author="Jean Dupont", author_profile=None,
+            text="Nous recrutons un juriste en CDI", language="fr", published_at=None,
+            collected_at="2025-09-18T10:00:00Z",
+        )
+        for pid in ("a", "b", "c")
+    ]
+    assert _store_sqlite(settings, posts[:2]) == 1
+    assert _store_sqlite(settings, posts[2:]) == 0
+    assert compact_duplicate_posts(settings.sqlite_path, dry_run=True) == 0
+    with get_repository(settings.sqlite_path).connection() as conn:
+        rows = conn.execute("SELECT id, dedup_key FROM posts").fetchall()
+    assert [r[0] for r in rows] == ["a"]
+    assert rows[0][1] == dedup_key(None, "jean dupont", None, "Jean Dupont", "Nous recrutons un juriste en CDI")
+
+
+def test_backfill_collision_is_marked_current_until_compaction(tmp_path):
+    from scraper.display_fields import backfill_display_fields
+
+    db = str(tmp_path / "collide.sqlite3")
+    repo = get_repository(db)
+    with repo.connection() as conn:
+        for pid, collected in (("old", "2025-01-01"), ("new", "2025-01-02")):
+            conn.execute(
+                "INSERT INTO posts(id, author, text, collected_at) VALUES(?, 'Jean Dupont', 'Recrute un juriste', ?)",
+                (pid, collected),
+            )
+        assert backfill_display_fields(conn) == 2
+        rows = {r[0]: (r[1], r[2]) for r in conn.execute("SELECT id, dedup_key, display_version FROM posts")}
+        assert rows["old"][0] and rows["new"][0] is None
+        assert rows["old"][1] == rows["new"][1] is not None
+        # Current version: the collision is not re-derived on the next pass
+        assert backfill_display_fields(conn) == 0
+    assert compact_duplicate_posts(db) == 1
+    with repo.connection() as conn:
+        assert [tuple(r) for r in conn.execute("SELECT id, dedup_key IS NOT NULL FROM posts")] == [("old", 1)]
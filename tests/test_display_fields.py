@@ -0,0 +1,52 @@
+import pytest
+
+from scraper import repository
+from scraper.display_fields import (
+    DISPLAY_FIELDS_VERSION,
+    backfill_display_fields,
+    canonical_permalink,
+    compute_display_fields,
+)
+from scraper.repository import get_repository
+
+
+@pytest.fixture(autouse=True)
+def _close_pools():
+    yield
+    repository.close_all()
+
+
+def test_compute_display_fields_derives_labels_once():
+    fields = compute_display_fields(
+        "Jean Dupont Jean Dupont",
+        None,
+        "https://www.linkedin.com/in/jean-dupont",
+        "Nous recrutons un notaire stagiaire en CDI chez Etude Martin, Paris",
+        "https://linkedin.com/feed/update/urn:li:activity:7212345678901234567/?utm=1",
+    )
+    assert fields["status"] == "CDI"
+    assert fields["metier"].startswith("Notaire stagiaire")
+    assert fields["company_display"] == "Etude Martin"
+    assert fields["permalink_canonical"] == "https://www.linkedin.com/feed/update/urn:li:activity:7212345678901234567"
+    assert fields["display_version"] == DISPLAY_FIELDS_VERSION
+
+
+def test_canonical_permalink_strips_query_and_slash():
+    assert canonical_permalink("https://example.com/p/1/?a=b#c") == "https://example.com/p/1"
+    assert canonical_permalink("") is None
+
+
+def test_backfill_only_touches_stale_rows(tmp_path):
+    repo = get_repository(str(tmp_path / "display.sqlite3"))
+    with repo.connection() as conn:
+        conn.execute("INSERT INTO posts(id, author, text) VALUES('old', 'A', 'Poste de juriste en CDD')")
+        conn.execute(
+            "INSERT INTO posts(id, author, text, metier, display_version) VALUES('new', 'B', 'Avocat', 'Avocat', ?)",
+            (DISPLAY_FIELDS_VERSION,),
+        )
+    with repo.connection() as conn:
+        assert backfill_display_fields(conn, batch_size=1) == 1
+        row = conn.execute("SELECT status, metier, display_version FROM posts WHERE id='old'").fetchone()
+        assert (row["status"], row["metier"], row["display_version"]) == ("CDD", "Juriste", DISPLAY_FIELDS_VERSION)
+        assert backfill_display_fields(conn) == 0
+        assert backfill_display_fields(conn, force=True) == 2
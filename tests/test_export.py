@@ -0,0 +1,86 @@
+import csv
+import io
+import json
+import re
+import zipfile
+from types import SimpleNamespace
+
+import pytest
+import structlog
+
+from scraper import repository
+from scraper.repository import get_repository
+from server import export, routes
+
+
+@pytest.fixture(autouse=True)
+def _close_pools():
+    yield
+    repository.close_all()
+
+
+@pytest.fixture()
+def ctx(tmp_path, monkeypatch):
+    # Small chunks so a 23-row export spans several keyset pages
+    monkeypatch.setattr(export, "EXPORT_CHUNK_ROWS", 5)
+    db = str(tmp_path / "export.sqlite3")
+    with get_repository(db).connection() as conn:
+        for i in range(23):
+            conn.execute(
+                "INSERT INTO posts(id, author, keyword, text, published_at, collected_at) VALUES(?,?,?,?,?,?)",
+                (f"p{i:02d}", f"Auteur {i}", "juriste", "=HYPERLINK(\"x\")" if i == 3 else f"texte {i}",
+                 f"2025-02-{i + 1:02d}T10:00:00Z", "2025-03-01T11:00:00Z"),
+            )
+    return SimpleNamespace(
+        settings=SimpleNamespace(sqlite_path=db, sqlite_pool_size=2, blocked_accounts=[]),
+        logger=structlog.get_logger(),
+    )
+
+
+async def _body(response) -> bytes:
+    chunks = []
+    async for block in response.body_iterator:
+        chunks.append(block if isinstance(block, bytes) else block.encode("utf-8"))
+    return b"".join(chunks)
+
+
+def _params(**kw):
+    base = dict(page=1, limit=None, q=None, sort_by="published_at", sort_dir="desc", cursor=None, ctx=None, _auth=None, _ls=None)
+    base.update(kw)
+    return base
+
+
+@pytest.mark.asyncio
+async def test_csv_export_streams_every_row_in_chunks(ctx):
+    response = await routes.export_csv(**_params(ctx=ctx))
+    text = (await _body(response)).decode("utf-8-sig")
+    rows = list(csv.reader(io.StringIO(text)))
+    assert rows[0] == [header for header, _ in export.EXPORT_COLUMNS]
+    assert len(rows) == 24
+    assert rows[1][1] == "Auteur 22" and rows[1][6] == "2025-02-23 10:00:00"
+
+
+@pytest.mark.asyncio
+async def test_ndjson_export_honours_limit(ctx):
+    response = await routes.export_ndjson(**_params(ctx=ctx, limit=12))
+    lines = (await _body(response)).decode("utf-8").splitlines()
+    assert len(lines) == 12
+    assert json.loads(lines[0])["published_at"] == "2025-02-23T10:00:00Z"
+
+
+@pytest.mark.asyncio
+async def test_excel_export_is_complete_and_resumable(ctx):
+    response = await routes.export_excel(**_params(ctx=ctx, limit=10))
+    cursor = response.headers["X-Next-Cursor"]
+    with zipfile.ZipFile(io.BytesIO(await _body(response))) as zf:
+        sheet = zf.read("xl/worksheets/sheet1.xml").decode("utf-8")
+    assert len(re.findall(r"<row ", sheet)) == 11
+    assert "Auteur 22" in sheet  # constant_memory writes inline strings
+    assert "<f>" not in sheet  # post text is never written as a formula
+
+    rest = await routes.export_excel(**_params(ctx=ctx, cursor=cursor))
+    assert "X-Next-Cursor" not in rest.headers
+    with zipfile.ZipFile(io.BytesIO(await _body(rest))) as zf:
+        sheet = zf.read("xl/worksheets/sheet1.xml").decode("utf-8")
+    assert len(re.findall(r"<row ", sheet)) == 14
+    assert "Auteur 12" in sheet and "Auteur 22" not in sheet
@@ -0,0 +1,116 @@
+"""In-page extraction (EXTRACT_POSTS_JS) and the Python-side record parsing."""
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from scraper.scrape_subprocess import (
+    AUTHOR_SELECTORS,
+    COMPANY_SELECTORS,
+    DATE_SELECTORS,
+    EXTRACT_POSTS_JS,
+    PERMALINK_BUTTON_SELECTORS,
+    PERMALINK_LINK_SELECTORS,
+    extract_posts_js_args,
+    parse_post_records,
+)
+
+FIXTURE = Path(__file__).parent / "fixtures" / "search_results_sdui.html"
+
+
+def _record(index, **fields):
+    rec = {
+        "index": index,
+        "urn": None,
+        "company_link": None,
+        "person_link": None,
+        "authors": [None] * len(AUTHOR_SELECTORS),
+        "sdui_texts": [None, None],
+        "classic_texts": [None, None, None],
+        "ltr_text": None,
+        "dates": [None] * len(DATE_SELECTORS),
+        "paragraphs": [],
+        "companies": [None] * len(COMPANY_SELECTORS),
+        "actor_descriptions": [None],
+        "share_href": None,
+        "links": [None] * len(PERMALINK_LINK_SELECTORS),
+        "buttons": [None] * len(PERMALINK_BUTTON_SELECTORS),
+        "html": None,
+    }
+    rec.update(fields)
+    return rec
+
+
+RECRUIT_TEXT = "Nous recrutons un juriste en droit social (H/F) en CDI pour notre bureau de Paris. Envoyez votre candidature !"
+
+
+def test_parse_records_author_permalink_and_date():
+    records = [
+        _record(
+            0,
+            urn="urn:li:activity:7416515147957137414",
+            company_link={"href": "https://www.linkedin.com/company/lefort/?trk=x", "name": " Cabinet  Lefort "},
+            sdui_texts=["  " + RECRUIT_TEXT + "  ", None],
+            paragraphs=["Cabinet Lefort", "Juriste chez Lefort Avocats", "2 j • Modifié"],
+        ),
+        _record(
+            1,
+            person_link={"href": "https://www.linkedin.com/in/claire-martin/", "name": "Claire Martin"},
+            sdui_texts=[None, "Je recrute un avocat collaborateur en droit des affaires à Lyon, poste en CDI."],
+            share_href="https://www.linkedin.com/feed/update/urn:li:share:7416215400826253312/?utm=1",
+        ),
+        _record(2, person_link={"href": "/in/paul", "name": "Paul Durand"}, sdui_texts=["Bonne journée !", None]),
+        _record(
+            3,
+            person_link={"href": "https://www.linkedin.com/in/sophie/", "name": "Sophie Bernard"},
+            sdui_texts=["Notre office notarial recrute un notaire assistant (H/F) en CDI à Bordeaux.", None],
+            html='<code>{"activityUrn":"urn:li:activity:7417000000000000001"}</code>',
+        ),
+    ]
+    posts = parse_post_records(records, "juriste", max_items=10)
+    assert [p["author"] for p in posts] == ["Cabinet Lefort", "Claire Martin", "Sophie Bernard"]
+    assert posts[0]["author_profile"] == "https://www.linkedin.com/company/lefort/"
+    assert posts[0]["text"] == RECRUIT_TEXT
+    assert posts[0]["permalink"].endswith("urn:li:activity:7416515147957137414")
+    assert posts[0]["published_at"] is not None
+    assert posts[1]["permalink"] == "https://www.linkedin.com/feed/update/urn:li:share:7416215400826253312/"
+    assert posts[2]["permalink"].endswith("urn:li:activity:7417000000000000001")
+    assert all(p["keyword"] == "juriste" for p in posts)
+
+
+def test_parse_records_profile_fallback_dedup_and_limit():
+    rec = _record(
+        0,
+        person_link={"href": "https://www.linkedin.com/in/claire-martin/", "name": "Claire Martin"},
+        sdui_texts=[RECRUIT_TEXT, None],
+    )
+    posts = parse_post_records([rec, dict(rec, index=1)], "juriste")
+    assert len(posts) == 1
+    assert posts[0]["permalink"].startswith("https://www.linkedin.com/in/claire-martin#post-")
+    other = dict(rec, index=2, urn="urn:li:activity:1234567890123456789")
+    assert len(parse_post_records([rec, other], "juriste", max_items=1)) == 1
+
+
+def test_extract_js_against_fixture_in_chromium():
+    async_api = pytest.importorskip("playwright.async_api")
+
+    async def run():
+        async with async_api.async_playwright() as pw:
+            try:
+                browser = await pw.chromium.launch(headless=True)
+            except Exception as exc:
+                pytest.skip(f"Chromium not available: {exc.__class__.__name__}")
+            try:
+                page = await browser.new_page()
+                await page.set_content(FIXTURE.read_text(encoding="utf-8"))
+                return await page.evaluate(EXTRACT_POSTS_JS, extract_posts_js_args())
+            finally:
+                await browser.close()
+
+    records = asyncio.run(run())
+    assert len(records) == 4
+    assert records[0]["html"] is None and records[3]["html"]
+    posts = parse_post_records(records, "juriste")
+    assert [p["author"] for p in posts] == ["Cabinet Lefort Avocats", "Claire Martin", "Sophie Bernard"]
+    assert posts[1]["permalink"] == "https://www.linkedin.com/feed/update/urn:li:share:7416215400826253312/"
+    assert posts[2]["permalink"].endswith("urn:li:activity:7417000000000000001")
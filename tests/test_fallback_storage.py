@@ -44,7 +44,8 @@ async def test_store_posts_fallback_sqlite(tmp_path, monkeypatch):
     with conn:
         cur = conn.execute("SELECT COUNT(*) FROM posts")
         count = cur.fetchone()[0]
-    assert count == 3
+    # Same author and text under three ids is one post (dedup_key / content_hash)
+    assert count == 1
 
 @pytest.mark.asyncio
 async def test_store_posts_fallback_csv(tmp_path, monkeypatch):
@@ -86,3 +87,36 @@ async def test_store_posts_fallback_csv(tmp_path, monkeypatch):
     assert Path(settings.csv_fallback_file).exists()
     content = Path(settings.csv_fallback_file).read_text(encoding="utf-8").strip().splitlines()
     assert len(content) == 1 + 2  # header + rows
+
+
+@pytest.mark.asyncio
+async def test_store_posts_counts_only_new_rows(tmp_path):
+    settings = Settings()
+    settings.sqlite_path = str(tmp_path / 'bulk.sqlite3')  # type: ignore[attr-defined]
+    settings.auto_favorite_opportunities = True  # type: ignore[attr-defined]
+    ctx = AppContext(settings=settings, logger=structlog.get_logger().bind(test="bulk"), redis=None)
+
+    def _posts(ids):
+        return [
+            Post(
+                id=f"bulk-{i}",
+                keyword="juriste",
+                author=f"Author {i}",
+                author_profile=None,
+                text=f"Nous recrutons un juriste en CDI (poste {i})",
+                language="fr",
+                published_at=None,
+                collected_at="2025-09-18T10:00:00Z",
+                score=0.5,
+                raw={},
+            )
+            for i in ids
+        ]
+
+    assert await store_posts(ctx, _posts(range(4))) == 4
+    # Trigger writes (FTS, daily_stats) and ignored duplicates are not counted
+    assert await store_posts(ctx, _posts(range(2, 6))) == 2
+    conn = sqlite3.connect(settings.sqlite_path)
+    with conn:
+        assert conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0] == 6
+        assert conn.execute("SELECT count FROM daily_stats WHERE day='2025-09-18' AND dim='total'").fetchone()[0] == 6
@@ -240,6 +240,42 @@ class TestExclusions:
         assert result.reason == "post_trop_ancien"
 
 
+class TestExclusionRules:
+    """Tests for the exclusion rule table and its runtime counters."""
+
+    def test_rule_table_reasons_unique(self):
+        from scraper.legal_filter import EXCLUSION_RULES
+
+        reasons = [rule.reason for rule in EXCLUSION_RULES]
+        assert len(reasons) == len(set(reasons))
+        assert reasons[0] == "post_trop_ancien"
+
+    def test_first_rule_in_table_order_wins(self):
+        """Stage and freelance both match: the earlier rule decides."""
+        result = check_exclusions("Stage ou mission freelance en droit social")
+        assert result.reason == "stage_alternance"
+
+    def test_disabled_rule_is_skipped(self):
+        from scraper.legal_filter import FilterConfig
+
+        result = check_exclusions("Mission freelance juriste 3 mois", config=FilterConfig(exclude_freelance=False))
+        assert result.reason != "freelance_mission"
+
+    def test_rule_stats(self):
+        from scraper.legal_filter import get_exclusion_rule_stats, reset_exclusion_rule_stats
+
+        reset_exclusion_rule_stats()
+        check_exclusions("Offre de stage en droit social")
+        check_exclusions("Mission freelance juriste 3 mois")
+        stats = {row["reason"]: row for row in get_exclusion_rule_stats()}
+        assert stats["stage_alternance"]["evaluated"] == 2
+        assert stats["stage_alternance"]["fired"] == 1
+        assert stats["stage_alternance"]["hit_rate"] == 0.5
+        assert stats["freelance_mission"]["evaluated"] == 1
+        assert stats["cabinet_recrutement"]["evaluated"] == 0
+        reset_exclusion_rule_stats()
+
+
 # =============================================================================
 # MAIN FILTER FUNCTION TESTS (is_legal_job_post)
 # =============================================================================
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import unicodedata
+
+from scraper import legal_filter, normalized_text
+from scraper.normalized_text import NormalizedText
+from scraper.utils import normalize_for_search
+
+
+def _legacy_normalize(text: str) -> str:
+    import re
+    text = text.lower()
+    nfkd = unicodedata.normalize("NFKD", text)
+    text = "".join(c for c in nfkd if not unicodedata.combining(c))
+    text = normalized_text._EMOJI_RE.sub("", text)
+    text = re.sub(r"#(\w+)", r"\1", text)
+    text = re.sub(r"\s+", " ", text)
+    text = re.sub(r"[^\w\s\'-]", " ", text)
+    text = re.sub(r"\s+", " ", text)
+    return text.strip()
+
+
+SAMPLES = [
+    "",
+    "Nous recrutons un Juriste (H/F) 🚀 #CDI à Paris !",
+    "  Stagiaire   Avocat — Cabinet d'affaires, Lyon  ",
+    "Élève-avocat : candidature spontanée ?",
+]
+
+
+def test_forms_match_legacy_normalizers():
+    for sample in SAMPLES:
+        view = NormalizedText.of(sample)
+        assert view == sample
+        assert view.normalized == _legacy_normalize(sample)
+        assert view.lower() == sample.lower()
+        assert normalize_for_search(view) == normalize_for_search(str(sample))
+        assert legal_filter.normalize_text(sample) == view.normalized
+
+
+def test_view_is_shared_and_idempotent():
+    text = "Offre : juriste droit social, CDI"
+    view = NormalizedText.of(text)
+    assert NormalizedText.of(text) is view
+    assert NormalizedText.of(view) is view
+    assert NormalizedText.of(None) == ""
+
+
+def test_tokens_and_spans():
+    view = NormalizedText.of("Juriste #Contrats à Nantes")
+    assert view.tokens == ("juriste", "contrats", "a", "nantes")
+    assert [view.normalized[s:e] for s, e in view.token_spans] == list(view.tokens)
+
+
+def test_filter_chain_normalizes_once(monkeypatch):
+    calls = []
+    original = normalized_text.remove_accents
+
+    def counting(text):
+        calls.append(text)
+        return original(text)
+
+    monkeypatch.setattr(normalized_text, "remove_accents", counting)
+    text = NormalizedText("Notre cabinet recrute un avocat collaborateur en CDI à Paris.")
+    legal_filter.is_legal_job_post(text)
+    legal_filter.is_recruitment_agency_strict(text)
+    assert len(calls) == 1
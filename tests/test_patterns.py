@@ -0,0 +1,57 @@
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from scraper.patterns import PatternRegistry
+
+
+def test_registry_compiles_on_first_access_only():
+    calls = []
+
+    def source():
+        calls.append(1)
+        return r"\bjuriste\b", re.IGNORECASE
+
+    reg = PatternRegistry(word=r"\w+", juriste=source)
+    assert reg.compiled == {}
+    first = reg.juriste
+    assert first.search("Un JURISTE confirmé")
+    assert reg.juriste is first
+    assert calls == [1]
+    assert set(reg.compiled) == {"juriste"}
+    assert len(reg.compile_all().compiled) == len(reg) == 2
+
+
+def test_registry_unknown_name():
+    with pytest.raises(AttributeError):
+        PatternRegistry(a="a").missing
+
+
+def test_filter_modules_import_without_bootstrap():
+    """Importing a filter module neither loads bootstrap nor compiles its regexes."""
+    code = (
+        "import sys, scraper.legal_filter, scraper.pre_qualifier\n"
+        "assert 'scraper.bootstrap' not in sys.modules, 'bootstrap imported'\n"
+        "assert scraper.pre_qualifier._PATTERNS.compiled == {}\n"
+        "assert scraper.legal_filter._PATTERNS.compiled == {}\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).resolve().parent.parent)
+
+
+def test_lazy_package_exports():
+    import scraper
+
+    assert scraper.is_legal_job_post is scraper.legal_filter.is_legal_job_post
+    with pytest.raises(AttributeError):
+        scraper.not_an_export
+
+
+def test_derive_company_norm():
+    from scraper.display_fields import derive_company_norm
+
+    assert derive_company_norm("Alice Martin", "Globex", None, "texte") == "Globex"
+    assert derive_company_norm("Alice Martin", "Alice Martin", None, "Juriste chez Acme Avocats") == "Acme Avocats"
+    assert derive_company_norm("Alice Martin", None, '{"headline": "Consultant"}', None) is None
@@ -0,0 +1,105 @@
+from types import SimpleNamespace
+
+import pytest
+import structlog
+
+from scraper import repository
+from scraper.repository import get_repository
+from server import routes
+
+
+@pytest.fixture(autouse=True)
+def _close_pools():
+    yield
+    repository.close_all()
+
+
+@pytest.fixture()
+def ctx(tmp_path):
+    db = str(tmp_path / "pages.sqlite3")
+    with get_repository(db).connection() as conn:
+        for i in range(45):
+            published = None if i % 9 == 0 else f"2025-02-{i % 20 + 1:02d}T10:00:00Z"
+            conn.execute(
+                "INSERT INTO posts(id, author, keyword, text, published_at, collected_at) VALUES(?,?,?,?,?,?)",
+                (f"p{i:02d}", f"Auteur {i}", "juriste", "texte", published, f"2025-02-{i % 27 + 1:02d}T11:00:00Z"),
+            )
+        for pid in ("p05", "p30"):
+            conn.execute("INSERT INTO post_flags(post_id, is_favorite) VALUES(?, 1)", (pid,))
+    return SimpleNamespace(
+        settings=SimpleNamespace(sqlite_path=db, sqlite_pool_size=2, blocked_accounts=[]),
+        logger=structlog.get_logger(),
+    )
+
+
+def _walk(ctx, limit, **kw):
+    ids, cursor = [], None
+    while True:
+        page, cursor = routes._fetch_posts_sync(ctx, 0, limit, cursor=cursor, **kw)
+        ids.extend(p["_id"] for p in page)
+        if not cursor:
+            return ids
+
+
+@pytest.mark.parametrize("sort_by,sort_dir", [("published_at", "desc"), ("collected_at", "asc")])
+def test_cursor_walk_matches_offset_pages(ctx, sort_by, sort_dir):
+    by_cursor = _walk(ctx, 7, sort_by=sort_by, sort_dir=sort_dir)
+    by_offset = []
+    for page in range(7):
+        rows, _ = routes._fetch_posts_sync(ctx, page * 7, 7, sort_by=sort_by, sort_dir=sort_dir)
+        by_offset.extend(p["_id"] for p in rows)
+    assert by_cursor == by_offset
+    assert len(by_cursor) == 45 and len(set(by_cursor)) == 45
+    assert set(by_cursor[:2]) == {"p05", "p30"}  # favorites first
+
+
+def test_cursor_for_other_sort_restarts_from_first_page(ctx):
+    first, cursor = routes._fetch_posts_sync(ctx, 0, 5, sort_by="published_at", sort_dir="desc")
+    again, _ = routes._fetch_posts_sync(ctx, 0, 5, sort_by="collected_at", sort_dir="desc", cursor=cursor)
+    fresh, _ = routes._fetch_posts_sync(ctx, 0, 5, sort_by="collected_at", sort_dir="desc")
+    assert cursor and [p["_id"] for p in again] == [p["_id"] for p in fresh]
+    assert routes._decode_cursor("not-a-cursor", "published_at", -1) is None
+
+
+def test_keyset_query_uses_composite_index(ctx):
+    with get_repository(ctx.settings.sqlite_path).connection() as conn:
+        plan = " ".join(
+            r[3]
+            for r in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT p.id FROM posts p LEFT JOIN post_flags f ON f.post_id = p.id "
+                "WHERE COALESCE(f.is_favorite,0) = 0 AND IFNULL(p.published_at,'') <= ? "
+                "AND (IFNULL(p.published_at,''), p.id) < (?, ?) ORDER BY IFNULL(p.published_at,'') DESC, p.id DESC LIMIT 10",
+                ("2025-02-10", "2025-02-10", "p10"),
+            )
+        )
+    assert "idx_posts_published_keyset" in plan
+
+
+def test_blocked_accounts_are_excluded_in_sql(ctx):
+    from scraper.display_fields import backfill_display_fields
+
+    with get_repository(ctx.settings.sqlite_path).connection() as conn:
+        backfill_display_fields(conn)
+    routes._blocked_add_sync(ctx, "https://www.linkedin.com/in/auteur-7/")
+    page, _ = routes._fetch_posts_sync(ctx, 0, 100)
+    ids = {p["_id"] for p in page}
+    assert "p07" not in ids and len(ids) == 44
+    assert routes._count_posts_sync(ctx) == 44
+    assert all("content_hash" not in p and "author_slug" not in p for p in page)
+
+
+def test_blocked_company_hides_names_containing_it(ctx):
+    from scraper.display_fields import backfill_display_fields
+
+    with get_repository(ctx.settings.sqlite_path).connection() as conn:
+        for pid, company in (("c1", "ACME France"), ("c2", "Acme Recrutement"), ("c3", "Globex")):
+            conn.execute(
+                "INSERT INTO posts(id, author, company, keyword, text, collected_at) VALUES(?,?,?,?,?,?)",
+                (pid, f"Personne {pid}", company, "juriste", "texte", "2025-03-01T10:00:00Z"),
+            )
+        backfill_display_fields(conn)
+    routes._blocked_add_sync(ctx, "https://www.linkedin.com/company/acme/")
+    page, _ = routes._fetch_posts_sync(ctx, 0, 100)
+    ids = {p["_id"] for p in page}
+    assert "c3" in ids and not ids & {"c1", "c2"}
+    assert routes._count_posts_sync(ctx) == 46
@@ -0,0 +1,70 @@
+import csv
+import sqlite3
+
+from scraper import maintenance
+from scraper.maintenance import RECRUITMENT_SCORE_VERSION, recompute_csv, recompute_sqlite
+from scraper.utils import compute_recruitment_signal
+
+_TEXTS = ["Nous recrutons un juriste en CDI", "Belle journée", None, "Je recrute un avocat, postulez"]
+
+
+def _make_db(path, n=25):
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE posts (id TEXT PRIMARY KEY, text TEXT)")
+    conn.executemany("INSERT INTO posts VALUES (?, ?)", [(f"p{i}", _TEXTS[i % 4]) for i in range(n)])
+    conn.commit()
+    conn.close()
+
+
+def test_recompute_sqlite_scores_in_batches_and_skips_current(tmp_path):
+    db = str(tmp_path / "scores.sqlite3")
+    _make_db(db)
+    assert recompute_sqlite(db, batch_size=4) == 25
+    conn = sqlite3.connect(db)
+    rows = conn.execute("SELECT text, recruitment_score, recruitment_score_version FROM posts").fetchall()
+    conn.close()
+    assert all(v == RECRUITMENT_SCORE_VERSION for _, _, v in rows)
+    assert all(s == compute_recruitment_signal(t or "") for t, s, _ in rows)
+    # Rerun touches nothing; force rescoring everything
+    assert recompute_sqlite(db, batch_size=4) == 0
+    assert recompute_sqlite(db, force=True, batch_size=4) == 25
+
+
+def test_recompute_sqlite_resumes_and_follows_version_bump(tmp_path, monkeypatch):
+    db = str(tmp_path / "resume.sqlite3")
+    _make_db(db, n=10)
+    calls = []
+
+    def flaky(text):
+        if len(calls) == 6:
+            raise KeyboardInterrupt
+        calls.append(text)
+        return 0.5
+
+    monkeypatch.setattr(maintenance.utils, "compute_recruitment_signal", flaky)
+    try:
+        recompute_sqlite(db, batch_size=3)
+    except KeyboardInterrupt:
+        pass
+    monkeypatch.undo()
+    # Two committed batches survive the interruption
+    assert recompute_sqlite(db, batch_size=3) == 4
+    monkeypatch.setattr(maintenance, "RECRUITMENT_SCORE_VERSION", RECRUITMENT_SCORE_VERSION + 1)
+    assert recompute_sqlite(db, batch_size=3) == 10
+
+
+def test_recompute_csv_only_rewrites_stale_rows(tmp_path):
+    path = tmp_path / "posts.csv"
+    with path.open("w", encoding="utf-8", newline="") as fh:
+        writer = csv.DictWriter(fh, fieldnames=["id", "score", "text"])
+        writer.writeheader()
+        writer.writerows([{"id": "1", "score": "0", "text": _TEXTS[0]}, {"id": "2", "score": "0", "text": _TEXTS[1]}])
+    assert recompute_csv(str(path)) == 2
+    with path.open(encoding="utf-8", newline="") as fh:
+        reader = csv.DictReader(fh)
+        assert reader.fieldnames == ["id", "score", "recruitment_score", "recruitment_score_version", "text"]
+        assert {r["recruitment_score_version"] for r in reader} == {str(RECRUITMENT_SCORE_VERSION)}
+    mtime = path.stat().st_mtime_ns
+    assert recompute_csv(str(path)) == 0
+    assert path.stat().st_mtime_ns == mtime
+    assert not (tmp_path / "posts.csv.tmp").exists()
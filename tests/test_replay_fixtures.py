@@ -0,0 +1,79 @@
+"""Tests for scripts/replay_fixtures.py - offline extraction pipeline replay."""
+import sqlite3
+
+import pytest
+
+from scraper.bootstrap import Settings
+from scraper.result_stream import StageSpans
+from scripts import replay_fixtures
+
+RECRUIT_TEXT = "Nous recrutons un juriste en droit social (H/F) en CDI pour notre bureau de Paris. Envoyez votre candidature !"
+
+
+def _records():
+    return [
+        {
+            "index": 0,
+            "urn": "urn:li:activity:7416515147957137414",
+            "person_link": {"href": "https://www.linkedin.com/in/claire-martin/", "name": "Claire Martin"},
+            "sdui_texts": [RECRUIT_TEXT, None],
+        },
+        {
+            "index": 1,
+            "urn": "urn:li:activity:7416515147957137415",
+            "person_link": {"href": "https://www.linkedin.com/in/john-smith/", "name": "John Smith"},
+            "sdui_texts": ["We are hiring a senior legal counsel in London, apply through the link below today.", None],
+        },
+        {
+            "index": 2,
+            "urn": "urn:li:activity:7416515147957137416",
+            "person_link": {"href": "https://www.linkedin.com/in/julie-leroy/", "name": "Julie Leroy"},
+            "sdui_texts": ["Notre étude notariale recrute un notaire assistant (H/F) en CDI à Nantes, prise de poste immédiate.", None],
+            "dates": ["5 sem."],
+        },
+    ]
+
+
+def test_process_records_counts_every_stage():
+    spans = StageSpans()
+    result = replay_fixtures.ReplayResult()
+    seen = set()
+    accepted = replay_fixtures.process_records(_records(), "juriste", spans, result, seen)
+    assert [p["author"] for p in accepted] == ["Claire Martin"]
+    # The English post is dropped by pre-qualification, the 5-week-old one by the filters
+    assert result.rejected == {"rejected_too_old": 1}
+    assert (result.records, result.parsed) == (3, 2)
+    # Same page again: both parsed posts are now duplicates
+    assert replay_fixtures.process_records(_records(), "juriste", spans, result, seen) == []
+    assert result.rejected["rejected_duplicate"] == 2
+    assert (result.records, result.parsed, result.accepted) == (6, 4, 1)
+    assert set(spans.pop()) == {"prequalify", "dedup", "filter_language", "filter_titan"}
+
+
+def test_store_inserts_through_worker_sqlite(tmp_path):
+    settings = Settings()
+    settings.sqlite_path = str(tmp_path / "replay.sqlite3")  # type: ignore[attr-defined]
+    spans = StageSpans()
+    result = replay_fixtures.ReplayResult()
+    accepted = replay_fixtures.process_records(_records(), "juriste", spans, result, set())
+    assert replay_fixtures.store(accepted, settings, spans, result) == 1
+    assert replay_fixtures.store(accepted, settings, spans, result) == 0  # INSERT OR IGNORE
+    with sqlite3.connect(settings.sqlite_path) as conn:
+        assert conn.execute("SELECT author FROM posts").fetchall() == [("Claire Martin",)]
+    assert result.stored == 1
+
+
+def test_replay_fixtures_in_chromium(tmp_path):
+    async_api = pytest.importorskip("playwright.async_api")
+    snapshots = replay_fixtures.load_snapshots([replay_fixtures.DEFAULT_FIXTURES_DIR])
+    assert snapshots
+    try:
+        result = replay_fixtures.asyncio.run(
+            replay_fixtures.replay(snapshots, str(tmp_path / "replay.sqlite3"), rounds=2)
+        )
+    except async_api.Error as exc:
+        pytest.skip(f"Chromium not available: {exc.__class__.__name__}")
+    assert result.pages == 2 * len(snapshots)
+    assert result.records > 0 and result.pages_per_sec > 0
+    assert result.rejected.get("rejected_duplicate", 0) >= result.accepted // 2
+    assert set(result.stages) == set(replay_fixtures.STAGES)
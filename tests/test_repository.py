@@ -0,0 +1,176 @@
+import sqlite3
+
+import pytest
+
+from scraper import repository
+from scraper.repository import SCHEMA_VERSION, get_repository
+
+
+@pytest.fixture(autouse=True)
+def _close_pools():
+    yield
+    repository.close_all()
+
+
+def _columns(path, table):
+    conn = sqlite3.connect(path)
+    try:
+        return {r[1] for r in conn.execute(f"PRAGMA table_info({table})")}
+    finally:
+        conn.close()
+
+
+def test_migrations_create_schema_and_set_user_version(tmp_path):
+    db = str(tmp_path / "repo.sqlite3")
+    repo = get_repository(db)
+    assert repo.schema_version == SCHEMA_VERSION
+    conn = sqlite3.connect(db)
+    try:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal"
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    finally:
+        conn.close()
+    assert {"posts", "post_flags", "blocked_accounts", "meta"} <= tables
+    assert {"intent", "company_norm", "content_hash", "search_norm"} <= _columns(db, "posts")
+    assert {"recruitment_score", "recruitment_score_version"} <= _columns(db, "posts")
+
+
+def test_slug_indexes_from_old_migration_are_dropped(tmp_path):
+    db = str(tmp_path / "slugs.sqlite3")
+    conn = sqlite3.connect(db)
+    for migration in repository.MIGRATIONS[:8]:
+        migration(conn)
+    conn.execute("CREATE INDEX idx_posts_author_slug ON posts(author_slug)")
+    conn.execute("CREATE INDEX idx_blocked_accounts_slug ON blocked_accounts(slug)")
+    conn.execute("PRAGMA user_version = 8")
+    conn.commit()
+    conn.close()
+    get_repository(db)
+    conn = sqlite3.connect(db)
+    try:
+        indexes = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+    finally:
+        conn.close()
+    assert not {"idx_posts_author_slug", "idx_posts_company_slug", "idx_blocked_accounts_slug"} & indexes
+
+
+def test_minimal_legacy_schema_is_upgraded(tmp_path):
+    db = str(tmp_path / "legacy.sqlite3")
+    conn = sqlite3.connect(db)
+    with conn:
+        conn.execute("CREATE TABLE posts (id TEXT PRIMARY KEY, author TEXT, text TEXT)")
+        conn.execute("INSERT INTO posts(id, author, text) VALUES('p1', 'A', 'T')")
+    conn.close()
+    get_repository(db)
+    cols = _columns(db, "posts")
+    assert {"keyword", "permalink", "collected_at", "relevance_score"} <= cols
+    with get_repository(db).connection() as c:
+        assert c.execute("SELECT text FROM posts WHERE id='p1'").fetchone()["text"] == "T"
+
+
+def test_repository_is_shared_and_connections_reused(tmp_path):
+    db = str(tmp_path / "shared.sqlite3")
+    repo = get_repository(db)
+    assert get_repository(db) is repo
+    with repo.connection() as c1:
+        first = c1
+    with repo.connection() as c2:
+        assert c2 is first
+
+
+def test_connection_rolls_back_on_error(tmp_path):
+    db = str(tmp_path / "rollback.sqlite3")
+    repo = get_repository(db)
+    with pytest.raises(RuntimeError):
+        with repo.connection() as conn:
+            conn.execute("INSERT INTO meta(id, last_run) VALUES('global', 'x')")
+            raise RuntimeError("boom")
+    with repo.connection() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM meta").fetchone()[0] == 0
+
+
+def test_replaced_database_file_gets_fresh_pool(tmp_path):
+    db = tmp_path / "swap.sqlite3"
+    repo = get_repository(str(db))
+    repo.close()
+    for suffix in ("", "-wal", "-shm"):
+        p = tmp_path / f"swap.sqlite3{suffix}"
+        if p.exists():
+            p.unlink()
+    repo2 = get_repository(str(db))
+    assert repo2 is not repo
+    assert "posts" in {r[0] for r in sqlite3.connect(str(db)).execute("SELECT name FROM sqlite_master")}
+
+
+@pytest.mark.asyncio
+async def test_run_sync_executes_off_loop_and_records_timing(tmp_path):
+    import threading
+
+    from scraper.bootstrap import SQLITE_QUERY_DURATION
+    from scraper.repository import run_sync
+
+    db = str(tmp_path / "offloop.sqlite3")
+    loop_thread = threading.get_ident()
+
+    def _count():
+        with get_repository(db).connection() as conn:
+            return threading.get_ident(), conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+    before = SQLITE_QUERY_DURATION.labels(query="count_test")._sum.get()
+    thread_id, count = await run_sync(_count, label="count_test")
+    assert count == 0
+    assert thread_id != loop_thread
+    assert SQLITE_QUERY_DURATION.labels(query="count_test")._sum.get() > before
+
+
+def _insert_post(conn, pid, text, author="Auteur"):
+    from scraper.utils import build_search_norm
+
+    conn.execute(
+        "INSERT INTO posts(id, author, text, keyword, search_norm) VALUES(?,?,?,?,?)",
+        (pid, author, text, "juriste", build_search_norm(text, author, None, "juriste")),
+    )
+
+
+def _fts_ids(conn, q):
+    from scraper.repository import fts_match_expression
+
+    sql = "SELECT p.id FROM posts p JOIN posts_fts ON posts_fts.rowid = p.rowid WHERE posts_fts MATCH ? ORDER BY bm25(posts_fts)"
+    return [r[0] for r in conn.execute(sql, (fts_match_expression(q),))]
+
+
+def test_fts_index_tracks_posts_with_prefix_and_accent_folding(tmp_path):
+    repo = get_repository(str(tmp_path / "fts.sqlite3"))
+    assert repo.fts_enabled
+    with repo.connection() as conn:
+        _insert_post(conn, "p1", "Notaire à Paris recrute un clerc")
+        _insert_post(conn, "p2", "Étude notariale à Lyon")
+    with repo.connection() as conn:
+        assert _fts_ids(conn, "notai") == ["p1"]
+        assert _fts_ids(conn, "ETUDE lyon") == ["p2"]
+        assert set(_fts_ids(conn, "à")) == {"p1", "p2"}
+        conn.execute("UPDATE posts SET search_norm = 'avocat bordeaux' WHERE id = 'p2'")
+        conn.execute("DELETE FROM posts WHERE id = 'p1'")
+    with repo.connection() as conn:
+        assert _fts_ids(conn, "notai") == []
+        assert _fts_ids(conn, "bordeau") == ["p2"]
+
+
+def test_fts_match_expression_neutralises_operators():
+    from scraper.repository import fts_match_expression
+
+    assert fts_match_expression('Notaire" OR NEAR(') == '"notaire"* "or"* "near"*'
+    assert fts_match_expression("  --  ") is None
+
+
+def test_migration_backfills_legacy_search_norm(tmp_path):
+    db = str(tmp_path / "legacy_fts.sqlite3")
+    conn = sqlite3.connect(db)
+    with conn:
+        conn.execute("CREATE TABLE posts (id TEXT PRIMARY KEY, author TEXT, text TEXT)")
+        conn.execute("INSERT INTO posts(id, author, text) VALUES('old', 'Maître Dupré', 'Juriste droit social')")
+    conn.close()
+    with get_repository(db).connection() as c:
+        assert c.execute("SELECT search_norm FROM posts WHERE id='old'").fetchone()[0]
+        assert _fts_ids(c, "dupre") == ["old"]
@@ -0,0 +1,198 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+import structlog
+from prometheus_client import REGISTRY
+
+from scraper import worker
+from scraper.result_stream import ResultStreamReader, ResultStreamWriter, StageSpans
+
+_LOGGER = structlog.get_logger().bind(test="result_stream")
+
+
+def test_reader_returns_complete_records_only(tmp_path):
+    path = str(tmp_path / "stream.ndjson")
+    reader = ResultStreamReader(path)
+    assert reader.read_new() == []  # not created yet
+    with ResultStreamWriter(path) as writer:
+        writer.post({"id": "a"})
+        writer.progress(keyword="juriste", accepted=1)
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write('{"type": "post", "seq": 1, "po')
+    records = reader.read_new()
+    assert [r["type"] for r in records] == ["post", "progress"]
+    assert records[0] == {"type": "post", "seq": 0, "post": {"id": "a"}}
+    with open(path, "a", encoding="utf-8") as fh:
+        fh.write('st": {"id": "b"}}\nnot json\n')
+    assert reader.read_new() == [{"type": "post", "seq": 1, "post": {"id": "b"}}]
+    assert reader.read_new() == []
+
+
+def _child(path, posts, sleep_after):
+    code = (
+        "import sys, time\n"
+        "from scraper.result_stream import ResultStreamWriter\n"
+        f"w = ResultStreamWriter({path!r})\n"
+        f"for i in range({posts}):\n"
+        "    w.post({'id': f'p{i}'})\n"
+        "    time.sleep(0.05)\n"
+        f"time.sleep({sleep_after})\n"
+        "w.end(success=True)\n"
+    )
+    return asyncio.create_subprocess_exec(sys.executable, "-c", code, cwd=Path(__file__).resolve().parent.parent)
+
+
+@pytest.mark.asyncio
+async def test_follow_stream_delivers_micro_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(worker, "_STREAM_POLL_SECONDS", 0.05)
+    monkeypatch.setattr(worker, "_STREAM_MICRO_BATCH_SIZE", 2)
+    path = str(tmp_path / "stream.ndjson")
+    batches = []
+
+    async def on_posts(posts):
+        batches.append([p["id"] for p in posts])
+
+    proc = await _child(path, 5, 0)
+    streamed, delivered, timed_out = await worker._follow_result_stream(
+        proc, ResultStreamReader(path), on_posts, _LOGGER, timeout=30
+    )
+    assert not timed_out
+    assert sorted(delivered) == list(range(5)) == sorted(streamed)
+    assert [i for b in batches for i in b] == [f"p{i}" for i in range(5)]
+    assert len(batches) > 1
+
+
+@pytest.mark.asyncio
+async def test_follow_stream_keeps_posts_on_timeout(tmp_path, monkeypatch):
+    monkeypatch.setattr(worker, "_STREAM_POLL_SECONDS", 0.05)
+    path = str(tmp_path / "stream.ndjson")
+    proc = await _child(path, 3, 60)
+    streamed, delivered, timed_out = await worker._follow_result_stream(
+        proc, ResultStreamReader(path), None, _LOGGER, timeout=2
+    )
+    assert timed_out
+    assert proc.returncode is not None
+    assert delivered == set()
+    assert [streamed[i]["id"] for i in sorted(streamed)] == ["p0", "p1", "p2"]
+
+
+def test_stage_spans_accumulate_and_reset():
+    spans = StageSpans()
+    spans.lap("navigation")
+    with spans.span("dedup"):
+        pass
+    spans.add("dedup", 0.5)
+    spans.mark()
+    spans.lap("extraction")
+    seconds = spans.pop()
+    assert set(seconds) == {"navigation", "dedup", "extraction"}
+    assert seconds["dedup"] >= 0.5
+    assert spans.pop() == {}
+
+
+@pytest.mark.asyncio
+async def test_follow_stream_observes_stage_spans(tmp_path):
+    path = str(tmp_path / "stream.ndjson")
+    with ResultStreamWriter(path) as writer:
+        writer.spans("avocat spans", {"extraction": 0.02, "filter_titan": 0.001})
+        writer.spans("avocat spans", {"extraction": 0.03})
+
+    def count(stage):
+        return REGISTRY.get_sample_value(
+            "scrape_stage_duration_seconds_count", {"stage": stage, "keyword": "avocat spans"}
+        ) or 0
+
+    before = count("extraction"), count("filter_titan")
+    proc = await asyncio.create_subprocess_exec(sys.executable, "-c", "pass")
+    await worker._follow_result_stream(proc, ResultStreamReader(path), None, _LOGGER, timeout=30)
+    assert (count("extraction"), count("filter_titan")) == (before[0] + 2, before[1] + 1)
+
+
+def _job_posts():
+    return [
+        worker.Post(
+            id=f"mb-{i}",
+            keyword="juriste",
+            author=f"Author {i}",
+            author_profile=None,
+            text=f"Nous recrutons un juriste en CDI à Paris (poste {i})",
+            language="fr",
+            published_at=None,
+            collected_at="2025-09-18T10:00:00Z",
+            permalink=f"https://www.linkedin.com/feed/update/urn:li:activity:{7000 + i}/",
+        )
+        for i in range(3)
+    ]
+
+
+def _job_ctx(tmp_path, monkeypatch):
+    from scraper.bootstrap import AppContext, Settings
+
+    settings = Settings()
+    settings.sqlite_path = str(tmp_path / "job.sqlite3")  # type: ignore[attr-defined]
+    settings.playwright_mock_mode = False
+    settings.fast_first_cycle = False  # type: ignore[attr-defined]
+    ctx = AppContext(settings=settings, logger=_LOGGER, redis=None)
+    ctx._relaxed_filters = True  # type: ignore[attr-defined]
+
+    async def _daily_count(ctx, day):
+        return 0
+
+    async def _meta(ctx, inserted):
+        return None
+
+    monkeypatch.setattr(worker, "_get_daily_count_from_db", _daily_count)
+    monkeypatch.setattr(worker, "update_meta", _meta)
+    monkeypatch.setattr(worker, "broadcast", None)
+    return ctx
+
+
+@pytest.mark.asyncio
+async def test_failed_micro_batch_is_stored_from_final_output(tmp_path, monkeypatch):
+    ctx = _job_ctx(tmp_path, monkeypatch)
+    posts = _job_posts()
+    real_store = worker.store_posts
+    calls = []
+
+    async def flaky_store(ctx, batch):
+        calls.append([p.id for p in batch])
+        if len(calls) == 1:
+            raise worker.StorageError("All storage backends failed")
+        return await real_store(ctx, batch)
+
+    async def batched(keywords, ctx, on_posts=None):
+        # Same contract as the stream follower: a failed micro-batch is returned again
+        try:
+            await on_posts(posts[:2])
+        except Exception:
+            return posts
+        return posts[2:]
+
+    monkeypatch.setattr(worker, "store_posts", flaky_store)
+    monkeypatch.setattr(worker, "process_keywords_batched", batched)
+    assert await worker.process_job(["juriste"], ctx) == 3
+    assert calls == [["mb-0", "mb-1"], ["mb-0", "mb-1", "mb-2"]]
+    assert ctx.legal_daily_count == 3
+
+
+@pytest.mark.asyncio
+async def test_storage_failure_on_final_output_fails_the_job(tmp_path, monkeypatch):
+    ctx = _job_ctx(tmp_path, monkeypatch)
+
+    async def broken_store(ctx, batch):
+        raise worker.StorageError("All storage backends failed")
+
+    async def batched(keywords, ctx, on_posts=None):
+        return _job_posts()
+
+    def successes():
+        return REGISTRY.get_sample_value("scrape_jobs_total", {"status": "success"}) or 0
+
+    before = successes()
+    monkeypatch.setattr(worker, "store_posts", broken_store)
+    monkeypatch.setattr(worker, "process_keywords_batched", batched)
+    with pytest.raises(worker.StorageError):
+        await worker.process_job(["juriste"], ctx)
+    assert successes() == before
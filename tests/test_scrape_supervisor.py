@@ -0,0 +1,104 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from scraper.result_stream import SERVER_REPLY_PREFIX
+from scraper.scrape_supervisor import ScrapeSupervisor
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Minimal stand-in for `scrape_subprocess --serve`: same stdin/stdout protocol,
+# reports rss_mb from the job input, exits on "crash"
+_FAKE_SERVER = f"""
+import json, os, sys
+prefix = {SERVER_REPLY_PREFIX!r}
+print("noise before ready", flush=True)
+print(prefix + json.dumps({{"event": "ready", "pid": os.getpid()}}), flush=True)
+for line in sys.stdin:
+    job = json.loads(line)
+    if job.get("cmd") == "shutdown":
+        break
+    data = json.load(open(job["input_file"]))
+    if data.get("crash"):
+        sys.exit(3)
+    json.dump({{"success": True, "posts": [], "pid": os.getpid()}}, open(job["output_file"], "w"))
+    print(prefix + json.dumps({{"event": "done", "id": job["id"], "success": True, "rss_mb": data.get("rss_mb")}}), flush=True)
+"""
+
+
+async def _run(supervisor, tmp_path, **input_data):
+    inp, out = tmp_path / "in.json", tmp_path / "out.json"
+    inp.write_text(json.dumps(input_data))
+    server = await supervisor.acquire()
+    done = await server.submit({"input_file": str(inp), "output_file": str(out), "stream_file": str(tmp_path / "s.ndjson")})
+    reply = await asyncio.wait_for(done, timeout=30)
+    reason = await supervisor.release(server, reply)
+    return server.proc.pid, reply, reason
+
+
+@pytest.mark.asyncio
+async def test_server_is_reused_then_recycled_after_max_jobs(tmp_path):
+    supervisor = ScrapeSupervisor([sys.executable, "-c", _FAKE_SERVER], str(ROOT), max_jobs=2)
+    try:
+        pid1, reply, reason = await _run(supervisor, tmp_path)
+        assert reply["success"] and reason is None
+        pid2, _, reason = await _run(supervisor, tmp_path)
+        assert pid2 == pid1 and reason == "max_jobs"
+        pid3, _, _ = await _run(supervisor, tmp_path)
+        assert pid3 != pid1
+        assert supervisor.starts == 2
+    finally:
+        await supervisor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_server_recycled_on_memory_ceiling_and_crash(tmp_path):
+    supervisor = ScrapeSupervisor([sys.executable, "-c", _FAKE_SERVER], str(ROOT), max_jobs=0, max_rss_mb=100)
+    try:
+        _, _, reason = await _run(supervisor, tmp_path, rss_mb=50)
+        assert reason is None
+        _, _, reason = await _run(supervisor, tmp_path, rss_mb=150)
+        assert reason == "memory"
+        _, reply, reason = await _run(supervisor, tmp_path, crash=True)
+        assert reply is None and reason == "crash"
+        assert supervisor.current is None
+        assert supervisor.recycles == {"memory": 1, "crash": 1}
+    finally:
+        await supervisor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_busy_server_is_not_shared_between_jobs(tmp_path):
+    supervisor = ScrapeSupervisor([sys.executable, "-c", _FAKE_SERVER], str(ROOT), max_jobs=0)
+    try:
+        server = await supervisor.acquire()
+        assert server is not None
+        # A concurrent job gets None (one-shot fallback) while the server is out
+        assert await supervisor.acquire() is None
+        assert await supervisor.release(server, None, timed_out=True) == "timeout"
+        pid, reply, reason = await _run(supervisor, tmp_path)
+        assert pid != server.proc.pid and reply["success"] and reason is None
+        # Released without recycling: free for the next job
+        again = await supervisor.acquire()
+        assert again is supervisor.current and again.proc.pid == pid
+        await supervisor.release(again, {"rss_mb": None})
+    finally:
+        await supervisor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_acquire_returns_none_when_server_never_ready():
+    supervisor = ScrapeSupervisor([sys.executable, "-c", "import time; time.sleep(30)"], start_timeout=0.5)
+    assert await supervisor.acquire() is None
+
+
+@pytest.mark.asyncio
+async def test_real_server_handshake_and_shutdown():
+    supervisor = ScrapeSupervisor([sys.executable, "-m", "scraper.scrape_subprocess", "--serve"], str(ROOT))
+    server = await supervisor.acquire()
+    assert server is not None and server.alive
+    await supervisor.shutdown()
+    assert server.proc.returncode == 0
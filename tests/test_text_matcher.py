@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from scraper import legal_filter, text_matcher
+from scraper.text_matcher import AhoCorasick, VocabularyMatcher
+
+
+def test_automaton_matches_naive_substring_search():
+    rng = random.Random(42)
+    for _ in range(500):
+        patterns = list({"".join(rng.choice("ab c") for _ in range(rng.randint(1, 5))) for _ in range(12)})
+        text = "".join(rng.choice("ab cd") for _ in range(rng.randint(0, 40)))
+        expected = {p for p in patterns if p in text}
+        automaton = AhoCorasick(patterns)
+        assert {automaton.patterns[i] for i in automaton.find(text)} == expected
+        assert set(VocabularyMatcher({"x": patterns}).scan(text).found) == expected
+
+
+def test_overlapping_and_nested_terms():
+    hits = VocabularyMatcher({"x": ["he", "she", "his", "hers", "stage", "stagiaire"]}).scan("ushers stagiaire")
+    assert hits.terms("x") == ["he", "she", "hers", "stagiaire"]
+
+
+def test_categories_keep_vocabulary_order_and_duplicates():
+    matcher = VocabularyMatcher({
+        "signals": ["cdi", "nous recrutons", "cdd", "cdi"],
+        "roles": ["juriste", "avocat"],
+    })
+    hits = matcher.scan("nous recrutons un avocat en cdi")
+    assert hits.terms("signals") == ["cdi", "nous recrutons", "cdi"]
+    assert hits.count("signals") == 3
+    assert hits.first("roles") == "avocat"
+    assert "avocat" in hits and "juriste" not in hits
+    # Unregistered terms fall back to a substring test
+    assert "un avocat" in hits and "notaire" not in hits
+    with pytest.raises(KeyError):
+        hits.terms("unknown")
+
+
+def test_pure_python_fallback(monkeypatch):
+    monkeypatch.setattr(text_matcher, "_ahocorasick", None)
+    matcher = VocabularyMatcher({"x": ["paris", "aris", "lyon"]})
+    assert isinstance(matcher._automaton, AhoCorasick)
+    assert matcher.scan("bureaux a paris").terms("x") == ["paris", "aris"]
+
+
+def test_legal_filter_registers_every_context_vocabulary():
+    vocab = legal_filter._get_matcher().vocabularies
+    assert "EXCLUSION_NON_FRANCE" in vocab and "_FRANCE_INDICATORS" in vocab
+    hits = legal_filter._scan(legal_filter.normalize_text("Nous recrutons un Juriste (CDI) à Paris"))
+    assert hits.first("EXCLUSION_STAGE_ALTERNANCE") is None
+    assert "juriste" in hits.terms("LEGAL_PROFESSIONS")
+    assert hits.has("_FRANCE_INDICATORS")
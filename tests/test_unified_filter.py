@@ -243,6 +243,60 @@ class TestConvenienceFunctions:
         reset_filter_config()
 
 
+class TestClassifyBatch:
+    """Tests for UnifiedFilterConfig.classify_batch."""
+    
+    POSTS = [
+        ("Nous recrutons un juriste confirmé en CDI pour notre direction juridique", "DRH", "ACME"),
+        ("Stage juriste 6 mois - stagiaire en droit des affaires", "", ""),
+        ("Belle journée ensoleillée sur Paris", "", ""),
+        ("Notre cabinet de recrutement recherche pour son client un avocat, chasseur de têtes", "Michael Page", ""),
+    ]
+    
+    def test_batch_matches_classify_post(self):
+        from filters.unified import UnifiedFilterConfig
+        
+        config = UnifiedFilterConfig()
+        batch = config.classify_batch(self.POSTS, with_matches=True)
+        
+        assert len(batch) == len(self.POSTS)
+        for i, post in enumerate(self.POSTS):
+            assert batch.result(i) == config.classify_post(*post)
+    
+    def test_batch_accepts_texts_and_mappings(self):
+        from filters.unified import PostCategory, UnifiedFilterConfig
+        
+        config = UnifiedFilterConfig()
+        batch = config.classify_batch([
+            self.POSTS[0][0],
+            {"text": self.POSTS[1][0], "author": None},
+        ])
+        
+        assert batch.category(0) == config.classify_post(self.POSTS[0][0]).category
+        assert batch.category(1) == PostCategory.STAGE_ALTERNANCE
+        assert batch.matched_patterns is None
+    
+    def test_batch_columns(self):
+        from filters.unified import classify_batch
+        
+        batch = classify_batch(self.POSTS * 3)
+        
+        assert len(batch.legal_scores) == 12
+        assert batch.relevant_indices() == [i for i in range(12) if batch.relevant[i]]
+        assert sum(batch.category_counts().values()) == 12
+    
+    def test_process_pool_keeps_order(self):
+        from filters.unified import UnifiedFilterConfig
+        
+        config = UnifiedFilterConfig()
+        posts = self.POSTS * 5
+        serial = config.classify_batch(posts)
+        pooled = config.classify_batch(posts, workers=2, chunk_size=3)
+        
+        assert list(pooled.categories) == list(serial.categories)
+        assert list(pooled.combined_scores) == list(serial.combined_scores)
+
+
 class TestPatternSets:
     """Tests for pattern sets completeness."""
     